@@ -1,20 +1,52 @@
-"""Advanced authentication handling with credential chaining for ADO-MCP."""
+"""
+Advanced authentication handling with credential chaining for ADO-MCP.
+
+Credentials are cached by AuthManager and, when they expire (Microsoft Entra
+tokens from the Azure CLI), refreshed in the background shortly before
+expires_at, so requests never wait on ``az`` once the first credential is in
+place. Entra tokens are also kept in a small token cache file shared by all
+server processes of the user, so that several MCP servers started side by
+side run ``az account get-access-token`` once between them.
+"""
 
 import json
 import logging
 import os
 import subprocess
+import tempfile
+import threading
 import time
 from abc import ABC, abstractmethod
 from base64 import b64encode
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
 
 from .config import AuthConfig
 from .errors import AdoAuthenticationError
 
+try:
+    import fcntl
+except ImportError:  # Windows: the token cache file is shared without locking
+    fcntl = None
+
 logger = logging.getLogger(__name__)
 
+# Azure DevOps's application ID, the resource Entra tokens are requested for
+AZURE_DEVOPS_RESOURCE = "499b84ac-1321-427f-aa17-267ca6975798"
+
+# Least time between two background refreshes, so a provider that keeps
+# returning nearly expired tokens is not called in a loop
+_MIN_REFRESH_INTERVAL_SECONDS = 30.0
+
+
+def default_token_cache_path() -> str:
+    """Default location of the shared token cache file, following XDG_CACHE_HOME."""
+    cache_home = os.getenv("XDG_CACHE_HOME") or os.path.join(Path.home(), ".cache")
+    return os.path.join(cache_home, "ado-mcp", "tokens.json")
+
 
 @dataclass
 class AuthCredential:
@@ -32,6 +64,12 @@ class AuthCredential:
             return False
         return time.time() >= self.expires_at
 
+    def expires_within(self, seconds: float) -> bool:
+        """Check if the credential expires in the next given number of seconds."""
+        if self.expires_at is None:
+            return False
+        return time.time() >= self.expires_at - seconds
+
     def to_header(self) -> dict[str, str]:
         """Convert credential to HTTP Authorization header."""
         if self.auth_type == "basic":
@@ -43,6 +81,106 @@ class AuthCredential:
             raise ValueError(f"Unknown auth type: {self.auth_type}")
 
 
+class SharedTokenCache:
+    """
+    Token cache file shared by the server processes of one user.
+
+    Callers hold locked() around checking the cache and fetching a new token,
+    so when several processes need a token at the same time one of them
+    fetches it and the others read it from the file. Only expiring (bearer)
+    tokens are stored; the file is created readable by its owner only.
+
+    Args:
+        path: Location of the cache file. A ``.lock`` file is kept next to it.
+    """
+
+    def __init__(self, path: str | None = None):
+        self.path = Path(path or default_token_cache_path())
+        self._lock_path = self.path.with_name(self.path.name + ".lock")
+        self._thread_lock = threading.Lock()
+
+    @contextmanager
+    def locked(self) -> Iterator[None]:
+        """Hold the cache exclusively, across threads and processes."""
+        with self._thread_lock:
+            lock_file = self._open_lock_file()
+            try:
+                if lock_file is not None and fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+                yield
+            finally:
+                if lock_file is not None:
+                    lock_file.close()  # Also releases the flock
+
+    def _open_lock_file(self):
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            return open(self._lock_path, "a")
+        except OSError as e:
+            logger.debug(f"Token cache lock unavailable, continuing without it: {e}")
+            return None
+
+    def _read(self) -> dict:
+        try:
+            return json.loads(self.path.read_text())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable token cache {self.path}: {e}")
+            return {}
+
+    def load(self, key: str, min_valid_seconds: float = 0) -> AuthCredential | None:
+        """
+        Get a cached token that stays valid for at least min_valid_seconds.
+
+        Returns:
+            AuthCredential | None: The cached credential, or None if there is no
+            such token.
+        """
+        entry = self._read().get(key)
+        if not isinstance(entry, dict):
+            return None
+        try:
+            credential = AuthCredential(
+                token=entry["token"],
+                auth_type=entry["auth_type"],
+                method=entry["method"],
+                expires_at=float(entry["expires_at"]),
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+        if credential.expires_within(min_valid_seconds):
+            return None
+        return credential
+
+    def store(self, key: str, credential: AuthCredential) -> None:
+        """Save an expiring credential, replacing the file atomically."""
+        if credential.expires_at is None:
+            return
+        entries = {
+            name: entry
+            for name, entry in self._read().items()
+            if isinstance(entry, dict) and entry.get("expires_at", 0) > time.time()
+        }
+        entries[key] = {
+            "token": credential.token,
+            "auth_type": credential.auth_type,
+            "method": credential.method,
+            "expires_at": credential.expires_at,
+        }
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=".tokens-")
+            try:
+                with os.fdopen(fd, "w") as tmp_file:
+                    json.dump(entries, tmp_file)
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.debug(f"Could not write token cache {self.path}: {e}")
+
+
 class AuthProvider(ABC):
     """Abstract base class for authentication providers."""
 
@@ -130,22 +268,53 @@ class AzureCliFileAuthProvider(AuthProvider):
 class AzureCliEntraAuthProvider(AuthProvider):
     """Azure CLI Microsoft Entra token authentication provider."""
 
-    def __init__(self, timeout: int = 10):
-        """Initialize with timeout."""
+    def __init__(
+        self,
+        timeout: int = 10,
+        token_cache: SharedTokenCache | None = None,
+        min_valid_seconds: float = 0,
+    ):
+        """
+        Initialize with timeout.
+
+        Args:
+            timeout: Seconds to wait for the Azure CLI.
+            token_cache: Cache shared with other server processes, if any.
+            min_valid_seconds: Shortest remaining lifetime for a cached token to
+                be reused rather than fetched again.
+        """
         self.timeout = timeout
+        self.token_cache = token_cache
+        self.min_valid_seconds = min_valid_seconds
 
     def get_credential(self) -> AuthCredential | None:
         """Get Microsoft Entra token for Azure DevOps."""
+        if self.token_cache is None:
+            return self._request_token()
+
+        cache_key = f"azure_cli_entra:{AZURE_DEVOPS_RESOURCE}"
+        with self.token_cache.locked():
+            credential = self.token_cache.load(cache_key, self.min_valid_seconds)
+            if credential is not None:
+                logger.debug("Using Microsoft Entra token from the shared token cache")
+                return credential
+
+            credential = self._request_token()
+            if credential is not None:
+                self.token_cache.store(cache_key, credential)
+            return credential
+
+    def _request_token(self) -> AuthCredential | None:
+        """Ask the Azure CLI for a token."""
         try:
             # Use Azure CLI to get Microsoft Entra token for Azure DevOps
-            # 499b84ac-1321-427f-aa17-267ca6975798 is Azure DevOps's application ID
             result = subprocess.run(
                 [
                     "az",
                     "account",
                     "get-access-token",
                     "--resource",
-                    "499b84ac-1321-427f-aa17-267ca6975798",
+                    AZURE_DEVOPS_RESOURCE,
                 ],
                 capture_output=True,
                 text=True,
@@ -155,26 +324,16 @@ class AzureCliEntraAuthProvider(AuthProvider):
             if result.returncode == 0:
                 token_data = json.loads(result.stdout)
                 access_token = token_data.get("accessToken")
-                expires_on = token_data.get("expiresOn")
 
                 if access_token:
                     logger.info(
                         "Successfully obtained Azure CLI Microsoft Entra token for Azure DevOps"
                     )
-
-                    # Parse expiration time
-                    expires_at = None
-                    if expires_on:
-                        try:
-                            expires_at = float(expires_on)
-                        except (ValueError, TypeError):
-                            logger.warning(f"Could not parse token expiration: {expires_on}")
-
                     return AuthCredential(
                         token=access_token,
                         auth_type="bearer",
                         method="azure_cli_entra",
-                        expires_at=expires_at,
+                        expires_at=self._parse_expiration(token_data),
                     )
                 else:
                     logger.warning("Azure CLI returned empty access token")
@@ -193,6 +352,28 @@ class AzureCliEntraAuthProvider(AuthProvider):
 
         return None
 
+    @staticmethod
+    def _parse_expiration(token_data: dict) -> float | None:
+        """
+        Get a token's expiration as a POSIX timestamp.
+
+        Recent Azure CLI versions return ``expires_on`` as a timestamp; older
+        ones only return ``expiresOn``, a local date and time.
+        """
+        for field_name in ("expires_on", "expiresOn"):
+            value = token_data.get(field_name)
+            if value in (None, ""):
+                continue
+            try:
+                return float(value)
+            except (ValueError, TypeError):
+                pass
+            try:
+                return datetime.fromisoformat(str(value)).timestamp()
+            except ValueError:
+                logger.warning(f"Could not parse token expiration: {value}")
+        return None
+
     def get_name(self) -> str:
         """Get provider name."""
         return "Azure CLI (Entra)"
@@ -219,6 +400,13 @@ class AuthManager:
 
     Implements the credential chaining pattern where multiple authentication
     providers are tried in order until one succeeds.
+
+    With background refresh enabled, expiring credentials are refreshed on a
+    timer refresh_margin_seconds before they expire, and a credential past its
+    cache TTL keeps being used while a new one is fetched in the background.
+    Callers only wait for the provider chain when there is no usable
+    credential at all. Headers are swapped atomically, so requests pick up a
+    refreshed credential on their next attempt.
     """
 
     def __init__(self, config: AuthConfig):
@@ -227,6 +415,16 @@ class AuthManager:
         self.providers: list[AuthProvider] = []
         self.cached_credential: AuthCredential | None = None
         self.cache_time: float = 0
+        # (credential, headers) for the cached credential, replaced as a whole
+        self._headers: tuple[AuthCredential, dict[str, str]] | None = None
+        # Serializes walks of the provider chain
+        self._fetch_lock = threading.Lock()
+        # Guards the background refresh state below
+        self._refresh_lock = threading.Lock()
+        self._refresh_timer: threading.Timer | None = None
+        self._refreshing = False
+        self._last_refresh_attempt = 0.0
+        self._closed = False
 
     def add_provider(self, provider: AuthProvider):
         """Add an authentication provider to the chain."""
@@ -248,9 +446,20 @@ class AuthManager:
         if self.config.enable_cli_fallback:
             self.add_provider(AzureCliFileAuthProvider())
 
-        # 4. Azure CLI Microsoft Entra token
+        # 4. Azure CLI Microsoft Entra token, shared with other server processes
         if self.config.enable_cli_fallback:
-            self.add_provider(AzureCliEntraAuthProvider(self.config.timeout_seconds))
+            token_cache = (
+                SharedTokenCache(self.config.token_cache_path)
+                if self.config.shared_token_cache
+                else None
+            )
+            self.add_provider(
+                AzureCliEntraAuthProvider(
+                    self.config.timeout_seconds,
+                    token_cache=token_cache,
+                    min_valid_seconds=self.config.refresh_margin_seconds,
+                )
+            )
 
         # 5. Interactive authentication
         if self.config.enable_interactive_fallback:
@@ -267,9 +476,20 @@ class AuthManager:
             AdoAuthenticationError: If no authentication method succeeds
         """
         # Check cached credential first
+        credential = self.cached_credential
         if self._is_cached_credential_valid():
-            return self.cached_credential
-
+            if self._is_cache_stale():
+                self._refresh_in_background()
+            return credential
+
+        with self._fetch_lock:
+            # Another thread may have fetched one while this one waited
+            if self._is_cached_credential_valid():
+                return self.cached_credential
+            return self._fetch_credential()
+
+    def _fetch_credential(self) -> AuthCredential:
+        """Walk the provider chain and cache the first valid credential (fetch lock held)."""
         # Try each provider in order
         for provider in self.providers:
             try:
@@ -297,41 +517,107 @@ class AuthManager:
         )
 
     def _is_cached_credential_valid(self) -> bool:
-        """Check if cached credential is still valid."""
+        """Check if cached credential can still be used."""
         if not self.cached_credential:
             return False
 
-        # Check if cache is expired
-        if time.time() - self.cache_time > self.config.cache_ttl_seconds:
-            return False
-
         # Check if credential is expired
         if self.cached_credential.is_expired():
             return False
 
+        # Without background refresh, an expired cache entry is fetched again right away
+        if not self.config.background_refresh and self._is_cache_stale():
+            return False
+
         return True
 
+    def _is_cache_stale(self) -> bool:
+        """Check if the cached credential is older than the cache TTL."""
+        return time.time() - self.cache_time > self.config.cache_ttl_seconds
+
     def _cache_credential(self, credential: AuthCredential):
         """Cache the credential."""
         self.cached_credential = credential
         self.cache_time = time.time()
+        self._schedule_refresh()
+
+    def _schedule_refresh(self) -> None:
+        """Set the timer that refreshes an expiring credential before it expires."""
+        expires_at = getattr(self.cached_credential, "expires_at", None)
+        if not self.config.background_refresh or not isinstance(expires_at, int | float):
+            return
+
+        refresh_at = min(
+            expires_at - self.config.refresh_margin_seconds,
+            self.cache_time + self.config.cache_ttl_seconds,
+        )
+        delay = max(_MIN_REFRESH_INTERVAL_SECONDS, refresh_at - time.time())
+        with self._refresh_lock:
+            if self._closed:
+                return
+            if self._refresh_timer is not None:
+                self._refresh_timer.cancel()
+            self._refresh_timer = threading.Timer(delay, self._refresh_in_background, (False,))
+            self._refresh_timer.daemon = True
+            self._refresh_timer.start()
+        logger.debug(f"Credential refresh scheduled in {delay:.0f}s")
+
+    def _refresh_in_background(self, throttle: bool = True) -> None:
+        """Start fetching a new credential on a background thread, unless one is already running."""
+        with self._refresh_lock:
+            now = time.time()
+            recently = now - self._last_refresh_attempt < _MIN_REFRESH_INTERVAL_SECONDS
+            if self._closed or self._refreshing or (throttle and recently):
+                return
+            self._refreshing = True
+            self._last_refresh_attempt = now
+        threading.Thread(target=self._refresh, name="ado-auth-refresh", daemon=True).start()
+
+    def _refresh(self) -> None:
+        try:
+            with self._fetch_lock:
+                self._fetch_credential()
+            logger.info("Credential refreshed in the background")
+        except AdoAuthenticationError as e:
+            # Keep using the current credential until it expires, and try again later
+            logger.warning(f"Background credential refresh failed: {e}")
+            self._schedule_refresh()
+        finally:
+            with self._refresh_lock:
+                self._refreshing = False
 
     def invalidate_cache(self):
         """Invalidate the cached credential."""
         self.cached_credential = None
         self.cache_time = 0
+        self._headers = None
         logger.debug("Authentication cache invalidated")
 
+    def close(self) -> None:
+        """Stop background refreshes."""
+        with self._refresh_lock:
+            self._closed = True
+            if self._refresh_timer is not None:
+                self._refresh_timer.cancel()
+                self._refresh_timer = None
+
     def get_auth_headers(self) -> dict[str, str]:
         """
         Get authentication headers for HTTP requests.
 
+        The returned dictionary is shared; copy it before modifying it.
+
         Returns:
             Dict[str, str]: Headers dictionary with authentication
         """
         credential = self.get_credential()
+        cached = self._headers
+        if cached is not None and cached[0] is credential:
+            return cached[1]
+
         headers = credential.to_header()
         headers["Content-Type"] = "application/json"
+        self._headers = (credential, headers)
         return headers
 
     def get_auth_method(self) -> str:
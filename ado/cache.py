@@ -7,24 +7,38 @@ This module provides intelligent caching for:
 - Service connections
 - Recent pipeline runs
 
-The cache uses TTL-based expiration and fuzzy name matching for better user experience.
+Entries are partitioned by organization, so switching between organizations
+keeps each one's cache warm. The cache uses TTL-based expiration. Each cached
+list of projects, pipelines and work item types gets a NameIndex, so exact name
+lookups are O(1) and fuzzy lookups only score a handful of candidates.
 """
 
 import logging
+import os
+import threading
 import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
-from difflib import get_close_matches
 from typing import Any
 
 from opentelemetry import metrics, trace
 
+from .cache_store import SqliteCacheStore
 from .models import Pipeline, Project
+from .utils.name_index import NameIndex
 from .work_items.models import ClassificationNode, WorkItemType
 
 logger = logging.getLogger(__name__)
 tracer = trace.get_tracer(__name__)
 meter = metrics.get_meter(__name__)
 
+# Organization whose partition is used in the current context, overriding the active one
+_scoped_organization: ContextVar[str | None] = ContextVar("ado_cache_organization", default=None)
+
 
 @dataclass
 class CacheEntry:
@@ -32,6 +46,7 @@ class CacheEntry:
 
     data: Any
     expires_at: float
+    stale: bool = False  # Served past its TTL while a background refresh runs
 
     def is_expired(self) -> bool:
         """Check if this cache entry has expired."""
@@ -44,12 +59,32 @@ class AdoCache:
 
     Provides fast name-to-ID lookups with fuzzy matching and TTL-based expiration.
     Designed to minimize API calls while keeping data reasonably fresh.
+
+    Entries are kept in an OrderedDict in least- to most-recently-used order, so
+    touching and evicting an entry are O(1). All access to the entries goes
+    through a lock, as tools use the cache from several executor threads.
+
+    An optional persistent store can be attached as a second tier: writes go
+    through to it, and in-memory misses are served from it before the caller
+    falls back to the network.
+
+    Keys (projects, pipelines per project ID, ...) are only unique within an
+    organization, so entries live in one partition per organization. The
+    active organization's partition is used unless a different one is scoped
+    with organization_scope(). Up to max_partitions organizations are kept,
+    each with up to max_size entries.
     """
 
-    def __init__(self, max_size: int = 1000):
-        self._cache: dict[str, CacheEntry] = {}
-        self._access_order: list[str] = []  # For LRU tracking
+    def __init__(self, max_size: int = 1000, max_partitions: int = 8):
+        self._partitions: OrderedDict[str, OrderedDict[str, CacheEntry]] = OrderedDict()
+        self._active_organization = ""
+        self._lock = threading.RLock()
         self.max_size = max_size
+        self.max_partitions = max_partitions
+
+        # Optional persistent tier, namespaced by organization
+        self._store: SqliteCacheStore | None = None
+        self._default_store_namespace = ""
 
         # TTL settings (in seconds)
         self.PROJECT_TTL = 15 * 60  # 15 minutes - projects rarely change
@@ -59,6 +94,13 @@ class AdoCache:
         self.WORK_ITEM_TYPE_TTL = 60 * 60  # 1 hour - work item types are very stable
         self.CLASSIFICATION_TTL = 60 * 60  # 1 hour - area/iteration paths rarely change
 
+        # How long past its TTL an entry may still be served while it is refreshed
+        self.STALE_GRACE = 5 * 60
+
+        # Background refreshes for stale entries, deduplicated by organization and key
+        self._refreshing: set[tuple[str, str]] = set()
+        self._refresh_executor: ThreadPoolExecutor | None = None
+
         # Initialize metrics
         self._cache_hit_counter = meter.create_counter(
             name="ado_cache_hits", description="Number of cache hits", unit="1"
@@ -78,13 +120,121 @@ class AdoCache:
             name="ado_cache_size", description="Current size of the cache", unit="1"
         )
 
+        self._stale_served_counter = meter.create_counter(
+            name="ado_cache_stale_served",
+            description="Number of expired entries served while being refreshed",
+            unit="1",
+        )
+
+        self._refresh_counter = meter.create_counter(
+            name="ado_cache_background_refreshes",
+            description="Number of background refreshes of stale cache entries",
+            unit="1",
+        )
+
+    @property
+    def organization(self) -> str:
+        """The organization whose partition is used in the current context."""
+        return _scoped_organization.get() or self._active_organization
+
+    @property
+    def _cache(self) -> OrderedDict[str, CacheEntry]:
+        """Entries of the current organization's partition, created on first use."""
+        organization = self.organization
+        with self._lock:
+            partition = self._partitions.get(organization)
+            if partition is None:
+                partition = self._partitions[organization] = OrderedDict()
+                self._enforce_partition_limit(keep=organization)
+            else:
+                self._partitions.move_to_end(organization)
+            return partition
+
+    @property
+    def _store_namespace(self) -> str:
+        """Namespace of the current organization in the persistent store."""
+        return self.organization or self._default_store_namespace
+
+    def use_organization(self, organization_url: str) -> None:
+        """
+        Make an organization's partition the active one.
+
+        Partitions of other organizations are kept (up to max_partitions), so
+        switching back to them finds their entries still cached.
+        """
+        with self._lock:
+            self._active_organization = organization_url
+            self._cache  # noqa: B018 - create the partition and mark it recently used
+        logger.info(f"Cache partition switched to {organization_url}")
+
+    @contextmanager
+    def organization_scope(self, organization_url: str) -> Iterator[None]:
+        """Use an organization's partition within a block, e.g. on a background thread."""
+        token = _scoped_organization.set(organization_url)
+        try:
+            yield
+        finally:
+            _scoped_organization.reset(token)
+
+    def drop_organization(self, organization_url: str) -> None:
+        """Discard all in-memory entries of an organization."""
+        with self._lock:
+            partition = self._partitions.pop(organization_url, None)
+        if partition:
+            self._record_removed(list(partition), "partition_dropped")
+
+    def _enforce_partition_limit(self, keep: str) -> None:
+        """Evict least recently used partitions beyond max_partitions (lock held)."""
+        while len(self._partitions) > self.max_partitions:
+            organization = next(
+                (org for org in self._partitions if org not in (keep, self._active_organization)),
+                None,
+            )
+            if organization is None:
+                break
+            partition = self._partitions.pop(organization)
+            self._record_removed(list(partition), "partition_eviction")
+            logger.info(f"Evicted cache partition for {organization or 'default organization'}")
+
+    def _record_removed(self, keys: list[str], reason: str) -> None:
+        """Update size and eviction metrics for removed entries."""
+        type_counts: dict[str, int] = {}
+        for key in keys:
+            cache_type = key.split(":")[0] if ":" in key else "unknown"
+            type_counts[cache_type] = type_counts.get(cache_type, 0) + 1
+        for cache_type, count in type_counts.items():
+            self._cache_size_gauge.add(-count, {"cache_type": cache_type})
+            self._cache_eviction_counter.add(count, {"cache_type": cache_type, "reason": reason})
+
+    def attach_store(self, store: SqliteCacheStore, namespace: str) -> None:
+        """
+        Attach a persistent store as the second cache tier.
+
+        Args:
+            store: The persistent store to read through and write through to.
+            namespace: Scope for entries of the default (unnamed) partition,
+                typically the organization URL. Named partitions use their
+                organization URL.
+        """
+        with self._lock:
+            self._store = store
+            self._default_store_namespace = namespace
+        logger.info(f"Attached persistent cache store {store.path} for {namespace}")
+
+    def detach_store(self) -> None:
+        """Stop using the persistent store."""
+        with self._lock:
+            self._store = None
+            self._default_store_namespace = ""
+
     def _get_cache_key(self, *parts: str) -> str:
         """Generate a cache key from parts."""
         return ":".join(str(part) for part in parts)
 
     def _is_valid(self, key: str) -> bool:
         """Check if a cache entry exists and is not expired."""
-        entry = self._cache.get(key)
+        with self._lock:
+            entry = self._cache.get(key)
         return entry is not None and not entry.is_expired()
 
     def _set(self, key: str, data: Any, ttl_seconds: int) -> None:
@@ -92,27 +242,56 @@ class AdoCache:
         # Extract cache type from key for metrics labeling
         cache_type = key.split(":")[0] if ":" in key else "unknown"
 
-        # Check if we're replacing an existing entry
-        is_new = key not in self._cache
+        expires_at = time.time() + ttl_seconds
+        with self._lock:
+            cache = self._cache
+            # Check if we're replacing an existing entry
+            is_new = key not in cache
 
-        # Update access order for LRU
-        if key in self._access_order:
-            self._access_order.remove(key)
-        self._access_order.append(key)
+            # Set the cache entry and mark it most recently used
+            cache[key] = CacheEntry(data=data, expires_at=expires_at)
+            cache.move_to_end(key)
 
-        # Set the cache entry
-        expires_at = time.time() + ttl_seconds
-        self._cache[key] = CacheEntry(data=data, expires_at=expires_at)
+            # Update cache size metric only for new entries
+            if is_new:
+                self._cache_size_gauge.add(1, {"cache_type": cache_type})
 
-        # Update cache size metric only for new entries
-        if is_new:
-            self._cache_size_gauge.add(1, {"cache_type": cache_type})
+            # Enforce size limit with LRU eviction
+            self._enforce_size_limit()
+            store, namespace = self._store, self._store_namespace
 
-        # Enforce size limit with LRU eviction
-        self._enforce_size_limit()
+        if store is not None:
+            try:
+                store.set(namespace, key, data, expires_at)
+            except Exception as e:
+                logger.warning(f"Failed to persist cache entry {key}: {e}")
 
         logger.debug(f"Cached {key} for {ttl_seconds}s")
 
+    def _get_from_store(self, key: str) -> tuple[bool, Any]:
+        """Look up an entry in the persistent tier, promoting it to memory on a hit."""
+        store, namespace = self._store, self._store_namespace
+        if store is None:
+            return False, None
+        try:
+            stored = store.get(namespace, key)
+        except Exception as e:
+            logger.warning(f"Failed to read persistent cache entry {key}: {e}")
+            return False, None
+        if stored is None:
+            return False, None
+
+        data, expires_at = stored
+        cache_type = key.split(":")[0] if ":" in key else "unknown"
+        with self._lock:
+            is_new = key not in self._cache
+            self._cache[key] = CacheEntry(data=data, expires_at=expires_at)
+            self._cache.move_to_end(key)
+            if is_new:
+                self._cache_size_gauge.add(1, {"cache_type": cache_type})
+            self._enforce_size_limit()
+        return True, data
+
     def _get(self, key: str) -> Any | None:
         """Get a cache entry if it exists and is valid."""
         with tracer.start_as_current_span("cache_get") as span:
@@ -120,22 +299,23 @@ class AdoCache:
             # Extract cache type from key for metrics labeling
             cache_type = key.split(":")[0] if ":" in key else "unknown"
 
-            if self._is_valid(key):
+            with self._lock:
+                cache = self._cache
+                entry = cache.get(key)
+                hit = entry is not None and not entry.is_expired()
+                if hit:
+                    # Update LRU order on access
+                    cache.move_to_end(key)
+                elif entry is not None:
+                    # Remove expired entry
+                    del cache[key]
+
+            if hit:
                 span.set_attribute("cache.hit", True)
                 self._cache_hit_counter.add(1, {"cache_type": cache_type})
                 logger.debug(f"Cache hit for key: {key}")
-
-                # Update LRU order on access
-                if key in self._access_order:
-                    self._access_order.remove(key)
-                    self._access_order.append(key)
-
-                return self._cache[key].data
-            elif key in self._cache:
-                # Remove expired entry
-                del self._cache[key]
-                if key in self._access_order:
-                    self._access_order.remove(key)
+                return entry.data
+            elif entry is not None:
                 self._cache_size_gauge.add(-1, {"cache_type": cache_type})
                 self._cache_eviction_counter.add(1, {"cache_type": cache_type, "reason": "expired"})
                 logger.debug(f"Removed expired cache entry: {key}")
@@ -147,37 +327,142 @@ class AdoCache:
                 span.set_attribute("cache.expired", False)
                 self._cache_miss_counter.add(1, {"cache_type": cache_type, "reason": "not_found"})
                 logger.debug(f"Cache miss for key: {key}")
+
+            found, data = self._get_from_store(key)
+            if found:
+                span.set_attribute("cache.persistent_hit", True)
+                self._cache_hit_counter.add(1, {"cache_type": cache_type, "tier": "persistent"})
+                logger.debug(f"Persistent cache hit for key: {key}")
+                return data
             return None
 
+    def _get_allow_stale(self, key: str) -> tuple[Any | None, bool]:
+        """
+        Get an entry, serving it past its TTL within the stale grace window.
+
+        The first read of a just-expired entry marks it stale and extends it by
+        STALE_GRACE, so every reader sees the same data until a refresh stores
+        a fresh entry (or the grace window runs out).
+
+        Returns:
+            Tuple of (data, stale). data is None on a miss.
+        """
+        cache_type = key.split(":")[0] if ":" in key else "unknown"
+        now = time.time()
+        with self._lock:
+            entry = self._cache.get(key)
+            if (
+                entry is not None
+                and entry.is_expired()
+                and not entry.stale
+                and now - entry.expires_at <= self.STALE_GRACE
+            ):
+                self._cache[key] = CacheEntry(
+                    data=entry.data, expires_at=entry.expires_at + self.STALE_GRACE, stale=True
+                )
+
+        data = self._get(key)
+        if data is None:
+            return None, False
+
+        with self._lock:
+            entry = self._cache.get(key)
+            stale = entry is not None and entry.stale
+        if stale:
+            self._stale_served_counter.add(1, {"cache_type": cache_type})
+            logger.debug(f"Serving stale cache entry: {key}")
+        return data, stale
+
+    def refresh_in_background(self, key: str, refresh: Callable[[], None]) -> bool:
+        """
+        Run a refresh for a stale entry on a background thread, once per key.
+
+        The refresh runs in the current organization's partition.
+
+        Args:
+            key: Cache key being refreshed; concurrent requests for it are dropped.
+            refresh: Fetches fresh data and stores it in the cache.
+
+        Returns:
+            True if a refresh was started, False if one is already running.
+        """
+        cache_type = key.split(":")[0] if ":" in key else "unknown"
+        organization = self.organization
+        refresh_key = (organization, key)
+        with self._lock:
+            if refresh_key in self._refreshing:
+                return False
+            self._refreshing.add(refresh_key)
+            if self._refresh_executor is None:
+                self._refresh_executor = ThreadPoolExecutor(
+                    max_workers=2, thread_name_prefix="ado-cache-refresh"
+                )
+            executor = self._refresh_executor
+
+        def run() -> None:
+            try:
+                with self.organization_scope(organization):
+                    refresh()
+                self._refresh_counter.add(1, {"cache_type": cache_type, "outcome": "success"})
+                logger.info(f"Refreshed stale cache entry {key} in background")
+            except Exception as e:
+                self._refresh_counter.add(1, {"cache_type": cache_type, "outcome": "failure"})
+                logger.warning(f"Background refresh of {key} failed: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(refresh_key)
+
+        executor.submit(run)
+        return True
+
     def _enforce_size_limit(self) -> None:
-        """Enforce cache size limit using LRU eviction."""
-        while len(self._cache) > self.max_size:
+        """Enforce cache size limit using LRU eviction. Must be called with the lock held."""
+        cache = self._cache
+        while len(cache) > self.max_size:
             # Remove least recently used entry
-            if not self._access_order:
-                break
+            lru_key, _ = cache.popitem(last=False)
+            cache_type = lru_key.split(":")[0] if ":" in lru_key else "unknown"
+            self._cache_size_gauge.add(-1, {"cache_type": cache_type})
+            self._cache_eviction_counter.add(
+                1, {"cache_type": cache_type, "reason": "lru_eviction"}
+            )
+            logger.debug(f"Evicted LRU cache entry: {lru_key}")
 
-            lru_key = self._access_order.pop(0)
-            if lru_key in self._cache:
-                cache_type = lru_key.split(":")[0] if ":" in lru_key else "unknown"
-                del self._cache[lru_key]
-                self._cache_size_gauge.add(-1, {"cache_type": cache_type})
-                self._cache_eviction_counter.add(
-                    1, {"cache_type": cache_type, "reason": "lru_eviction"}
-                )
-                logger.debug(f"Evicted LRU cache entry: {lru_key}")
+    def _name_index(self, key: str, items: list, ttl: int) -> NameIndex:
+        """
+        Get the name index for the cached list stored under key.
+
+        The index is stored next to the list when it is cached. It is rebuilt if
+        the list came from elsewhere (e.g. the persistent tier) or it was evicted.
+        """
+        index_key = f"{key}:name_map"
+        with self._lock:
+            cache = self._cache
+            entry = cache.get(index_key)
+            if entry is not None:
+                cache.move_to_end(index_key)
+        if entry is not None and isinstance(entry.data, NameIndex) and entry.data.items is items:
+            return entry.data
+
+        index = NameIndex(items)
+        self._set(index_key, index, ttl)
+        return index
 
     # Project caching
     def get_projects(self) -> list[Project] | None:
         """Get cached projects list."""
         return self._get("projects")
 
+    def get_projects_allow_stale(self) -> tuple[list[Project] | None, bool]:
+        """Get cached projects, allowing recently expired data. Returns (projects, stale)."""
+        return self._get_allow_stale("projects")
+
     def set_projects(self, projects: list[Project]) -> None:
         """Cache projects list and create name-to-ID mapping."""
         self._set("projects", projects, self.PROJECT_TTL)
 
-        # Create name mapping for fast lookups
-        name_map = {project.name.lower(): project.id for project in projects}
-        self._set("projects:name_map", name_map, self.PROJECT_TTL)
+        # Index names for fast lookups
+        self._set("projects:name_map", NameIndex(projects), self.PROJECT_TTL)
 
         logger.info(f"Cached {len(projects)} projects")
 
@@ -196,25 +481,10 @@ class AdoCache:
         if not projects:
             return None
 
-        name_lower = name.lower()
-
-        # Exact match first
-        for project in projects:
-            if project.name.lower() == name_lower:
-                return project
-
-        # Fuzzy matching if enabled
-        if fuzzy:
-            project_names = [p.name for p in projects]
-            matches = get_close_matches(name, project_names, n=1, cutoff=0.6)
-            if matches:
-                match_name = matches[0]
-                for project in projects:
-                    if project.name == match_name:
-                        logger.info(f"Fuzzy matched '{name}' to project '{match_name}'")
-                        return project
-
-        return None
+        project = self._name_index("projects", projects, self.PROJECT_TTL).find(name, fuzzy)
+        if project is not None and project.name.casefold() != name.casefold():
+            logger.info(f"Fuzzy matched '{name}' to project '{project.name}'")
+        return project
 
     def get_project_id_by_name(self, name: str) -> str | None:
         """Get project ID by name."""
@@ -227,15 +497,17 @@ class AdoCache:
         key = f"pipelines:{project_id}"
         return self._get(key)
 
+    def get_pipelines_allow_stale(self, project_id: str) -> tuple[list[Pipeline] | None, bool]:
+        """Get cached pipelines, allowing recently expired data. Returns (pipelines, stale)."""
+        return self._get_allow_stale(f"pipelines:{project_id}")
+
     def set_pipelines(self, project_id: str, pipelines: list[Pipeline]) -> None:
         """Cache pipelines for a project."""
         key = f"pipelines:{project_id}"
         self._set(key, pipelines, self.PIPELINE_TTL)
 
-        # Create name mapping
-        name_map = {pipeline.name.lower(): pipeline.id for pipeline in pipelines}
-        name_key = f"pipelines:{project_id}:name_map"
-        self._set(name_key, name_map, self.PIPELINE_TTL)
+        # Index names for fast lookups
+        self._set(f"{key}:name_map", NameIndex(pipelines), self.PIPELINE_TTL)
 
         logger.info(f"Cached {len(pipelines)} pipelines for project {project_id}")
 
@@ -257,25 +529,11 @@ class AdoCache:
         if not pipelines:
             return None
 
-        name_lower = name.lower()
-
-        # Exact match first
-        for pipeline in pipelines:
-            if pipeline.name.lower() == name_lower:
-                return pipeline
-
-        # Fuzzy matching
-        if fuzzy:
-            pipeline_names = [p.name for p in pipelines]
-            matches = get_close_matches(name, pipeline_names, n=1, cutoff=0.6)
-            if matches:
-                match_name = matches[0]
-                for pipeline in pipelines:
-                    if pipeline.name == match_name:
-                        logger.info(f"Fuzzy matched '{name}' to pipeline '{match_name}'")
-                        return pipeline
-
-        return None
+        index = self._name_index(f"pipelines:{project_id}", pipelines, self.PIPELINE_TTL)
+        pipeline = index.find(name, fuzzy)
+        if pipeline is not None and pipeline.name.casefold() != name.casefold():
+            logger.info(f"Fuzzy matched '{name}' to pipeline '{pipeline.name}'")
+        return pipeline
 
     def get_pipeline_id_by_name(self, project_id: str, name: str) -> int | None:
         """Get pipeline ID by name within a project."""
@@ -324,10 +582,8 @@ class AdoCache:
         key = f"work_item_types:{project_id}"
         self._set(key, work_item_types, self.WORK_ITEM_TYPE_TTL)
 
-        # Create name mapping for fast lookups
-        name_map = {wit.name.lower(): wit for wit in work_item_types}
-        name_key = f"work_item_types:{project_id}:name_map"
-        self._set(name_key, name_map, self.WORK_ITEM_TYPE_TTL)
+        # Index names for fast lookups
+        self._set(f"{key}:name_map", NameIndex(work_item_types), self.WORK_ITEM_TYPE_TTL)
 
         logger.info(f"Cached {len(work_item_types)} work item types for project {project_id}")
 
@@ -349,25 +605,13 @@ class AdoCache:
         if not work_item_types:
             return None
 
-        name_lower = name.lower()
-
-        # Exact match first
-        for wit in work_item_types:
-            if wit.name.lower() == name_lower:
-                return wit
-
-        # Fuzzy matching
-        if fuzzy:
-            wit_names = [wit.name for wit in work_item_types]
-            matches = get_close_matches(name, wit_names, n=1, cutoff=0.6)
-            if matches:
-                match_name = matches[0]
-                for wit in work_item_types:
-                    if wit.name == match_name:
-                        logger.info(f"Fuzzy matched '{name}' to work item type '{match_name}'")
-                        return wit
-
-        return None
+        index = self._name_index(
+            f"work_item_types:{project_id}", work_item_types, self.WORK_ITEM_TYPE_TTL
+        )
+        wit = index.find(name, fuzzy)
+        if wit is not None and wit.name.casefold() != name.casefold():
+            logger.info(f"Fuzzy matched '{name}' to work item type '{wit.name}'")
+        return wit
 
     # Classification nodes caching (area and iteration paths)
     def get_area_paths(self, project_id: str) -> list[ClassificationNode] | None:
@@ -396,31 +640,50 @@ class AdoCache:
 
     # Cache management
     def clear_expired(self) -> int:
-        """Remove all expired cache entries. Returns number of entries removed."""
-        len(self._cache)
-        expired_keys = [key for key, entry in self._cache.items() if entry.is_expired()]
+        """Remove expired cache entries of every organization. Returns number removed."""
+        expired_keys = []
+        with self._lock:
+            for partition in self._partitions.values():
+                expired = [key for key, entry in partition.items() if entry.is_expired()]
+                for key in expired:
+                    del partition[key]
+                expired_keys.extend(expired)
 
         for key in expired_keys:
             cache_type = key.split(":")[0] if ":" in key else "unknown"
-            del self._cache[key]
-            if key in self._access_order:
-                self._access_order.remove(key)
             self._cache_size_gauge.add(-1, {"cache_type": cache_type})
             self._cache_eviction_counter.add(
                 1, {"cache_type": cache_type, "reason": "manual_clear"}
             )
 
         removed_count = len(expired_keys)
+        if self._store is not None:
+            try:
+                self._store.purge_expired()
+            except Exception as e:
+                logger.warning(f"Failed to purge persistent cache: {e}")
+
         if removed_count > 0:
             logger.info(f"Removed {removed_count} expired cache entries")
 
         return removed_count
 
     def clear_all(self) -> None:
-        """Clear all cache entries."""
-        # Count entries by type before clearing
+        """Clear all cache entries of the current organization."""
+        with self._lock:
+            keys = list(self._cache)
+            self._cache.clear()
+            store, namespace = self._store, self._store_namespace
+
+        if store is not None:
+            try:
+                store.clear(namespace)
+            except Exception as e:
+                logger.warning(f"Failed to clear persistent cache: {e}")
+
+        # Count entries by type
         type_counts = {}
-        for key in self._cache:
+        for key in keys:
             cache_type = key.split(":")[0] if ":" in key else "unknown"
             type_counts[cache_type] = type_counts.get(cache_type, 0) + 1
 
@@ -431,42 +694,50 @@ class AdoCache:
                 count, {"cache_type": cache_type, "reason": "manual_clear_all"}
             )
 
-        self._cache.clear()
-        self._access_order.clear()
         logger.info("Cleared all cache entries")
 
     def invalidate_pipelines(self, project_id: str) -> None:
         """Invalidate pipeline cache for a specific project."""
         key = f"pipelines:{project_id}"
-        name_map_key = f"pipeline_names:{project_id}"
+        name_map_key = f"{key}:name_map"
 
-        if key in self._cache:
-            del self._cache[key]
-            if key in self._access_order:
-                self._access_order.remove(key)
+        with self._lock:
+            removed = self._cache.pop(key, None) is not None
+            removed_name_map = self._cache.pop(name_map_key, None) is not None
+            store, namespace = self._store, self._store_namespace
+
+        if store is not None:
+            try:
+                store.delete(namespace, key)
+                store.delete(namespace, name_map_key)
+            except Exception as e:
+                logger.warning(f"Failed to invalidate persistent cache entries: {e}")
+
+        if removed:
             self._cache_size_gauge.add(-1, {"cache_type": "pipelines"})
             self._cache_eviction_counter.add(
                 1, {"cache_type": "pipelines", "reason": "manual_invalidate"}
             )
             logger.info(f"Invalidated pipeline cache for project {project_id}")
 
-        if name_map_key in self._cache:
-            del self._cache[name_map_key]
-            if name_map_key in self._access_order:
-                self._access_order.remove(name_map_key)
-            self._cache_size_gauge.add(-1, {"cache_type": "pipeline_names"})
+        if removed_name_map:
+            self._cache_size_gauge.add(-1, {"cache_type": "pipelines"})
             self._cache_eviction_counter.add(
-                1, {"cache_type": "pipeline_names", "reason": "manual_invalidate"}
+                1, {"cache_type": "pipelines", "reason": "manual_invalidate"}
             )
 
     def get_stats(self) -> dict[str, Any]:
-        """Get cache statistics including hit/miss rates."""
-        total_entries = len(self._cache)
-        expired_entries = sum(1 for entry in self._cache.values() if entry.is_expired())
+        """Get statistics of the current organization's entries."""
+        with self._lock:
+            entries = list(self._cache.items())
+            organizations = [org for org in self._partitions if org]
+
+        total_entries = len(entries)
+        expired_entries = sum(1 for _, entry in entries if entry.is_expired())
 
         # Group cache entries by type
         entries_by_type = {}
-        for key in self._cache:
+        for key, _ in entries:
             cache_type = key.split(":")[0] if ":" in key else "unknown"
             entries_by_type[cache_type] = entries_by_type.get(cache_type, 0) + 1
 
@@ -475,7 +746,9 @@ class AdoCache:
             "active_entries": total_entries - expired_entries,
             "expired_entries": expired_entries,
             "entries_by_type": entries_by_type,
-            "cache_keys": list(self._cache.keys()),
+            "cache_keys": [key for key, _ in entries],
+            "organization": self.organization or None,
+            "cached_organizations": organizations,
             # Note: Hit/miss rates are tracked via OpenTelemetry metrics
             # and should be queried from the metrics backend
             "metrics_info": "Hit/miss rates are tracked via OpenTelemetry metrics",
@@ -483,4 +756,7 @@ class AdoCache:
 
 
 # Global cache instance
-ado_cache = AdoCache()
+ado_cache = AdoCache(
+    max_size=int(os.getenv("ADO_CACHE_MAX_SIZE", "1000")),
+    max_partitions=int(os.getenv("ADO_CACHE_MAX_ORGANIZATIONS", "8")),
+)
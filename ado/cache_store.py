@@ -0,0 +1,212 @@
+"""
+Persistent SQLite tier for AdoCache.
+
+A fresh server process (including every MCP stdio process an agent spawns)
+starts with an empty in-memory cache and would otherwise re-fetch projects,
+pipelines, work item types and classification trees before its first useful
+answer. SqliteCacheStore keeps cache entries together with their expiry in a
+local SQLite file, so a warm start can be served from disk.
+
+The database runs in WAL mode with a busy timeout, so several processes on the
+same host can read and write it concurrently. Entries are namespaced (by
+organization URL) because the in-memory cache keys are not.
+
+Values are stored as JSON. Pydantic models are tagged with their class and
+only restored if that class is a BaseModel defined in the ``ado`` package, so
+the file never causes arbitrary code to run on load.
+"""
+
+import importlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+_MODEL_TAG = "__ado_model__"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+)
+"""
+
+
+def default_cache_path() -> str:
+    """Default location of the persistent cache file, following XDG_CACHE_HOME."""
+    cache_home = os.getenv("XDG_CACHE_HOME") or os.path.join(Path.home(), ".cache")
+    return os.path.join(cache_home, "ado-mcp", "cache.sqlite3")
+
+
+def _encode(value: Any) -> Any:
+    """Convert a cache value to JSON-compatible data, tagging pydantic models."""
+    if isinstance(value, BaseModel):
+        cls = type(value)
+        return {
+            _MODEL_TAG: f"{cls.__module__}:{cls.__qualname__}",
+            "data": value.model_dump(mode="json"),
+        }
+    if isinstance(value, dict):
+        if not all(isinstance(k, str) for k in value):
+            raise TypeError("Only string dictionary keys can be persisted")
+        return {k: _encode(v) for k, v in value.items()}
+    if isinstance(value, list | tuple):
+        return [_encode(v) for v in value]
+    if value is None or isinstance(value, str | int | float | bool):
+        return value
+    raise TypeError(f"Cannot persist value of type {type(value).__name__}")
+
+
+def _resolve_model(tag: str) -> type[BaseModel]:
+    module_name, _, qualname = tag.partition(":")
+    if module_name != "ado" and not module_name.startswith("ado."):
+        raise ValueError(f"Refusing to restore model from module {module_name}")
+    cls = importlib.import_module(module_name)
+    for part in qualname.split("."):
+        cls = getattr(cls, part)
+    if not (isinstance(cls, type) and issubclass(cls, BaseModel)):
+        raise ValueError(f"{tag} is not a pydantic model")
+    return cls
+
+
+def _decode(value: Any) -> Any:
+    """Restore a value produced by _encode."""
+    if isinstance(value, dict):
+        if _MODEL_TAG in value:
+            return _resolve_model(value[_MODEL_TAG]).model_validate(value["data"])
+        return {k: _decode(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_decode(v) for v in value]
+    return value
+
+
+def encode_value(value: Any) -> str:
+    """
+    Serialize a cache value for storage.
+
+    Raises:
+        TypeError: If the value contains something that can't be persisted.
+    """
+    return json.dumps(_encode(value), separators=(",", ":"))
+
+
+def decode_value(text: str) -> Any:
+    """
+    Deserialize a stored cache value.
+
+    Raises:
+        ValueError: If the value is malformed or references a disallowed class.
+    """
+    return _decode(json.loads(text))
+
+
+class SqliteCacheStore:
+    """
+    Cache entries with expiry persisted to a SQLite file shared between processes.
+
+    Each thread uses its own connection; SQLite's locking serializes writers
+    across threads and processes.
+    """
+
+    def __init__(self, path: str | None = None, busy_timeout_seconds: float = 5.0):
+        self.path = path or default_cache_path()
+        self.busy_timeout_seconds = busy_timeout_seconds
+        self._local = threading.local()
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+
+        with self._connection() as conn:
+            conn.execute(_SCHEMA)
+        logger.info(f"Persistent cache store opened at {self.path}")
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "connection", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.busy_timeout_seconds)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = conn
+        return conn
+
+    def get(self, namespace: str, key: str) -> tuple[Any, float] | None:
+        """
+        Get an unexpired entry.
+
+        Returns:
+            Tuple of (data, expires_at), or None if missing, expired or unreadable.
+        """
+        row = (
+            self._connection()
+            .execute(
+                "SELECT value, expires_at FROM cache_entries "
+                "WHERE namespace = ? AND key = ? AND expires_at > ?",
+                (namespace, key, time.time()),
+            )
+            .fetchone()
+        )
+        if row is None:
+            return None
+        try:
+            return decode_value(row[0]), row[1]
+        except (ValueError, TypeError, AttributeError, ImportError) as e:
+            logger.warning(f"Dropping unreadable persistent cache entry {key}: {e}")
+            self.delete(namespace, key)
+            return None
+
+    def set(self, namespace: str, key: str, data: Any, expires_at: float) -> bool:
+        """
+        Store an entry, replacing any existing one.
+
+        Returns:
+            True if stored, False if the value can't be persisted.
+        """
+        try:
+            value = encode_value(data)
+        except TypeError as e:
+            logger.debug(f"Not persisting cache entry {key}: {e}")
+            return False
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache_entries (namespace, key, value, expires_at) "
+                "VALUES (?, ?, ?, ?)",
+                (namespace, key, value, expires_at),
+            )
+        return True
+
+    def delete(self, namespace: str, key: str) -> None:
+        """Remove an entry, if present."""
+        with self._connection() as conn:
+            conn.execute(
+                "DELETE FROM cache_entries WHERE namespace = ? AND key = ?", (namespace, key)
+            )
+
+    def clear(self, namespace: str) -> None:
+        """Remove all entries in a namespace."""
+        with self._connection() as conn:
+            conn.execute("DELETE FROM cache_entries WHERE namespace = ?", (namespace,))
+
+    def purge_expired(self) -> int:
+        """Remove expired entries in every namespace. Returns the number removed."""
+        with self._connection() as conn:
+            cursor = conn.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (time.time(),))
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """Close this thread's connection."""
+        conn = getattr(self._local, "connection", None)
+        if conn is not None:
+            conn.close()
+            self._local.connection = None
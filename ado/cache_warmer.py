@@ -0,0 +1,150 @@
+"""
+Cache warm-up after start-up.
+
+The first name-based tool call of a fresh server (run_pipeline_by_name,
+work item creation by type and area path, ...) otherwise pays serially for
+the project list, the project's pipelines and its work item metadata.
+CacheWarmer fetches them in parallel right after authentication, on a
+background thread:
+
+1. the project list;
+2. for each configured hot project, its pipelines, work item types and area
+   and iteration trees.
+
+Warm-up requests run under background_priority(), so the rate limiter keeps
+part of the organization's capacity free for interactive tool calls. They
+go through the same lookups as tool calls, so entries that are already
+cached are not fetched again.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from typing import Any
+
+from opentelemetry import metrics
+
+from .cache import ado_cache
+from .config import CacheWarmupConfig
+from .models import Project
+from .rate_limiter import background_priority
+from .work_items.type_client import TypeClient
+
+logger = logging.getLogger(__name__)
+meter = metrics.get_meter(__name__)
+
+_warmup_counter = meter.create_counter(
+    name="ado_cache_warmup_tasks",
+    description="Number of cache warm-up fetches by kind and outcome",
+    unit="1",
+)
+
+
+class CacheWarmer:
+    """
+    Prefetches lookup data of one organization into ado_cache.
+
+    Args:
+        client: Authenticated AdoClient of the organization.
+        organization: Cache partition to fill, normally the normalized organization URL.
+        config: Which projects to warm and how many fetches to run at once.
+    """
+
+    def __init__(self, client, organization: str, config: CacheWarmupConfig):
+        self.client = client
+        self.organization = organization
+        self.config = config
+        self._outcome_lock = threading.Lock()
+
+    def start(self) -> threading.Thread:
+        """Run warm() on a background thread."""
+        thread = threading.Thread(target=self.warm, name="ado-cache-warmup", daemon=True)
+        thread.start()
+        return thread
+
+    def warm(self) -> dict[str, Any]:
+        """
+        Fetch everything configured into the cache.
+
+        Failures are logged and counted but never raised; whatever could not be
+        prefetched is fetched on first use as usual.
+
+        Returns:
+            dict: Number of fetches that succeeded and failed, and the time taken.
+        """
+        start = time.monotonic()
+        outcomes = {"succeeded": 0, "failed": 0}
+        with ado_cache.organization_scope(self.organization), background_priority():
+            projects = self._run("projects", self.client._lookups.ensure_projects_cached, outcomes)
+            tasks = self._project_tasks(projects or [])
+            if tasks:
+                with ThreadPoolExecutor(
+                    max_workers=self.config.max_workers, thread_name_prefix="ado-cache-warmup"
+                ) as executor:
+                    for kind, fetch in tasks:
+                        # Each task keeps the organization scope and background priority
+                        executor.submit(copy_context().run, self._run, kind, fetch, outcomes)
+
+        summary = {**outcomes, "seconds": round(time.monotonic() - start, 3)}
+        logger.info(f"Cache warm-up for {self.organization} finished: {summary}")
+        return summary
+
+    def _project_tasks(self, projects: list[Project]) -> list[tuple[str, Any]]:
+        """Fetches for the configured hot projects that exist in the organization."""
+        by_key = {}
+        for project in projects:
+            by_key[project.id.lower()] = project
+            by_key[project.name.lower()] = project
+
+        tasks = []
+        type_client = TypeClient(self.client)
+        for configured in self.config.projects:
+            project = by_key.get(configured.lower())
+            if project is None:
+                logger.warning(f"Cache warm-up: project '{configured}' not found, skipping")
+                continue
+            tasks.append(
+                ("pipelines", lambda p=project: self.client._lookups.ensure_pipelines_cached(p.id))
+            )
+            if not self.config.work_item_metadata:
+                continue
+            tasks.extend(
+                [
+                    ("work_item_types", lambda p=project: self._work_item_types(type_client, p)),
+                    ("area_paths", lambda p=project: self._area_paths(type_client, p)),
+                    ("iteration_paths", lambda p=project: self._iteration_paths(type_client, p)),
+                ]
+            )
+        return tasks
+
+    # Work item metadata is cached under whatever the caller passed as project_id,
+    # so it is stored under the project's name as well as its ID.
+
+    def _work_item_types(self, type_client: TypeClient, project: Project) -> None:
+        types = type_client.list_work_item_types(project.id)
+        ado_cache.set_work_item_types(project.name, types)
+
+    def _area_paths(self, type_client: TypeClient, project: Project) -> None:
+        paths = type_client.list_area_paths(project.id)
+        if paths:
+            ado_cache.set_area_paths(project.name, paths)
+
+    def _iteration_paths(self, type_client: TypeClient, project: Project) -> None:
+        paths = type_client.list_iteration_paths(project.id)
+        if paths:
+            ado_cache.set_iteration_paths(project.name, paths)
+
+    def _run(self, kind: str, fetch, outcomes: dict[str, int]) -> Any:
+        try:
+            result = fetch()
+            outcome = "succeeded"
+        except Exception as e:
+            logger.warning(f"Cache warm-up of {kind} failed: {e}")
+            result = None
+            outcome = "failed"
+        _warmup_counter.add(1, {"kind": kind, "outcome": outcome})
+        with self._outcome_lock:
+            outcomes[outcome] += 1
+        return result
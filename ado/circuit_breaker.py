@@ -0,0 +1,298 @@
+"""
+Per-endpoint circuit breakers for Azure DevOps API calls.
+
+A single breaker for the whole client lets one flapping endpoint (signed log
+content URLs, the preview API, ...) cut off every other call, while healthy
+traffic keeps resetting it and hides an endpoint that is really down.
+Breakers are therefore kept per endpoint template, such as
+``GET dev.azure.com/_apis/build/builds/{id}/timeline``:
+
+- closed: requests flow; consecutive failures are counted;
+- open: after failure_threshold consecutive failures, requests fail fast with
+  AdoCircuitOpenError instead of waiting through timeouts;
+- half-open: once open_seconds have passed, a limited number of probe
+  requests go through. A successful probe closes the breaker and a failed
+  one opens it again.
+
+Only failures that say something about the endpoint's health count:
+network errors, timeouts and 5xx responses. 4xx responses and throttling
+mean the endpoint answered.
+"""
+
+import asyncio
+import functools
+import logging
+import re
+import threading
+import time
+import weakref
+from collections.abc import Callable
+from typing import Any
+from urllib.parse import unquote, urlsplit
+
+import httpx
+import requests
+from opentelemetry import metrics
+
+from .config import CircuitBreakerConfig
+from .errors import AdoCircuitOpenError, AdoNetworkError, AdoTimeoutError
+
+logger = logging.getLogger(__name__)
+meter = metrics.get_meter(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+_STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+# Path segments that identify a resource rather than an endpoint: numbers, GUIDs and tokens
+_ID_SEGMENT = re.compile(
+    r"^(\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+    r"|[A-Za-z0-9_\-.=]{32,})$"
+)
+
+
+def endpoint_template(method: str, url: str) -> str:
+    """
+    Reduce a request to the endpoint it targets.
+
+    The organization and project segments before ``_apis`` are dropped, and
+    IDs in the rest of the path are replaced by ``{id}``. The query string is
+    ignored.
+
+    Example:
+        ``GET https://dev.azure.com/org/proj/_apis/build/builds/42/timeline?changeId=3``
+        becomes ``GET dev.azure.com/_apis/build/builds/{id}/timeline``.
+    """
+    parsed = urlsplit(url)
+    segments = [segment for segment in parsed.path.split("/") if segment]
+    if "_apis" in segments:
+        segments = segments[segments.index("_apis") :]
+    templated = ["{id}" if _ID_SEGMENT.match(unquote(s)) else s for s in segments]
+    return f"{method.upper()} {parsed.netloc}/{'/'.join(templated)}"
+
+
+def is_endpoint_failure(exception: BaseException) -> bool:
+    """Whether an exception says the endpoint is unhealthy (network error, timeout or 5xx)."""
+    if isinstance(exception, AdoCircuitOpenError):
+        return False
+    if isinstance(exception, AdoTimeoutError) and exception.context.get("deadline_exceeded"):
+        # The caller ran out of time; the endpoint was never (fully) tried
+        return False
+    response = getattr(exception, "response", None)
+    if isinstance(exception, AdoNetworkError) and response is None:
+        response = getattr(exception.original_exception, "response", None)
+    if response is not None and getattr(response, "status_code", None) is not None:
+        return response.status_code >= 500
+    return isinstance(
+        exception,
+        AdoNetworkError
+        | AdoTimeoutError
+        | requests.exceptions.ConnectionError
+        | requests.exceptions.Timeout
+        | httpx.TransportError,
+    )
+
+
+class CircuitBreaker:
+    """
+    Breaker for a single endpoint.
+
+    Args:
+        endpoint: Endpoint template the breaker guards.
+        config: Thresholds and timings.
+    """
+
+    def __init__(self, endpoint: str, config: CircuitBreakerConfig):
+        self.endpoint = endpoint
+        self.config = config
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._check_half_open()
+            return self._state
+
+    def _check_half_open(self) -> None:
+        """Move an open breaker to half-open once its open period has passed (lock held)."""
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.config.open_seconds:
+            self._transition(HALF_OPEN)
+
+    def _transition(self, state: str) -> None:
+        """Change state and record it (lock held)."""
+        self._state = state
+        if state == OPEN:
+            self._opened_at = time.monotonic()
+        if state != HALF_OPEN:
+            self._probes_in_flight = 0
+        _transition_counter.add(1, {"endpoint": self.endpoint, "state": state})
+        log = logger.warning if state == OPEN else logger.info
+        log(f"Circuit breaker for {self.endpoint} is now {state}")
+
+    def before_request(self) -> bool:
+        """
+        Admit a request or fail fast.
+
+        Returns:
+            bool: True if the request is a half-open probe.
+
+        Raises:
+            AdoCircuitOpenError: If the breaker is open, or half-open with all
+                probe slots taken.
+        """
+        with self._lock:
+            self._check_half_open()
+            if self._state == CLOSED:
+                return False
+            probes_left = self._probes_in_flight < self.config.half_open_max_probes
+            if self._state == HALF_OPEN and probes_left:
+                self._probes_in_flight += 1
+                return True
+            retry_in = max(0.0, self.config.open_seconds - (time.monotonic() - self._opened_at))
+
+        _fast_fail_counter.add(1, {"endpoint": self.endpoint})
+        raise AdoCircuitOpenError(
+            f"Circuit breaker open for {self.endpoint}",
+            retry_after=retry_in,
+            context={"endpoint": self.endpoint},
+        )
+
+    def record_success(self, probe: bool = False) -> None:
+        with self._lock:
+            self._consecutive_failures = 0
+            if probe:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+            if self._state != CLOSED and (probe or self._state == HALF_OPEN):
+                self._transition(CLOSED)
+
+    def record_failure(self, probe: bool = False) -> None:
+        with self._lock:
+            self._consecutive_failures += 1
+            if probe:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+            if self._state == HALF_OPEN or (
+                self._state == CLOSED
+                and self._consecutive_failures >= self.config.failure_threshold
+            ):
+                self._transition(OPEN)
+
+    def _record(self, probe: bool, exception: BaseException | None) -> None:
+        if exception is not None and not isinstance(exception, Exception):
+            # Cancelled or interrupted: no verdict on the endpoint, just free the probe slot
+            if probe:
+                with self._lock:
+                    self._probes_in_flight = max(0, self._probes_in_flight - 1)
+            return
+        if exception is not None and is_endpoint_failure(exception):
+            self.record_failure(probe)
+        else:
+            self.record_success(probe)
+
+    def protect(self, func: Callable[..., Any]) -> Callable[..., Any]:
+        """Decorate a function or coroutine function so its calls go through the breaker."""
+        if asyncio.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                probe = self.before_request()
+                try:
+                    result = await func(*args, **kwargs)
+                except BaseException as e:
+                    self._record(probe, e)
+                    raise
+                self._record(probe, None)
+                return result
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            probe = self.before_request()
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as e:
+                self._record(probe, e)
+                raise
+            self._record(probe, None)
+            return result
+
+        return wrapper
+
+
+class _DisabledBreaker:
+    """Stand-in used when circuit breaking is turned off."""
+
+    state = CLOSED
+
+    def protect(self, func: Callable[..., Any]) -> Callable[..., Any]:
+        return func
+
+
+class CircuitBreakerRegistry:
+    """
+    Circuit breakers of one client, created per endpoint template on first use.
+
+    Args:
+        config: Settings applied to every breaker.
+        name: Label for metrics, typically the organization URL.
+    """
+
+    def __init__(self, config: CircuitBreakerConfig, name: str = ""):
+        self.config = config
+        self.name = name
+        self._lock = threading.Lock()
+        self._breakers: dict[str, CircuitBreaker] = {}
+        _registries.add(self)
+
+    def for_request(self, method: str, url: str) -> CircuitBreaker | _DisabledBreaker:
+        """Get the breaker guarding a request's endpoint."""
+        if not self.config.enabled:
+            return _DISABLED
+        endpoint = endpoint_template(method, url)
+        with self._lock:
+            breaker = self._breakers.get(endpoint)
+            if breaker is None:
+                breaker = self._breakers[endpoint] = CircuitBreaker(endpoint, self.config)
+            return breaker
+
+    def states(self) -> dict[str, str]:
+        """State of every known endpoint's breaker."""
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {breaker.endpoint: breaker.state for breaker in breakers}
+
+
+_DISABLED = _DisabledBreaker()
+_registries: "weakref.WeakSet[CircuitBreakerRegistry]" = weakref.WeakSet()
+
+
+def _observe_states(options):
+    for registry in list(_registries):
+        for endpoint, state in registry.states().items():
+            yield metrics.Observation(
+                _STATE_VALUES[state], {"endpoint": endpoint, "organization": registry.name}
+            )
+
+
+_transition_counter = meter.create_counter(
+    name="ado_circuit_breaker_transitions",
+    description="Number of circuit breaker state changes by endpoint and new state",
+    unit="1",
+)
+_fast_fail_counter = meter.create_counter(
+    name="ado_circuit_breaker_fast_failures",
+    description="Number of requests rejected by an open circuit breaker",
+    unit="1",
+)
+meter.create_observable_gauge(
+    name="ado_circuit_breaker_state",
+    callbacks=[_observe_states],
+    description="Circuit breaker state per endpoint (0 closed, 1 half-open, 2 open)",
+    unit="1",
+)
@@ -1,28 +1,55 @@
 """Azure DevOps client with core functionality and pipeline operations."""
 
+import asyncio
+import copy
 import json
 import logging
 import subprocess
+import threading
 import uuid
 from base64 import b64encode
 from typing import Any
 
+import httpx
 import requests
 from opentelemetry import trace
 from requests.adapters import HTTPAdapter
 
 from .auth import AuthManager
+from .cache import ado_cache
+from .cache_store import SqliteCacheStore, default_cache_path
+from .circuit_breaker import CircuitBreakerRegistry
 from .config import AdoMcpConfig
+from .deadline import request_timeout
 from .errors import AdoAuthenticationError, AdoNetworkError, AdoRateLimitError, AdoTimeoutError
+from .hedging import Hedger
+from .http_cache import ValidatorCache, ValidatorEntry
 from .lookups import AdoLookups
 from .models import Project
-from .pipelines import BuildOperations, LogOperations, PipelineOperations
+from .pipelines import (
+    BuildOperations,
+    LogOperations,
+    PipelineOperations,
+    RunStatusPoller,
+    TimelineTracker,
+)
+from .rate_limiter import rate_limiters
 from .retry import RetryManager
+from .single_flight import single_flight
 from .telemetry import get_telemetry_manager, initialize_telemetry
 
 logger = logging.getLogger(__name__)
 tracer = trace.get_tracer(__name__)
 
+# Pending session closes; the event loop only holds weak references to tasks
+_closing_tasks: set[asyncio.Task] = set()
+
+
+def _close_task_done(task: asyncio.Task) -> None:
+    _closing_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.debug(f"Could not close async connection pool session: {task.exception()}")
+
 
 class AdoClient:
     """
@@ -67,9 +94,34 @@ class AdoClient:
         # Initialize retry manager
         self.retry_manager = RetryManager(self.config.retry)
 
+        # Circuit breakers per endpoint, so one failing endpoint doesn't block the others
+        self.circuit_breakers = CircuitBreakerRegistry(
+            self.config.circuit_breaker, name=self.organization_url
+        )
+
+        # Duplicates slow idempotent reads once they pass their endpoint's p95 (opt-in)
+        self.hedger = Hedger(self.config.hedging)
+
+        # Paces requests to this organization, shared with its other clients
+        self.rate_limiter = rate_limiters.get(self.organization_url, self.config.rate_limit)
+
         # Initialize connection pooling session if enabled
         self.session = self._create_session() if self.config.connection_pool.enabled else requests
 
+        # Async sessions are created lazily, one per event loop they are used from
+        self._async_sessions: dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+        self._async_sessions_lock = threading.Lock()
+
+        # ETag/Last-Modified validators for conditional GET revalidation
+        self.validator_cache = ValidatorCache(self.config.validator_cache.max_entries)
+
+        # Persistent second tier for the shared lookup cache, scoped to this organization
+        if self.config.persistent_cache.enabled:
+            self._attach_persistent_cache()
+
+        # Last timeline seen per run, so later fetches only request changed records
+        self.timeline_tracker = TimelineTracker(self.config.timeline_tracker.max_runs)
+
         # Generate correlation ID for this client instance
         self.correlation_id = str(uuid.uuid4())
 
@@ -77,9 +129,10 @@ class AdoClient:
         self.auth_manager = AuthManager(self.config.auth)
         self.auth_manager.setup_default_providers(pat)
 
-        # Get authentication headers
+        # Fetch the first credential; later ones are refreshed in the background
+        self._pinned_headers: dict[str, str] | None = None
         try:
-            self.headers = self.auth_manager.get_auth_headers()
+            self.auth_manager.get_credential()
             self.auth_method = self._get_compatible_auth_method()
         except AdoAuthenticationError as e:
             if self.telemetry:
@@ -102,10 +155,30 @@ class AdoClient:
         self._logs = LogOperations(self)
         self._lookups = AdoLookups(self)
 
+        # Shared poller for runs being waited on; its thread starts on first use
+        self.run_poller = RunStatusPoller(self, self.config.run_poller)
+
         logger.info(
             f"AdoClient initialized with connection_pool_enabled={self.config.connection_pool.enabled}"
         )
 
+    @property
+    def headers(self) -> dict[str, str]:
+        """
+        Current authentication headers.
+
+        Read on every request attempt, so requests pick up credentials the
+        auth manager refreshes in the background. Do not modify in place.
+        """
+        if self._pinned_headers is not None:
+            return self._pinned_headers
+        return self.auth_manager.get_auth_headers()
+
+    @headers.setter
+    def headers(self, headers: dict[str, str]) -> None:
+        """Pin explicit headers instead of the auth manager's."""
+        self._pinned_headers = headers
+
     def _get_compatible_auth_method(self) -> str:
         """Get authentication method name compatible with existing tests."""
         actual_method = self.auth_manager.get_auth_method()
@@ -149,17 +222,145 @@ class AdoClient:
 
         return session
 
+    def _create_async_session(self) -> httpx.AsyncClient:
+        """
+        Create an httpx async client sharing the connection pool configuration.
+
+        Returns:
+            httpx.AsyncClient: Configured async client with pooling
+        """
+        pool_config = self.config.connection_pool
+        limits = httpx.Limits(
+            max_connections=pool_config.max_pool_size,
+            max_keepalive_connections=(
+                pool_config.max_pool_connections if pool_config.enabled else 0
+            ),
+        )
+        timeout = httpx.Timeout(self.config.request_timeout_seconds, pool=pool_config.pool_timeout)
+
+        logger.info(
+            f"Async connection pool configured: max_connections={pool_config.max_pool_size}, "
+            f"max_keepalive={limits.max_keepalive_connections}"
+        )
+
+        return httpx.AsyncClient(limits=limits, timeout=timeout, follow_redirects=True)
+
+    def _attach_persistent_cache(self) -> None:
+        """Attach the SQLite cache tier to the shared cache, reusing an open store."""
+        # Imported here since client_pool builds on this module
+        from .client_pool import normalize_organization_url
+
+        path = self.config.persistent_cache.path or default_cache_path()
+        store = ado_cache._store
+        try:
+            if store is None or store.path != path:
+                store = SqliteCacheStore(path, self.config.persistent_cache.busy_timeout_seconds)
+            ado_cache.attach_store(
+                store, namespace=normalize_organization_url(self.organization_url)
+            )
+        except Exception as e:
+            # The persistent tier is an optimization; run without it rather than fail
+            logger.warning(f"Could not open persistent cache at {path}: {e}")
+
+    def _get_async_session(self) -> httpx.AsyncClient:
+        """
+        Get the async client for the running event loop, creating it if needed.
+
+        httpx connections are bound to the loop that opened them, so each loop gets
+        its own client. Clients of loops that have since closed are dropped: their
+        connections can no longer be used or closed through the loop.
+
+        Returns:
+            httpx.AsyncClient: Async client bound to the running loop
+        """
+        loop = asyncio.get_running_loop()
+        with self._async_sessions_lock:
+            for closed_loop in [other for other in self._async_sessions if other.is_closed()]:
+                del self._async_sessions[closed_loop]
+            session = self._async_sessions.get(loop)
+            if session is None or session.is_closed:
+                session = self._create_async_session()
+                self._async_sessions[loop] = session
+        return session
+
+    def _take_async_sessions(self) -> dict[asyncio.AbstractEventLoop, httpx.AsyncClient]:
+        """Remove and return the async clients that are still open."""
+        lock = getattr(self, "_async_sessions_lock", None)
+        if lock is None:
+            return {}
+        with lock:
+            sessions, self._async_sessions = self._async_sessions, {}
+        return {loop: session for loop, session in sessions.items() if not session.is_closed}
+
+    @staticmethod
+    def _close_async_session_on(loop: asyncio.AbstractEventLoop, session: httpx.AsyncClient):
+        """
+        Close an async client on the loop that owns its connections.
+
+        Args:
+            loop: Event loop the client was used from
+            session: Async client to close
+        """
+        if loop.is_closed():
+            return
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        try:
+            if loop is running_loop:
+                task = loop.create_task(session.aclose())
+                _closing_tasks.add(task)
+                task.add_done_callback(_close_task_done)
+            elif loop.is_running():
+                asyncio.run_coroutine_threadsafe(session.aclose(), loop)
+            else:
+                loop.run_until_complete(session.aclose())
+        except RuntimeError as e:
+            logger.debug(f"Could not close async connection pool session: {e}")
+
     def close(self):
         """
-        Close the connection pool session if it exists.
+        Close the connection pool sessions if they exist.
 
         This method should be called when the client is no longer needed
         to properly clean up connection pool resources.
         """
+        run_poller = getattr(self, "run_poller", None)
+        if run_poller is not None:
+            run_poller.close()
+
+        hedger = getattr(self, "hedger", None)
+        if hedger is not None:
+            hedger.close()
+
+        auth_manager = getattr(self, "auth_manager", None)
+        if auth_manager is not None:
+            auth_manager.close()
+
+        for loop, async_session in self._take_async_sessions().items():
+            logger.info("Closing async connection pool session")
+            self._close_async_session_on(loop, async_session)
+
         if hasattr(self, "session") and self.session != requests and hasattr(self.session, "close"):
             logger.info("Closing connection pool session")
             self.session.close()
 
+    async def aclose(self):
+        """
+        Close both the async and the sync connection pools.
+
+        Use this instead of close() when the client was used from an event loop.
+        """
+        running_loop = asyncio.get_running_loop()
+        for loop, async_session in self._take_async_sessions().items():
+            logger.info("Closing async connection pool session")
+            if loop is running_loop:
+                await async_session.aclose()
+            else:
+                self._close_async_session_on(loop, async_session)
+        self.close()
+
     def __enter__(self):
         """Context manager entry."""
         return self
@@ -292,7 +493,8 @@ class AdoClient:
         """Refresh authentication credentials."""
         try:
             self.auth_manager.invalidate_cache()
-            self.headers = self.auth_manager.get_auth_headers()
+            self._pinned_headers = None
+            self.auth_manager.get_credential()
             self.auth_method = self._get_compatible_auth_method()
 
             if self.telemetry:
@@ -305,7 +507,7 @@ class AdoClient:
                 self.telemetry.record_auth_attempt("none", False)
             raise e
 
-    def _validate_response(self, response: requests.Response) -> None:
+    def _validate_response(self, response: requests.Response | httpx.Response) -> None:
         """
         Check if the response indicates an authentication failure.
 
@@ -314,7 +516,7 @@ class AdoClient:
         2. Anonymous user response for connectionData endpoint
 
         Args:
-            response (requests.Response): The HTTP response object.
+            response (requests.Response | httpx.Response): The HTTP response object.
 
         Raises:
             AdoAuthenticationError: If the response indicates authentication failure.
@@ -337,7 +539,7 @@ class AdoClient:
             )
 
         # Check for anonymous user in connectionData response (specific to auth check)
-        if response.url and "connectionData" in response.url:
+        if response.url and "connectionData" in str(response.url):
             try:
                 data = response.json()
                 authenticated_user = data.get("authenticatedUser", {})
@@ -372,21 +574,33 @@ class AdoClient:
             method (str): The HTTP method (e.g., 'GET', 'POST').
             url (str): The full URL for the API endpoint.
             **kwargs: Additional keyword arguments to pass to `requests.request`.
+                Any ``headers`` given are merged over the authentication headers.
+                Pass ``idempotent=True`` to make a non-GET request (e.g. a WIQL
+                query) eligible for hedging.
 
         Returns:
             dict or None: The parsed JSON response from the API, or None if the
             response has no content.
 
+        Each attempt's timeout is capped at the time left before the current
+        deadline (see ado.deadline), and retries stop once it would be overrun.
+        Attempts go through the endpoint's circuit breaker (see ado.circuit_breaker).
+
         Raises:
             AdoRateLimitError: For rate limiting (429) errors.
             AdoNetworkError: For network-related errors.
-            AdoTimeoutError: For timeout errors.
+            AdoTimeoutError: For timeout errors, or when the deadline has passed.
+            AdoCircuitOpenError: If the endpoint's circuit breaker is open.
             requests.exceptions.HTTPError: For other HTTP-related errors.
         """
         # Set up request with timeout
         kwargs.setdefault("timeout", self.config.request_timeout_seconds)
+        extra_headers = kwargs.pop("headers", None)
+        idempotent = kwargs.pop("idempotent", False)
 
         @self.retry_manager.retry_on_failure
+        @self.circuit_breakers.for_request(method, url).protect
+        @self.hedger.hedge(method, url, idempotent)
         def make_request():
             try:
                 # Use session for connection pooling if enabled, otherwise fall back to requests
@@ -395,31 +609,34 @@ class AdoClient:
                     if hasattr(self, "session") and self.session != requests
                     else requests.request
                 )
-                response = request_func(method, url, headers=self.headers, **kwargs)
+                # Read per attempt, so retries use a credential refreshed meanwhile
+                headers = self._merge_headers(extra_headers)
+                request_headers, validator_key, validator_entry = self._conditional_request(
+                    method, url, kwargs.get("params"), headers, extra_headers
+                )
+                timeout = request_timeout(kwargs["timeout"], f"{method} {url}")
+                with self.rate_limiter.acquire(f"{method} {url}"):
+                    response = request_func(
+                        method, url, headers=request_headers, **{**kwargs, "timeout": timeout}
+                    )
+                self.rate_limiter.observe(response.status_code, response.headers)
+
+                # Reuse the stored body if the resource has not changed
+                if response.status_code == 304 and validator_entry is not None:
+                    self.validator_cache.record_revalidation(validator_key)
+                    return copy.deepcopy(validator_entry.body)
+
                 self._validate_response(response)
 
                 # Handle rate limiting
                 if response.status_code == 429:
-                    retry_after = response.headers.get("Retry-After")
-                    if retry_after:
-                        try:
-                            retry_after = int(retry_after)
-                        except ValueError:
-                            retry_after = None
-
-                    raise AdoRateLimitError(
-                        f"Rate limit exceeded for {method} {url}",
-                        retry_after=retry_after,
-                        context={
-                            "correlation_id": self.correlation_id,
-                            "method": method,
-                            "url": url,
-                            "status_code": response.status_code,
-                        },
-                    )
+                    raise self._rate_limit_error(method, url, response)
 
                 response.raise_for_status()
-                return response.json() if response.content else None
+                data = response.json() if response.content else None
+                if validator_key is not None:
+                    self.validator_cache.store(validator_key, response.headers, data)
+                return data
 
             except requests.exceptions.HTTPError as e:
                 # Log HTTP errors with detailed response information
@@ -476,8 +693,197 @@ class AdoClient:
                     original_exception=e,
                 ) from e
 
+        coalescing_key = self._coalescing_key(method, url, kwargs.get("params"), extra_headers)
+        if coalescing_key is not None:
+            return single_flight.do(coalescing_key, make_request)
         return make_request()
 
+    def _conditional_request(
+        self,
+        method: str,
+        url: str,
+        params: Any,
+        headers: dict[str, str],
+        extra_headers: dict[str, str] | None,
+    ) -> tuple[dict[str, str], Any, ValidatorEntry | None]:
+        """
+        Add conditional headers to a GET when validators are stored for it.
+
+        Returns:
+            tuple: (headers to send, validator cache key or None if the request
+            is not cacheable, stored entry or None)
+        """
+        if not self.config.validator_cache.enabled or method.upper() != "GET":
+            return headers, None, None
+
+        # Leave requests alone when the caller manages validators itself
+        if extra_headers and any(
+            name.lower() in ("if-none-match", "if-modified-since") for name in extra_headers
+        ):
+            return headers, None, None
+
+        key = ValidatorCache.make_key(url, params)
+        entry = self.validator_cache.get(key)
+        if entry is None:
+            return headers, key, None
+        return {**headers, **entry.conditional_headers()}, key, entry
+
+    def _coalescing_key(
+        self, method: str, url: str, params: Any, extra_headers: dict[str, str] | None
+    ):
+        """
+        Get the single-flight key for a request, or None if it must not be coalesced.
+
+        Only GET requests are coalesced, since they are idempotent and concurrent
+        identical calls can safely share one upstream response.
+        """
+        if not self.config.request_coalescing_enabled or method.upper() != "GET":
+            return None
+        return single_flight.make_key(
+            method,
+            url,
+            params=params,
+            organization_url=self.organization_url,
+            headers=extra_headers,
+        )
+
+    def _merge_headers(self, extra_headers: dict[str, str] | None) -> dict[str, str]:
+        """Merge per-request headers over the client's authentication headers."""
+        if not extra_headers:
+            return self.headers
+        return {**self.headers, **extra_headers}
+
+    def _rate_limit_error(
+        self, method: str, url: str, response: requests.Response | httpx.Response
+    ) -> AdoRateLimitError:
+        """Build an AdoRateLimitError from a 429 response, honoring Retry-After."""
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                retry_after = int(retry_after)
+            except ValueError:
+                retry_after = None
+
+        return AdoRateLimitError(
+            f"Rate limit exceeded for {method} {url}",
+            retry_after=retry_after,
+            context={
+                "correlation_id": self.correlation_id,
+                "method": method,
+                "url": url,
+                "status_code": response.status_code,
+            },
+        )
+
+    async def _send_request_async(self, method: str, url: str, **kwargs) -> dict[str, Any]:
+        """
+        Send an authenticated request to the Azure DevOps API without blocking the event loop.
+
+        This is the async counterpart of `_send_request`. It uses a pooled httpx
+        async client and the same authentication, response validation, rate limit
+        handling and retry policy, with backoff awaited instead of slept.
+
+        Args:
+            method (str): The HTTP method (e.g., 'GET', 'POST').
+            url (str): The full URL for the API endpoint.
+            **kwargs: Additional keyword arguments to pass to `httpx.AsyncClient.request`.
+                Any ``headers`` given are merged over the authentication headers.
+                Pass ``idempotent=True`` to make a non-GET request (e.g. a WIQL
+                query) eligible for hedging.
+
+        Returns:
+            dict or None: The parsed JSON response from the API, or None if the
+            response has no content.
+
+        Raises:
+            AdoRateLimitError: For rate limiting (429) errors.
+            AdoNetworkError: For network-related and server (5xx) errors.
+            AdoTimeoutError: For timeout errors.
+            httpx.HTTPStatusError: For other (4xx) HTTP errors.
+        """
+        kwargs.setdefault("timeout", self.config.request_timeout_seconds)
+        extra_headers = kwargs.pop("headers", None)
+        idempotent = kwargs.pop("idempotent", False)
+
+        @self.retry_manager.async_retry_on_failure
+        @self.circuit_breakers.for_request(method, url).protect
+        @self.hedger.hedge(method, url, idempotent)
+        async def make_request():
+            session = self._get_async_session()
+            headers = self._merge_headers(extra_headers)
+            request_headers, validator_key, validator_entry = self._conditional_request(
+                method, url, kwargs.get("params"), headers, extra_headers
+            )
+            timeout = request_timeout(kwargs["timeout"], f"{method} {url}")
+            try:
+                async with self.rate_limiter.acquire_async(f"{method} {url}"):
+                    response = await session.request(
+                        method, url, headers=request_headers, **{**kwargs, "timeout": timeout}
+                    )
+            except httpx.TimeoutException as e:
+                raise AdoTimeoutError(
+                    f"Request timeout for {method} {url}",
+                    timeout_seconds=self.config.request_timeout_seconds,
+                    context={
+                        "correlation_id": self.correlation_id,
+                        "method": method,
+                        "url": url,
+                    },
+                    original_exception=e,
+                ) from e
+            except httpx.HTTPError as e:
+                raise AdoNetworkError(
+                    f"Network error for {method} {url}: {str(e)}",
+                    context={
+                        "correlation_id": self.correlation_id,
+                        "method": method,
+                        "url": url,
+                        "error_type": type(e).__name__,
+                    },
+                    original_exception=e,
+                ) from e
+            self.rate_limiter.observe(response.status_code, response.headers)
+
+            # Reuse the stored body if the resource has not changed
+            if response.status_code == 304 and validator_entry is not None:
+                self.validator_cache.record_revalidation(validator_key)
+                return copy.deepcopy(validator_entry.body)
+
+            self._validate_response(response)
+
+            if response.status_code == 429:
+                raise self._rate_limit_error(method, url, response)
+
+            try:
+                response.raise_for_status()
+            except httpx.HTTPStatusError as e:
+                logger.error(
+                    f"HTTP Error: {e} - Status: {response.status_code} - "
+                    f"Response Body: {response.text[:500]}"
+                )
+                if response.status_code >= 500:
+                    raise AdoNetworkError(
+                        f"Server error for {method} {url}: {response.status_code}",
+                        context={
+                            "correlation_id": self.correlation_id,
+                            "method": method,
+                            "url": url,
+                            "status_code": response.status_code,
+                        },
+                        original_exception=e,
+                    ) from e
+                raise
+
+            data = response.json() if response.content else None
+            if validator_key is not None:
+                self.validator_cache.store(validator_key, response.headers, data)
+            return data
+
+        coalescing_key = self._coalescing_key(method, url, kwargs.get("params"), extra_headers)
+        if coalescing_key is not None:
+            return await single_flight.do_async(coalescing_key, make_request)
+        return await make_request()
+
     def check_authentication(self) -> bool:
         """
         Verify that the provided credentials are valid.
@@ -571,6 +977,31 @@ class AdoClient:
         """Implementation of list_projects with span context."""
         logger.info("Fetching list of projects")
         response = self._send_request("GET", url)
+        return self._parse_projects(response, span)
+
+    async def list_projects_async(self) -> list[Project]:
+        """
+        Retrieve a list of projects in the organization without blocking the event loop.
+
+        Returns:
+            List[Project]: A list of Project objects.
+
+        Raises:
+            AdoNetworkError: For network-related errors.
+        """
+        operation_name = "list_projects"
+        url = f"{self.organization_url}/_apis/projects?api-version=7.1-preview.4"
+
+        with tracer.start_as_current_span(f"ado_{operation_name}") as span:
+            span.set_attribute("ado.operation", operation_name)
+            span.set_attribute("ado.organization_url", self.organization_url)
+            span.set_attribute("correlation_id", self.correlation_id)
+            logger.info("Fetching list of projects")
+            response = await self._send_request_async("GET", url)
+            return self._parse_projects(response, span)
+
+    def _parse_projects(self, response: dict[str, Any], span) -> list[Project]:
+        """Parse a projects API response into Project models."""
         projects_data = response.get("value", [])
 
         span.set_attribute("ado.projects_count", len(projects_data))
@@ -622,6 +1053,10 @@ class AdoClient:
         """List pipelines for a project."""
         return self._pipelines.list_pipelines(project_id)
 
+    async def list_pipelines_async(self, project_id: str):
+        """List pipelines for a project without blocking the event loop."""
+        return await self._pipelines.list_pipelines_async(project_id)
+
     def create_pipeline(self, project_id: str, request):
         """Create a new pipeline."""
         return self._pipelines.create_pipeline(project_id, request)
@@ -634,30 +1069,50 @@ class AdoClient:
         """Get pipeline details."""
         return self._pipelines.get_pipeline(project_id, pipeline_id)
 
+    async def get_pipeline_async(self, project_id: str, pipeline_id: int):
+        """Get pipeline details without blocking the event loop."""
+        return await self._pipelines.get_pipeline_async(project_id, pipeline_id)
+
     def preview_pipeline(self, project_id: str, pipeline_id: int, request=None):
         """Preview a pipeline."""
         return self._pipelines.preview_pipeline(project_id, pipeline_id, request)
 
+    async def preview_pipeline_async(self, project_id: str, pipeline_id: int, request=None):
+        """Preview a pipeline without blocking the event loop."""
+        return await self._pipelines.preview_pipeline_async(project_id, pipeline_id, request)
+
     # Build Operations
     def run_pipeline(self, project_id: str, pipeline_id: int, request=None):
         """Run a pipeline."""
         return self._builds.run_pipeline(project_id, pipeline_id, request)
 
+    async def run_pipeline_async(self, project_id: str, pipeline_id: int, request=None):
+        """Run a pipeline without blocking the event loop."""
+        return await self._builds.run_pipeline_async(project_id, pipeline_id, request)
+
     def get_pipeline_run(self, project_id: str, pipeline_id: int, run_id: int):
         """Get pipeline run details."""
         return self._builds.get_pipeline_run(project_id, pipeline_id, run_id)
 
+    async def get_pipeline_run_async(self, project_id: str, pipeline_id: int, run_id: int):
+        """Get pipeline run details without blocking the event loop."""
+        return await self._builds.get_pipeline_run_async(project_id, pipeline_id, run_id)
+
     def get_build_by_id(self, project_id: str, build_id: int):
         """Get build details by ID."""
         return self._builds.get_build_by_id(project_id, build_id)
 
+    async def get_build_by_id_async(self, project_id: str, build_id: int):
+        """Get build details by ID without blocking the event loop."""
+        return await self._builds.get_build_by_id_async(project_id, build_id)
+
     def wait_for_pipeline_completion(
         self,
         project_id: str,
         pipeline_id: int,
         run_id: int,
         timeout_seconds: int = 300,
-        poll_interval_seconds: int = 10,
+        poll_interval_seconds: int | None = None,
     ):
         """Wait for pipeline completion."""
         return self._builds.wait_for_pipeline_completion(
@@ -677,6 +1132,19 @@ class AdoClient:
             project_id, pipeline_id, run_id, timeout_seconds, max_lines
         )
 
+    async def watch_pipeline_async(
+        self,
+        project_id: str,
+        pipeline_id: int,
+        run_id: int,
+        timeout_seconds: int = 300,
+        max_lines: int = 100,
+    ):
+        """Watch an already running pipeline without blocking the event loop."""
+        return await self._builds.watch_pipeline_async(
+            project_id, pipeline_id, run_id, timeout_seconds, max_lines
+        )
+
     def extract_pipeline_run_data(self, project_id: str, pipeline_id: int, run_id: int):
         """Extract resources, variables, and parameters from pipeline run."""
         return self._builds.extract_pipeline_run_data(project_id, pipeline_id, run_id)
@@ -694,27 +1162,78 @@ class AdoClient:
             project_id, pipeline_id, request, timeout_seconds, max_lines
         )
 
+    async def run_pipeline_and_get_outcome_async(
+        self,
+        project_id: str,
+        pipeline_id: int,
+        request=None,
+        timeout_seconds: int = 300,
+        max_lines: int = 100,
+    ):
+        """Run pipeline and get complete outcome without blocking the event loop."""
+        return await self._builds.run_pipeline_and_get_outcome_async(
+            project_id, pipeline_id, request, timeout_seconds, max_lines
+        )
+
     # Log Operations
     def list_pipeline_logs(self, project_id: str, pipeline_id: int, run_id: int):
         """List pipeline logs."""
         return self._logs.list_pipeline_logs(project_id, pipeline_id, run_id)
 
+    async def list_pipeline_logs_async(self, project_id: str, pipeline_id: int, run_id: int):
+        """List pipeline logs without blocking the event loop."""
+        return await self._logs.list_pipeline_logs_async(project_id, pipeline_id, run_id)
+
     def get_log_content_by_id(
         self, project_id: str, pipeline_id: int, run_id: int, log_id: int, max_lines: int = 100
     ):
         """Get log content by ID."""
         return self._logs.get_log_content_by_id(project_id, pipeline_id, run_id, log_id, max_lines)
 
+    def get_log_tail_by_id(
+        self, project_id: str, pipeline_id: int, run_id: int, log_id: int, max_lines: int = 100
+    ):
+        """Get the tail of a log with byte and line counts."""
+        return self._logs.get_log_tail_by_id(project_id, pipeline_id, run_id, log_id, max_lines)
+
+    async def get_log_tail_by_id_async(
+        self, project_id: str, pipeline_id: int, run_id: int, log_id: int, max_lines: int = 100
+    ):
+        """Get the tail of a log with byte and line counts without blocking the event loop."""
+        return await self._logs.get_log_tail_by_id_async(
+            project_id, pipeline_id, run_id, log_id, max_lines
+        )
+
+    async def get_log_content_by_id_async(
+        self, project_id: str, pipeline_id: int, run_id: int, log_id: int, max_lines: int = 100
+    ):
+        """Get log content by ID without blocking the event loop."""
+        return await self._logs.get_log_content_by_id_async(
+            project_id, pipeline_id, run_id, log_id, max_lines
+        )
+
     def get_pipeline_timeline(self, project_id: str, pipeline_id: int, run_id: int):
         """Get pipeline timeline."""
         return self._logs.get_pipeline_timeline(project_id, pipeline_id, run_id)
 
+    async def get_pipeline_timeline_async(self, project_id: str, pipeline_id: int, run_id: int):
+        """Get pipeline timeline without blocking the event loop."""
+        return await self._logs.get_pipeline_timeline_async(project_id, pipeline_id, run_id)
+
     def get_pipeline_failure_summary(
         self, project_id: str, pipeline_id: int, run_id: int, max_lines: int = 100
     ):
         """Get pipeline failure summary."""
         return self._logs.get_pipeline_failure_summary(project_id, pipeline_id, run_id, max_lines)
 
+    async def get_pipeline_failure_summary_async(
+        self, project_id: str, pipeline_id: int, run_id: int, max_lines: int = 100
+    ):
+        """Get pipeline failure summary without blocking the event loop."""
+        return await self._logs.get_pipeline_failure_summary_async(
+            project_id, pipeline_id, run_id, max_lines
+        )
+
     def get_failed_step_logs(
         self, project_id: str, pipeline_id: int, run_id: int, step_name=None, max_lines: int = 100
     ):
@@ -723,6 +1242,14 @@ class AdoClient:
             project_id, pipeline_id, run_id, step_name, max_lines
         )
 
+    async def get_failed_step_logs_async(
+        self, project_id: str, pipeline_id: int, run_id: int, step_name=None, max_lines: int = 100
+    ):
+        """Get failed step logs without blocking the event loop."""
+        return await self._logs.get_failed_step_logs_async(
+            project_id, pipeline_id, run_id, step_name, max_lines
+        )
+
     # Name-based lookup operations
     def find_project_by_name(self, name: str):
         """Find project by name with fuzzy matching."""
@@ -736,6 +1263,10 @@ class AdoClient:
         """Run pipeline by project and pipeline names."""
         return self._lookups.run_pipeline_by_name(project_name, pipeline_name, request)
 
+    async def run_pipeline_by_name_async(self, project_name: str, pipeline_name: str, request=None):
+        """Run pipeline by names without blocking the event loop."""
+        return await self._lookups.run_pipeline_by_name_async(project_name, pipeline_name, request)
+
     def get_pipeline_failure_summary_by_name(
         self, project_name: str, pipeline_name: str, run_id: int, max_lines: int = 100
     ):
@@ -744,6 +1275,14 @@ class AdoClient:
             project_name, pipeline_name, run_id, max_lines
         )
 
+    async def get_pipeline_failure_summary_by_name_async(
+        self, project_name: str, pipeline_name: str, run_id: int, max_lines: int = 100
+    ):
+        """Get pipeline failure summary by names without blocking the event loop."""
+        return await self._lookups.get_pipeline_failure_summary_by_name_async(
+            project_name, pipeline_name, run_id, max_lines
+        )
+
     def run_pipeline_and_get_outcome_by_name(
         self,
         project_name: str,
@@ -757,6 +1296,19 @@ class AdoClient:
             project_name, pipeline_name, request, timeout_seconds, max_lines
         )
 
+    async def run_pipeline_and_get_outcome_by_name_async(
+        self,
+        project_name: str,
+        pipeline_name: str,
+        request=None,
+        timeout_seconds: int = 300,
+        max_lines: int = 100,
+    ):
+        """Run pipeline by name and get outcome without blocking the event loop."""
+        return await self._lookups.run_pipeline_and_get_outcome_by_name_async(
+            project_name, pipeline_name, request, timeout_seconds, max_lines
+        )
+
     def watch_pipeline_by_name(
         self,
         project_name: str,
@@ -770,6 +1322,19 @@ class AdoClient:
             project_name, pipeline_name, run_id, timeout_seconds, max_lines
         )
 
+    async def watch_pipeline_by_name_async(
+        self,
+        project_name: str,
+        pipeline_name: str,
+        run_id: int,
+        timeout_seconds: int = 300,
+        max_lines: int = 100,
+    ):
+        """Watch pipeline run by name without blocking the event loop."""
+        return await self._lookups.watch_pipeline_by_name_async(
+            project_name, pipeline_name, run_id, timeout_seconds, max_lines
+        )
+
     def extract_pipeline_run_data_by_name(self, project_name: str, pipeline_name: str, run_id: int):
         """Extract resources, variables, and parameters from pipeline run using names."""
         return self._lookups.extract_pipeline_run_data_by_name(project_name, pipeline_name, run_id)
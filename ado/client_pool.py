@@ -0,0 +1,150 @@
+"""
+Pool of Azure DevOps clients, one per organization.
+
+Agents switch between a handful of organizations. Building an AdoClient for
+every switch means a new authentication check and new connection pools, so
+the server keeps recently used clients, each with its own sessions and
+credentials, in an LRU-bounded pool. Switching back to a pooled organization
+is instant.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+
+from opentelemetry import metrics
+
+from .client import AdoClient
+from .errors import AdoConfigurationError
+
+logger = logging.getLogger(__name__)
+meter = metrics.get_meter(__name__)
+
+
+def normalize_organization_url(organization_url: str) -> str:
+    """Normalize an organization URL so equivalent spellings share a pool entry."""
+    return organization_url.strip().rstrip("/")
+
+
+class AdoClientPool:
+    """
+    Thread-safe, LRU-bounded pool of clients keyed by organization URL.
+
+    Args:
+        client_factory: Creates (and authenticates) the client for an
+            organization URL. Exceptions it raises propagate from get().
+        max_clients: Number of clients kept. The least recently used client is
+            closed when another organization's client is added.
+    """
+
+    def __init__(self, client_factory: Callable[[str], AdoClient], max_clients: int = 4):
+        if max_clients <= 0:
+            raise AdoConfigurationError(
+                "max_clients must be positive", context={"max_clients": max_clients}
+            )
+        self.client_factory = client_factory
+        self.max_clients = max_clients
+        self._clients: OrderedDict[str, AdoClient] = OrderedDict()
+        self._lock = threading.Lock()
+        # One lock per organization so concurrent first uses build a single client
+        self._creation_locks: dict[str, threading.Lock] = {}
+
+        self._lookup_counter = meter.create_counter(
+            name="ado_client_pool_lookups",
+            description="Number of client pool lookups by outcome",
+            unit="1",
+        )
+
+    def get(self, organization_url: str) -> AdoClient:
+        """
+        Get the client for an organization, creating it if it isn't pooled.
+
+        Args:
+            organization_url: The organization URL.
+
+        Returns:
+            AdoClient: The pooled client.
+
+        Raises:
+            Whatever client_factory raises if the client can't be created; the
+            pool is left unchanged.
+        """
+        key = normalize_organization_url(organization_url)
+        client = self._get_pooled(key)
+        if client is not None:
+            return client
+
+        with self._lock:
+            creation_lock = self._creation_locks.setdefault(key, threading.Lock())
+        with creation_lock:
+            client = self._get_pooled(key)
+            if client is not None:
+                return client
+
+            self._lookup_counter.add(1, {"outcome": "created"})
+            client = self.client_factory(organization_url)
+            self._add(key, client)
+            return client
+
+    def _get_pooled(self, key: str) -> AdoClient | None:
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                self._clients.move_to_end(key)
+        if client is not None:
+            self._lookup_counter.add(1, {"outcome": "hit"})
+            logger.debug(f"Reusing pooled client for {key}")
+        return client
+
+    def _add(self, key: str, client: AdoClient) -> None:
+        with self._lock:
+            self._clients[key] = client
+            self._clients.move_to_end(key)
+            evicted = []
+            while len(self._clients) > self.max_clients:
+                evicted.append(self._clients.popitem(last=False))
+            for evicted_key, _ in evicted:
+                self._creation_locks.pop(evicted_key, None)
+
+        for evicted_key, evicted_client in evicted:
+            logger.info(f"Closing least recently used client for {evicted_key}")
+            self._close_client(evicted_client)
+
+    def remove(self, organization_url: str) -> None:
+        """Close and remove an organization's client, e.g. after its credentials are revoked."""
+        key = normalize_organization_url(organization_url)
+        with self._lock:
+            client = self._clients.pop(key, None)
+            self._creation_locks.pop(key, None)
+        if client is not None:
+            self._close_client(client)
+
+    def organizations(self) -> list[str]:
+        """Pooled organization URLs, least recently used first."""
+        with self._lock:
+            return list(self._clients)
+
+    def close(self) -> None:
+        """Close and remove all pooled clients."""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+            self._creation_locks.clear()
+        for client in clients:
+            self._close_client(client)
+
+    @staticmethod
+    def _close_client(client: AdoClient) -> None:
+        try:
+            client.close()
+        except Exception as e:
+            logger.warning(f"Error closing pooled client: {e}")
+
+    def __contains__(self, organization_url: str) -> bool:
+        with self._lock:
+            return normalize_organization_url(organization_url) in self._clients
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._clients)
@@ -23,6 +23,7 @@ class RetryConfig:
     max_delay: float = 60.0
     backoff_multiplier: float = 2.0
     jitter: bool = True
+    use_retry_budget: bool = True  # Draw retries from the process-wide retry budget
 
     def __post_init__(self):
         """Validate retry configuration values."""
@@ -56,6 +57,10 @@ class AuthConfig:
     enable_cli_fallback: bool = True
     enable_interactive_fallback: bool = False
     cache_ttl_seconds: int = 3600
+    background_refresh: bool = True
+    refresh_margin_seconds: int = 300
+    shared_token_cache: bool = True
+    token_cache_path: str | None = None  # Defaults to $XDG_CACHE_HOME/ado-mcp/tokens.json
 
     def __post_init__(self):
         """Validate authentication configuration values."""
@@ -71,6 +76,12 @@ class AuthConfig:
                 context={"cache_ttl_seconds": self.cache_ttl_seconds},
             )
 
+        if self.refresh_margin_seconds < 0:
+            raise AdoConfigurationError(
+                "refresh_margin_seconds must be non-negative",
+                context={"refresh_margin_seconds": self.refresh_margin_seconds},
+            )
+
 
 @dataclass
 class ConnectionPoolConfig:
@@ -101,6 +112,258 @@ class ConnectionPoolConfig:
             )
 
 
+@dataclass
+class ValidatorCacheConfig:
+    """Configuration for the ETag/Last-Modified conditional request cache."""
+
+    enabled: bool = True
+    max_entries: int = 500
+
+    def __post_init__(self):
+        """Validate validator cache configuration values."""
+        if self.max_entries <= 0:
+            raise AdoConfigurationError(
+                "max_entries must be positive", context={"max_entries": self.max_entries}
+            )
+
+
+@dataclass
+class LogFetchConfig:
+    """Configuration for fetching step logs in parallel for failure summaries."""
+
+    max_concurrency: int = 8
+    per_log_timeout_seconds: float = 30.0
+
+    def __post_init__(self):
+        """Validate log fetch configuration values."""
+        if self.max_concurrency <= 0:
+            raise AdoConfigurationError(
+                "max_concurrency must be positive",
+                context={"max_concurrency": self.max_concurrency},
+            )
+        if self.per_log_timeout_seconds <= 0:
+            raise AdoConfigurationError(
+                "per_log_timeout_seconds must be positive",
+                context={"per_log_timeout_seconds": self.per_log_timeout_seconds},
+            )
+
+
+@dataclass
+class WorkItemBulkConfig:
+    """Configuration for bulk work item fetches and per-item batch update/delete fallback."""
+
+    max_concurrency: int = 4
+
+    def __post_init__(self):
+        """Validate bulk fetch configuration values."""
+        if self.max_concurrency <= 0:
+            raise AdoConfigurationError(
+                "max_concurrency must be positive",
+                context={"max_concurrency": self.max_concurrency},
+            )
+
+
+@dataclass
+class QueryCursorConfig:
+    """Configuration for the snapshots behind cursor-paginated work item queries."""
+
+    ttl_seconds: float = 600.0  # Counted from the last page read
+
+    def __post_init__(self):
+        """Validate query cursor configuration values."""
+        if self.ttl_seconds <= 0:
+            raise AdoConfigurationError(
+                "ttl_seconds must be positive", context={"ttl_seconds": self.ttl_seconds}
+            )
+
+
+@dataclass
+class RunPollerConfig:
+    """Configuration for the shared run status poller used when waiting on runs."""
+
+    enabled: bool = True
+    min_interval_seconds: float = 2.0
+    max_interval_seconds: float = 30.0
+    fast_poll_window_seconds: float = 30.0
+    timeline_refresh_seconds: float = 120.0
+
+    def __post_init__(self):
+        """Validate run poller configuration values."""
+        if self.min_interval_seconds <= 0:
+            raise AdoConfigurationError(
+                "min_interval_seconds must be positive",
+                context={"min_interval_seconds": self.min_interval_seconds},
+            )
+        if self.max_interval_seconds < self.min_interval_seconds:
+            raise AdoConfigurationError(
+                "max_interval_seconds must be >= min_interval_seconds",
+                context={
+                    "min_interval_seconds": self.min_interval_seconds,
+                    "max_interval_seconds": self.max_interval_seconds,
+                },
+            )
+
+
+@dataclass
+class TimelineTrackerConfig:
+    """Configuration for incremental (changeId based) build timeline fetching."""
+
+    enabled: bool = True
+    max_runs: int = 200
+
+    def __post_init__(self):
+        """Validate timeline tracker configuration values."""
+        if self.max_runs <= 0:
+            raise AdoConfigurationError(
+                "max_runs must be positive", context={"max_runs": self.max_runs}
+            )
+
+
+@dataclass
+class PersistentCacheConfig:
+    """Configuration for the optional SQLite-backed persistent tier of AdoCache."""
+
+    enabled: bool = False
+    path: str | None = None  # Defaults to $XDG_CACHE_HOME/ado-mcp/cache.sqlite3
+    busy_timeout_seconds: float = 5.0
+
+    def __post_init__(self):
+        """Validate persistent cache configuration values."""
+        if self.busy_timeout_seconds <= 0:
+            raise AdoConfigurationError(
+                "busy_timeout_seconds must be positive",
+                context={"busy_timeout_seconds": self.busy_timeout_seconds},
+            )
+
+
+@dataclass
+class CacheWarmupConfig:
+    """Configuration for prefetching lookup data into the cache after start-up."""
+
+    enabled: bool = False
+    # Projects (names or IDs) whose pipelines and work item metadata are prefetched
+    projects: list[str] = field(default_factory=list)
+    max_workers: int = 2
+    work_item_metadata: bool = True
+
+    def __post_init__(self):
+        """Validate cache warm-up configuration values."""
+        if self.max_workers < 1:
+            raise AdoConfigurationError(
+                "max_workers must be at least 1", context={"max_workers": self.max_workers}
+            )
+
+
+@dataclass
+class RateLimitConfig:
+    """Configuration for the client-side adaptive rate limiter shared per organization."""
+
+    enabled: bool = True
+    requests_per_second: float = 20.0
+    min_requests_per_second: float = 0.5
+    burst: int = 40
+    initial_concurrency: int = 16
+    min_concurrency: int = 1
+    max_concurrency: int = 64
+    decrease_factor: float = 0.5
+    decrease_cooldown_seconds: float = 1.0
+    # Share of the concurrency window and token bucket background requests may use
+    background_share: float = 0.5
+
+    def __post_init__(self):
+        """Validate rate limit configuration values."""
+        if self.requests_per_second <= 0 or self.min_requests_per_second <= 0:
+            raise AdoConfigurationError(
+                "requests_per_second and min_requests_per_second must be positive",
+                context={
+                    "requests_per_second": self.requests_per_second,
+                    "min_requests_per_second": self.min_requests_per_second,
+                },
+            )
+        if self.burst < 1:
+            raise AdoConfigurationError("burst must be at least 1", context={"burst": self.burst})
+        if not 1 <= self.min_concurrency <= self.initial_concurrency <= self.max_concurrency:
+            raise AdoConfigurationError(
+                "concurrency limits must satisfy 1 <= min <= initial <= max",
+                context={
+                    "min_concurrency": self.min_concurrency,
+                    "initial_concurrency": self.initial_concurrency,
+                    "max_concurrency": self.max_concurrency,
+                },
+            )
+        if not 0 < self.decrease_factor < 1:
+            raise AdoConfigurationError(
+                "decrease_factor must be between 0 and 1",
+                context={"decrease_factor": self.decrease_factor},
+            )
+        if not 0 < self.background_share <= 1:
+            raise AdoConfigurationError(
+                "background_share must be greater than 0 and at most 1",
+                context={"background_share": self.background_share},
+            )
+
+
+@dataclass
+class CircuitBreakerConfig:
+    """Configuration for the per-endpoint circuit breakers."""
+
+    enabled: bool = True
+    failure_threshold: int = 5
+    open_seconds: float = 30.0
+    half_open_max_probes: int = 1
+
+    def __post_init__(self):
+        """Validate circuit breaker configuration values."""
+        if self.failure_threshold < 1:
+            raise AdoConfigurationError(
+                "failure_threshold must be at least 1",
+                context={"failure_threshold": self.failure_threshold},
+            )
+        if self.open_seconds <= 0:
+            raise AdoConfigurationError(
+                "open_seconds must be positive", context={"open_seconds": self.open_seconds}
+            )
+        if self.half_open_max_probes < 1:
+            raise AdoConfigurationError(
+                "half_open_max_probes must be at least 1",
+                context={"half_open_max_probes": self.half_open_max_probes},
+            )
+
+
+@dataclass
+class HedgingConfig:
+    """Configuration for hedged (duplicated after a delay) idempotent requests."""
+
+    enabled: bool = False
+    percentile: float = 95.0
+    min_samples: int = 20
+    window_size: int = 200
+    budget_ratio: float = 0.05
+    max_burst: float = 10.0
+    min_delay_seconds: float = 0.05
+    max_workers: int = 8  # Threads running hedge copies of synchronous requests
+
+    def __post_init__(self):
+        """Validate hedging configuration values."""
+        if not 0 < self.percentile < 100:
+            raise AdoConfigurationError(
+                "percentile must be between 0 and 100", context={"percentile": self.percentile}
+            )
+        if self.min_samples < 1 or self.window_size < self.min_samples:
+            raise AdoConfigurationError(
+                "min_samples must be at least 1 and no larger than window_size",
+                context={"min_samples": self.min_samples, "window_size": self.window_size},
+            )
+        if not 0 <= self.budget_ratio <= 1:
+            raise AdoConfigurationError(
+                "budget_ratio must be between 0 and 1", context={"budget_ratio": self.budget_ratio}
+            )
+        if self.max_workers < 1:
+            raise AdoConfigurationError(
+                "max_workers must be at least 1", context={"max_workers": self.max_workers}
+            )
+
+
 @dataclass
 class TelemetryConfig:
     """Configuration for telemetry and observability."""
@@ -138,9 +401,21 @@ class AdoMcpConfig:
     auth: AuthConfig = field(default_factory=AuthConfig)
     telemetry: TelemetryConfig = field(default_factory=TelemetryConfig)
     connection_pool: ConnectionPoolConfig = field(default_factory=ConnectionPoolConfig)
+    validator_cache: ValidatorCacheConfig = field(default_factory=ValidatorCacheConfig)
+    log_fetch: LogFetchConfig = field(default_factory=LogFetchConfig)
+    work_item_bulk: WorkItemBulkConfig = field(default_factory=WorkItemBulkConfig)
+    query_cursor: QueryCursorConfig = field(default_factory=QueryCursorConfig)
+    run_poller: RunPollerConfig = field(default_factory=RunPollerConfig)
+    timeline_tracker: TimelineTrackerConfig = field(default_factory=TimelineTrackerConfig)
+    persistent_cache: PersistentCacheConfig = field(default_factory=PersistentCacheConfig)
+    cache_warmup: CacheWarmupConfig = field(default_factory=CacheWarmupConfig)
+    rate_limit: RateLimitConfig = field(default_factory=RateLimitConfig)
+    circuit_breaker: CircuitBreakerConfig = field(default_factory=CircuitBreakerConfig)
+    hedging: HedgingConfig = field(default_factory=HedgingConfig)
 
     # Request settings
     request_timeout_seconds: int = 30
+    request_coalescing_enabled: bool = True
 
     def __post_init__(self):
         """Load configuration from environment variables and validate."""
@@ -158,6 +433,10 @@ class AdoMcpConfig:
             os.getenv("ADO_RETRY_BACKOFF_MULTIPLIER", self.retry.backoff_multiplier)
         )
         self.retry.jitter = os.getenv("ADO_RETRY_JITTER", "true").lower() == "true"
+        self.retry.use_retry_budget = (
+            os.getenv("ADO_RETRY_BUDGET_ENABLED", str(self.retry.use_retry_budget)).lower()
+            == "true"
+        )
 
         # Override auth config from environment
         self.auth.timeout_seconds = int(os.getenv("ADO_AUTH_TIMEOUT", self.auth.timeout_seconds))
@@ -168,6 +447,20 @@ class AdoMcpConfig:
         self.auth.cache_ttl_seconds = int(
             os.getenv("ADO_AUTH_CACHE_TTL", self.auth.cache_ttl_seconds)
         )
+        self.auth.background_refresh = (
+            os.getenv("ADO_AUTH_BACKGROUND_REFRESH", str(self.auth.background_refresh)).lower()
+            == "true"
+        )
+        self.auth.refresh_margin_seconds = int(
+            os.getenv("ADO_AUTH_REFRESH_MARGIN", self.auth.refresh_margin_seconds)
+        )
+        self.auth.shared_token_cache = (
+            os.getenv("ADO_AUTH_SHARED_TOKEN_CACHE", str(self.auth.shared_token_cache)).lower()
+            == "true"
+        )
+        self.auth.token_cache_path = (
+            os.getenv("ADO_AUTH_TOKEN_CACHE_PATH") or self.auth.token_cache_path
+        )
 
         # Override telemetry config from environment
         self.telemetry.enabled = os.getenv("ADO_TELEMETRY_ENABLED", "true").lower() == "true"
@@ -203,10 +496,122 @@ class AdoMcpConfig:
             os.getenv("ADO_CONNECTION_POOL_TIMEOUT", self.connection_pool.pool_timeout)
         )
 
+        # Override validator cache config from environment
+        self.validator_cache.enabled = (
+            os.getenv("ADO_VALIDATOR_CACHE_ENABLED", str(self.validator_cache.enabled)).lower()
+            == "true"
+        )
+        self.validator_cache.max_entries = int(
+            os.getenv("ADO_VALIDATOR_CACHE_MAX_ENTRIES", self.validator_cache.max_entries)
+        )
+
+        # Override log fetch config from environment
+        self.log_fetch.max_concurrency = int(
+            os.getenv("ADO_LOG_FETCH_MAX_CONCURRENCY", self.log_fetch.max_concurrency)
+        )
+        self.log_fetch.per_log_timeout_seconds = float(
+            os.getenv("ADO_LOG_FETCH_TIMEOUT", self.log_fetch.per_log_timeout_seconds)
+        )
+
+        # Override work item bulk fetch config from environment
+        self.work_item_bulk.max_concurrency = int(
+            os.getenv("ADO_WORK_ITEM_BULK_MAX_CONCURRENCY", self.work_item_bulk.max_concurrency)
+        )
+
+        # Override query cursor config from environment
+        self.query_cursor.ttl_seconds = float(
+            os.getenv("ADO_QUERY_CURSOR_TTL", self.query_cursor.ttl_seconds)
+        )
+
+        # Override run poller config from environment
+        self.run_poller.enabled = (
+            os.getenv("ADO_RUN_POLLER_ENABLED", str(self.run_poller.enabled)).lower() == "true"
+        )
+        self.run_poller.min_interval_seconds = float(
+            os.getenv("ADO_RUN_POLLER_MIN_INTERVAL", self.run_poller.min_interval_seconds)
+        )
+        self.run_poller.max_interval_seconds = float(
+            os.getenv("ADO_RUN_POLLER_MAX_INTERVAL", self.run_poller.max_interval_seconds)
+        )
+
+        # Override timeline tracker config from environment
+        self.timeline_tracker.enabled = (
+            os.getenv("ADO_TIMELINE_TRACKER_ENABLED", str(self.timeline_tracker.enabled)).lower()
+            == "true"
+        )
+        self.timeline_tracker.max_runs = int(
+            os.getenv("ADO_TIMELINE_TRACKER_MAX_RUNS", self.timeline_tracker.max_runs)
+        )
+
+        # Override persistent cache config from environment
+        self.persistent_cache.enabled = (
+            os.getenv("ADO_PERSISTENT_CACHE_ENABLED", str(self.persistent_cache.enabled)).lower()
+            == "true"
+        )
+        self.persistent_cache.path = (
+            os.getenv("ADO_PERSISTENT_CACHE_PATH") or self.persistent_cache.path
+        )
+
+        # Override rate limit config from environment
+        self.rate_limit.enabled = (
+            os.getenv("ADO_RATE_LIMIT_ENABLED", str(self.rate_limit.enabled)).lower() == "true"
+        )
+        self.rate_limit.requests_per_second = float(
+            os.getenv("ADO_RATE_LIMIT_REQUESTS_PER_SECOND", self.rate_limit.requests_per_second)
+        )
+        self.rate_limit.burst = int(os.getenv("ADO_RATE_LIMIT_BURST", self.rate_limit.burst))
+        self.rate_limit.max_concurrency = int(
+            os.getenv("ADO_RATE_LIMIT_MAX_CONCURRENCY", self.rate_limit.max_concurrency)
+        )
+
+        # Override cache warm-up config from environment
+        self.cache_warmup.enabled = (
+            os.getenv("ADO_CACHE_WARMUP_ENABLED", str(self.cache_warmup.enabled)).lower() == "true"
+        )
+        warmup_projects = os.getenv("ADO_CACHE_WARMUP_PROJECTS")
+        if warmup_projects is not None:
+            self.cache_warmup.projects = [
+                project.strip() for project in warmup_projects.split(",") if project.strip()
+            ]
+        self.cache_warmup.max_workers = int(
+            os.getenv("ADO_CACHE_WARMUP_WORKERS", self.cache_warmup.max_workers)
+        )
+
+        # Override circuit breaker config from environment
+        self.circuit_breaker.enabled = (
+            os.getenv("ADO_CIRCUIT_BREAKER_ENABLED", str(self.circuit_breaker.enabled)).lower()
+            == "true"
+        )
+        self.circuit_breaker.failure_threshold = int(
+            os.getenv(
+                "ADO_CIRCUIT_BREAKER_FAILURE_THRESHOLD", self.circuit_breaker.failure_threshold
+            )
+        )
+        self.circuit_breaker.open_seconds = float(
+            os.getenv("ADO_CIRCUIT_BREAKER_OPEN_SECONDS", self.circuit_breaker.open_seconds)
+        )
+
+        # Override hedging config from environment
+        self.hedging.enabled = (
+            os.getenv("ADO_HEDGING_ENABLED", str(self.hedging.enabled)).lower() == "true"
+        )
+        self.hedging.percentile = float(
+            os.getenv("ADO_HEDGING_PERCENTILE", self.hedging.percentile)
+        )
+        self.hedging.budget_ratio = float(
+            os.getenv("ADO_HEDGING_BUDGET_RATIO", self.hedging.budget_ratio)
+        )
+
         # Override request timeout from environment
         self.request_timeout_seconds = int(
             os.getenv("ADO_REQUEST_TIMEOUT", self.request_timeout_seconds)
         )
+        self.request_coalescing_enabled = (
+            os.getenv(
+                "ADO_REQUEST_COALESCING_ENABLED", str(self.request_coalescing_enabled)
+            ).lower()
+            == "true"
+        )
 
         # Validate configuration
         self._validate()
@@ -226,6 +631,66 @@ class AdoMcpConfig:
                 context={"request_timeout_seconds": self.request_timeout_seconds},
             )
 
+        if self.validator_cache.max_entries <= 0:
+            raise AdoConfigurationError(
+                "validator_cache.max_entries must be positive",
+                context={"max_entries": self.validator_cache.max_entries},
+            )
+
+        if self.log_fetch.max_concurrency <= 0 or self.log_fetch.per_log_timeout_seconds <= 0:
+            raise AdoConfigurationError(
+                "log_fetch.max_concurrency and per_log_timeout_seconds must be positive",
+                context={
+                    "max_concurrency": self.log_fetch.max_concurrency,
+                    "per_log_timeout_seconds": self.log_fetch.per_log_timeout_seconds,
+                },
+            )
+
+        if self.work_item_bulk.max_concurrency <= 0:
+            raise AdoConfigurationError(
+                "work_item_bulk.max_concurrency must be positive",
+                context={"max_concurrency": self.work_item_bulk.max_concurrency},
+            )
+
+        if self.query_cursor.ttl_seconds <= 0:
+            raise AdoConfigurationError(
+                "query_cursor.ttl_seconds must be positive",
+                context={"ttl_seconds": self.query_cursor.ttl_seconds},
+            )
+
+        if self.run_poller.max_interval_seconds < self.run_poller.min_interval_seconds:
+            raise AdoConfigurationError(
+                "run_poller.max_interval_seconds must be >= min_interval_seconds",
+                context={
+                    "min_interval_seconds": self.run_poller.min_interval_seconds,
+                    "max_interval_seconds": self.run_poller.max_interval_seconds,
+                },
+            )
+
+        if self.timeline_tracker.max_runs <= 0:
+            raise AdoConfigurationError(
+                "timeline_tracker.max_runs must be positive",
+                context={"max_runs": self.timeline_tracker.max_runs},
+            )
+
+        if self.rate_limit.requests_per_second <= 0 or self.rate_limit.burst < 1:
+            raise AdoConfigurationError(
+                "rate_limit.requests_per_second must be positive and burst at least 1",
+                context={
+                    "requests_per_second": self.rate_limit.requests_per_second,
+                    "burst": self.rate_limit.burst,
+                },
+            )
+
+        if self.rate_limit.max_concurrency < self.rate_limit.initial_concurrency:
+            raise AdoConfigurationError(
+                "rate_limit.max_concurrency must be >= initial_concurrency",
+                context={
+                    "initial_concurrency": self.rate_limit.initial_concurrency,
+                    "max_concurrency": self.rate_limit.max_concurrency,
+                },
+            )
+
         # Ensure connection pool config is valid
         if (
             self.connection_pool.enabled
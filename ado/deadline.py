@@ -0,0 +1,159 @@
+"""
+Deadlines for tool calls.
+
+Each tool call gets a total time budget. The deadline lives in a context
+variable, so every request made on behalf of the call sees it without being
+passed around: each attempt's timeout is capped at the time left, and retries
+stop as soon as their backoff would overrun the deadline. Without it a tool
+could keep backing off for minutes after the MCP client has given up.
+
+Context variables follow asyncio tasks and anyio worker threads, but not
+threads started with a plain ThreadPoolExecutor; work handed to those runs
+without a deadline.
+"""
+
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+
+from .errors import AdoTimeoutError
+
+logger = logging.getLogger(__name__)
+
+
+class Deadline:
+    """A point in (monotonic) time by which an operation must finish."""
+
+    def __init__(self, seconds: float):
+        self.budget_seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        """Seconds left before the deadline, never negative."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def extend(self, seconds: float) -> None:
+        """Push the deadline back, e.g. for time the caller explicitly asked to wait."""
+        self.expires_at += seconds
+        self.budget_seconds += seconds
+
+
+_current_deadline: ContextVar[Deadline | None] = ContextVar("ado_deadline", default=None)
+
+
+def current_deadline() -> Deadline | None:
+    """The deadline of the current context, or None if there is none."""
+    return _current_deadline.get()
+
+
+def remaining_time() -> float | None:
+    """Seconds left before the current deadline, or None if there is none."""
+    deadline = _current_deadline.get()
+    return deadline.remaining() if deadline is not None else None
+
+
+@contextmanager
+def deadline_scope(seconds: float | None) -> Iterator[Deadline | None]:
+    """
+    Run a block under a deadline.
+
+    A nested scope can only shorten the deadline: if an enclosing deadline
+    expires first, it stays in effect.
+
+    Args:
+        seconds: Time budget for the block. None (or a non-positive value)
+            keeps the enclosing deadline, if any.
+
+    Yields:
+        The deadline in effect inside the block.
+    """
+    outer = _current_deadline.get()
+    if not seconds or seconds <= 0:
+        yield outer
+        return
+
+    deadline = Deadline(seconds)
+    if outer is not None and outer.expires_at <= deadline.expires_at:
+        yield outer
+        return
+
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+def extend_deadline(seconds: float) -> None:
+    """
+    Extend the current deadline, if any, by the given number of seconds.
+
+    Used by operations whose caller explicitly asks them to wait (such as
+    waiting for a pipeline run) so the wait does not eat the call's budget.
+    """
+    deadline = _current_deadline.get()
+    if deadline is not None and seconds > 0:
+        deadline.extend(seconds)
+
+
+def deadline_exceeded_error(detail: str) -> AdoTimeoutError:
+    """Build the AdoTimeoutError raised when the current deadline has passed."""
+    deadline = current_deadline()
+    budget = deadline.budget_seconds if deadline is not None else 0.0
+    return AdoTimeoutError(
+        f"Deadline exceeded {detail}",
+        timeout_seconds=int(budget),
+        context={"deadline_exceeded": True, "budget_seconds": budget},
+    )
+
+
+def request_timeout(timeout: Any, operation: str) -> Any:
+    """
+    Cap a request timeout at the time left before the current deadline.
+
+    Args:
+        timeout: The configured timeout: seconds, a (connect, read) tuple, or None.
+        operation: Description of the request, used in the error message.
+
+    Returns:
+        The timeout to use for this attempt.
+
+    Raises:
+        AdoTimeoutError: If the deadline has already passed.
+    """
+    remaining = remaining_time()
+    if remaining is None:
+        return timeout
+    if remaining <= 0:
+        raise deadline_exceeded_error(f"before {operation}")
+    if timeout is None:
+        return remaining
+    if isinstance(timeout, tuple):
+        return tuple(remaining if t is None else min(t, remaining) for t in timeout)
+    if isinstance(timeout, int | float):
+        return min(timeout, remaining)
+    return timeout
+
+
+class ToolDeadlineMiddleware(Middleware):
+    """
+    FastMCP middleware that runs every tool call under a deadline.
+
+    Args:
+        seconds: Time budget per tool call. Zero disables deadlines.
+    """
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next):
+        with deadline_scope(self.seconds):
+            return await call_next(context)
@@ -106,6 +106,29 @@ class AdoNetworkError(AdoError):
         )
 
 
+class AdoCircuitOpenError(AdoError):
+    """Exception raised without calling an endpoint whose circuit breaker is open."""
+
+    def __init__(
+        self,
+        message: str = "Circuit breaker open",
+        retry_after: float | None = None,
+        context: dict[str, Any] | None = None,
+        original_exception: Exception | None = None,
+    ):
+        context = context or {}
+        if retry_after is not None:
+            context["retry_after"] = retry_after
+
+        super().__init__(
+            message=message,
+            error_code="ADO_CIRCUIT_OPEN",
+            context=context,
+            original_exception=original_exception,
+        )
+        self.retry_after = retry_after
+
+
 class AdoConfigurationError(AdoError):
     """Exception for configuration-related errors."""
 
@@ -0,0 +1,257 @@
+"""
+Hedged requests for idempotent reads.
+
+Some Azure DevOps endpoints (WIQL queries, build timelines, log metadata)
+have long latency tails: most calls are quick, but a few take many times
+longer for reasons unrelated to the request. When hedging is enabled, an
+idempotent request that has not answered within its endpoint's rolling p95
+latency is sent a second time, and whichever copy answers first is used.
+
+Hedges are bounded three ways:
+- a token bucket admits at most budget_ratio hedges per request;
+- the duplicate goes through the rate limiter like any other request;
+- endpoints need min_samples latencies before they are hedged at all.
+
+Synchronous primaries run on a thread of their own, so concurrent callers never
+queue behind each other; only the hedge copies share a bounded worker pool.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextvars import copy_context
+from typing import Any
+
+from opentelemetry import metrics
+
+from .circuit_breaker import endpoint_template
+from .config import HedgingConfig
+from .retry import RetryBudget
+
+logger = logging.getLogger(__name__)
+meter = metrics.get_meter(__name__)
+
+_hedge_counter = meter.create_counter(
+    name="ado_hedged_requests",
+    description="Number of hedged requests by endpoint and which copy answered first",
+    unit="1",
+)
+_latency_histogram = meter.create_histogram(
+    name="ado_endpoint_latency_seconds",
+    description="Latency of hedging-eligible requests by endpoint",
+    unit="s",
+)
+
+
+class LatencyTracker:
+    """
+    Rolling window of recent latencies per endpoint.
+
+    Args:
+        window_size: Latencies kept per endpoint.
+    """
+
+    def __init__(self, window_size: int = 200):
+        self.window_size = window_size
+        self._lock = threading.Lock()
+        self._samples: dict[str, deque[float]] = {}
+
+    def record(self, endpoint: str, seconds: float) -> None:
+        with self._lock:
+            samples = self._samples.get(endpoint)
+            if samples is None:
+                samples = self._samples[endpoint] = deque(maxlen=self.window_size)
+            samples.append(seconds)
+        _latency_histogram.record(seconds, {"endpoint": endpoint})
+
+    def percentile(self, endpoint: str, percentile: float, min_samples: int = 1) -> float | None:
+        """
+        The given percentile of an endpoint's recent latencies.
+
+        Returns:
+            float | None: Latency in seconds, or None with fewer than min_samples.
+        """
+        with self._lock:
+            samples = sorted(self._samples.get(endpoint, ()))
+        if not samples or len(samples) < min_samples:
+            return None
+        index = min(len(samples) - 1, int(len(samples) * percentile / 100))
+        return samples[index]
+
+
+class Hedger:
+    """
+    Runs eligible request attempts with a hedge after the endpoint's rolling p95.
+
+    Args:
+        config: Hedging settings.
+    """
+
+    def __init__(self, config: HedgingConfig):
+        self.config = config
+        self.latencies = LatencyTracker(config.window_size)
+        # Same token bucket as the retry budget, without a time-based floor
+        self.budget = RetryBudget(
+            ratio=config.budget_ratio, min_retries_per_second=0.0, max_tokens=config.max_burst
+        )
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+
+    def hedge(
+        self, method: str, url: str, idempotent: bool = False
+    ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        """
+        Decorator for a single request attempt.
+
+        GETs are always eligible; other methods only when the caller marks the
+        request idempotent (e.g. WIQL queries, which are POSTs). Ineligible
+        requests, and all requests while hedging is disabled, are left alone.
+        """
+        if not self.config.enabled or not (idempotent or method.upper() == "GET"):
+            return lambda func: func
+
+        endpoint = endpoint_template(method, url)
+
+        def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+            if asyncio.iscoroutinefunction(func):
+
+                async def async_hedged():
+                    return await self.run_async(endpoint, func)
+
+                return async_hedged
+
+            def hedged():
+                return self.run(endpoint, func)
+
+            return hedged
+
+        return decorator
+
+    def threshold(self, endpoint: str) -> float | None:
+        """How long to wait before hedging a request to an endpoint, or None to not hedge."""
+        latency = self.latencies.percentile(
+            endpoint, self.config.percentile, self.config.min_samples
+        )
+        if latency is None:
+            return None
+        return max(self.config.min_delay_seconds, latency)
+
+    def _record_primary(self, endpoint: str, start: float) -> Callable[[Any], None]:
+        """Done-callback recording the primary's latency if it succeeded."""
+
+        def record(future) -> None:
+            if not future.cancelled() and future.exception() is None:
+                self.latencies.record(endpoint, time.monotonic() - start)
+
+        return record
+
+    def _start_primary(self, endpoint: str, func: Callable[[], Any]) -> Future:
+        """
+        Run a synchronous primary on a thread of its own.
+
+        Its latency is measured from when it actually starts, and recorded if it
+        succeeds.
+        """
+        future: Future = Future()
+        context = copy_context()
+
+        def target() -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+            start = time.monotonic()
+            try:
+                result = context.run(func)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                self.latencies.record(endpoint, time.monotonic() - start)
+                future.set_result(result)
+
+        threading.Thread(target=target, name="ado-hedge-primary", daemon=True).start()
+        return future
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.config.max_workers, thread_name_prefix="ado-hedge"
+                )
+            return self._executor
+
+    def run(self, endpoint: str, func: Callable[[], Any]) -> Any:
+        """Run a synchronous attempt, hedging it if it is slower than the endpoint's threshold."""
+        start = time.monotonic()
+        threshold = self.threshold(endpoint)
+        if threshold is None:
+            result = func()
+            self.latencies.record(endpoint, time.monotonic() - start)
+            return result
+
+        primary = self._start_primary(endpoint, func)
+        self.budget.record_request()
+
+        done, _ = wait([primary], timeout=threshold)
+        if done or not self.budget.try_acquire():
+            return primary.result()
+
+        logger.debug(f"Hedging request to {endpoint} after {threshold:.3f}s")
+        hedge = self._get_executor().submit(copy_context().run, func)
+        return self._first_success(endpoint, primary, hedge)
+
+    def _first_success(self, endpoint: str, primary: Future, hedge: Future) -> Any:
+        """Return the first successful result of two futures, or raise the primary's error."""
+        pending = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    winner = "primary" if future is primary else "hedge"
+                    _hedge_counter.add(1, {"endpoint": endpoint, "winner": winner})
+                    return future.result()
+        _hedge_counter.add(1, {"endpoint": endpoint, "winner": "none"})
+        return primary.result()
+
+    async def run_async(self, endpoint: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Async variant of run(); the losing copy is cancelled."""
+        start = time.monotonic()
+        threshold = self.threshold(endpoint)
+        if threshold is None:
+            result = await func()
+            self.latencies.record(endpoint, time.monotonic() - start)
+            return result
+
+        primary = asyncio.ensure_future(func())
+        primary.add_done_callback(self._record_primary(endpoint, start))
+        self.budget.record_request()
+
+        done, _ = await asyncio.wait({primary}, timeout=threshold)
+        if done or not self.budget.try_acquire():
+            return await primary
+
+        logger.debug(f"Hedging request to {endpoint} after {threshold:.3f}s")
+        hedge = asyncio.ensure_future(func())
+        pending = {primary, hedge}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        winner = "primary" if task is primary else "hedge"
+                        _hedge_counter.add(1, {"endpoint": endpoint, "winner": winner})
+                        return task.result()
+            _hedge_counter.add(1, {"endpoint": endpoint, "winner": "none"})
+            return primary.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def close(self) -> None:
+        """Shut down the worker threads used for synchronous hedging."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
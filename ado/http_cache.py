@@ -0,0 +1,129 @@
+"""
+HTTP validator cache for conditional Azure DevOps GET requests.
+
+Azure DevOps returns ETag and Last-Modified validators on many resources. This
+module remembers those validators together with the parsed response body, so a
+later GET of the same resource can be sent with If-None-Match/If-Modified-Since
+and a 304 Not Modified answered from the stored body instead of re-downloading
+and re-parsing the payload.
+"""
+
+import copy
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from opentelemetry import metrics
+
+logger = logging.getLogger(__name__)
+meter = metrics.get_meter(__name__)
+
+
+@dataclass
+class ValidatorEntry:
+    """Validators and parsed body stored for a GET response."""
+
+    body: Any
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Build the conditional request headers for revalidating this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ValidatorCache:
+    """
+    Thread-safe LRU store of response validators keyed by request.
+
+    Bodies are copied on the way in, and the client copies them again when a 304
+    reuses them, so no caller shares a body with the cache or with another caller.
+    """
+
+    def __init__(self, max_entries: int = 500):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, ValidatorEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._revalidated_counter = meter.create_counter(
+            name="ado_http_cache_revalidations",
+            description="Number of GET requests answered by 304 Not Modified",
+            unit="1",
+        )
+
+    @staticmethod
+    def make_key(url: str, params: Mapping[str, Any] | None = None) -> Hashable:
+        """Build a cache key from the request URL and query parameters."""
+        frozen_params = None
+        if params:
+            items = params.items() if isinstance(params, Mapping) else params
+            frozen_params = tuple(sorted((str(k), str(v)) for k, v in items))
+        return (url, frozen_params)
+
+    def get(self, key: Hashable) -> ValidatorEntry | None:
+        """Get the stored entry for a request, marking it recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def store(self, key: Hashable, headers: Mapping[str, str], body: Any) -> bool:
+        """
+        Store the validators and parsed body of a successful GET response.
+
+        Args:
+            key: Cache key from make_key().
+            headers: Response headers.
+            body: Parsed response body.
+
+        Returns:
+            True if the response carried validators and was stored.
+        """
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        etag = etag if isinstance(etag, str) else None
+        last_modified = last_modified if isinstance(last_modified, str) else None
+
+        if not etag and not last_modified:
+            # Drop any stale entry so we don't revalidate against old validators
+            self.invalidate(key)
+            return False
+
+        with self._lock:
+            self._entries[key] = ValidatorEntry(
+                body=copy.deepcopy(body), etag=etag, last_modified=last_modified
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        logger.debug(f"Stored validators for {key[0]} (etag={etag}, last_modified={last_modified})")
+        return True
+
+    def record_revalidation(self, key: Hashable) -> None:
+        """Record that a stored body was reused after a 304 response."""
+        self._revalidated_counter.add(1)
+        logger.debug(f"Reusing stored body for {key[0]} after 304 Not Modified")
+
+    def invalidate(self, key: Hashable) -> None:
+        """Remove the entry for a request, if any."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all stored entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
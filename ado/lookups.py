@@ -40,14 +40,43 @@ class AdoLookups:
 
     # Project lookups
     def ensure_projects_cached(self) -> list[Project]:
-        """Ensure projects are cached, fetching if needed."""
+        """
+        Ensure projects are cached, fetching if needed.
+
+        Projects that expired within the cache's stale grace window are
+        returned immediately while a single background refresh fetches them.
+        """
         with tracer.start_as_current_span("ensure_projects_cached") as span:
-            projects = ado_cache.get_projects()
+            projects, stale = ado_cache.get_projects_allow_stale()
             if projects is None:
                 span.set_attribute("cache.source", "api")
                 logger.info("Projects not cached, fetching from API...")
                 projects = self.client.list_projects()
                 ado_cache.set_projects(projects)
+            elif stale:
+                span.set_attribute("cache.source", "stale")
+                logger.info("Serving stale projects from cache while refreshing")
+                ado_cache.refresh_in_background("projects", self._refresh_projects)
+            else:
+                span.set_attribute("cache.source", "cache")
+                logger.info("Projects loaded from cache")
+
+            span.set_attribute("projects.count", len(projects))
+            return projects
+
+    async def ensure_projects_cached_async(self) -> list[Project]:
+        """Async variant of ensure_projects_cached."""
+        with tracer.start_as_current_span("ensure_projects_cached") as span:
+            projects, stale = ado_cache.get_projects_allow_stale()
+            if projects is None:
+                span.set_attribute("cache.source", "api")
+                logger.info("Projects not cached, fetching from API...")
+                projects = await self.client.list_projects_async()
+                ado_cache.set_projects(projects)
+            elif stale:
+                span.set_attribute("cache.source", "stale")
+                logger.info("Serving stale projects from cache while refreshing")
+                ado_cache.refresh_in_background("projects", self._refresh_projects)
             else:
                 span.set_attribute("cache.source", "cache")
                 logger.info("Projects loaded from cache")
@@ -55,6 +84,10 @@ class AdoLookups:
             span.set_attribute("projects.count", len(projects))
             return projects
 
+    def _refresh_projects(self) -> None:
+        """Re-fetch and cache projects (runs on the cache's refresh thread)."""
+        ado_cache.set_projects(self.client.list_projects())
+
     def find_project(self, name: str) -> Project | None:
         """
         Find a project by name with intelligent caching and fuzzy matching.
@@ -68,6 +101,11 @@ class AdoLookups:
         self.ensure_projects_cached()
         return ado_cache.find_project_by_name(name)
 
+    async def find_project_async(self, name: str) -> Project | None:
+        """Async variant of find_project."""
+        await self.ensure_projects_cached_async()
+        return ado_cache.find_project_by_name(name)
+
     def get_project_id(self, name: str) -> str | None:
         """Get project ID by name."""
         project = self.find_project(name)
@@ -75,15 +113,22 @@ class AdoLookups:
 
     # Pipeline lookups
     def ensure_pipelines_cached(self, project_id: str) -> list[Pipeline]:
-        """Ensure pipelines are cached for a project, fetching if needed."""
+        """
+        Ensure pipelines are cached for a project, fetching if needed.
+
+        Like ensure_projects_cached, recently expired pipelines are served while
+        a single background refresh runs.
+        """
         with tracer.start_as_current_span("ensure_pipelines_cached") as span:
             span.set_attribute("project_id", project_id)
-            pipelines = ado_cache.get_pipelines(project_id)
+            pipelines, stale = ado_cache.get_pipelines_allow_stale(project_id)
             if pipelines is None:
                 span.set_attribute("cache.source", "api")
                 logger.info(f"Pipelines not cached for project {project_id}, fetching from API...")
                 pipelines = self.client.list_pipelines(project_id)
                 ado_cache.set_pipelines(project_id, pipelines)
+            elif stale:
+                self._serve_stale_pipelines(span, project_id)
             else:
                 span.set_attribute("cache.source", "cache")
                 logger.info(f"Pipelines loaded from cache for project {project_id}")
@@ -91,6 +136,34 @@ class AdoLookups:
             span.set_attribute("pipelines.count", len(pipelines))
             return pipelines
 
+    async def ensure_pipelines_cached_async(self, project_id: str) -> list[Pipeline]:
+        """Async variant of ensure_pipelines_cached."""
+        with tracer.start_as_current_span("ensure_pipelines_cached") as span:
+            span.set_attribute("project_id", project_id)
+            pipelines, stale = ado_cache.get_pipelines_allow_stale(project_id)
+            if pipelines is None:
+                span.set_attribute("cache.source", "api")
+                logger.info(f"Pipelines not cached for project {project_id}, fetching from API...")
+                pipelines = await self.client._pipelines.list_pipelines_async(project_id)
+                ado_cache.set_pipelines(project_id, pipelines)
+            elif stale:
+                self._serve_stale_pipelines(span, project_id)
+            else:
+                span.set_attribute("cache.source", "cache")
+                logger.info(f"Pipelines loaded from cache for project {project_id}")
+
+            span.set_attribute("pipelines.count", len(pipelines))
+            return pipelines
+
+    def _serve_stale_pipelines(self, span, project_id: str) -> None:
+        """Record that stale pipelines were served and start their refresh."""
+        span.set_attribute("cache.source", "stale")
+        logger.info(f"Serving stale pipelines for project {project_id} while refreshing")
+        ado_cache.refresh_in_background(
+            f"pipelines:{project_id}",
+            lambda: ado_cache.set_pipelines(project_id, self.client.list_pipelines(project_id)),
+        )
+
     def find_pipeline(
         self, project_name: str, pipeline_name: str
     ) -> tuple[Project, Pipeline] | None:
@@ -107,14 +180,7 @@ class AdoLookups:
         # Find project first
         project = self.find_project(project_name)
         if not project:
-            # Get all projects for fuzzy matching suggestions
-            projects = ado_cache.get_projects()
-            matcher = FuzzyMatcher()
-            matches = matcher.find_matches(
-                project_name, projects or [], name_extractor=lambda p: p.name
-            )
-            error_msg = create_suggestion_error_message(project_name, "Project", matches)
-            raise ValueError(error_msg)
+            raise self._project_not_found_error(project_name)
 
         # Ensure pipelines are cached for this project
         self.ensure_pipelines_cached(project.id)
@@ -122,17 +188,46 @@ class AdoLookups:
         # Find pipeline
         pipeline = ado_cache.find_pipeline_by_name(project.id, pipeline_name)
         if not pipeline:
-            # Get all pipelines for fuzzy matching suggestions
-            pipelines = ado_cache.get_pipelines(project.id)
-            matcher = FuzzyMatcher()
-            matches = matcher.find_matches(
-                pipeline_name, pipelines or [], name_extractor=lambda p: p.name
-            )
-            error_msg = create_suggestion_error_message(pipeline_name, "Pipeline", matches)
-            raise ValueError(error_msg)
+            raise self._pipeline_not_found_error(project.id, pipeline_name)
+
+        return (project, pipeline)
+
+    async def find_pipeline_async(
+        self, project_name: str, pipeline_name: str
+    ) -> tuple[Project, Pipeline] | None:
+        """Async variant of find_pipeline."""
+        project = await self.find_project_async(project_name)
+        if not project:
+            raise self._project_not_found_error(project_name)
+
+        await self.ensure_pipelines_cached_async(project.id)
+
+        pipeline = ado_cache.find_pipeline_by_name(project.id, pipeline_name)
+        if not pipeline:
+            raise self._pipeline_not_found_error(project.id, pipeline_name)
 
         return (project, pipeline)
 
+    def _project_not_found_error(self, project_name: str) -> ValueError:
+        """Build a ValueError with fuzzy-matched project suggestions."""
+        # Get all projects for fuzzy matching suggestions
+        projects = ado_cache.get_projects()
+        matcher = FuzzyMatcher()
+        matches = matcher.find_matches(
+            project_name, projects or [], name_extractor=lambda p: p.name
+        )
+        return ValueError(create_suggestion_error_message(project_name, "Project", matches))
+
+    def _pipeline_not_found_error(self, project_id: str, pipeline_name: str) -> ValueError:
+        """Build a ValueError with fuzzy-matched pipeline suggestions."""
+        # Get all pipelines for fuzzy matching suggestions
+        pipelines = ado_cache.get_pipelines(project_id)
+        matcher = FuzzyMatcher()
+        matches = matcher.find_matches(
+            pipeline_name, pipelines or [], name_extractor=lambda p: p.name
+        )
+        return ValueError(create_suggestion_error_message(pipeline_name, "Pipeline", matches))
+
     def get_pipeline_ids(self, project_name: str, pipeline_name: str) -> tuple[str, int] | None:
         """
         Get project ID and pipeline ID by names.
@@ -144,6 +239,13 @@ class AdoLookups:
         project, pipeline = self.find_pipeline(project_name, pipeline_name)
         return (project.id, pipeline.id)
 
+    async def get_pipeline_ids_async(
+        self, project_name: str, pipeline_name: str
+    ) -> tuple[str, int]:
+        """Async variant of get_pipeline_ids."""
+        project, pipeline = await self.find_pipeline_async(project_name, pipeline_name)
+        return (project.id, pipeline.id)
+
     # High-level operations using names
     def run_pipeline_by_name(
         self, project_name: str, pipeline_name: str, request: PipelineRunRequest | None = None
@@ -164,6 +266,14 @@ class AdoLookups:
         logger.info(f"Running pipeline '{pipeline_name}' in project '{project_name}'")
         return self.client.run_pipeline(project_id, pipeline_id, request)
 
+    async def run_pipeline_by_name_async(
+        self, project_name: str, pipeline_name: str, request: PipelineRunRequest | None = None
+    ) -> PipelineRun | None:
+        """Async variant of run_pipeline_by_name."""
+        project_id, pipeline_id = await self.get_pipeline_ids_async(project_name, pipeline_name)
+        logger.info(f"Running pipeline '{pipeline_name}' in project '{project_name}'")
+        return await self.client._builds.run_pipeline_async(project_id, pipeline_id, request)
+
     def get_pipeline_failure_summary_by_name(
         self, project_name: str, pipeline_name: str, run_id: int, max_lines: int = 100
     ) -> FailureSummary | None:
@@ -186,6 +296,15 @@ class AdoLookups:
         project_id, pipeline_id = ids
         return self.client.get_pipeline_failure_summary(project_id, pipeline_id, run_id, max_lines)
 
+    async def get_pipeline_failure_summary_by_name_async(
+        self, project_name: str, pipeline_name: str, run_id: int, max_lines: int = 100
+    ) -> FailureSummary | None:
+        """Async variant of get_pipeline_failure_summary_by_name."""
+        project_id, pipeline_id = await self.get_pipeline_ids_async(project_name, pipeline_name)
+        return await self.client._logs.get_pipeline_failure_summary_async(
+            project_id, pipeline_id, run_id, max_lines
+        )
+
     def run_pipeline_and_get_outcome_by_name(
         self,
         project_name: str,
@@ -219,6 +338,23 @@ class AdoLookups:
             project_id, pipeline_id, request, timeout_seconds, max_lines
         )
 
+    async def run_pipeline_and_get_outcome_by_name_async(
+        self,
+        project_name: str,
+        pipeline_name: str,
+        request: PipelineRunRequest | None = None,
+        timeout_seconds: int = 300,
+        max_lines: int = 100,
+    ) -> PipelineOutcome | None:
+        """Async variant of run_pipeline_and_get_outcome_by_name."""
+        project_id, pipeline_id = await self.get_pipeline_ids_async(project_name, pipeline_name)
+        logger.info(
+            f"Running pipeline '{pipeline_name}' in project '{project_name}' and waiting for outcome"
+        )
+        return await self.client._builds.run_pipeline_and_get_outcome_async(
+            project_id, pipeline_id, request, timeout_seconds, max_lines
+        )
+
     def watch_pipeline_by_name(
         self,
         project_name: str,
@@ -252,6 +388,23 @@ class AdoLookups:
             project_id, pipeline_id, run_id, timeout_seconds, max_lines
         )
 
+    async def watch_pipeline_by_name_async(
+        self,
+        project_name: str,
+        pipeline_name: str,
+        run_id: int,
+        timeout_seconds: int = 300,
+        max_lines: int = 100,
+    ) -> PipelineOutcome | None:
+        """Async variant of watch_pipeline_by_name."""
+        project_id, pipeline_id = await self.get_pipeline_ids_async(project_name, pipeline_name)
+        logger.info(
+            f"Watching pipeline run {run_id} for '{pipeline_name}' in project '{project_name}'"
+        )
+        return await self.client._builds.watch_pipeline_async(
+            project_id, pipeline_id, run_id, timeout_seconds, max_lines
+        )
+
     # Utility functions
     def list_available_projects(self) -> list[str]:
         """Get list of available project names."""
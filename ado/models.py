@@ -248,6 +248,10 @@ class StepFailure(BaseModel):
     log_id: int | None = None
     issues: list[str] = []
     log_content: str | None = None
+    log_total_lines: int | None = None
+    log_total_bytes: int | None = None
+    log_truncated: bool = False
+    log_error: str | None = None
     start_time: str | None = None
     finish_time: str | None = None
 
@@ -262,6 +266,7 @@ class FailureSummary(BaseModel):
     hierarchy_failures: list[StepFailure]  # Job/Stage level that failed due to tasks
     pipeline_url: str | None = None
     build_id: int | None = None
+    failed_log_fetches: int = 0  # Root causes whose log could not be retrieved
 
 
 class LogEntry(BaseModel):
@@ -277,6 +282,20 @@ class LogEntry(BaseModel):
     signedContent: dict[str, Any] | None = None
 
 
+class LogContent(BaseModel):
+    """
+    Represents the (possibly truncated) tail of a log with size information.
+    """
+
+    log_id: int
+    content: str
+    lines_returned: int
+    total_lines: int | None = None  # From log metadata, when available
+    bytes_read: int
+    total_bytes: int | None = None
+    truncated: bool = False
+
+
 class LogCollection(BaseModel):
     """
     Represents the collection of logs for a pipeline run.
@@ -3,5 +3,13 @@
 from .builds import BuildOperations
 from .logs import LogOperations
 from .pipelines import PipelineOperations
+from .run_poller import RunStatusPoller
+from .timeline_tracker import TimelineTracker
 
-__all__ = ["PipelineOperations", "BuildOperations", "LogOperations"]
+__all__ = [
+    "PipelineOperations",
+    "BuildOperations",
+    "LogOperations",
+    "RunStatusPoller",
+    "TimelineTracker",
+]
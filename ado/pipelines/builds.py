@@ -1,13 +1,18 @@
 """Pipeline build and run operations."""
 
+import asyncio
 import logging
 import time
 from typing import Any
 
+from ..deadline import extend_deadline
 from ..models import PipelineOutcome, PipelineRun, PipelineRunRequest
 
 logger = logging.getLogger(__name__)
 
+# Status check interval used when the shared run poller is disabled
+DEFAULT_POLL_INTERVAL_SECONDS = 10
+
 
 class BuildOperations:
     """Azure DevOps pipeline build and run operations."""
@@ -37,16 +42,7 @@ class BuildOperations:
         url = f"{self._client.organization_url}/{project_id}/_apis/pipelines/{pipeline_id}/runs?api-version=7.1"
 
         # Validate if branch/self repository resources are supported before sending the request
-        # Note: Only validate for 'self' repository overrides and branch parameters
-        # External repository overrides (like 'tooling', 'templates', etc.) typically work
-        has_self_repo_override = (
-            request
-            and request.resources
-            and request.resources.repositories
-            and "self" in request.resources.repositories
-        )
-
-        if request and (request.branch or has_self_repo_override):
+        if self._requires_resource_validation(request):
             try:
                 self._validate_pipeline_supports_resources(project_id, pipeline_id, request)
             except ValueError as e:
@@ -57,7 +53,74 @@ class BuildOperations:
                 logger.warning(f"Resource validation failed, proceeding anyway: {e}")
                 # Continue execution for other types of errors (network, auth, etc.)
 
-        # Prepare request data
+        request_data = self._build_run_request_data(request)
+
+        logger.info(f"Running pipeline {pipeline_id} in project {project_id}")
+        if request_data:
+            logger.debug(f"Pipeline run request data: {request_data}")
+            response = self._client._send_request("POST", url, json=request_data)
+        else:
+            # For basic pipeline runs without parameters, send empty JSON object
+            # Azure DevOps requires a Content-Length header and expects JSON body
+            logger.debug("Sending empty JSON body for basic pipeline run")
+            response = self._client._send_request("POST", url, json={})
+        logger.info(
+            f"Pipeline run started: {response.get('id')} with state: {response.get('state')}"
+        )
+        return PipelineRun(**response)
+
+    async def run_pipeline_async(
+        self, project_id: str, pipeline_id: int, request: PipelineRunRequest | None = None
+    ) -> PipelineRun:
+        """Async variant of run_pipeline."""
+        url = f"{self._client.organization_url}/{project_id}/_apis/pipelines/{pipeline_id}/runs?api-version=7.1"
+
+        if self._requires_resource_validation(request):
+            try:
+                await self._validate_pipeline_supports_resources_async(
+                    project_id, pipeline_id, request
+                )
+            except ValueError as e:
+                logger.error(f"Resource validation failed: {e}")
+                raise
+            except Exception as e:
+                logger.warning(f"Resource validation failed, proceeding anyway: {e}")
+
+        request_data = self._build_run_request_data(request)
+
+        logger.info(f"Running pipeline {pipeline_id} in project {project_id}")
+        # Azure DevOps requires a JSON body even for basic runs
+        response = await self._client._send_request_async("POST", url, json=request_data)
+        logger.info(
+            f"Pipeline run started: {response.get('id')} with state: {response.get('state')}"
+        )
+        return PipelineRun(**response)
+
+    def _requires_resource_validation(self, request: PipelineRunRequest | None) -> bool:
+        """
+        Check whether a run request needs a preview-based resource validation.
+
+        Note: Only validate for 'self' repository overrides and branch parameters.
+        External repository overrides (like 'tooling', 'templates', etc.) typically work.
+        """
+        has_self_repo_override = (
+            request
+            and request.resources
+            and request.resources.repositories
+            and "self" in request.resources.repositories
+        )
+        return bool(request and (request.branch or has_self_repo_override))
+
+    def _build_run_request_data(self, request: PipelineRunRequest | None) -> dict[str, Any]:
+        """
+        Convert a PipelineRunRequest into the JSON body expected by the runs API.
+
+        Args:
+            request (Optional[PipelineRunRequest]): The run request, if any.
+
+        Returns:
+            dict: Request body (empty if no request was given).
+        """
         request_data = {}
         if request:
             request_dict = request.model_dump(exclude_none=True)
@@ -100,19 +163,7 @@ class BuildOperations:
             # Add other fields
             request_data.update(request_dict)
 
-        logger.info(f"Running pipeline {pipeline_id} in project {project_id}")
-        if request_data:
-            logger.debug(f"Pipeline run request data: {request_data}")
-            response = self._client._send_request("POST", url, json=request_data)
-        else:
-            # For basic pipeline runs without parameters, send empty JSON object
-            # Azure DevOps requires a Content-Length header and expects JSON body
-            logger.debug("Sending empty JSON body for basic pipeline run")
-            response = self._client._send_request("POST", url, json={})
-        logger.info(
-            f"Pipeline run started: {response.get('id')} with state: {response.get('state')}"
-        )
-        return PipelineRun(**response)
+        return request_data
 
     def get_pipeline_run(self, project_id: str, pipeline_id: int, run_id: int) -> PipelineRun:
         """
@@ -137,6 +188,18 @@ class BuildOperations:
         )
         return PipelineRun(**response)
 
+    async def get_pipeline_run_async(
+        self, project_id: str, pipeline_id: int, run_id: int
+    ) -> PipelineRun:
+        """Async variant of get_pipeline_run."""
+        url = f"{self._client.organization_url}/{project_id}/_apis/pipelines/{pipeline_id}/runs/{run_id}?api-version=7.1"
+        logger.debug(f"Getting pipeline run {run_id} details for project {project_id}")
+        response = await self._client._send_request_async("GET", url)
+        logger.debug(
+            f"Pipeline run {run_id} state: {response.get('state')}, result: {response.get('result')}"
+        )
+        return PipelineRun(**response)
+
     def get_build_by_id(self, project_id: str, build_id: int) -> dict[str, Any]:
         """
         Retrieve build details by build ID using the Azure DevOps Build API.
@@ -160,23 +223,37 @@ class BuildOperations:
         logger.debug(f"Build {build_id} definition: {response.get('definition', {}).get('name')}")
         return response
 
+    async def get_build_by_id_async(self, project_id: str, build_id: int) -> dict[str, Any]:
+        """Async variant of get_build_by_id."""
+        url = f"{self._client.organization_url}/{project_id}/_apis/build/builds/{build_id}?api-version=7.1"
+        logger.info(f"Getting build details for build {build_id} in project {project_id}")
+        response = await self._client._send_request_async("GET", url)
+        logger.debug(f"Build {build_id} definition: {response.get('definition', {}).get('name')}")
+        return response
+
     def wait_for_pipeline_completion(
         self,
         project_id: str,
         pipeline_id: int,
         run_id: int,
         timeout_seconds: int = 300,
-        poll_interval_seconds: int = 10,
+        poll_interval_seconds: int | None = None,
     ) -> PipelineRun:
         """
         Wait for a pipeline run to complete by polling its status.
 
+        When the shared run poller is enabled, the run is checked together with
+        every other watched run in batched requests, at an interval that adapts
+        to the run's progress.
+
         Args:
             project_id (str): The ID of the project.
             pipeline_id (int): The ID of the pipeline.
             run_id (int): The ID of the pipeline run.
             timeout_seconds (int): Maximum time to wait in seconds. Defaults to 300 (5 minutes).
-            poll_interval_seconds (int): Time between status checks in seconds. Defaults to 10.
+            poll_interval_seconds (Optional[int]): Fixed time between status checks in seconds.
+                Defaults to None, which polls adaptively (or every 10 seconds when the
+                run poller is disabled).
 
         Returns:
             PipelineRun: The final pipeline run object.
@@ -185,8 +262,17 @@ class BuildOperations:
             TimeoutError: If the pipeline doesn't complete within the timeout period.
             requests.exceptions.RequestException: For network-related errors.
         """
-        start_time = time.time()
         logger.info(f"Waiting for pipeline run {run_id} to complete (timeout: {timeout_seconds}s)")
+        # The caller asked to wait this long, so don't count it against the call's deadline
+        extend_deadline(timeout_seconds)
+
+        if self._client.config.run_poller.enabled:
+            return self._client.run_poller.wait(
+                project_id, pipeline_id, run_id, timeout_seconds, poll_interval_seconds
+            )
+
+        start_time = time.time()
+        poll_interval_seconds = poll_interval_seconds or DEFAULT_POLL_INTERVAL_SECONDS
 
         while True:
             # Check if we've exceeded the timeout
@@ -208,6 +294,48 @@ class BuildOperations:
             logger.debug(f"Pipeline run {run_id} still in progress (state: {pipeline_run.state})")
             time.sleep(poll_interval_seconds)
 
+    async def wait_for_pipeline_completion_async(
+        self,
+        project_id: str,
+        pipeline_id: int,
+        run_id: int,
+        timeout_seconds: int = 300,
+        poll_interval_seconds: int | None = None,
+    ) -> PipelineRun:
+        """
+        Async variant of wait_for_pipeline_completion.
+
+        Awaits the shared run poller (or polls with asyncio.sleep when it is
+        disabled) so that a long wait holds no thread and never blocks other
+        tool calls on the event loop.
+        """
+        logger.info(f"Waiting for pipeline run {run_id} to complete (timeout: {timeout_seconds}s)")
+        extend_deadline(timeout_seconds)
+
+        if self._client.config.run_poller.enabled:
+            return await self._client.run_poller.wait_async(
+                project_id, pipeline_id, run_id, timeout_seconds, poll_interval_seconds
+            )
+
+        start_time = time.time()
+        poll_interval_seconds = poll_interval_seconds or DEFAULT_POLL_INTERVAL_SECONDS
+
+        while True:
+            elapsed_time = time.time() - start_time
+            if elapsed_time > timeout_seconds:
+                raise TimeoutError(
+                    f"Pipeline run {run_id} did not complete within {timeout_seconds} seconds"
+                )
+
+            pipeline_run = await self.get_pipeline_run_async(project_id, pipeline_id, run_id)
+
+            if pipeline_run.is_completed():
+                logger.info(f"Pipeline run {run_id} completed with result: {pipeline_run.result}")
+                return pipeline_run
+
+            logger.debug(f"Pipeline run {run_id} still in progress (state: {pipeline_run.state})")
+            await asyncio.sleep(poll_interval_seconds)
+
     def watch_pipeline(
         self,
         project_id: str,
@@ -376,6 +504,111 @@ class BuildOperations:
         )
         return outcome
 
+    async def watch_pipeline_async(
+        self,
+        project_id: str,
+        pipeline_id: int,
+        run_id: int,
+        timeout_seconds: int = 300,
+        max_lines: int = 100,
+    ) -> PipelineOutcome:
+        """Async variant of watch_pipeline."""
+        start_time = time.time()
+        logger.info(f"Watching pipeline run {run_id} for completion...")
+
+        initial_run = await self.get_pipeline_run_async(project_id, pipeline_id, run_id)
+
+        if initial_run.is_completed():
+            logger.info(
+                f"Pipeline run {run_id} is already completed with result: {initial_run.result}"
+            )
+            final_run = initial_run
+        else:
+            final_run = await self._await_final_run_async(
+                project_id, pipeline_id, run_id, timeout_seconds
+            )
+
+        outcome = await self._build_outcome_async(
+            project_id, pipeline_id, final_run, max_lines, start_time
+        )
+        logger.info(
+            f"Pipeline watch for run {run_id} completed in {outcome.execution_time_seconds:.2f}s "
+            f"with result: {final_run.result}"
+        )
+        return outcome
+
+    async def run_pipeline_and_get_outcome_async(
+        self,
+        project_id: str,
+        pipeline_id: int,
+        request: PipelineRunRequest | None = None,
+        timeout_seconds: int = 300,
+        max_lines: int = 100,
+    ) -> PipelineOutcome:
+        """Async variant of run_pipeline_and_get_outcome."""
+        start_time = time.time()
+        logger.info(f"Starting pipeline {pipeline_id} and waiting for outcome...")
+
+        pipeline_run = await self.run_pipeline_async(project_id, pipeline_id, request)
+        final_run = await self._await_final_run_async(
+            project_id, pipeline_id, pipeline_run.id, timeout_seconds
+        )
+
+        outcome = await self._build_outcome_async(
+            project_id, pipeline_id, final_run, max_lines, start_time
+        )
+        logger.info(
+            f"Pipeline {pipeline_id} completed in {outcome.execution_time_seconds:.2f}s "
+            f"with result: {final_run.result}"
+        )
+        return outcome
+
+    async def _await_final_run_async(
+        self, project_id: str, pipeline_id: int, run_id: int, timeout_seconds: int
+    ) -> PipelineRun:
+        """Wait for a run to finish, returning its latest state if the wait times out."""
+        try:
+            return await self.wait_for_pipeline_completion_async(
+                project_id, pipeline_id, run_id, timeout_seconds
+            )
+        except TimeoutError:
+            logger.warning(f"Pipeline run {run_id} timed out after {timeout_seconds} seconds")
+            return await self.get_pipeline_run_async(project_id, pipeline_id, run_id)
+
+    async def _build_outcome_async(
+        self,
+        project_id: str,
+        pipeline_id: int,
+        final_run: PipelineRun,
+        max_lines: int,
+        start_time: float,
+    ) -> PipelineOutcome:
+        """Build a PipelineOutcome, attaching a failure summary for failed runs."""
+        # Import here to avoid circular imports
+        from ..pipelines.logs import LogOperations
+
+        execution_time = time.time() - start_time
+        success = final_run.result == "succeeded" if final_run.result else False
+        failure_summary = None
+
+        if not success and final_run.is_completed():
+            try:
+                failure_summary = await LogOperations(
+                    self._client
+                ).get_pipeline_failure_summary_async(
+                    project_id, pipeline_id, final_run.id, max_lines
+                )
+                logger.info(f"Retrieved failure summary for failed pipeline run {final_run.id}")
+            except Exception as e:
+                logger.warning(f"Could not retrieve failure summary: {e}")
+
+        return PipelineOutcome(
+            pipeline_run=final_run,
+            success=success,
+            failure_summary=failure_summary,
+            execution_time_seconds=execution_time,
+        )
+
     def _validate_pipeline_supports_resources(
         self, project_id: str, pipeline_id: int, request: PipelineRunRequest
     ) -> None:
@@ -390,47 +623,78 @@ class BuildOperations:
         Raises:
             ValueError: If the pipeline doesn't support the requested resources.
         """
-        from ..models import PipelinePreviewRequest
         from ..pipelines.pipelines import PipelineOperations
 
         try:
-            # Create a preview request to test if the pipeline supports resources
-            preview_request = PipelinePreviewRequest(
-                previewRun=True,
-                resources=request.resources if request.resources else None,
-            )
+            preview_request = self._build_validation_preview_request(request)
+            pipeline_ops = PipelineOperations(self._client)
+            pipeline_ops.preview_pipeline(project_id, pipeline_id, preview_request)
 
-            # Add branch as a resource if specified
-            if request.branch:
-                if not preview_request.resources:
-                    from ..models import RunResourcesParameters
+            logger.info(f"Pipeline preview successful for pipeline {pipeline_id}")
 
-                    preview_request.resources = RunResourcesParameters()
-                if not preview_request.resources.repositories:
-                    preview_request.resources.repositories = {}
-                preview_request.resources.repositories["self"] = {"refName": request.branch}
+        except Exception as e:
+            validation_error = self._resource_validation_error(pipeline_id, e)
+            if validation_error:
+                raise validation_error from e
+            # Re-raise other errors as they might be network or permission issues
+            raise
+
+    async def _validate_pipeline_supports_resources_async(
+        self, project_id: str, pipeline_id: int, request: PipelineRunRequest
+    ) -> None:
+        """Async variant of _validate_pipeline_supports_resources."""
+        from ..pipelines.pipelines import PipelineOperations
 
+        try:
+            preview_request = self._build_validation_preview_request(request)
             pipeline_ops = PipelineOperations(self._client)
-            pipeline_ops.preview_pipeline(project_id, pipeline_id, preview_request)
+            await pipeline_ops.preview_pipeline_async(project_id, pipeline_id, preview_request)
 
             logger.info(f"Pipeline preview successful for pipeline {pipeline_id}")
 
         except Exception as e:
-            error_msg = str(e).lower()
-            if "400" in error_msg or "bad request" in error_msg:
-                logger.error(
-                    f"Pipeline {pipeline_id} does not support self repository branch overrides. "
-                    f"This typically occurs with server-pool pipelines or pipelines without resources sections. "
-                    f"External repository overrides may still work. Error: {e}"
-                )
-                raise ValueError(
-                    f"Pipeline {pipeline_id} does not support branch overrides or 'self' repository resources. "
-                    f"External repository overrides (like 'tooling', 'templates') may still work. "
-                    f"For branch overrides, ensure the pipeline YAML includes a 'resources' section and uses a VM-based pool."
-                ) from e
-            else:
-                # Re-raise other errors as they might be network or permission issues
-                raise
+            validation_error = self._resource_validation_error(pipeline_id, e)
+            if validation_error:
+                raise validation_error from e
+            raise
+
+    def _build_validation_preview_request(self, request: PipelineRunRequest):
+        """Create a preview request that exercises the run's resources and branch."""
+        from ..models import PipelinePreviewRequest
+
+        # Create a preview request to test if the pipeline supports resources
+        preview_request = PipelinePreviewRequest(
+            previewRun=True,
+            resources=request.resources if request.resources else None,
+        )
+
+        # Add branch as a resource if specified
+        if request.branch:
+            if not preview_request.resources:
+                from ..models import RunResourcesParameters
+
+                preview_request.resources = RunResourcesParameters()
+            if not preview_request.resources.repositories:
+                preview_request.resources.repositories = {}
+            preview_request.resources.repositories["self"] = {"refName": request.branch}
+
+        return preview_request
+
+    def _resource_validation_error(self, pipeline_id: int, error: Exception) -> ValueError | None:
+        """Translate a failed preview into a user-facing ValueError, if it was a bad request."""
+        error_msg = str(error).lower()
+        if "400" in error_msg or "bad request" in error_msg:
+            logger.error(
+                f"Pipeline {pipeline_id} does not support self repository branch overrides. "
+                f"This typically occurs with server-pool pipelines or pipelines without resources sections. "
+                f"External repository overrides may still work. Error: {error}"
+            )
+            return ValueError(
+                f"Pipeline {pipeline_id} does not support branch overrides or 'self' repository resources. "
+                f"External repository overrides (like 'tooling', 'templates') may still work. "
+                f"For branch overrides, ensure the pipeline YAML includes a 'resources' section and uses a VM-based pool."
+            )
+        return None
 
     def extract_pipeline_run_data(self, project_id: str, pipeline_id: int, run_id: int) -> dict:
         """
@@ -0,0 +1,235 @@
+"""
+Memory-bounded tail reads of pipeline log content.
+
+Build logs can be hundreds of megabytes, while callers usually only want the
+last few hundred lines. The readers here fetch the signed log content URL
+backwards with HTTP Range requests, doubling the window until enough lines have
+been seen, so only the tail of the log is ever downloaded. If the server ignores
+Range, the body is streamed through a bounded deque instead of being loaded into
+memory.
+"""
+
+import logging
+import re
+from collections import deque
+from dataclasses import dataclass
+
+import httpx
+import requests
+
+logger = logging.getLogger(__name__)
+
+# Size of the first Range window read from the end of a log
+TAIL_CHUNK_BYTES = 64 * 1024
+# Upper bound for a single Range window as it doubles
+MAX_TAIL_CHUNK_BYTES = 4 * 1024 * 1024
+
+_CONTENT_RANGE_RE = re.compile(r"bytes (\d+)-(\d+)/(\d+|\*)")
+
+
+@dataclass
+class LogTail:
+    """The tail of a log along with how much of it was read."""
+
+    content: str
+    lines_returned: int
+    bytes_read: int
+    total_bytes: int | None
+    truncated: bool
+
+
+def _parse_content_range(header: str | None) -> tuple[int, int, int | None] | None:
+    """Parse a 'bytes start-end/total' Content-Range header."""
+    if not header:
+        return None
+    match = _CONTENT_RANGE_RE.match(header)
+    if not match:
+        return None
+    start, end, total = match.groups()
+    return int(start), int(end), None if total == "*" else int(total)
+
+
+def _range_header(end: int | None, chunk_size: int) -> str:
+    """Build the Range header for the window ending just before `end`."""
+    if end is None:
+        return f"bytes=-{chunk_size}"
+    return f"bytes={max(0, end - chunk_size)}-{end - 1}"
+
+
+class _TailBuffer:
+    """Collects chunks read backwards from the end of a log."""
+
+    def __init__(self, max_lines: int):
+        self.max_lines = max_lines
+        self.chunks: list[bytes] = []
+        self.newlines = 0
+        self.bytes_read = 0
+
+    def prepend(self, data: bytes) -> None:
+        self.chunks.insert(0, data)
+        self.newlines += data.count(b"\n")
+        self.bytes_read += len(data)
+
+    def has_enough_lines(self) -> bool:
+        # One extra newline guarantees the first (possibly partial) line can be dropped
+        return self.newlines > self.max_lines
+
+    def build(self, total_bytes: int | None, reached_start: bool) -> LogTail:
+        lines = b"".join(self.chunks).decode("utf-8", errors="replace").splitlines()
+        if not reached_start and lines:
+            # The first line starts mid-way through the log
+            lines = lines[1:]
+        truncated = not reached_start or len(lines) > self.max_lines
+        tail_lines = lines[-self.max_lines :]
+        return LogTail(
+            content="\n".join(tail_lines),
+            lines_returned=len(tail_lines),
+            bytes_read=self.bytes_read,
+            total_bytes=total_bytes,
+            truncated=truncated,
+        )
+
+
+class _StreamTail:
+    """Keeps the last max_lines lines of a streamed log in a bounded deque."""
+
+    def __init__(self, max_lines: int):
+        self.lines: deque[str] = deque(maxlen=max_lines if max_lines > 0 else None)
+        self.line_count = 0
+        self.bytes_read = 0
+        self._partial = b""
+
+    def feed(self, chunk: bytes) -> None:
+        self.bytes_read += len(chunk)
+        *complete, self._partial = (self._partial + chunk).split(b"\n")
+        for line in complete:
+            self._add(line)
+
+    def _add(self, line: bytes) -> None:
+        self.lines.append(line.rstrip(b"\r").decode("utf-8", errors="replace"))
+        self.line_count += 1
+
+    def build(self) -> LogTail:
+        if self._partial:
+            self._add(self._partial)
+            self._partial = b""
+        return LogTail(
+            content="\n".join(self.lines),
+            lines_returned=len(self.lines),
+            bytes_read=self.bytes_read,
+            total_bytes=self.bytes_read,
+            truncated=self.line_count > len(self.lines),
+        )
+
+
+def _empty_tail() -> LogTail:
+    return LogTail(content="", lines_returned=0, bytes_read=0, total_bytes=0, truncated=False)
+
+
+def read_log_tail(session, url: str, max_lines: int, timeout: float) -> LogTail:
+    """
+    Read the last max_lines lines of a log without downloading all of it.
+
+    Args:
+        session: A requests Session (or the requests module) used for the fetches.
+        url: The signed log content URL.
+        max_lines: Number of trailing lines to return. Zero or negative reads the
+            whole log, streamed line by line.
+        timeout: Per-request timeout in seconds.
+
+    Returns:
+        LogTail: The tail content and byte/line counts.
+
+    Raises:
+        requests.exceptions.RequestException: For network or HTTP errors.
+    """
+    if max_lines <= 0:
+        with session.get(url, timeout=timeout, stream=True) as response:
+            response.raise_for_status()
+            return _stream_lines(response, max_lines)
+
+    buffer = _TailBuffer(max_lines)
+    chunk_size = TAIL_CHUNK_BYTES
+    end = None
+    total_bytes = None
+
+    while True:
+        headers = {"Range": _range_header(end, chunk_size)}
+        with session.get(url, headers=headers, timeout=timeout, stream=True) as response:
+            if response.status_code == 416:
+                # Range not satisfiable: the log is empty
+                return _empty_tail()
+            response.raise_for_status()
+
+            content_range = _parse_content_range(response.headers.get("Content-Range"))
+            if response.status_code != 206 or content_range is None:
+                logger.debug("Log server ignored Range request, streaming log tail")
+                return _stream_lines(response, max_lines)
+
+            buffer.prepend(response.content)
+
+        start, _, total_bytes = content_range
+        end = start
+        if start == 0 or buffer.has_enough_lines():
+            break
+        chunk_size = min(chunk_size * 2, MAX_TAIL_CHUNK_BYTES)
+
+    return buffer.build(total_bytes, reached_start=end == 0)
+
+
+async def read_log_tail_async(
+    session: httpx.AsyncClient, url: str, max_lines: int, timeout: float
+) -> LogTail:
+    """
+    Async variant of read_log_tail using a pooled httpx client.
+
+    Raises:
+        httpx.HTTPError: For network or HTTP errors.
+    """
+    if max_lines <= 0:
+        async with session.stream("GET", url, timeout=timeout) as response:
+            response.raise_for_status()
+            return await _stream_lines_async(response, max_lines)
+
+    buffer = _TailBuffer(max_lines)
+    chunk_size = TAIL_CHUNK_BYTES
+    end = None
+    total_bytes = None
+
+    while True:
+        headers = {"Range": _range_header(end, chunk_size)}
+        async with session.stream("GET", url, headers=headers, timeout=timeout) as response:
+            if response.status_code == 416:
+                return _empty_tail()
+            response.raise_for_status()
+
+            content_range = _parse_content_range(response.headers.get("Content-Range"))
+            if response.status_code != 206 or content_range is None:
+                logger.debug("Log server ignored Range request, streaming log tail")
+                return await _stream_lines_async(response, max_lines)
+
+            buffer.prepend(await response.aread())
+
+        start, _, total_bytes = content_range
+        end = start
+        if start == 0 or buffer.has_enough_lines():
+            break
+        chunk_size = min(chunk_size * 2, MAX_TAIL_CHUNK_BYTES)
+
+    return buffer.build(total_bytes, reached_start=end == 0)
+
+
+def _stream_lines(response: requests.Response, max_lines: int) -> LogTail:
+    """Stream a full log response, keeping only the last max_lines lines."""
+    tail = _StreamTail(max_lines)
+    for chunk in response.iter_content(chunk_size=TAIL_CHUNK_BYTES):
+        tail.feed(chunk)
+    return tail.build()
+
+
+async def _stream_lines_async(response: httpx.Response, max_lines: int) -> LogTail:
+    """Async variant of _stream_lines."""
+    tail = _StreamTail(max_lines)
+    async for chunk in response.aiter_bytes(chunk_size=TAIL_CHUNK_BYTES):
+        tail.feed(chunk)
+    return tail.build()
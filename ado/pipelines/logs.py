@@ -1,15 +1,22 @@
 """Pipeline logging and failure analysis operations."""
 
+import asyncio
 import logging
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextvars import copy_context
 
-import requests
-
+from ..config import LogFetchConfig
+from ..deadline import request_timeout
 from ..models import (
     FailureSummary,
     LogCollection,
+    LogContent,
     StepFailure,
     TimelineResponse,
 )
+from .log_tail import LogTail, read_log_tail, read_log_tail_async
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +49,16 @@ class LogOperations:
         logger.info(f"Retrieved {len(response.get('logs', []))} logs for run {run_id}")
         return LogCollection(**response)
 
+    async def list_pipeline_logs_async(
+        self, project_id: str, pipeline_id: int, run_id: int
+    ) -> LogCollection:
+        """Async variant of list_pipeline_logs."""
+        url = f"{self._client.organization_url}/{project_id}/_apis/pipelines/{pipeline_id}/runs/{run_id}/logs?api-version=7.1"
+        logger.info(f"Listing logs for pipeline run {run_id} in project {project_id}")
+        response = await self._client._send_request_async("GET", url)
+        logger.info(f"Retrieved {len(response.get('logs', []))} logs for run {run_id}")
+        return LogCollection(**response)
+
     def get_log_content_by_id(
         self, project_id: str, pipeline_id: int, run_id: int, log_id: int, max_lines: int = 100
     ) -> str:
@@ -59,6 +76,31 @@ class LogOperations:
         Returns:
             str: The log content as a string, limited to the last max_lines.
 
+        Raises:
+            requests.exceptions.RequestException: For network-related errors.
+        """
+        return self.get_log_tail_by_id(project_id, pipeline_id, run_id, log_id, max_lines).content
+
+    def get_log_tail_by_id(
+        self, project_id: str, pipeline_id: int, run_id: int, log_id: int, max_lines: int = 100
+    ) -> LogContent:
+        """
+        Get the last lines of a log along with its byte and line counts.
+
+        The signed content URL is read backwards with HTTP Range requests through
+        the pooled session, so only the tail of large logs is downloaded.
+
+        Args:
+            project_id (str): The ID of the project.
+            pipeline_id (int): The ID of the pipeline.
+            run_id (int): The ID of the pipeline run.
+            log_id (int): The ID of the specific log.
+            max_lines (int): Maximum number of lines to return from the end of the log (default: 100).
+                           Set to 0 or negative to return all lines.
+
+        Returns:
+            LogContent: The log tail with line and byte counts.
+
         Raises:
             requests.exceptions.RequestException: For network-related errors.
         """
@@ -68,38 +110,97 @@ class LogOperations:
         response = self._client._send_request("GET", url)
 
         # Extract and fetch content from signed URL
-        if "signedContent" in response and "url" in response["signedContent"]:
-            signed_url = response["signedContent"]["url"]
-            content_response = requests.get(signed_url)
-            content_response.raise_for_status()
-
-            full_content = content_response.text
-
-            # Apply line limiting if max_lines is positive
-            if max_lines > 0:
-                lines = full_content.splitlines()
-                if len(lines) > max_lines:
-                    limited_lines = lines[-max_lines:]  # Get last max_lines
-                    limited_content = "\n".join(limited_lines)
-                    logger.info(
-                        f"Retrieved log content for log {log_id}: {len(lines)} total lines, "
-                        f"showing last {max_lines} lines ({len(limited_content)} characters)"
-                    )
-                    return limited_content
-                else:
-                    logger.info(
-                        f"Retrieved log content for log {log_id}: {len(lines)} lines "
-                        f"({len(full_content)} characters) - under limit"
-                    )
-                    return full_content
-            else:
-                logger.info(
-                    f"Retrieved full log content for log {log_id} ({len(full_content)} characters)"
-                )
-                return full_content
+        signed_url = self._signed_content_url(response)
+        if signed_url is None:
+            logger.warning(f"No signed content URL found for log {log_id}")
+            return LogContent(log_id=log_id, content="", lines_returned=0, bytes_read=0)
+
+        @self._client.retry_manager.retry_on_failure
+        @self._client.circuit_breakers.for_request("GET", signed_url).protect
+        def read_tail():
+            return read_log_tail(
+                self._client.session,
+                signed_url,
+                max_lines,
+                timeout=request_timeout(
+                    self._client.config.request_timeout_seconds, f"reading log {log_id}"
+                ),
+            )
 
-        logger.warning(f"No signed content URL found for log {log_id}")
-        return ""
+        return self._log_content(log_id, response, read_tail(), max_lines)
+
+    async def get_log_content_by_id_async(
+        self, project_id: str, pipeline_id: int, run_id: int, log_id: int, max_lines: int = 100
+    ) -> str:
+        """Async variant of get_log_content_by_id."""
+        log_content = await self.get_log_tail_by_id_async(
+            project_id, pipeline_id, run_id, log_id, max_lines
+        )
+        return log_content.content
+
+    async def get_log_tail_by_id_async(
+        self, project_id: str, pipeline_id: int, run_id: int, log_id: int, max_lines: int = 100
+    ) -> LogContent:
+        """
+        Async variant of get_log_tail_by_id.
+
+        The signed content URL is read through the client's pooled async session.
+        """
+        url = f"{self._client.organization_url}/{project_id}/_apis/pipelines/{pipeline_id}/runs/{run_id}/logs/{log_id}?$expand=signedContent&api-version=7.1"
+        logger.info(f"Getting log content for log {log_id} from run {run_id}")
+        response = await self._client._send_request_async("GET", url)
+
+        signed_url = self._signed_content_url(response)
+        if signed_url is None:
+            logger.warning(f"No signed content URL found for log {log_id}")
+            return LogContent(log_id=log_id, content="", lines_returned=0, bytes_read=0)
+
+        @self._client.retry_manager.async_retry_on_failure
+        @self._client.circuit_breakers.for_request("GET", signed_url).protect
+        async def read_tail():
+            return await read_log_tail_async(
+                self._client._get_async_session(),
+                signed_url,
+                max_lines,
+                timeout=request_timeout(
+                    self._client.config.request_timeout_seconds, f"reading log {log_id}"
+                ),
+            )
+
+        return self._log_content(log_id, response, await read_tail(), max_lines)
+
+    def _signed_content_url(self, response: dict | None) -> str | None:
+        """Extract the signed content URL from a log metadata response."""
+        if response and "signedContent" in response and "url" in response["signedContent"]:
+            return response["signedContent"]["url"]
+        return None
+
+    def _log_content(
+        self, log_id: int, metadata: dict, tail: LogTail, max_lines: int
+    ) -> LogContent:
+        """Build a LogContent from log metadata and the tail that was read."""
+        log_content = LogContent(
+            log_id=log_id,
+            content=tail.content,
+            lines_returned=tail.lines_returned,
+            total_lines=metadata.get("lineCount"),
+            bytes_read=tail.bytes_read,
+            total_bytes=tail.total_bytes,
+            truncated=tail.truncated,
+        )
+
+        if max_lines > 0:
+            total_lines = log_content.total_lines if log_content.total_lines is not None else "?"
+            logger.info(
+                f"Retrieved log content for log {log_id}: showing last "
+                f"{log_content.lines_returned} of {total_lines} lines "
+                f"({log_content.bytes_read} of {log_content.total_bytes} bytes read)"
+            )
+        else:
+            logger.info(
+                f"Retrieved full log content for log {log_id} ({log_content.bytes_read} bytes)"
+            )
+        return log_content
 
     def get_pipeline_timeline(
         self, project_id: str, pipeline_id: int, run_id: int
@@ -107,6 +208,10 @@ class LogOperations:
         """
         Get the build timeline for a pipeline run, showing status of all stages, jobs, and tasks.
 
+        When timeline tracking is enabled, repeated calls for the same run only
+        fetch the records changed since the last call (by changeId) and merge
+        them into the stored timeline.
+
         Args:
             project_id (str): The ID of the project.
             pipeline_id (int): The ID of the pipeline.
@@ -118,14 +223,70 @@ class LogOperations:
         Raises:
             requests.exceptions.RequestException: For network-related errors.
         """
-        # Use the run_id as build_id for the build timeline API
-        url = f"{self._client.organization_url}/{project_id}/_apis/build/builds/{run_id}/timeline?api-version=7.1-preview.2"
+        change_id = self._timeline_change_id(project_id, run_id)
+        url = self._timeline_url(project_id, run_id, change_id)
         logger.info(f"Getting timeline for pipeline run {run_id} in project {project_id}")
         response = self._client._send_request("GET", url)
-        logger.info(
-            f"Retrieved timeline with {len(response.get('records', []))} records for run {run_id}"
-        )
-        return TimelineResponse(**response)
+        timeline = self._timeline_from_response(project_id, run_id, response, change_id)
+        if timeline is None:
+            url = self._timeline_url(project_id, run_id, None)
+            response = self._client._send_request("GET", url)
+            timeline = self._timeline_from_response(project_id, run_id, response, None)
+        return timeline
+
+    async def get_pipeline_timeline_async(
+        self, project_id: str, pipeline_id: int, run_id: int
+    ) -> TimelineResponse:
+        """Async variant of get_pipeline_timeline."""
+        change_id = self._timeline_change_id(project_id, run_id)
+        url = self._timeline_url(project_id, run_id, change_id)
+        logger.info(f"Getting timeline for pipeline run {run_id} in project {project_id}")
+        response = await self._client._send_request_async("GET", url)
+        timeline = self._timeline_from_response(project_id, run_id, response, change_id)
+        if timeline is None:
+            url = self._timeline_url(project_id, run_id, None)
+            response = await self._client._send_request_async("GET", url)
+            timeline = self._timeline_from_response(project_id, run_id, response, None)
+        return timeline
+
+    def _timeline_change_id(self, project_id: str, run_id: int) -> int | None:
+        """Get the changeId to request a timeline delta with, if tracking is enabled."""
+        if not self._client.config.timeline_tracker.enabled:
+            return None
+        return self._client.timeline_tracker.change_id(project_id, run_id)
+
+    def _timeline_url(self, project_id: str, run_id: int, change_id: int | None) -> str:
+        """Build the build timeline URL, using the run_id as build ID."""
+        url = f"{self._client.organization_url}/{project_id}/_apis/build/builds/{run_id}/timeline?api-version=7.1-preview.2"
+        if change_id is not None:
+            url += f"&changeId={change_id}"
+        return url
+
+    def _timeline_from_response(
+        self, project_id: str, run_id: int, response: dict | None, change_id: int | None
+    ) -> TimelineResponse | None:
+        """
+        Turn a timeline response (full or delta) into the complete timeline.
+
+        Returns None if a delta can't be applied because the stored timeline was
+        dropped after its changeId was read; the caller then refetches in full.
+        """
+        record_count = len((response or {}).get("records", []))
+        if not self._client.config.timeline_tracker.enabled:
+            logger.info(f"Retrieved timeline with {record_count} records for run {run_id}")
+            return TimelineResponse(**response)
+
+        timeline = self._client.timeline_tracker.merge(project_id, run_id, response, change_id)
+        if timeline is None:
+            logger.info(f"Stored timeline of run {run_id} was dropped; fetching it in full")
+        elif change_id is None:
+            logger.info(f"Retrieved timeline with {record_count} records for run {run_id}")
+        else:
+            logger.info(
+                f"Retrieved {record_count} changed timeline records for run {run_id} "
+                f"({len(timeline.records)} total)"
+            )
+        return timeline
 
     def get_pipeline_failure_summary(
         self, project_id: str, pipeline_id: int, run_id: int, max_lines: int = 100
@@ -133,6 +294,11 @@ class LogOperations:
         """
         Get a comprehensive summary of pipeline failures, including root causes and affected components.
 
+        The run lookup is issued concurrently with the timeline fetch, and the
+        logs of failed tasks are fetched in parallel on a bounded worker pool.
+        A log that fails or exceeds the per-log timeout is reported on its step
+        instead of failing the whole summary.
+
         Args:
             project_id (str): The ID of the project.
             pipeline_id (int): The ID of the pipeline.
@@ -150,68 +316,215 @@ class LogOperations:
         from .builds import BuildOperations
 
         builds_ops = BuildOperations(self._client)
+        log_fetch = self._client.config.log_fetch
 
         logger.info(f"Analyzing failures for pipeline run {run_id}")
 
-        # Get the timeline to identify failed steps
-        timeline = self.get_pipeline_timeline(project_id, pipeline_id, run_id)
+        # The run is only needed for its URL, so look it up while the timeline loads
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="ado-run-lookup") as run_lookup:
+            # Run in a copy of this context so the lookup keeps the caller's deadline
+            run_future = run_lookup.submit(
+                copy_context().run, builds_ops.get_pipeline_run, project_id, pipeline_id, run_id
+            )
+
+            timeline = self.get_pipeline_timeline(project_id, pipeline_id, run_id)
+            failed_records = [record for record in timeline.records if record.result == "failed"]
+            root_cause_tasks, hierarchy_failures = self._split_failures(failed_records)
+
+            self._fetch_logs_in_pool(
+                [step for step in root_cause_tasks if step.log_id],
+                lambda step: self.get_log_tail_by_id(
+                    project_id, pipeline_id, run_id, step.log_id, max_lines
+                ),
+                log_fetch,
+            )
+
+            pipeline_run = run_future.result()
 
-        # Find all failed records
-        failed_records = [record for record in timeline.records if record.result == "failed"]
+        return self._build_failure_summary(
+            run_id, pipeline_run, len(failed_records), root_cause_tasks, hierarchy_failures
+        )
 
-        # Separate root causes (Tasks) from hierarchy failures (Jobs, Stages)
+    async def get_pipeline_failure_summary_async(
+        self, project_id: str, pipeline_id: int, run_id: int, max_lines: int = 100
+    ) -> FailureSummary:
+        """Async variant of get_pipeline_failure_summary."""
+        # Import here to avoid circular imports
+        from .builds import BuildOperations
+
+        builds_ops = BuildOperations(self._client)
+        log_fetch = self._client.config.log_fetch
+
+        logger.info(f"Analyzing failures for pipeline run {run_id}")
+
+        run_task = asyncio.ensure_future(
+            builds_ops.get_pipeline_run_async(project_id, pipeline_id, run_id)
+        )
+        try:
+            timeline = await self.get_pipeline_timeline_async(project_id, pipeline_id, run_id)
+            failed_records = [record for record in timeline.records if record.result == "failed"]
+            root_cause_tasks, hierarchy_failures = self._split_failures(failed_records)
+
+            semaphore = asyncio.Semaphore(log_fetch.max_concurrency)
+
+            async def fetch_log(step: StepFailure) -> None:
+                async with semaphore:
+                    try:
+                        log_content = await asyncio.wait_for(
+                            self.get_log_tail_by_id_async(
+                                project_id, pipeline_id, run_id, step.log_id, max_lines
+                            ),
+                            timeout=log_fetch.per_log_timeout_seconds,
+                        )
+                    except TimeoutError:
+                        self._record_log_error(
+                            step,
+                            f"timed out after {log_fetch.per_log_timeout_seconds}s",
+                        )
+                    except Exception as e:
+                        self._record_log_error(step, str(e))
+                    else:
+                        self._attach_log(step, log_content)
+
+            await asyncio.gather(*(fetch_log(step) for step in root_cause_tasks if step.log_id))
+
+            pipeline_run = await run_task
+        finally:
+            run_task.cancel()
+
+        return self._build_failure_summary(
+            run_id, pipeline_run, len(failed_records), root_cause_tasks, hierarchy_failures
+        )
+
+    def _split_failures(self, failed_records) -> tuple[list[StepFailure], list[StepFailure]]:
+        """Separate root causes (Tasks) from hierarchy failures (Jobs, Stages)."""
         root_cause_tasks = []
         hierarchy_failures = []
-
         for record in failed_records:
-            # Extract issues as strings
-            issues = []
-            if record.issues:
-                issues = [issue.get("message", "Unknown error") for issue in record.issues]
-
-            step_failure = StepFailure(
-                step_name=record.name or "Unknown Step",
-                step_type=record.type or "Unknown",
-                result=record.result or "failed",
-                log_id=record.log.get("id") if record.log else None,
-                issues=issues,
-                start_time=record.startTime,
-                finish_time=record.finishTime,
-            )
-
-            # Get log content for tasks with logs
-            if record.type == "Task" and step_failure.log_id:
-                try:
-                    step_failure.log_content = self.get_log_content_by_id(
-                        project_id, pipeline_id, run_id, step_failure.log_id, max_lines
-                    )
-                except Exception as e:
-                    logger.warning(f"Failed to get log content for step {record.name}: {e}")
-                    step_failure.log_content = f"Error retrieving log: {e}"
-
-            # Categorize failures
+            step_failure = self._step_failure_from_record(record)
             if record.type == "Task":
                 root_cause_tasks.append(step_failure)
             else:
                 hierarchy_failures.append(step_failure)
+        return root_cause_tasks, hierarchy_failures
+
+    def _fetch_logs_in_pool(
+        self,
+        steps: list[StepFailure],
+        fetch: Callable[[StepFailure], LogContent],
+        log_fetch: LogFetchConfig,
+    ) -> None:
+        """
+        Fetch and attach the logs of several steps on a bounded worker pool.
+
+        Each log's timeout starts when a worker picks it up, so logs queued
+        behind others are not penalised. Failures and timeouts are recorded on
+        the step rather than raised.
+        """
+        if not steps:
+            return
+
+        per_log_timeout = log_fetch.per_log_timeout_seconds
+        started: dict[int, float] = {}
+
+        def run(index: int) -> LogContent:
+            started[index] = time.monotonic()
+            return fetch(steps[index])
 
-        # Get pipeline URL from the run
-        pipeline_run = builds_ops.get_pipeline_run(project_id, pipeline_id, run_id)
+        executor = ThreadPoolExecutor(
+            max_workers=min(log_fetch.max_concurrency, len(steps)),
+            thread_name_prefix="ado-log-fetch",
+        )
+        try:
+            futures = {
+                executor.submit(copy_context().run, run, index): index
+                for index in range(len(steps))
+            }
+            pending = set(futures)
+
+            while pending:
+                now = time.monotonic()
+                deadlines = [
+                    started[futures[f]] + per_log_timeout for f in pending if futures[f] in started
+                ]
+                wait_for = max(0.0, min(deadlines, default=now + per_log_timeout) - now)
+                done, pending = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    step = steps[futures[future]]
+                    try:
+                        self._attach_log(step, future.result())
+                    except Exception as e:
+                        self._record_log_error(step, str(e))
+
+                now = time.monotonic()
+                for future in list(pending):
+                    index = futures[future]
+                    if index in started and now - started[index] >= per_log_timeout:
+                        pending.discard(future)
+                        self._record_log_error(steps[index], f"timed out after {per_log_timeout}s")
+        finally:
+            # Don't wait for fetches that were abandoned after timing out
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _step_failure_from_record(self, record) -> StepFailure:
+        """Build a StepFailure (without log content) from a failed timeline record."""
+        # Extract issues as strings
+        issues = []
+        if record.issues:
+            issues = [issue.get("message", "Unknown error") for issue in record.issues]
+
+        return StepFailure(
+            step_name=record.name or "Unknown Step",
+            step_type=record.type or "Unknown",
+            result=record.result or "failed",
+            log_id=record.log.get("id") if record.log else None,
+            issues=issues,
+            start_time=record.startTime,
+            finish_time=record.finishTime,
+        )
+
+    def _attach_log(self, step_failure: StepFailure, log_content: LogContent) -> None:
+        """Copy a log tail and its size information onto a step failure."""
+        step_failure.log_content = log_content.content
+        step_failure.log_total_lines = log_content.total_lines
+        step_failure.log_total_bytes = log_content.total_bytes
+        step_failure.log_truncated = log_content.truncated
+
+    def _record_log_error(self, step_failure: StepFailure, error: str) -> None:
+        """Report a log that could not be retrieved on its step failure."""
+        logger.warning(f"Failed to get log content for step {step_failure.step_name}: {error}")
+        step_failure.log_error = error
+        step_failure.log_content = f"Error retrieving log: {error}"
+
+    def _build_failure_summary(
+        self,
+        run_id: int,
+        pipeline_run,
+        total_failed: int,
+        root_cause_tasks: list[StepFailure],
+        hierarchy_failures: list[StepFailure],
+    ) -> FailureSummary:
+        """Assemble the FailureSummary for a run."""
         pipeline_url = None
         if hasattr(pipeline_run, "_links") and pipeline_run._links:
             pipeline_url = pipeline_run._links.get("web", {}).get("href")
 
-        total_failed = len(failed_records)
         logger.info(
             f"Found {total_failed} failed steps: {len(root_cause_tasks)} root causes, {len(hierarchy_failures)} hierarchy failures"
         )
 
+        failed_log_fetches = sum(1 for step in root_cause_tasks if step.log_error)
+        if failed_log_fetches:
+            logger.warning(f"Could not retrieve {failed_log_fetches} step logs for run {run_id}")
+
         return FailureSummary(
             total_failed_steps=total_failed,
             root_cause_tasks=root_cause_tasks,
             hierarchy_failures=hierarchy_failures,
             pipeline_url=pipeline_url,
             build_id=run_id,
+            failed_log_fetches=failed_log_fetches,
         )
 
     def get_failed_step_logs(
@@ -264,3 +577,28 @@ class LogOperations:
 
         logger.info(f"Returning {len(all_failures)} failed steps")
         return all_failures
+
+    async def get_failed_step_logs_async(
+        self,
+        project_id: str,
+        pipeline_id: int,
+        run_id: int,
+        step_name: str | None = None,
+        max_lines: int = 100,
+    ) -> list[StepFailure]:
+        """Async variant of get_failed_step_logs."""
+        failure_summary = await self.get_pipeline_failure_summary_async(
+            project_id, pipeline_id, run_id, max_lines
+        )
+        all_failures = failure_summary.root_cause_tasks + failure_summary.hierarchy_failures
+
+        if step_name:
+            step_name_lower = step_name.lower()
+            filtered_failures = [
+                failure for failure in all_failures if step_name_lower in failure.step_name.lower()
+            ]
+            logger.info(f"Filtered to {len(filtered_failures)} steps matching '{step_name}'")
+            return filtered_failures
+
+        logger.info(f"Returning {len(all_failures)} failed steps")
+        return all_failures
@@ -39,25 +39,48 @@ class PipelineOperations:
             url = f"{self._client.organization_url}/{project_id}/_apis/pipelines?api-version=7.1"
             logger.info(f"Fetching pipelines for project {project_id} from: {url}")
             response = self._client._send_request("GET", url)
-            pipelines_data = response.get("value", [])
+            return self._parse_pipelines(project_id, response, span)
 
-            span.set_attribute("ado.pipelines_count", len(pipelines_data))
-            logger.info(f"Retrieved {len(pipelines_data)} pipelines for project {project_id}")
+    async def list_pipelines_async(self, project_id: str) -> list[Pipeline]:
+        """
+        Retrieve a list of pipelines for a given project without blocking the event loop.
+
+        Args:
+            project_id (str): The ID of the project.
+
+        Returns:
+            List[Pipeline]: A list of Pipeline objects.
+        """
+        with tracer.start_as_current_span("ado_list_pipelines") as span:
+            span.set_attribute("ado.operation", "list_pipelines")
+            span.set_attribute("ado.project_id", project_id)
+
+            url = f"{self._client.organization_url}/{project_id}/_apis/pipelines?api-version=7.1"
+            logger.info(f"Fetching pipelines for project {project_id} from: {url}")
+            response = await self._client._send_request_async("GET", url)
+            return self._parse_pipelines(project_id, response, span)
 
-            if pipelines_data:
-                logger.debug(f"First pipeline data: {pipelines_data[0]}")
+    def _parse_pipelines(self, project_id: str, response: dict, span) -> list[Pipeline]:
+        """Parse a pipelines API response into Pipeline models."""
+        pipelines_data = response.get("value", [])
 
-            pipelines = []
-            for pipeline_data in pipelines_data:
-                try:
-                    pipeline = Pipeline(**pipeline_data)
-                    pipelines.append(pipeline)
-                    logger.debug(f"Parsed pipeline: {pipeline.name} (ID: {pipeline.id})")
-                except Exception as e:
-                    logger.error(f"Failed to parse pipeline data: {pipeline_data}. Error: {e}")
-                    span.record_exception(e)
+        span.set_attribute("ado.pipelines_count", len(pipelines_data))
+        logger.info(f"Retrieved {len(pipelines_data)} pipelines for project {project_id}")
 
-            return pipelines
+        if pipelines_data:
+            logger.debug(f"First pipeline data: {pipelines_data[0]}")
+
+        pipelines = []
+        for pipeline_data in pipelines_data:
+            try:
+                pipeline = Pipeline(**pipeline_data)
+                pipelines.append(pipeline)
+                logger.debug(f"Parsed pipeline: {pipeline.name} (ID: {pipeline.id})")
+            except Exception as e:
+                logger.error(f"Failed to parse pipeline data: {pipeline_data}. Error: {e}")
+                span.record_exception(e)
+
+        return pipelines
 
     def create_pipeline(self, project_id: str, request: CreatePipelineRequest) -> Pipeline:
         """
@@ -142,6 +165,14 @@ class PipelineOperations:
         logger.debug(f"Pipeline {pipeline_id} name: {response.get('name')}")
         return response
 
+    async def get_pipeline_async(self, project_id: str, pipeline_id: int) -> dict:
+        """Async variant of get_pipeline."""
+        url = f"{self._client.organization_url}/{project_id}/_apis/pipelines/{pipeline_id}?api-version=7.1"
+        logger.debug(f"Getting pipeline {pipeline_id} details for project {project_id}")
+        response = await self._client._send_request_async("GET", url)
+        logger.debug(f"Pipeline {pipeline_id} name: {response.get('name')}")
+        return response
+
     def preview_pipeline(
         self, project_id: str, pipeline_id: int, request: PipelinePreviewRequest | None = None
     ) -> PreviewRun:
@@ -170,6 +201,29 @@ class PipelineOperations:
         response = self._client._send_request("POST", url, json=request_data)
         logger.info(f"Pipeline preview completed for pipeline {pipeline_id}")
 
+        return self._build_preview_run(request, request_data, response)
+
+    async def preview_pipeline_async(
+        self, project_id: str, pipeline_id: int, request: PipelinePreviewRequest | None = None
+    ) -> PreviewRun:
+        """Async variant of preview_pipeline."""
+        url = f"{self._client.organization_url}/{project_id}/_apis/pipelines/{pipeline_id}/preview?api-version=7.1"
+        logger.info(f"Previewing pipeline {pipeline_id} in project {project_id}")
+
+        request_data = {}
+        if request:
+            request_data = request.model_dump(exclude_none=True)
+
+        logger.debug(f"Pipeline preview request data: {request_data}")
+        response = await self._client._send_request_async("POST", url, json=request_data)
+        logger.info(f"Pipeline preview completed for pipeline {pipeline_id}")
+
+        return self._build_preview_run(request, request_data, response)
+
+    def _build_preview_run(
+        self, request: PipelinePreviewRequest | None, request_data: dict, response: dict
+    ) -> PreviewRun:
+        """Build the PreviewRun, patching finalYaml with the user's resource parameters."""
         # Update the finalYaml to reflect user's resource parameters if provided
         if request and request.resources:
             resources_data = request_data.get("resources", {})
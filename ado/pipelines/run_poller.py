@@ -0,0 +1,374 @@
+"""
+Shared, adaptive status polling for pipeline runs being waited on.
+
+Every waiter used to poll its own run with get_pipeline_run on a fixed
+interval. RunStatusPoller instead tracks all watched runs on one background
+thread, checks the runs that are due with a single
+``_apis/build/builds?buildIds=...`` request per project per tick, and resolves
+each waiter's future once its run completes. How often a run is checked adapts
+to its age and to the remaining time estimated from its timeline.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+from opentelemetry import metrics
+
+from ..config import RunPollerConfig
+from ..models import PipelineRun, TimelineResponse
+
+logger = logging.getLogger(__name__)
+meter = metrics.get_meter(__name__)
+
+# Azure DevOps rejects very long buildIds lists, so larger batches are split
+MAX_BUILD_IDS_PER_REQUEST = 100
+# Consecutive failed status checks after which a run's waiters receive the error
+MAX_CONSECUTIVE_ERRORS = 3
+
+
+@dataclass
+class _WatchedRun:
+    """A run being polled and the futures of everyone waiting on it."""
+
+    project_id: str
+    pipeline_id: int
+    run_id: int
+    waiters: list[Future] = field(default_factory=list)
+    fixed_interval: float | None = None
+    started_at: datetime | None = None
+    estimated_remaining: float | None = None
+    timeline_checked_at: float = 0.0
+    next_check: float = 0.0
+    errors: int = 0
+
+
+def _parse_time(value: str | None) -> datetime | None:
+    """Parse an Azure DevOps timestamp, which may carry 7 fractional digits."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+
+
+def estimate_remaining_seconds(timeline: TimelineResponse, now: datetime) -> float | None:
+    """
+    Estimate how long a run has left from the progress of its timeline tasks.
+
+    Assumes the pending tasks take as long on average as the completed ones.
+
+    Args:
+        timeline: The run's timeline.
+        now: The current time (timezone aware).
+
+    Returns:
+        Estimated seconds remaining, or None if no task has completed yet.
+    """
+    tasks = [record for record in timeline.records if record.type == "Task"]
+    completed = [task for task in tasks if task.state == "completed"]
+    start_times = [_parse_time(task.startTime) for task in tasks]
+    start_times = [start for start in start_times if start is not None]
+    if not completed or not start_times:
+        return None
+
+    elapsed = (now - min(start_times)).total_seconds()
+    pending = len(tasks) - len(completed)
+    return max(0.0, elapsed * pending / len(completed))
+
+
+class RunStatusPoller:
+    """
+    Polls the status of every watched run from a single background thread.
+
+    Waiters get a concurrent.futures.Future that resolves with the completed
+    PipelineRun, so sync callers block on it and async callers await it
+    without holding a thread. The polling thread starts on the first watch and
+    exits once nothing is being watched.
+    """
+
+    def __init__(self, client_core, config: RunPollerConfig):
+        self._client = client_core
+        self.config = config
+        self._runs: dict[tuple[str, int], _WatchedRun] = {}
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+
+        self._requests_counter = meter.create_counter(
+            name="ado_run_status_poll_requests",
+            description="Number of batched build status requests made by the run poller",
+            unit="1",
+        )
+
+    def watch(
+        self,
+        project_id: str,
+        pipeline_id: int,
+        run_id: int,
+        poll_interval_seconds: float | None = None,
+    ) -> Future:
+        """
+        Start waiting for a run to complete.
+
+        Args:
+            project_id: The ID of the project.
+            pipeline_id: The ID of the pipeline.
+            run_id: The ID of the pipeline run.
+            poll_interval_seconds: Fixed interval for this run. None polls adaptively.
+
+        Returns:
+            Future: Resolves with the completed PipelineRun, or with the error
+                that kept the run's status from being read.
+        """
+        future: Future = Future()
+        with self._condition:
+            key = (project_id, run_id)
+            run = self._runs.get(key)
+            if run is None:
+                run = _WatchedRun(project_id, pipeline_id, run_id, next_check=time.monotonic())
+                self._runs[key] = run
+            if poll_interval_seconds is not None:
+                run.fixed_interval = poll_interval_seconds
+            run.waiters.append(future)
+            self._ensure_thread()
+            self._condition.notify()
+        return future
+
+    def unwatch(self, project_id: str, run_id: int, future: Future) -> None:
+        """Stop waiting on a run, e.g. after the waiter timed out."""
+        with self._condition:
+            run = self._runs.get((project_id, run_id))
+            if run is None:
+                return
+            if future in run.waiters:
+                run.waiters.remove(future)
+            if not run.waiters:
+                del self._runs[(project_id, run_id)]
+        future.cancel()
+
+    def wait(
+        self,
+        project_id: str,
+        pipeline_id: int,
+        run_id: int,
+        timeout_seconds: float,
+        poll_interval_seconds: float | None = None,
+    ) -> PipelineRun:
+        """
+        Block until a run completes.
+
+        Raises:
+            TimeoutError: If the run doesn't complete within timeout_seconds.
+        """
+        future = self.watch(project_id, pipeline_id, run_id, poll_interval_seconds)
+        try:
+            return future.result(timeout=timeout_seconds)
+        except TimeoutError:
+            self.unwatch(project_id, run_id, future)
+            raise TimeoutError(
+                f"Pipeline run {run_id} did not complete within {timeout_seconds} seconds"
+            ) from None
+
+    async def wait_async(
+        self,
+        project_id: str,
+        pipeline_id: int,
+        run_id: int,
+        timeout_seconds: float,
+        poll_interval_seconds: float | None = None,
+    ) -> PipelineRun:
+        """
+        Async variant of wait that holds no thread while waiting.
+
+        Raises:
+            TimeoutError: If the run doesn't complete within timeout_seconds.
+        """
+        future = self.watch(project_id, pipeline_id, run_id, poll_interval_seconds)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout_seconds)
+        except (TimeoutError, asyncio.CancelledError) as e:
+            self.unwatch(project_id, run_id, future)
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            raise TimeoutError(
+                f"Pipeline run {run_id} did not complete within {timeout_seconds} seconds"
+            ) from None
+
+    def watched_count(self) -> int:
+        """Number of runs currently being polled."""
+        with self._condition:
+            return len(self._runs)
+
+    def close(self) -> None:
+        """Stop polling and cancel all outstanding waiters."""
+        with self._condition:
+            self._closed = True
+            runs = list(self._runs.values())
+            self._runs.clear()
+            self._condition.notify()
+        for run in runs:
+            for future in run.waiters:
+                future.cancel()
+
+    def _ensure_thread(self) -> None:
+        # Called with the condition held
+        if self._thread is None or not self._thread.is_alive():
+            self._closed = False
+            self._thread = threading.Thread(
+                target=self._run_loop, name="ado-run-poller", daemon=True
+            )
+            self._thread.start()
+
+    def _run_loop(self) -> None:
+        while True:
+            with self._condition:
+                if self._closed or not self._runs:
+                    self._thread = None
+                    return
+                now = time.monotonic()
+                next_check = min(run.next_check for run in self._runs.values())
+                if next_check > now:
+                    self._condition.wait(timeout=next_check - now)
+                    continue
+                due = [run for run in self._runs.values() if run.next_check <= now]
+
+            try:
+                self.poll_once(due)
+            except Exception as e:
+                # Never let the shared thread die; poll_once reports per-run errors itself
+                logger.exception(f"Run status poller tick failed: {e}")
+
+    def poll_once(self, runs: list[_WatchedRun]) -> None:
+        """
+        Check the status of the given runs with one batched request per project.
+
+        Completed runs resolve their waiters; the rest are rescheduled.
+        """
+        by_project: dict[str, list[_WatchedRun]] = {}
+        for run in runs:
+            by_project.setdefault(run.project_id, []).append(run)
+
+        for project_id, project_runs in by_project.items():
+            for start in range(0, len(project_runs), MAX_BUILD_IDS_PER_REQUEST):
+                batch = project_runs[start : start + MAX_BUILD_IDS_PER_REQUEST]
+                try:
+                    builds = self._fetch_builds(project_id, [run.run_id for run in batch])
+                except Exception as e:
+                    logger.warning(f"Batched status check failed for project {project_id}: {e}")
+                    for run in batch:
+                        self._record_error(run, e)
+                    continue
+
+                for run in batch:
+                    build = builds.get(run.run_id)
+                    try:
+                        self._handle_build(run, build)
+                    except Exception as e:
+                        self._record_error(run, e)
+
+    def _fetch_builds(self, project_id: str, run_ids: list[int]) -> dict[int, dict]:
+        """Get the current status of several builds in one request."""
+        ids = ",".join(str(run_id) for run_id in run_ids)
+        url = (
+            f"{self._client.organization_url}/{project_id}/_apis/build/builds"
+            f"?buildIds={ids}&api-version=7.1"
+        )
+        self._requests_counter.add(1, {"batch_size": len(run_ids)})
+        logger.debug(f"Checking status of {len(run_ids)} runs in project {project_id}")
+        response = self._client._send_request("GET", url)
+        return {build["id"]: build for build in (response or {}).get("value", [])}
+
+    def _handle_build(self, run: _WatchedRun, build: dict | None) -> None:
+        if build is not None and build.get("status") != "completed":
+            run.errors = 0
+            run.started_at = run.started_at or _parse_time(
+                build.get("startTime") or build.get("queueTime")
+            )
+            self._refresh_estimate(run)
+            self._reschedule(run)
+            return
+
+        # Completed (or missing from the batch response): read the run itself so
+        # waiters get the same PipelineRun as get_pipeline_run would return
+        pipeline_run = self._client._builds.get_pipeline_run(
+            run.project_id, run.pipeline_id, run.run_id
+        )
+        if not pipeline_run.is_completed():
+            self._reschedule(run)
+            return
+
+        logger.info(f"Pipeline run {run.run_id} completed with result: {pipeline_run.result}")
+        self._resolve(run, result=pipeline_run)
+
+    def _refresh_estimate(self, run: _WatchedRun) -> None:
+        if run.fixed_interval is not None or self.config.timeline_refresh_seconds <= 0:
+            return
+        now = time.monotonic()
+        if now - run.timeline_checked_at < self.config.timeline_refresh_seconds:
+            return
+        run.timeline_checked_at = now
+        try:
+            timeline = self._client._logs.get_pipeline_timeline(
+                run.project_id, run.pipeline_id, run.run_id
+            )
+            run.estimated_remaining = estimate_remaining_seconds(timeline, datetime.now(UTC))
+        except Exception as e:
+            logger.debug(f"Could not estimate remaining time for run {run.run_id}: {e}")
+
+    def next_interval(self, run: _WatchedRun) -> float:
+        """
+        Choose how long to wait before checking a run again.
+
+        New runs are checked often since many fail fast. After that the
+        interval follows the estimated remaining time when the timeline gives
+        one, and otherwise grows with the run's age.
+        """
+        if run.fixed_interval is not None:
+            return run.fixed_interval
+
+        min_interval = self.config.min_interval_seconds
+        max_interval = self.config.max_interval_seconds
+        age = (datetime.now(UTC) - run.started_at).total_seconds() if run.started_at else 0.0
+
+        if age < self.config.fast_poll_window_seconds:
+            interval = min_interval
+        elif run.estimated_remaining is not None:
+            interval = run.estimated_remaining / 4
+        else:
+            interval = age / 10
+        return min(max(interval, min_interval), max_interval)
+
+    def _reschedule(self, run: _WatchedRun) -> None:
+        run.next_check = time.monotonic() + self.next_interval(run)
+        logger.debug(f"Pipeline run {run.run_id} still in progress")
+
+    def _record_error(self, run: _WatchedRun, error: Exception) -> None:
+        run.errors += 1
+        if run.errors >= MAX_CONSECUTIVE_ERRORS:
+            self._resolve(run, error=error)
+            return
+        # Back off on errors so a failing endpoint isn't hammered
+        run.next_check = time.monotonic() + self.config.max_interval_seconds
+
+    def _resolve(
+        self, run: _WatchedRun, result: PipelineRun | None = None, error: Exception | None = None
+    ) -> None:
+        with self._condition:
+            key = (run.project_id, run.run_id)
+            if self._runs.get(key) is run:
+                del self._runs[key]
+            waiters = list(run.waiters)
+        for future in waiters:
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
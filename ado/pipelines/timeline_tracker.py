@@ -0,0 +1,138 @@
+"""
+Incremental build timeline tracking using the timeline changeId.
+
+Timelines of large matrix builds can hold thousands of records, and watch and
+failure-summary flows read them repeatedly while a run is in flight. The build
+timeline API accepts a ``changeId`` and then returns only the records changed
+since that change. TimelineTracker remembers the last timeline seen for each
+run, hands out the changeId to request deltas with, and merges the returned
+records into the stored timeline.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+from opentelemetry import metrics
+
+from ..models import TimelineRecord, TimelineResponse
+
+logger = logging.getLogger(__name__)
+meter = metrics.get_meter(__name__)
+
+
+@dataclass
+class _TrackedTimeline:
+    """The merged records and metadata of one run's timeline."""
+
+    records: dict[str, TimelineRecord] = field(default_factory=dict)
+    metadata: dict[str, Any] = field(default_factory=dict)
+    change_id: int | None = None
+
+
+class TimelineTracker:
+    """
+    Thread-safe, LRU-bounded store of the latest timeline of each run.
+
+    Records are replaced rather than mutated when a delta arrives, so timelines
+    returned earlier stay consistent while they are being read.
+    """
+
+    def __init__(self, max_runs: int = 200):
+        self.max_runs = max_runs
+        self._timelines: OrderedDict[tuple[str, int], _TrackedTimeline] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._delta_counter = meter.create_counter(
+            name="ado_timeline_delta_fetches",
+            description="Number of timeline fetches answered with a changeId delta",
+            unit="1",
+        )
+
+    def change_id(self, project_id: str, run_id: int) -> int | None:
+        """
+        Get the changeId to request a delta for a run's timeline.
+
+        Returns:
+            The changeId of the stored timeline, or None if the full timeline
+            must be fetched.
+        """
+        with self._lock:
+            tracked = self._timelines.get((project_id, run_id))
+            return tracked.change_id if tracked else None
+
+    def merge(
+        self,
+        project_id: str,
+        run_id: int,
+        response: dict[str, Any] | None,
+        base_change_id: int | None,
+    ) -> TimelineResponse | None:
+        """
+        Merge a timeline response into the stored timeline for a run.
+
+        Args:
+            project_id: The ID of the project.
+            run_id: The ID of the pipeline run.
+            response: The parsed timeline response, or None if nothing changed.
+            base_change_id: The changeId the request was made with, or None for
+                a full fetch.
+
+        Returns:
+            TimelineResponse: The complete, merged timeline, or None if the
+            response is a delta whose base timeline is no longer stored (the run
+            was evicted or forgotten meanwhile) and the full timeline must be
+            fetched instead.
+        """
+        key = (project_id, run_id)
+        response = response or {}
+        records = [TimelineRecord(**record) for record in response.get("records", [])]
+        metadata = {k: v for k, v in response.items() if k != "records" and v is not None}
+
+        with self._lock:
+            tracked = self._timelines.get(key)
+            if base_change_id is not None and tracked is None:
+                # A delta alone is an incomplete record set; don't store it
+                logger.debug(f"Discarding timeline delta for run {run_id}: base timeline gone")
+                return None
+            if base_change_id is None:
+                # A full fetch replaces whatever we had
+                tracked = _TrackedTimeline()
+                self._timelines[key] = tracked
+            else:
+                self._delta_counter.add(1)
+
+            for record in records:
+                # Records without an id can't be matched against later deltas
+                tracked.records[record.id or f"__anonymous_{len(tracked.records)}"] = record
+            tracked.metadata.update(metadata)
+
+            change_id = metadata.get("changeId")
+            if change_id is not None:
+                tracked.change_id = max(change_id, tracked.change_id or 0)
+
+            self._timelines.move_to_end(key)
+            while len(self._timelines) > self.max_runs:
+                self._timelines.popitem(last=False)
+
+            logger.debug(
+                f"Merged {len(records)} timeline records for run {run_id} "
+                f"(changeId {base_change_id} -> {tracked.change_id})"
+            )
+            return TimelineResponse(records=list(tracked.records.values()), **tracked.metadata)
+
+    def forget(self, project_id: str, run_id: int) -> None:
+        """Drop the stored timeline for a run."""
+        with self._lock:
+            self._timelines.pop((project_id, run_id), None)
+
+    def clear(self) -> None:
+        """Drop all stored timelines."""
+        with self._lock:
+            self._timelines.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._timelines)
@@ -0,0 +1,315 @@
+"""
+Client-side adaptive rate limiting for Azure DevOps API calls.
+
+Azure DevOps throttles per user and organization by a budget of TSTUs
+(throughput units). When a caller gets close to it, responses carry
+X-RateLimit-Limit/-Remaining/-Reset headers, X-RateLimit-Delay when requests
+are being slowed down, and 429 with Retry-After once the budget is spent.
+Handling 429 per call only makes the thread that got it back off while the
+others keep sending requests.
+
+AdaptiveRateLimiter paces every request to an organization with two
+controls, both fed by those headers:
+
+- a token bucket that bounds the request rate. Its rate drops in proportion
+  to the remaining budget until the window resets, and all requests pause
+  until Retry-After has passed after a 429;
+- an AIMD concurrency window that bounds requests in flight. It grows by
+  about one request per window of successful responses and halves when
+  requests are delayed or throttled.
+
+Requests made under background_priority() (cache warm-up, prefetching) only
+use background_share of the window and leave the rest of the token bucket
+to interactive requests, so they never hold up a tool call.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator, Mapping
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from opentelemetry import metrics
+
+from .config import RateLimitConfig
+from .deadline import deadline_exceeded_error, remaining_time
+
+logger = logging.getLogger(__name__)
+meter = metrics.get_meter(__name__)
+
+# How long to wait before checking again when all concurrency slots are taken
+_SLOT_POLL_SECONDS = 0.05
+
+_wait_histogram = meter.create_histogram(
+    name="ado_rate_limit_wait_seconds",
+    description="Time requests waited for the client-side rate limiter",
+    unit="s",
+)
+_throttle_counter = meter.create_counter(
+    name="ado_rate_limit_throttle_signals",
+    description="Number of throttling signals received from Azure DevOps",
+    unit="1",
+)
+
+
+_background = ContextVar("ado_background_priority", default=False)
+
+
+@contextmanager
+def background_priority() -> Iterator[None]:
+    """Mark requests made in this block as background work that yields to interactive requests."""
+    token = _background.set(True)
+    try:
+        yield
+    finally:
+        _background.reset(token)
+
+
+def _header_float(headers: Mapping[str, str], name: str) -> float | None:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class AdaptiveRateLimiter:
+    """
+    Token bucket plus AIMD concurrency window shared by all requests to one organization.
+
+    Thread-safe; async callers wait with asyncio.sleep so they never block
+    the event loop.
+
+    Args:
+        config: Rate limit settings.
+        name: Label used in logs and metrics, typically the organization URL.
+    """
+
+    def __init__(self, config: RateLimitConfig, name: str = ""):
+        self.config = config
+        self.name = name
+        self._lock = threading.Lock()
+        self._slot_released = threading.Condition(self._lock)
+
+        self._rate = config.requests_per_second
+        self._tokens = float(config.burst)
+        self._last_refill = time.monotonic()
+        self._paced_until = 0.0
+        self._blocked_until = 0.0
+
+        self._concurrency_limit = float(config.initial_concurrency)
+        self._in_flight = 0
+        self._last_decrease = 0.0
+
+    # Admission
+
+    def _refill(self, now: float) -> None:
+        """Add tokens for the time elapsed and restore the full rate after a window reset (lock held)."""
+        if self._paced_until and now >= self._paced_until:
+            self._rate = self.config.requests_per_second
+            self._paced_until = 0.0
+        self._tokens = min(self.config.burst, self._tokens + (now - self._last_refill) * self._rate)
+        self._last_refill = now
+
+    def _try_acquire(self, background: bool = False) -> float:
+        """
+        Take a token and a concurrency slot if both are available (lock held).
+
+        Background requests must leave the interactive share of the window and
+        the token bucket free.
+
+        Returns:
+            0 if admitted, otherwise how long to wait before trying again.
+        """
+        now = time.monotonic()
+        if now < self._blocked_until:
+            return self._blocked_until - now
+        slots = int(self._concurrency_limit)
+        needed = 1.0
+        if background:
+            slots = max(1, int(slots * self.config.background_share))
+            needed = min(
+                float(self.config.burst),
+                needed + self.config.burst * (1 - self.config.background_share),
+            )
+        if self._in_flight >= slots:
+            return _SLOT_POLL_SECONDS
+        self._refill(now)
+        if self._tokens < needed:
+            return (needed - self._tokens) / self._rate
+        self._tokens -= 1
+        self._in_flight += 1
+        return 0.0
+
+    def _wait_time(self, wait: float, operation: str) -> float:
+        """Clamp a wait to the current deadline, raising if it would be overrun."""
+        remaining = remaining_time()
+        if remaining is not None and wait >= remaining:
+            raise deadline_exceeded_error(f"waiting for the rate limiter before {operation}")
+        return wait
+
+    def _release(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            self._slot_released.notify()
+
+    @contextmanager
+    def acquire(self, operation: str = "request") -> Iterator[None]:
+        """
+        Hold a request slot for the duration of the block, waiting for one if needed.
+
+        Raises:
+            AdoTimeoutError: If the current deadline passes while waiting.
+        """
+        if not self.config.enabled:
+            yield
+            return
+
+        start = time.monotonic()
+        background = _background.get()
+        with self._lock:
+            while (wait := self._try_acquire(background)) > 0:
+                self._slot_released.wait(self._wait_time(wait, operation))
+        self._record_wait(start)
+        try:
+            yield
+        finally:
+            self._release()
+
+    @asynccontextmanager
+    async def acquire_async(self, operation: str = "request") -> AsyncIterator[None]:
+        """Async variant of acquire()."""
+        if not self.config.enabled:
+            yield
+            return
+
+        start = time.monotonic()
+        background = _background.get()
+        while True:
+            with self._lock:
+                wait = self._try_acquire(background)
+            if wait <= 0:
+                break
+            await asyncio.sleep(self._wait_time(wait, operation))
+        self._record_wait(start)
+        try:
+            yield
+        finally:
+            self._release()
+
+    def _record_wait(self, start: float) -> None:
+        waited = time.monotonic() - start
+        if waited > 0.001:
+            _wait_histogram.record(waited, {"organization": self.name})
+
+    # Feedback
+
+    def observe(self, status_code: int, headers: Mapping[str, str]) -> None:
+        """
+        Adapt to the throttling signals of a response.
+
+        Args:
+            status_code: HTTP status of the response.
+            headers: Response headers (case-insensitive mapping).
+        """
+        if not self.config.enabled:
+            return
+
+        retry_after = _header_float(headers, "Retry-After")
+        delay = _header_float(headers, "X-RateLimit-Delay")
+        remaining = _header_float(headers, "X-RateLimit-Remaining")
+        limit = _header_float(headers, "X-RateLimit-Limit")
+        reset = _header_float(headers, "X-RateLimit-Reset")
+
+        now = time.monotonic()
+        with self._lock:
+            if status_code == 429:
+                _throttle_counter.add(1, {"organization": self.name, "signal": "429"})
+                self._decrease(now)
+                pause = retry_after if retry_after is not None else 1.0
+                self._blocked_until = max(self._blocked_until, now + pause)
+                logger.warning(
+                    f"Throttled by Azure DevOps for {self.name}; pausing requests for {pause:.1f}s"
+                )
+            elif delay:
+                _throttle_counter.add(1, {"organization": self.name, "signal": "delay"})
+                self._decrease(now)
+            else:
+                # Additive increase: about one more slot per window of successes
+                self._concurrency_limit = min(
+                    self.config.max_concurrency,
+                    self._concurrency_limit + 1 / self._concurrency_limit,
+                )
+
+            if remaining is not None and reset is not None:
+                self._pace(now, remaining, limit, reset)
+
+    def _decrease(self, now: float) -> None:
+        """Multiplicative decrease, at most once per cooldown so one burst of signals counts once (lock held)."""
+        if now - self._last_decrease < self.config.decrease_cooldown_seconds:
+            return
+        self._last_decrease = now
+        self._concurrency_limit = max(
+            self.config.min_concurrency, self._concurrency_limit * self.config.decrease_factor
+        )
+        logger.info(
+            f"Rate limiter for {self.name} reduced concurrency to {int(self._concurrency_limit)}"
+        )
+
+    def _pace(self, now: float, remaining: float, limit: float | None, reset: float) -> None:
+        """Slow the request rate in proportion to the budget left until the window resets (lock held)."""
+        seconds_to_reset = max(0.0, reset - time.time())
+        if seconds_to_reset <= 0:
+            return
+        if remaining <= 0:
+            self._blocked_until = max(self._blocked_until, now + seconds_to_reset)
+            return
+
+        share = remaining / limit if limit else 1.0
+        rate = self.config.requests_per_second * min(1.0, share)
+        self._refill(now)
+        self._rate = max(self.config.min_requests_per_second, rate)
+        self._paced_until = now + seconds_to_reset
+
+    def stats(self) -> dict[str, Any]:
+        """Current limiter state, for diagnostics."""
+        with self._lock:
+            now = time.monotonic()
+            return {
+                "organization": self.name,
+                "requests_per_second": self._rate,
+                "concurrency_limit": int(self._concurrency_limit),
+                "in_flight": self._in_flight,
+                "blocked_for_seconds": max(0.0, self._blocked_until - now),
+            }
+
+
+class RateLimiterRegistry:
+    """Process-wide AdaptiveRateLimiter per organization, shared by all of its clients."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._limiters: dict[str, AdaptiveRateLimiter] = {}
+
+    def get(self, organization_url: str, config: RateLimitConfig) -> AdaptiveRateLimiter:
+        """Get the limiter for an organization, creating it with config on first use."""
+        key = organization_url.strip().rstrip("/")
+        with self._lock:
+            limiter = self._limiters.get(key)
+            if limiter is None:
+                limiter = self._limiters[key] = AdaptiveRateLimiter(config, name=key)
+            return limiter
+
+    def clear(self) -> None:
+        """Forget every organization's limiter, e.g. between tests."""
+        with self._lock:
+            self._limiters.clear()
+
+
+# Global registry shared by all clients in the process
+rate_limiters = RateLimiterRegistry()
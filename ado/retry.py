@@ -1,20 +1,95 @@
 """Retry mechanism with exponential backoff for ADO API calls."""
 
+import asyncio
 import logging
+import os
 import random
+import threading
 import time
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from functools import wraps
 from typing import Any
 
+import httpx
 import requests
-from opentelemetry import trace
+from opentelemetry import metrics, trace
 
 from .config import RetryConfig
+from .deadline import remaining_time
 from .errors import AdoNetworkError, AdoRateLimitError, AdoTimeoutError
 
 logger = logging.getLogger(__name__)
 tracer = trace.get_tracer(__name__)
+meter = metrics.get_meter(__name__)
+
+_retries_skipped_counter = meter.create_counter(
+    name="ado_retries_skipped",
+    description="Number of retries skipped because of the deadline or the retry budget",
+    unit="1",
+)
+
+
+class RetryBudget:
+    """
+    Process-wide token bucket that limits retries to a share of request traffic.
+
+    Every first attempt deposits `ratio` tokens and every retry withdraws one,
+    so retries can add at most about `ratio` extra load on top of regular
+    traffic. A small floor of `min_retries_per_second` keeps occasional
+    retries possible when traffic is low. During an outage the bucket drains
+    and failing calls give up instead of turning into a retry storm.
+
+    Args:
+        ratio: Retries allowed per request, e.g. 0.2 for 20%.
+        min_retries_per_second: Tokens added per second regardless of traffic.
+        max_tokens: Bucket capacity, which bounds retry bursts.
+    """
+
+    def __init__(
+        self, ratio: float = 0.2, min_retries_per_second: float = 1.0, max_tokens: float = 20.0
+    ):
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """Add the time-based floor (lock held)."""
+        now = time.monotonic()
+        self._tokens = min(
+            self.max_tokens, self._tokens + (now - self._last_refill) * self.min_retries_per_second
+        )
+        self._last_refill = now
+
+    def record_request(self) -> None:
+        """Account for a first attempt."""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_acquire(self) -> bool:
+        """Take a token for a retry. Returns False if the budget is exhausted."""
+        with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    @property
+    def available(self) -> float:
+        """Number of retries currently available."""
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def reset(self) -> None:
+        """Refill the bucket completely, e.g. between tests."""
+        with self._lock:
+            self._tokens = self.max_tokens
+            self._last_refill = time.monotonic()
 
 
 class RetryManager:
@@ -25,21 +100,24 @@ class RetryManager:
     - Rate limiting (429 errors) with respect for Retry-After headers
     - Network errors with exponential backoff
     - Timeout handling
-    - Circuit breaker pattern for persistent failures
+
+    Circuit breaking is done per endpoint by ado.circuit_breaker, outside the
+    retry loop: a request rejected by an open breaker fails fast and is not
+    retried.
     """
 
-    def __init__(self, config: RetryConfig):
+    def __init__(self, config: RetryConfig, budget: RetryBudget | None = None):
         """
         Initialize retry manager with configuration.
 
         Args:
             config: Retry configuration settings
+            budget: Retry budget to draw retries from. Defaults to the
+                process-wide budget unless config.use_retry_budget is off.
         """
         self.config = config
+        self.budget = budget or (retry_budget if config.use_retry_budget else None)
         self._failure_count = 0
-        self._circuit_open = False
-        self._last_failure_time = 0
-        self._circuit_timeout = 60  # seconds
 
     def _calculate_delay(self, attempt: int, retry_after: int | None = None) -> float:
         """
@@ -80,14 +158,6 @@ class RetryManager:
         Returns:
             bool: True if should retry
         """
-        # Check circuit breaker
-        if self._circuit_open:
-            if time.time() - self._last_failure_time > self._circuit_timeout:
-                self._circuit_open = False
-                logger.info("Circuit breaker reset after timeout")
-            else:
-                return False
-
         # Check max retries
         if attempt >= self.config.max_retries:
             return False
@@ -120,26 +190,144 @@ class RetryManager:
 
     def _handle_failure(self, exception: Exception):
         """
-        Handle failure tracking for circuit breaker.
+        Count a failed call.
 
         Args:
             exception: The exception that occurred
         """
         self._failure_count += 1
-        self._last_failure_time = time.time()
-
-        # Open circuit breaker after many failures
-        if self._failure_count >= 5:
-            self._circuit_open = True
-            logger.warning(f"Circuit breaker opened after {self._failure_count} failures")
 
     def _handle_success(self):
-        """Handle successful request for circuit breaker."""
+        """Reset the failure count after a successful call."""
         if self._failure_count > 0:
             logger.info(f"Request succeeded after {self._failure_count} failures")
 
         self._failure_count = 0
-        self._circuit_open = False
+
+    def _normalize_exception(self, e: Exception, attempt: int) -> Exception:
+        """
+        Convert a raw transport exception into the structured error used for retry decisions.
+
+        Args:
+            e: The exception raised by the wrapped call
+            attempt: Current attempt number (0-based)
+
+        Returns:
+            Exception: The structured exception (or the original one if no mapping applies)
+        """
+        # Handle rate limiting specially
+        if isinstance(e, requests.exceptions.HTTPError) and e.response.status_code == 429:
+            retry_after = None
+            if hasattr(e.response, "headers"):
+                retry_after = e.response.headers.get("Retry-After")
+                if retry_after:
+                    try:
+                        retry_after = int(retry_after)
+                    except ValueError:
+                        retry_after = None
+
+            return AdoRateLimitError(
+                f"Rate limit exceeded on attempt {attempt + 1}",
+                retry_after=retry_after,
+                context={"attempt": attempt + 1, "url": str(e.response.url)},
+                original_exception=e,
+            )
+
+        # Handle network errors
+        if isinstance(e, requests.exceptions.RequestException):
+            # For HTTPError, check if it's a non-retryable error
+            if (
+                isinstance(e, requests.exceptions.HTTPError)
+                and hasattr(e, "response")
+                and e.response is not None
+            ):
+                status_code = e.response.status_code
+                # Don't wrap 4xx errors (except 429) - let them through as-is
+                if 400 <= status_code < 500 and status_code != 429:
+                    return e
+                return AdoNetworkError(
+                    f"Network error on attempt {attempt + 1}: {str(e)}",
+                    context={
+                        "attempt": attempt + 1,
+                        "error_type": type(e).__name__,
+                    },
+                    original_exception=e,
+                )
+            return AdoNetworkError(
+                f"Network error on attempt {attempt + 1}: {str(e)}",
+                context={"attempt": attempt + 1, "error_type": type(e).__name__},
+                original_exception=e,
+            )
+
+        # Handle raw httpx errors raised by async callers
+        if isinstance(e, httpx.TimeoutException):
+            return AdoTimeoutError(
+                f"Request timeout on attempt {attempt + 1}",
+                context={"attempt": attempt + 1},
+                original_exception=e,
+            )
+
+        if isinstance(e, httpx.HTTPStatusError):
+            status_code = e.response.status_code
+            if status_code == 429:
+                retry_after = e.response.headers.get("Retry-After")
+                return AdoRateLimitError(
+                    f"Rate limit exceeded on attempt {attempt + 1}",
+                    retry_after=int(retry_after) if retry_after and retry_after.isdigit() else None,
+                    context={"attempt": attempt + 1, "url": str(e.request.url)},
+                    original_exception=e,
+                )
+            # Don't wrap 4xx errors - let them through as-is
+            if 400 <= status_code < 500:
+                return e
+
+        if isinstance(e, httpx.HTTPError):
+            return AdoNetworkError(
+                f"Network error on attempt {attempt + 1}: {str(e)}",
+                context={"attempt": attempt + 1, "error_type": type(e).__name__},
+                original_exception=e,
+            )
+
+        return e
+
+    def _next_delay(self, exception: Exception, attempt: int) -> float:
+        """Calculate the backoff delay for a failed attempt and log the retry."""
+        retry_after = None
+        if isinstance(exception, AdoRateLimitError):
+            retry_after = exception.retry_after
+
+        delay = self._calculate_delay(attempt, retry_after)
+
+        logger.warning(
+            f"Attempt {attempt + 1} failed: {str(exception)}. Retrying in {delay:.2f} seconds..."
+        )
+        return delay
+
+    def _may_retry_after(self, delay: float) -> bool:
+        """
+        Check that a retry after the given backoff fits the deadline and the retry budget.
+
+        Args:
+            delay: Backoff before the retry, in seconds
+
+        Returns:
+            bool: True if the retry may go ahead
+        """
+        remaining = remaining_time()
+        if remaining is not None and delay >= remaining:
+            logger.warning(
+                f"Not retrying: backoff of {delay:.2f}s exceeds the {remaining:.2f}s left "
+                "before the deadline"
+            )
+            _retries_skipped_counter.add(1, {"reason": "deadline"})
+            return False
+
+        if self.budget is not None and not self.budget.try_acquire():
+            logger.warning("Not retrying: retry budget exhausted")
+            _retries_skipped_counter.add(1, {"reason": "budget"})
+            return False
+
+        return True
 
     def retry_on_failure(self, func: Callable[..., Any]) -> Callable[..., Any]:
         """
@@ -156,6 +344,9 @@ class RetryManager:
         def wrapper(*args, **kwargs):
             last_exception = None
 
+            if self.budget is not None:
+                self.budget.record_request()
+
             for attempt in range(self.config.max_retries + 1):
                 try:
                     with tracer.start_as_current_span("retry_attempt") as span:
@@ -171,86 +362,82 @@ class RetryManager:
                         return result
 
                 except Exception as e:
-                    last_exception = e
-
-                    # Handle rate limiting specially
-                    if (
-                        isinstance(e, requests.exceptions.HTTPError)
-                        and e.response.status_code == 429
-                    ):
-                        retry_after = None
-                        if hasattr(e.response, "headers"):
-                            retry_after = e.response.headers.get("Retry-After")
-                            if retry_after:
-                                try:
-                                    retry_after = int(retry_after)
-                                except ValueError:
-                                    retry_after = None
-
-                        last_exception = AdoRateLimitError(
-                            f"Rate limit exceeded on attempt {attempt + 1}",
-                            retry_after=retry_after,
-                            context={"attempt": attempt + 1, "url": str(e.response.url)},
-                            original_exception=e,
-                        )
-
-                    # Handle network errors
-                    elif isinstance(e, requests.exceptions.RequestException):
-                        # For HTTPError, check if it's a non-retryable error
-                        if (
-                            isinstance(e, requests.exceptions.HTTPError)
-                            and hasattr(e, "response")
-                            and e.response is not None
-                        ):
-                            status_code = e.response.status_code
-                            # Don't wrap 4xx errors (except 429) - let them through as-is
-                            if 400 <= status_code < 500 and status_code != 429:
-                                last_exception = e
-                            else:
-                                last_exception = AdoNetworkError(
-                                    f"Network error on attempt {attempt + 1}: {str(e)}",
-                                    context={
-                                        "attempt": attempt + 1,
-                                        "error_type": type(e).__name__,
-                                    },
-                                    original_exception=e,
-                                )
-                        else:
-                            last_exception = AdoNetworkError(
-                                f"Network error on attempt {attempt + 1}: {str(e)}",
-                                context={"attempt": attempt + 1, "error_type": type(e).__name__},
-                                original_exception=e,
-                            )
-
-                    # Handle timeouts
-                    elif isinstance(e, requests.exceptions.Timeout):
-                        last_exception = AdoTimeoutError(
-                            f"Request timeout on attempt {attempt + 1}",
-                            context={"attempt": attempt + 1},
-                            original_exception=e,
-                        )
+                    last_exception = self._normalize_exception(e, attempt)
 
                     # Check if we should retry
                     if not self._should_retry(last_exception, attempt):
                         self._handle_failure(last_exception)
                         break
 
-                    # Calculate delay
-                    retry_after = None
-                    if isinstance(last_exception, AdoRateLimitError):
-                        retry_after = last_exception.retry_after
+                    delay = self._next_delay(last_exception, attempt)
+                    if not self._may_retry_after(delay):
+                        break
+
+                    with tracer.start_as_current_span("retry_delay") as span:
+                        span.set_attribute("retry.delay_seconds", delay)
+                        span.set_attribute("retry.attempt", attempt)
+                        time.sleep(delay)
+
+            # All retries exhausted
+            self._handle_failure(last_exception)
+            logger.error(f"All {self.config.max_retries + 1} attempts failed")
+            raise last_exception
+
+        return wrapper
 
-                    delay = self._calculate_delay(attempt, retry_after)
+    def async_retry_on_failure(
+        self, func: Callable[..., Awaitable[Any]]
+    ) -> Callable[..., Awaitable[Any]]:
+        """
+        Decorator that adds retry logic to a coroutine function.
+
+        Uses the same retry decisions and backoff as retry_on_failure, but waits
+        with asyncio.sleep so that backoff never blocks the event loop.
+
+        Args:
+            func: Coroutine function to wrap with retry logic
+
+        Returns:
+            Callable: Wrapped coroutine function with retry logic
+        """
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            last_exception = None
 
-                    logger.warning(
-                        f"Attempt {attempt + 1} failed: {str(last_exception)}. "
-                        f"Retrying in {delay:.2f} seconds..."
-                    )
+            if self.budget is not None:
+                self.budget.record_request()
+
+            for attempt in range(self.config.max_retries + 1):
+                try:
+                    with tracer.start_as_current_span("retry_attempt") as span:
+                        span.set_attribute("retry.attempt", attempt)
+                        span.set_attribute("retry.max_retries", self.config.max_retries)
+
+                        result = await func(*args, **kwargs)
+
+                        if attempt > 0:
+                            span.set_attribute("retry.success_after_retries", True)
+
+                        self._handle_success()
+                        return result
+
+                except Exception as e:
+                    last_exception = self._normalize_exception(e, attempt)
+
+                    # Check if we should retry
+                    if not self._should_retry(last_exception, attempt):
+                        self._handle_failure(last_exception)
+                        break
+
+                    delay = self._next_delay(last_exception, attempt)
+                    if not self._may_retry_after(delay):
+                        break
 
                     with tracer.start_as_current_span("retry_delay") as span:
                         span.set_attribute("retry.delay_seconds", delay)
                         span.set_attribute("retry.attempt", attempt)
-                        time.sleep(delay)
+                        await asyncio.sleep(delay)
 
             # All retries exhausted
             self._handle_failure(last_exception)
@@ -260,6 +447,14 @@ class RetryManager:
         return wrapper
 
 
+# Global retry budget shared by all clients in the process
+retry_budget = RetryBudget(
+    ratio=float(os.getenv("ADO_RETRY_BUDGET_RATIO", "0.2")),
+    min_retries_per_second=float(os.getenv("ADO_RETRY_BUDGET_MIN_PER_SECOND", "1.0")),
+    max_tokens=float(os.getenv("ADO_RETRY_BUDGET_MAX_TOKENS", "20")),
+)
+
+
 def with_retry(config: RetryConfig):
     """
     Decorator factory for adding retry logic to functions.
@@ -0,0 +1,177 @@
+"""
+Single-flight request coalescing for Azure DevOps API calls.
+
+When several callers issue the same idempotent request at the same time, only
+the first one (the leader) goes upstream; the others wait for the leader and
+receive a copy of its parsed result, or the same exception. This keeps cache-miss bursts, such
+as many agents listing projects right after the cache TTL expires, from turning
+into a burst of identical API calls.
+"""
+
+import asyncio
+import copy
+import logging
+import threading
+from collections.abc import Awaitable, Callable, Hashable, Mapping
+from typing import Any
+
+from opentelemetry import metrics
+
+logger = logging.getLogger(__name__)
+meter = metrics.get_meter(__name__)
+
+
+class _InFlightCall:
+    """A synchronous call in progress that followers can wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent identical calls into a single execution.
+
+    Each follower receives its own deep copy of the leader's result, so a caller
+    modifying what it got back cannot affect the others. Nothing is cached once
+    the call completes; a request started after the leader finishes goes
+    upstream again.
+
+    Synchronous calls are coalesced across threads. Asynchronous calls are
+    coalesced per event loop, since tasks cannot be awaited from another loop.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _InFlightCall] = {}
+        self._tasks: dict[tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Task] = {}
+
+        self._coalesced_counter = meter.create_counter(
+            name="ado_requests_coalesced",
+            description="Number of requests served by an identical in-flight request",
+            unit="1",
+        )
+
+    @staticmethod
+    def make_key(
+        method: str,
+        url: str,
+        params: Mapping[str, Any] | None = None,
+        organization_url: str | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> Hashable:
+        """
+        Build a coalescing key for a request.
+
+        Args:
+            method: HTTP method.
+            url: Full request URL.
+            params: Query parameters passed separately from the URL.
+            organization_url: Organization the request is made against.
+            headers: Per-request headers that change the response (e.g. conditional headers).
+
+        Returns:
+            A hashable key identifying the request.
+        """
+        return (
+            method.upper(),
+            url,
+            _freeze(params),
+            organization_url,
+            _freeze(headers),
+        )
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Run fn, or wait for an identical in-flight call to finish.
+
+        Args:
+            key: Coalescing key, usually from make_key().
+            fn: Zero-argument callable performing the request.
+
+        Returns:
+            The result of fn, copied for callers that joined an in-flight call.
+
+        Raises:
+            Any exception raised by fn, re-raised in every waiting caller.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = _InFlightCall()
+                self._calls[key] = call
+
+        if not is_leader:
+            logger.debug(f"Coalescing request onto in-flight call: {key[:2]}")
+            self._coalesced_counter.add(1, {"mode": "sync"})
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await fn(), or join an identical in-flight call on the running loop.
+
+        The shared call runs in its own task, so cancelling one waiter does not
+        cancel the request for the others.
+
+        Args:
+            key: Coalescing key, usually from make_key().
+            fn: Zero-argument coroutine function performing the request.
+
+        Returns:
+            The result of fn(), copied for callers that joined an in-flight call.
+
+        Raises:
+            Any exception raised by fn(), re-raised in every waiting caller.
+        """
+        loop = asyncio.get_running_loop()
+        task_key = (loop, key)
+
+        task = self._tasks.get(task_key)
+        is_leader = task is None
+        if is_leader:
+            task = loop.create_task(fn())
+            self._tasks[task_key] = task
+            task.add_done_callback(lambda _: self._tasks.pop(task_key, None))
+        else:
+            logger.debug(f"Coalescing request onto in-flight task: {key[:2]}")
+            self._coalesced_counter.add(1, {"mode": "async"})
+
+        result = await asyncio.shield(task)
+        return result if is_leader else copy.deepcopy(result)
+
+    def in_flight_count(self) -> int:
+        """Return the number of distinct calls currently in flight."""
+        with self._lock:
+            return len(self._calls) + len(self._tasks)
+
+
+def _freeze(value: Any) -> Hashable:
+    """Convert request params/headers into a hashable, order-independent form."""
+    if value is None:
+        return None
+    if isinstance(value, Mapping):
+        return tuple(sorted((str(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(v) for v in value)
+    return str(value)
+
+
+# Global single-flight group shared by all clients in the process
+single_flight = SingleFlight()
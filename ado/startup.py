@@ -0,0 +1,118 @@
+"""
+Deferred client initialization for fast server start-up.
+
+Creating the initial AdoClient means getting a credential (possibly running
+``az``) and checking authentication against Azure DevOps, which takes a few
+seconds. Done at import time, it delays the MCP handshake of every freshly
+spawned stdio server. In lazy-start mode server.py hands it to
+BackgroundClientInit instead: the handshake is answered right away, and
+ClientReadyMiddleware holds tool calls until the client is in place.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from typing import Any
+
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+
+from .deadline import deadline_exceeded_error, remaining_time
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundClientInit:
+    """
+    Initializes the client of a client container on a background thread.
+
+    Args:
+        client_container: Container the tools read the client from; its
+            ``client`` entry is set once initialization finishes.
+    """
+
+    def __init__(self, client_container: dict[str, Any]):
+        self.client_container = client_container
+        self._future: Future | None = None
+
+    def start(self, initializer: Callable[[], Any]) -> None:
+        """
+        Run initializer on a background thread and store the client it returns.
+
+        Errors are logged rather than raised; tools then see no client, as they
+        do when the initial setup fails at import time.
+        """
+        future: Future = Future()
+        self._future = future
+
+        def run() -> None:
+            start = time.monotonic()
+            try:
+                client = initializer()
+                # A client selected while this one was initializing takes precedence
+                if self.client_container.get("client") is None:
+                    self.client_container["client"] = client
+                logger.info(
+                    f"Background client initialization took {time.monotonic() - start:.2f}s"
+                )
+            except Exception as e:
+                logger.warning(f"Background client initialization failed: {e}")
+            finally:
+                future.set_result(None)
+
+        threading.Thread(target=run, name="ado-client-init", daemon=True).start()
+
+    @property
+    def pending(self) -> bool:
+        return self._future is not None and not self._future.done()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """
+        Block until initialization has finished.
+
+        Returns:
+            bool: False if it was still running after timeout seconds.
+        """
+        if not self.pending:
+            return True
+        try:
+            self._future.result(timeout)
+        except TimeoutError:
+            return False
+        return True
+
+    async def wait_async(self) -> None:
+        """
+        Wait for initialization without blocking the event loop.
+
+        Raises:
+            AdoTimeoutError: If the current deadline passes first.
+        """
+        if not self.pending:
+            return
+        try:
+            await asyncio.wait_for(
+                asyncio.shield(asyncio.wrap_future(self._future)), timeout=remaining_time()
+            )
+        except TimeoutError as e:
+            raise deadline_exceeded_error(
+                "waiting for the Azure DevOps client to initialize"
+            ) from e
+
+
+class ClientReadyMiddleware(Middleware):
+    """
+    FastMCP middleware that holds tool calls until background initialization is done.
+
+    Args:
+        client_init: The initialization to wait for.
+    """
+
+    def __init__(self, client_init: BackgroundClientInit):
+        self.client_init = client_init
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next):
+        await self.client_init.wait_async()
+        return await call_next(context)
@@ -1,24 +1,24 @@
-"""Production telemetry and observability for ADO-MCP."""
+"""
+Production telemetry and observability for ADO-MCP.
+
+Only the OpenTelemetry API is imported with this module. The SDK, the OTLP
+exporters and the requests instrumentation take a noticeable part of server
+start-up to import, so they are loaded when telemetry is set up.
+"""
 
 import logging
 import os
 import time
 from contextlib import contextmanager
+from typing import TYPE_CHECKING
 
 from opentelemetry import metrics, trace
-from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExporter
-from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
-from opentelemetry.instrumentation.requests import RequestsInstrumentor
-from opentelemetry.sdk.metrics import MeterProvider
-from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
-from opentelemetry.sdk.resources import Resource
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
-from opentelemetry.sdk.trace.sampling import TraceIdRatioBased
-from opentelemetry.semconv.resource import ResourceAttributes
 
 from .config import TelemetryConfig
 
+if TYPE_CHECKING:
+    from opentelemetry.sdk.resources import Resource
+
 logger = logging.getLogger(__name__)
 
 
@@ -57,6 +57,10 @@ class TelemetryManager:
     def _setup_telemetry(self):
         """Set up OpenTelemetry providers and exporters."""
         try:
+            from opentelemetry.instrumentation.requests import RequestsInstrumentor
+            from opentelemetry.sdk.resources import Resource
+            from opentelemetry.semconv.resource import ResourceAttributes
+
             # Create resource
             resource = Resource(
                 attributes={
@@ -84,8 +88,13 @@ class TelemetryManager:
             # Don't fail the application if telemetry setup fails
             self.config.enabled = False
 
-    def _setup_tracing(self, resource: Resource):
+    def _setup_tracing(self, resource: "Resource"):
         """Set up distributed tracing."""
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+        from opentelemetry.sdk.trace.sampling import TraceIdRatioBased
+
         # Create tracer provider
         tracer_provider = TracerProvider(
             resource=resource, sampler=TraceIdRatioBased(self.config.trace_sampling_rate)
@@ -101,8 +110,12 @@ class TelemetryManager:
         trace.set_tracer_provider(tracer_provider)
         self.tracer = trace.get_tracer(__name__)
 
-    def _setup_metrics(self, resource: Resource):
+    def _setup_metrics(self, resource: "Resource"):
         """Set up metrics collection."""
+        from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExporter
+        from opentelemetry.sdk.metrics import MeterProvider
+        from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
+
         # Setup OTLP metric exporter if endpoint is configured
         otlp_endpoint = os.getenv("OTEL_EXPORTER_OTLP_METRICS_ENDPOINT")
         if otlp_endpoint:
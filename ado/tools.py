@@ -1,4 +1,3 @@
-import asyncio
 import logging
 import os
 from typing import Any
@@ -47,14 +46,16 @@ def register_ado_tools(mcp_instance, client_container):
             return None, error_return
         return ado_client_instance, None
 
-    def get_pipeline_ids_with_client_check(project_name: str, pipeline_name: str):
+    async def get_pipeline_ids_with_client_check(project_name: str, pipeline_name: str):
         """Get client and resolve pipeline IDs from names."""
         client, error_return = get_client_or_error()
         if client is None:
             return None, None, None
 
         try:
-            project_id, pipeline_id = client._lookups.get_pipeline_ids(project_name, pipeline_name)
+            project_id, pipeline_id = await client._lookups.get_pipeline_ids_async(
+                project_name, pipeline_name
+            )
             return client, project_id, pipeline_id
         except Exception as e:
             logger.error(f"Error resolving pipeline IDs: {e}")
@@ -74,7 +75,7 @@ def register_ado_tools(mcp_instance, client_container):
         return ado_client_instance.check_authentication()
 
     @mcp_instance.tool
-    def list_projects() -> list[Project]:
+    async def list_projects() -> list[Project]:
         """
         Lists all projects in the Azure DevOps organization.
 
@@ -96,7 +97,7 @@ def register_ado_tools(mcp_instance, client_container):
             if projects is None:
                 span.set_attribute("cache.source", "api")
                 logger.info("Projects not cached, fetching from API...")
-                projects = ado_client_instance.list_projects()
+                projects = await ado_client_instance.list_projects_async()
                 ado_cache.set_projects(projects)
             else:
                 span.set_attribute("cache.source", "cache")
@@ -106,7 +107,7 @@ def register_ado_tools(mcp_instance, client_container):
             return projects
 
     @mcp_instance.tool
-    def list_pipelines(project_id: str) -> list[Pipeline]:
+    async def list_pipelines(project_id: str) -> list[Pipeline]:
         """
         Lists all pipelines in a given Azure DevOps project.
 
@@ -120,7 +121,7 @@ def register_ado_tools(mcp_instance, client_container):
         if not ado_client_instance:
             logger.error("ADO client is not available.")
             return []
-        pipelines_response = ado_client_instance.list_pipelines(project_id)
+        pipelines_response = await ado_client_instance.list_pipelines_async(project_id)
         logger.info(f"Retrieved {len(pipelines_response)} pipelines for project {project_id}")
         return pipelines_response
 
@@ -237,7 +238,7 @@ def register_ado_tools(mcp_instance, client_container):
             return False
 
     @mcp_instance.tool
-    def get_pipeline(project_name: str, pipeline_name: str) -> dict:
+    async def get_pipeline(project_name: str, pipeline_name: str) -> dict:
         """
         Retrieves details for a specific pipeline in an Azure DevOps project.
 
@@ -248,15 +249,15 @@ def register_ado_tools(mcp_instance, client_container):
         Returns:
             dict: A dictionary representing the pipeline details.
         """
-        ado_client_instance, project_id, pipeline_id = get_pipeline_ids_with_client_check(
+        ado_client_instance, project_id, pipeline_id = await get_pipeline_ids_with_client_check(
             project_name, pipeline_name
         )
         if ado_client_instance is None:
             return {}
-        return ado_client_instance.get_pipeline(project_id, pipeline_id)
+        return await ado_client_instance.get_pipeline_async(project_id, pipeline_id)
 
     @mcp_instance.tool
-    def get_build_by_id(project_id: str, build_id: int) -> dict:
+    async def get_build_by_id(project_id: str, build_id: int) -> dict:
         """
         🔍 MAP BUILD ID TO PIPELINE: Retrieves build details and extracts pipeline information.
 
@@ -279,7 +280,7 @@ def register_ado_tools(mcp_instance, client_container):
         if not ado_client_instance:
             logger.error("ADO client is not available.")
             return {}
-        return ado_client_instance.get_build_by_id(project_id, build_id)
+        return await ado_client_instance.get_build_by_id_async(project_id, build_id)
 
     @mcp_instance.tool
     @handle_tool_cancellation("run_pipeline")
@@ -351,16 +352,14 @@ def register_ado_tools(mcp_instance, client_container):
                 resources=resources,
             )
 
-        # Execute the synchronous client call in a thread pool to make it cancellable  
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            ado_client_instance.run_pipeline_by_name,
+        return await ado_client_instance.run_pipeline_by_name_async(
             project_name, pipeline_name, request
         )
 
     @mcp_instance.tool
-    def get_pipeline_run(project_name: str, pipeline_name: str, run_id: int) -> PipelineRun | None:
+    async def get_pipeline_run(
+        project_name: str, pipeline_name: str, run_id: int
+    ) -> PipelineRun | None:
         """
         Retrieves details for a specific pipeline run in an Azure DevOps project.
 
@@ -372,12 +371,12 @@ def register_ado_tools(mcp_instance, client_container):
         Returns:
             Optional[PipelineRun]: A PipelineRun object representing the pipeline run details, or None if client unavailable.
         """
-        ado_client_instance, project_id, pipeline_id = get_pipeline_ids_with_client_check(
+        ado_client_instance, project_id, pipeline_id = await get_pipeline_ids_with_client_check(
             project_name, pipeline_name
         )
         if ado_client_instance is None:
             return None
-        return ado_client_instance.get_pipeline_run(project_id, pipeline_id, run_id)
+        return await ado_client_instance.get_pipeline_run_async(project_id, pipeline_id, run_id)
 
     def _inject_github_tokens_if_needed(
         ado_client_instance, project_id: str, pipeline_id: int, resources_dict: dict | None
@@ -568,20 +567,16 @@ def register_ado_tools(mcp_instance, client_container):
             return None
 
         # Get project and pipeline IDs using name lookup
-        project_id, pipeline_id = ado_client_instance._lookups.get_pipeline_ids(
+        project_id, pipeline_id = await ado_client_instance._lookups.get_pipeline_ids_async(
             project_name, pipeline_name
         )
 
-        # Execute the synchronous client call in a thread pool to make it cancellable
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            ado_client_instance.get_pipeline_failure_summary,
+        return await ado_client_instance.get_pipeline_failure_summary_async(
             project_id, pipeline_id, run_id, max_lines
         )
 
     @mcp_instance.tool
-    def get_failed_step_logs(
+    async def get_failed_step_logs(
         project_id: str,
         pipeline_id: int,
         run_id: int,
@@ -607,12 +602,12 @@ def register_ado_tools(mcp_instance, client_container):
             logger.error("ADO client is not available.")
             return None
 
-        return ado_client_instance.get_failed_step_logs(
+        return await ado_client_instance.get_failed_step_logs_async(
             project_id, pipeline_id, run_id, step_name, max_lines
         )
 
     @mcp_instance.tool
-    def get_pipeline_timeline(
+    async def get_pipeline_timeline(
         project_id: str, pipeline_id: int, run_id: int
     ) -> TimelineResponse | None:
         """
@@ -631,10 +626,12 @@ def register_ado_tools(mcp_instance, client_container):
             logger.error("ADO client is not available.")
             return None
 
-        return ado_client_instance.get_pipeline_timeline(project_id, pipeline_id, run_id)
+        return await ado_client_instance.get_pipeline_timeline_async(project_id, pipeline_id, run_id)
 
     @mcp_instance.tool
-    def list_pipeline_logs(project_id: str, pipeline_id: int, run_id: int) -> LogCollection | None:
+    async def list_pipeline_logs(
+        project_id: str, pipeline_id: int, run_id: int
+    ) -> LogCollection | None:
         """
         Lists all logs for a specific pipeline run.
 
@@ -651,10 +648,10 @@ def register_ado_tools(mcp_instance, client_container):
             logger.error("ADO client is not available.")
             return None
 
-        return ado_client_instance.list_pipeline_logs(project_id, pipeline_id, run_id)
+        return await ado_client_instance.list_pipeline_logs_async(project_id, pipeline_id, run_id)
 
     @mcp_instance.tool
-    def get_log_content_by_id(
+    async def get_log_content_by_id(
         project_id: str, pipeline_id: int, run_id: int, log_id: int, max_lines: int = 100
     ) -> str | None:
         """
@@ -676,12 +673,12 @@ def register_ado_tools(mcp_instance, client_container):
             logger.error("ADO client is not available.")
             return None
 
-        return ado_client_instance.get_log_content_by_id(
+        return await ado_client_instance.get_log_content_by_id_async(
             project_id, pipeline_id, run_id, log_id, max_lines
         )
 
     @mcp_instance.tool
-    def run_pipeline_and_get_outcome(
+    async def run_pipeline_and_get_outcome(
         project_name: str,
         pipeline_name: str,
         timeout_seconds: int = 300,
@@ -762,12 +759,12 @@ def register_ado_tools(mcp_instance, client_container):
                 resources=resources,
             )
 
-        return ado_client_instance.run_pipeline_and_get_outcome_by_name(
+        return await ado_client_instance.run_pipeline_and_get_outcome_by_name_async(
             project_name, pipeline_name, request, timeout_seconds, max_lines
         )
 
     @mcp_instance.tool
-    def watch_pipeline(
+    async def watch_pipeline(
         project_id: str,
         pipeline_id: int,
         run_id: int,
@@ -808,12 +805,12 @@ def register_ado_tools(mcp_instance, client_container):
         if ado_client_instance is None:
             return error_return
 
-        return ado_client_instance.watch_pipeline(
+        return await ado_client_instance.watch_pipeline_async(
             project_id, pipeline_id, run_id, timeout_seconds, max_lines
         )
 
     @mcp_instance.tool
-    def watch_pipeline_by_name(
+    async def watch_pipeline_by_name(
         project_name: str,
         pipeline_name: str,
         run_id: int,
@@ -854,13 +851,15 @@ def register_ado_tools(mcp_instance, client_container):
             # Watch with custom timeout
             watch_pipeline_by_name("MyProject", "CI Pipeline", 456, timeout_seconds=600)
         """
-        client, project_id, pipeline_id = get_pipeline_ids_with_client_check(
+        client, project_id, pipeline_id = await get_pipeline_ids_with_client_check(
             project_name, pipeline_name
         )
         if client is None:
             return None
 
-        return client.watch_pipeline(project_id, pipeline_id, run_id, timeout_seconds, max_lines)
+        return await client.watch_pipeline_async(
+            project_id, pipeline_id, run_id, timeout_seconds, max_lines
+        )
 
     # 🔍 ENHANCED PROJECT DISCOVERY TOOLS
 
@@ -1025,7 +1024,7 @@ def register_ado_tools(mcp_instance, client_container):
         return None
 
     @mcp_instance.tool
-    def run_pipeline_by_name(
+    async def run_pipeline_by_name(
         project_name: str,
         pipeline_name: str,
         variables: dict[str, Any] | None = None,
@@ -1089,10 +1088,12 @@ def register_ado_tools(mcp_instance, client_container):
                 resources=resources,
             )
 
-        return ado_client_instance.run_pipeline_by_name(project_name, pipeline_name, request)
+        return await ado_client_instance.run_pipeline_by_name_async(
+            project_name, pipeline_name, request
+        )
 
     @mcp_instance.tool
-    def get_pipeline_failure_summary_by_name(
+    async def get_pipeline_failure_summary_by_name(
         project_name: str, pipeline_name: str, run_id: int, max_lines: int = 100
     ) -> FailureSummary | None:
         """
@@ -1122,7 +1123,7 @@ def register_ado_tools(mcp_instance, client_container):
             logger.error("ADO client is not available.")
             return None
 
-        return ado_client_instance.get_pipeline_failure_summary_by_name(
+        return await ado_client_instance.get_pipeline_failure_summary_by_name_async(
             project_name, pipeline_name, run_id, max_lines
         )
 
@@ -1197,11 +1198,7 @@ def register_ado_tools(mcp_instance, client_container):
                 resources=resources,
             )
 
-        # Execute the synchronous client call in a thread pool to make it cancellable
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            ado_client_instance.run_pipeline_and_get_outcome_by_name,
+        return await ado_client_instance.run_pipeline_and_get_outcome_by_name_async(
             project_name, pipeline_name, request, timeout_seconds, max_lines
         )
 
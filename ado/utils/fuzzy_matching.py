@@ -3,15 +3,24 @@ Fuzzy matching utilities for Azure DevOps MCP server.
 
 This module provides intelligent string matching capabilities using Levenshtein distance
 and weighted scoring to help LLMs find resources even with typos or slight naming differences.
+
+Candidate lists are indexed once (FuzzyIndex) so repeated queries against the same
+projects or pipelines only score the candidates that can reach the similarity
+threshold, within the matcher's time budget.
 """
 
 import logging
+import re
+import threading
 import time
-from collections.abc import Callable
+from collections import OrderedDict, defaultdict
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass
 from typing import Any, TypeVar
 
 from Levenshtein import distance as levenshtein_distance
+from rapidfuzz import process as rf_process
+from rapidfuzz.distance import Levenshtein as rf_levenshtein
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +44,18 @@ CHARACTER_DISTANCE_WEIGHT = 0.7  # Medium confidence - based on edit distance
 DEFAULT_SIMILARITY_THRESHOLD = 0.5  # Minimum confidence for suggestions
 # Tuned to balance helpful suggestions vs noise
 
+# Common separators in Azure DevOps naming
+TOKEN_SEPARATORS = re.compile(r"[ \-_./\\()\[\]]")
+
+# Number of candidate lists whose FuzzyIndex is kept for reuse
+INDEX_CACHE_SIZE = 16
+
+# How many candidates are scored between checks of the time budget
+DEADLINE_CHECK_INTERVAL = 64
+
+# Candidates whose edit distance is computed in one batch call
+EDIT_DISTANCE_BATCH_SIZE = 1024
+
 
 @dataclass
 class MatchResult:
@@ -56,6 +77,175 @@ class MatchResult:
     match_type: str = "fuzzy"
 
 
+def tokenize(text: str) -> list[str]:
+    """
+    Split text into tokens using common separators.
+
+    Args:
+        text: Input text to tokenize
+
+    Returns:
+        List of normalized tokens
+    """
+    return [token.strip().lower() for token in TOKEN_SEPARATORS.split(text) if token.strip()]
+
+
+@dataclass(frozen=True)
+class IndexedName:
+    """A candidate with its name normalized and tokenized once for matching."""
+
+    item: Any
+    name: str
+    lower: str
+    tokens: frozenset[str]
+    id: str | None
+
+
+class FuzzyIndex:
+    """
+    Pre-processed candidate list for repeated fuzzy matching.
+
+    Besides the normalized names, it keeps three inverted indexes used to
+    pre-filter candidates: trigrams (for substring matches), tokens (for word
+    matches) and name lengths (for edit distance matches, since the distance is
+    at least the difference in length).
+
+    The candidate list is treated as an immutable snapshot.
+    """
+
+    def __init__(
+        self,
+        candidates: list[T],
+        name_extractor: Callable[[T], str] = lambda x: str(x),
+        id_extractor: Callable[[T], Any] = lambda x: getattr(x, "id", None),
+    ):
+        self.candidates = candidates
+        self.entries: list[IndexedName] = []
+        self._by_trigram: dict[str, set[int]] = defaultdict(set)
+        self._by_token: dict[str, list[int]] = defaultdict(list)
+        self._by_length: dict[int, list[int]] = defaultdict(list)
+        # Names whose lowercase form changes length can't be bucketed by length
+        self._unbucketed: list[int] = []
+
+        for candidate in candidates:
+            try:
+                name = name_extractor(candidate)
+                if not name:
+                    continue
+                candidate_id = id_extractor(candidate)
+            except Exception as e:
+                logger.warning(f"Error processing candidate {candidate}: {e}")
+                continue
+
+            lower = name.lower()
+            position = len(self.entries)
+            self.entries.append(
+                IndexedName(
+                    item=candidate,
+                    name=name,
+                    lower=lower,
+                    tokens=frozenset(tokenize(lower)),
+                    id=str(candidate_id) if candidate_id is not None else None,
+                )
+            )
+            for i in range(len(lower) - 2):
+                self._by_trigram[lower[i : i + 3]].add(position)
+            for token in self.entries[-1].tokens:
+                self._by_token[token].append(position)
+            if len(lower) == len(name):
+                self._by_length[len(name)].append(position)
+            else:
+                self._unbucketed.append(position)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def substring_candidates(self, query_lower: str) -> Iterator[int]:
+        """Positions of names that may contain the query, ignoring case."""
+        if len(query_lower) < 3:
+            yield from range(len(self.entries))
+            return
+
+        postings = sorted(
+            (
+                self._by_trigram.get(query_lower[i : i + 3], set())
+                for i in range(len(query_lower) - 2)
+            ),
+            key=len,
+        )
+        yield from sorted(set.intersection(*postings))
+
+    def token_candidates(self, tokens: frozenset[str]) -> Iterator[int]:
+        """Positions of names sharing at least one token with the query."""
+        positions = set()
+        for token in tokens:
+            positions.update(self._by_token.get(token, ()))
+        yield from sorted(positions)
+
+    def length_candidates(self, query_length: int, min_similarity: float) -> Iterator[int]:
+        """
+        Positions of names whose length allows the given edit-distance similarity.
+
+        Buckets closest in length to the query come first, as they tend to
+        score best.
+        """
+        yield from self._unbucketed
+        if min_similarity > 1:
+            return
+        for length in sorted(self._by_length, key=lambda n: abs(n - query_length)):
+            max_length = max(length, query_length)
+            # One extra edit of slack so float rounding never drops a candidate
+            max_distance = int(max_length * (1 - min_similarity)) + 1
+            if abs(length - query_length) <= max_distance:
+                yield from self._by_length[length]
+
+
+_index_cache: OrderedDict[tuple, FuzzyIndex] = OrderedDict()
+_index_cache_lock = threading.Lock()
+
+
+def get_fuzzy_index[T](
+    candidates: list[T],
+    name_extractor: Callable[[T], str] = lambda x: str(x),
+    id_extractor: Callable[[T], Any] = lambda x: getattr(x, "id", None),
+) -> FuzzyIndex:
+    """
+    Get the FuzzyIndex for a candidate list, reusing one built for the same list.
+
+    Indexes are reused when the same list object (e.g. a cached pipeline list)
+    is matched with extractors defined by the same code.
+
+    Args:
+        candidates: List of candidate items to index
+        name_extractor: Function to extract display name from candidate items
+        id_extractor: Function to extract ID from candidate items
+
+    Returns:
+        FuzzyIndex over the candidates
+    """
+    if not isinstance(candidates, list | tuple):
+        return FuzzyIndex(list(candidates), name_extractor, id_extractor)
+
+    key = (
+        id(candidates),
+        len(candidates),
+        getattr(name_extractor, "__code__", name_extractor),
+        getattr(id_extractor, "__code__", id_extractor),
+    )
+    with _index_cache_lock:
+        index = _index_cache.get(key)
+        if index is not None and index.candidates is candidates:
+            _index_cache.move_to_end(key)
+            return index
+
+    index = FuzzyIndex(candidates, name_extractor, id_extractor)
+    with _index_cache_lock:
+        _index_cache[key] = index
+        while len(_index_cache) > INDEX_CACHE_SIZE:
+            _index_cache.popitem(last=False)
+    return index
+
+
 class FuzzyMatcher:
     """
     Advanced fuzzy matching engine using Levenshtein distance with weighted scoring.
@@ -80,7 +270,8 @@ class FuzzyMatcher:
         Args:
             similarity_threshold: Minimum similarity score to include in results (0.0-1.0)
             max_suggestions: Maximum number of suggestions to return
-            performance_threshold_ms: Maximum time allowed for matching operation
+            performance_threshold_ms: Time budget for a matching operation; when it is
+                exceeded the best matches found so far are returned
             exact_substring_weight: Weight for exact substring matches (default 1.0)
             case_insensitive_weight: Weight for case-insensitive matches (default 0.9)
             character_distance_weight: Weight for character distance-based matches (default 0.7)
@@ -115,62 +306,180 @@ class FuzzyMatcher:
         Returns:
             List of MatchResult objects sorted by similarity score (descending)
         """
-        start_time = time.time()
-
         if not query or not candidates:
             return []
 
-        query_normalized = query.strip()
-        if not query_normalized:
-            return []
+        return self.find_matches_in_index(
+            query, get_fuzzy_index(candidates, name_extractor, id_extractor)
+        )
 
-        results = []
+    def find_matches_in_index(self, query: str, index: FuzzyIndex) -> list[MatchResult]:
+        """
+        Find fuzzy matches for a query string against an indexed candidate list.
 
-        for candidate in candidates:
-            try:
-                candidate_name = name_extractor(candidate)
-                if not candidate_name:
-                    continue
+        Scores are the same as _calculate_similarity's, but only candidates that
+        can reach the similarity threshold are scored: substring matches, names
+        sharing a word with the query, and names close enough in length for
+        their edit distance to qualify. Edit distances are computed in batches,
+        and once performance_threshold_ms has elapsed the best matches found so
+        far are returned.
 
-                similarity = self._calculate_similarity(query_normalized, candidate_name)
+        Args:
+            query: The search query string
+            index: FuzzyIndex of the candidates
 
-                if similarity >= self.similarity_threshold:
-                    match_type = self._determine_match_type(query_normalized, candidate_name)
-                    candidate_id = id_extractor(candidate)
+        Returns:
+            List of MatchResult objects sorted by similarity score (descending)
+        """
+        start_time = time.perf_counter()
+        deadline = start_time + self.performance_threshold_ms / 1000
 
-                    results.append(
-                        MatchResult(
-                            item=candidate,
-                            name=candidate_name,
-                            id=str(candidate_id) if candidate_id is not None else None,
-                            similarity=similarity,
-                            match_type=match_type,
-                        )
-                    )
+        query_normalized = query.strip()
+        if not query_normalized or not len(index):
+            return []
 
-            except Exception as e:
-                logger.warning(f"Error processing candidate {candidate}: {e}")
+        query_lower = query_normalized.lower()
+        query_tokens = frozenset(tokenize(query_lower))
+        entries = index.entries
+        scores: dict[int, float] = {}
+        timed_out = False
+
+        # Substring matches score highest and need no further comparison
+        substring_positions = set()
+        for position in index.substring_candidates(query_lower):
+            entry = entries[position]
+            if query_normalized in entry.name:
+                scores[position] = self.exact_substring_weight
+            elif query_lower in entry.lower:
+                scores[position] = self.case_insensitive_weight
+            else:
                 continue
+            substring_positions.add(position)
+
+        # Word similarity is only non-zero for names sharing a token with the query
+        if self.common_word_weight > 0 and query_tokens:
+            for checked, position in enumerate(index.token_candidates(query_tokens), 1):
+                if position not in substring_positions:
+                    scores[position] = (
+                        self._jaccard(query_tokens, entries[position].tokens)
+                        * self.common_word_weight
+                    )
+                if checked % DEADLINE_CHECK_INTERVAL == 0 and time.perf_counter() > deadline:
+                    timed_out = True
+                    break
+
+        # Edit distance, for names whose length leaves it a chance to reach the threshold
+        if self.character_distance_weight > 0 and not timed_out:
+            min_char_similarity = self.similarity_threshold / self.character_distance_weight
+            pending = [
+                position
+                for position in index.length_candidates(len(query_lower), min_char_similarity)
+                if position not in substring_positions
+            ]
+            for offset in range(0, len(pending), EDIT_DISTANCE_BATCH_SIZE):
+                batch = pending[offset : offset + EDIT_DISTANCE_BATCH_SIZE]
+                self._score_edit_distances(query_normalized, query_lower, batch, entries, scores)
+                if time.perf_counter() > deadline and offset + len(batch) < len(pending):
+                    timed_out = True
+                    break
+
+        if self.similarity_threshold <= 0 and not timed_out:
+            # Every candidate qualifies, including those that share nothing with the query
+            for position in range(len(entries)):
+                scores.setdefault(position, 0.0)
+
+        # Sort by similarity score (descending), keeping candidate order for ties
+        ranked = sorted(
+            (-similarity, position)
+            for position, similarity in scores.items()
+            if similarity >= self.similarity_threshold
+        )[: self.max_suggestions]
 
-        # Sort by similarity score (descending) and limit results
-        results.sort(key=lambda x: x.similarity, reverse=True)
-        results = results[: self.max_suggestions]
+        results = []
+        for negative_similarity, position in ranked:
+            entry = entries[position]
+            results.append(
+                MatchResult(
+                    item=entry.item,
+                    name=entry.name,
+                    id=entry.id,
+                    similarity=-negative_similarity,
+                    match_type=self._determine_indexed_match_type(
+                        query_normalized, query_tokens, entry
+                    ),
+                )
+            )
 
         # Log performance metrics
-        elapsed_ms = (time.time() - start_time) * 1000
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
         logger.info(
-            f"Fuzzy matching completed: query='{query}', candidates={len(candidates)}, "
+            f"Fuzzy matching completed: query='{query}', candidates={len(index)}, "
             f"matches={len(results)}, elapsed={elapsed_ms:.1f}ms"
         )
 
-        if elapsed_ms > self.performance_threshold_ms:
+        if timed_out:
             logger.warning(
                 f"Fuzzy matching exceeded performance threshold: {elapsed_ms:.1f}ms > "
-                f"{self.performance_threshold_ms}ms for {len(candidates)} candidates"
+                f"{self.performance_threshold_ms}ms for {len(index)} candidates; "
+                f"returning the best matches found so far"
             )
 
         return results
 
+    def _score_edit_distances(
+        self,
+        query: str,
+        query_lower: str,
+        positions: list[int],
+        entries: list[IndexedName],
+        scores: dict[int, float],
+    ) -> None:
+        """
+        Raise the scores of candidates whose edit distance similarity reaches the threshold.
+
+        Distances are computed in one batch call that skips candidates beyond
+        the largest distance that could still qualify.
+        """
+        min_char_similarity = self.similarity_threshold / self.character_distance_weight
+        if min_char_similarity > 1 or not positions:
+            return
+
+        longest = max(len(query), max(len(entries[position].name) for position in positions))
+        # One extra edit of slack so float rounding never drops a candidate
+        max_distance = int(longest * (1 - min_char_similarity)) + 1
+        lowers = [entries[position].lower for position in positions]
+
+        for _, distance, i in rf_process.extract_iter(
+            query_lower, lowers, scorer=rf_levenshtein.distance, score_cutoff=max_distance
+        ):
+            position = positions[i]
+            max_length = max(len(query), len(entries[position].name))
+            char_score = (max_length - distance) / max_length * self.character_distance_weight
+            if char_score > scores.get(position, 0.0):
+                scores[position] = char_score
+
+    def _determine_indexed_match_type(
+        self, query: str, query_tokens: frozenset[str], entry: IndexedName
+    ) -> str:
+        """Equivalent of _determine_match_type using the candidate's cached tokens."""
+        if query == entry.name:
+            return "exact"
+        elif query in entry.name:
+            return "exact_substring"
+        elif query.lower() in entry.lower:
+            return "case_insensitive"
+        elif self._jaccard(query_tokens, entry.tokens) * self.common_word_weight > 0.5:
+            return "word_match"
+        else:
+            return "fuzzy"
+
+    @staticmethod
+    def _jaccard(left: frozenset[str], right: frozenset[str]) -> float:
+        """Jaccard similarity (intersection over union) of two token sets."""
+        if not left or not right:
+            return 0.0
+        return len(left & right) / len(left | right)
+
     def _calculate_similarity(self, query: str, candidate: str) -> float:
         """
         Calculate similarity score using weighted criteria.
@@ -245,18 +554,7 @@ class FuzzyMatcher:
         Returns:
             List of normalized tokens
         """
-        # Common separators in Azure DevOps naming
-        separators = [" ", "-", "_", ".", "/", "\\", "(", ")", "[", "]"]
-
-        tokens = [text]
-        for sep in separators:
-            new_tokens = []
-            for token in tokens:
-                new_tokens.extend(token.split(sep))
-            tokens = new_tokens
-
-        # Filter out empty tokens and normalize
-        return [token.strip().lower() for token in tokens if token.strip()]
+        return tokenize(text)
 
     def _determine_match_type(self, query: str, candidate: str) -> str:
         """
@@ -0,0 +1,108 @@
+"""
+Name indexes for resolving cached Azure DevOps resources by name.
+
+Name resolution runs on nearly every tool call, and projects can hold thousands
+of pipelines. NameIndex is built once when a list of resources is cached: a
+case-folded dict answers exact lookups in O(1), and a trigram inverted index
+narrows fuzzy lookups to the few names that share the most (rare) trigrams with
+the query before they are scored with difflib.
+"""
+
+from collections import Counter, defaultdict
+from collections.abc import Callable, Sequence
+from difflib import SequenceMatcher
+from operator import attrgetter
+
+# Names sharing the most trigrams with the query that are scored for fuzzy matches
+MAX_FUZZY_CANDIDATES = 50
+
+# Trigrams counted for fuzzy candidates even when they are common to many names
+MIN_COUNTED_TRIGRAMS = 3
+
+
+def trigrams(name: str) -> set[str]:
+    """Case-folded trigrams of a name, padded so short names and word edges count."""
+    padded = f"  {name.casefold()} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class NameIndex[T]:
+    """
+    Exact and fuzzy name lookup over an immutable list of items.
+
+    Args:
+        items: The items to index. The index keeps a reference so callers can
+            check it still describes the list they hold.
+        name_of: Returns the name of an item.
+    """
+
+    def __init__(self, items: Sequence[T], name_of: Callable[[T], str] = attrgetter("name")):
+        self.items = items
+        self._folded = [name_of(item).casefold() for item in items]
+        self._exact: dict[str, T] = {}
+        self._postings: dict[str, list[int]] = defaultdict(list)
+
+        for position, (item, folded) in enumerate(zip(items, self._folded, strict=True)):
+            # The first item wins on duplicate names, like a linear scan would
+            self._exact.setdefault(folded, item)
+            for gram in trigrams(folded):
+                self._postings[gram].append(position)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def get(self, name: str) -> T | None:
+        """Get the item whose name matches exactly, ignoring case."""
+        return self._exact.get(name.casefold())
+
+    def closest(self, name: str, n: int = 1, cutoff: float = 0.6) -> list[T]:
+        """
+        Get the items whose names are most similar to a (possibly misspelled) name.
+
+        Similarity is difflib's ratio on case-folded names, as with
+        difflib.get_close_matches, but only names sharing the most trigrams
+        with the query are scored.
+
+        Args:
+            name: Name to search for.
+            n: Maximum number of items to return.
+            cutoff: Minimum similarity between 0.0 and 1.0.
+
+        Returns:
+            Matching items, best first.
+        """
+        # Count rare trigrams first; trigrams shared by a large share of the names
+        # (e.g. a common "-deploy" suffix) barely discriminate, so once a few
+        # have been counted they are skipped to keep the lookup sublinear.
+        postings = sorted(
+            (self._postings[gram] for gram in trigrams(name) if gram in self._postings), key=len
+        )
+        common = max(MAX_FUZZY_CANDIDATES, len(self.items) // 20)
+        overlap: Counter[int] = Counter()
+        for counted, positions in enumerate(postings):
+            if counted >= MIN_COUNTED_TRIGRAMS and len(positions) > common:
+                break
+            overlap.update(positions)
+
+        matcher = SequenceMatcher()
+        matcher.set_seq2(name.casefold())
+        scored = []
+        for position, _ in overlap.most_common(MAX_FUZZY_CANDIDATES):
+            matcher.set_seq1(self._folded[position])
+            if (
+                matcher.real_quick_ratio() >= cutoff
+                and matcher.quick_ratio() >= cutoff
+                and (score := matcher.ratio()) >= cutoff
+            ):
+                scored.append((-score, position))
+
+        scored.sort()
+        return [self.items[position] for _, position in scored[:n]]
+
+    def find(self, name: str, fuzzy: bool = True, cutoff: float = 0.6) -> T | None:
+        """Get the exact match for a name, falling back to the closest fuzzy match."""
+        item = self.get(name)
+        if item is None and fuzzy:
+            matches = self.closest(name, n=1, cutoff=cutoff)
+            item = matches[0] if matches else None
+        return item
@@ -1,7 +1,16 @@
 """Batch client methods for Azure DevOps Work Items API operations."""
 
+import asyncio
+import json
 import logging
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextvars import copy_context
+from dataclasses import dataclass, field, replace
 from typing import Any
+from urllib.parse import quote, urlencode
+
+import requests
 
 from ado.client import AdoClient
 from ado.errors import AdoError
@@ -12,6 +21,76 @@ from ado.work_items.models import (
 
 logger = logging.getLogger(__name__)
 
+# Azure DevOps returns at most this many work items per batch GET
+MAX_BATCH_GET_SIZE = 200
+
+
+@dataclass
+class _Mutation:
+    """One work item PATCH or DELETE of a batch update or deletion."""
+
+    index: int  # Position in the caller's list
+    work_item_id: int
+    method: str
+    params: dict[str, Any]
+    body: list[dict[str, Any]] | None = None
+    sources: list[int] = field(default_factory=list)  # Caller's update index of each operation
+
+
+@dataclass
+class _MutationResult:
+    mutation: _Mutation
+    data: dict[str, Any] | None = None
+    error: str | None = None
+
+
+def _conflicting_operations(mutation: _Mutation) -> str | None:
+    """
+    Describe the first path two merged updates set differently, if any.
+
+    Operations from the same update are left to Azure DevOps, as are appends
+    ("/-" paths) and test operations, which never conflict.
+    """
+    writes: dict[str, tuple[int, dict[str, Any]]] = {}
+    for source, operation in zip(mutation.sources, mutation.body, strict=True):
+        path = operation.get("path", "")
+        if operation.get("op") == "test" or path.endswith("/-"):
+            continue
+        if path in writes:
+            previous_source, previous_operation = writes[path]
+            if previous_source != source and previous_operation != operation:
+                return (
+                    f"Updates {previous_source} and {source} of work item "
+                    f"{mutation.work_item_id} conflict on {path}"
+                )
+        writes[path] = (source, operation)
+    return None
+
+
+def _query_params(params: dict[str, Any]) -> dict[str, Any]:
+    """Query parameters with booleans spelled the way Azure DevOps expects them."""
+    return {
+        name: str(value).lower() if isinstance(value, bool) else value
+        for name, value in params.items()
+    }
+
+
+def _batch_response_result(mutation: _Mutation, response: dict[str, Any]) -> _MutationResult:
+    """Turn one entry of a $batch response into a result; its body is a JSON string."""
+    code = response.get("code", 0)
+    body = response.get("body")
+    if isinstance(body, str) and body:
+        try:
+            body = json.loads(body)
+        except ValueError:
+            pass
+
+    if 200 <= code < 300:
+        return _MutationResult(mutation, data=body if isinstance(body, dict) else None)
+
+    message = body.get("message", body) if isinstance(body, dict) else body
+    return _MutationResult(mutation, error=f"HTTP {code}: {message}")
+
 
 class BatchClient:
     """Client for batch Azure DevOps Work Items API operations."""
@@ -56,13 +135,230 @@ class BatchClient:
             AdoError: If the API call fails or error_policy is "fail" and any item fails
             ValueError: If more than 200 work item IDs are provided
         """
-        if len(work_item_ids) > 200:
+        if len(work_item_ids) > MAX_BATCH_GET_SIZE:
             raise ValueError("Cannot retrieve more than 200 work items in a single batch request")
 
         if not work_item_ids:
             logger.info("No work item IDs provided, returning empty list")
             return []
 
+        url, params = self._build_batch_get_request(
+            project_id, work_item_ids, fields, expand_relations, as_of, error_policy
+        )
+
+        try:
+            data = self.client._send_request(method="GET", url=url, params=params)
+            return self._parse_batch_items(data, len(work_item_ids), error_policy)
+
+        except Exception as e:
+            logger.error(f"Failed to get work items batch: {e}")
+            raise AdoError(f"Failed to get work items batch: {e}", "work_items_batch_failed") from e
+
+    async def get_work_items_batch_async(
+        self,
+        project_id: str,
+        work_item_ids: list[int],
+        fields: list[str] | None = None,
+        expand_relations: bool = False,
+        as_of: str | None = None,
+        error_policy: str = "omit",
+    ) -> list[WorkItem]:
+        """Async variant of get_work_items_batch."""
+        if len(work_item_ids) > MAX_BATCH_GET_SIZE:
+            raise ValueError("Cannot retrieve more than 200 work items in a single batch request")
+
+        if not work_item_ids:
+            logger.info("No work item IDs provided, returning empty list")
+            return []
+
+        url, params = self._build_batch_get_request(
+            project_id, work_item_ids, fields, expand_relations, as_of, error_policy
+        )
+
+        try:
+            data = await self.client._send_request_async(method="GET", url=url, params=params)
+            return self._parse_batch_items(data, len(work_item_ids), error_policy)
+
+        except Exception as e:
+            logger.error(f"Failed to get work items batch: {e}")
+            raise AdoError(f"Failed to get work items batch: {e}", "work_items_batch_failed") from e
+
+    def get_work_items_bulk(
+        self,
+        project_id: str,
+        work_item_ids: list[int],
+        fields: list[str] | None = None,
+        expand_relations: bool = False,
+        as_of: str | None = None,
+        error_policy: str = "omit",
+    ) -> list[WorkItem]:
+        """
+        Get any number of work items, fetched as concurrent 200-ID batches.
+
+        Duplicate IDs are fetched once. The chunks run in parallel (bounded by
+        config.work_item_bulk.max_concurrency) and each goes through the rate
+        limiter like any other request.
+
+        Args:
+            project_id: The ID or name of the project.
+            work_item_ids: Work item IDs to retrieve; there is no upper limit.
+            fields: List of specific fields to return. If not specified, all fields are returned.
+            expand_relations: If true, include related work items information.
+            as_of: Retrieve work items as they were at a specific date/time (ISO 8601 format).
+            error_policy: "omit" (default) skips items that can't be retrieved,
+                        "fail" fails the whole call if any item can't be retrieved.
+
+        Returns:
+            List of WorkItem objects in the order their IDs were first requested.
+
+        Raises:
+            AdoError: If a chunk fails, or error_policy is "fail" and any item fails
+        """
+        items = [
+            item
+            for chunk in self.iter_work_items_bulk(
+                project_id, work_item_ids, fields, expand_relations, as_of, error_policy
+            )
+            for item in chunk
+        ]
+        return self._in_request_order(items, work_item_ids)
+
+    def iter_work_items_bulk(
+        self,
+        project_id: str,
+        work_item_ids: list[int],
+        fields: list[str] | None = None,
+        expand_relations: bool = False,
+        as_of: str | None = None,
+        error_policy: str = "omit",
+        ordered: bool = False,
+    ) -> Iterator[list[WorkItem]]:
+        """
+        Like get_work_items_bulk, but yields each chunk's work items as soon as it arrives.
+
+        Chunks are yielded in completion order, or with ordered=True in request
+        order (each chunk once it and all chunks before it have arrived). Closing
+        the iterator early cancels the chunks that have not started yet.
+        """
+        chunks = self._bulk_chunks(work_item_ids)
+        if not chunks:
+            return
+
+        max_workers = min(len(chunks), self.client.config.work_item_bulk.max_concurrency)
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="ado-work-item-bulk"
+        ) as executor:
+            # Each chunk runs in a copy of this context so it keeps the caller's deadline
+            futures = [
+                executor.submit(
+                    copy_context().run,
+                    self.get_work_items_batch,
+                    project_id,
+                    chunk,
+                    fields,
+                    expand_relations,
+                    as_of,
+                    error_policy,
+                )
+                for chunk in chunks
+            ]
+            try:
+                if not ordered:
+                    for future in as_completed(futures):
+                        yield future.result()
+                    return
+                for future, chunk in zip(futures, chunks, strict=True):
+                    yield self._in_request_order(future.result(), chunk)
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    async def get_work_items_bulk_async(
+        self,
+        project_id: str,
+        work_item_ids: list[int],
+        fields: list[str] | None = None,
+        expand_relations: bool = False,
+        as_of: str | None = None,
+        error_policy: str = "omit",
+    ) -> list[WorkItem]:
+        """Async variant of get_work_items_bulk."""
+        items = [
+            item
+            async for chunk in self.iter_work_items_bulk_async(
+                project_id, work_item_ids, fields, expand_relations, as_of, error_policy
+            )
+            for item in chunk
+        ]
+        return self._in_request_order(items, work_item_ids)
+
+    async def iter_work_items_bulk_async(
+        self,
+        project_id: str,
+        work_item_ids: list[int],
+        fields: list[str] | None = None,
+        expand_relations: bool = False,
+        as_of: str | None = None,
+        error_policy: str = "omit",
+        ordered: bool = False,
+    ) -> AsyncIterator[list[WorkItem]]:
+        """Async variant of iter_work_items_bulk."""
+        chunks = self._bulk_chunks(work_item_ids)
+        if not chunks:
+            return
+
+        semaphore = asyncio.Semaphore(self.client.config.work_item_bulk.max_concurrency)
+
+        async def fetch(chunk: list[int]) -> list[WorkItem]:
+            async with semaphore:
+                return await self.get_work_items_batch_async(
+                    project_id, chunk, fields, expand_relations, as_of, error_policy
+                )
+
+        tasks = [asyncio.ensure_future(fetch(chunk)) for chunk in chunks]
+        try:
+            if not ordered:
+                for next_chunk in asyncio.as_completed(tasks):
+                    yield await next_chunk
+                return
+            for task, chunk in zip(tasks, chunks, strict=True):
+                yield self._in_request_order(await task, chunk)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _bulk_chunks(self, work_item_ids: list[int]) -> list[list[int]]:
+        """Split de-duplicated IDs, in first-requested order, into batch-sized chunks."""
+        unique_ids = list(dict.fromkeys(work_item_ids))
+        chunks = [
+            unique_ids[start : start + MAX_BATCH_GET_SIZE]
+            for start in range(0, len(unique_ids), MAX_BATCH_GET_SIZE)
+        ]
+        logger.info(
+            f"Fetching {len(unique_ids)} work items in {len(chunks)} chunks "
+            f"({len(work_item_ids) - len(unique_ids)} duplicate IDs dropped)"
+        )
+        return chunks
+
+    def _in_request_order(
+        self, work_items: list[WorkItem], work_item_ids: list[int]
+    ) -> list[WorkItem]:
+        """Order fetched work items by the first position of their ID in the request."""
+        position = {
+            work_item_id: index for index, work_item_id in enumerate(dict.fromkeys(work_item_ids))
+        }
+        return sorted(work_items, key=lambda item: position.get(item.id, len(position)))
+
+    def _build_batch_get_request(
+        self,
+        project_id: str,
+        work_item_ids: list[int],
+        fields: list[str] | None,
+        expand_relations: bool,
+        as_of: str | None,
+        error_policy: str,
+    ) -> tuple[str, dict[str, Any]]:
+        """Build the URL and query parameters for a batch work item GET."""
         # Build parameters
         params = {
             "ids": ",".join(map(str, work_item_ids)),
@@ -86,31 +382,30 @@ class BatchClient:
             f"(error_policy: {error_policy})"
         )
 
-        try:
-            data = self.client._send_request(method="GET", url=url, params=params)
-
-            work_items = []
-            if data and "value" in data:
-                for item_data in data["value"]:
-                    try:
-                        work_items.append(WorkItem(**item_data))
-                    except Exception as e:
-                        logger.warning(f"Failed to parse work item data: {item_data}. Error: {e}")
-                        if error_policy == "fail":
-                            raise AdoError(
-                                f"Failed to parse work item data: {e}", "work_item_parse_failed"
-                            ) from e
-                        # If error_policy is "omit", just skip this item
-                        continue
+        return url, params
 
-            logger.info(
-                f"Successfully retrieved {len(work_items)} work items out of {len(work_item_ids)} requested"
-            )
-            return work_items
+    def _parse_batch_items(
+        self, data: dict[str, Any] | None, requested_count: int, error_policy: str
+    ) -> list[WorkItem]:
+        """Parse a batch GET response according to the error policy."""
+        work_items = []
+        if data and "value" in data:
+            for item_data in data["value"]:
+                try:
+                    work_items.append(WorkItem(**item_data))
+                except Exception as e:
+                    logger.warning(f"Failed to parse work item data: {item_data}. Error: {e}")
+                    if error_policy == "fail":
+                        raise AdoError(
+                            f"Failed to parse work item data: {e}", "work_item_parse_failed"
+                        ) from e
+                    # If error_policy is "omit", just skip this item
+                    continue
 
-        except Exception as e:
-            logger.error(f"Failed to get work items batch: {e}")
-            raise AdoError(f"Failed to get work items batch: {e}", "work_items_batch_failed") from e
+        logger.info(
+            f"Successfully retrieved {len(work_items)} work items out of {requested_count} requested"
+        )
+        return work_items
 
     def update_work_items_batch(
         self,
@@ -122,10 +417,20 @@ class BatchClient:
         error_policy: str = "fail",
     ) -> list[WorkItem]:
         """
-        Update multiple work items in a batch operation using individual API calls.
+        Update multiple work items with one request to the work item $batch endpoint.
+
+        Updates of the same work item are merged into a single JSON Patch
+        document, in order, so the item gets one PATCH and one revision. Merged
+        updates that set the same path differently conflict: with error_policy
+        "fail" nothing is sent, with "omit" that work item is skipped.
 
-        Note: Azure DevOps doesn't have a true batch update API for work items,
-        so this performs individual updates with transaction-like behavior based on error_policy.
+        Azure DevOps applies each request of a $batch independently. So with
+        error_policy "fail" the updates are first sent with validateOnly, and if
+        any of them would fail nothing is changed. An update can still fail while
+        the batch is applied (e.g. a concurrent edit); the AdoError raised then
+        carries the work items that were updated in its context. If the server
+        rejects the $batch request as a whole, the updates are sent as individual
+        PATCH requests, a few at a time.
 
         Args:
             project_id: The ID or name of the project.
@@ -140,10 +445,13 @@ class BatchClient:
                         - "omit": Skip items that can't be updated
 
         Returns:
-            List of updated WorkItem objects
+            List of updated WorkItem objects, one per distinct work item ID in the
+            order the IDs first appear (not one per update entry)
 
         Raises:
-            AdoError: If the API call fails or error_policy is "fail" and any item fails
+            AdoError: If the API call fails or error_policy is "fail" and any item fails.
+                Its context holds "updated_work_items" and "failed_updates" when
+                some work items had already been updated.
             ValueError: If more than 200 work item updates are provided
         """
         if len(work_item_updates) > 200:
@@ -163,6 +471,8 @@ class BatchClient:
         )
 
         try:
+            mutations: dict[Any, _Mutation] = {}
+            accepted_updates = 0
             for i, update in enumerate(work_item_updates):
                 if "work_item_id" not in update:
                     error_msg = f"Update {i} missing required 'work_item_id' field"
@@ -182,44 +492,93 @@ class BatchClient:
                         failed_updates.append(error_msg)
                         continue
 
+                # Convert operations to JsonPatchOperation objects
+                patch_operations = [
+                    op if isinstance(op, JsonPatchOperation) else JsonPatchOperation(**op)
+                    for op in update["operations"]
+                ]
+                patch_document = [
+                    op.model_dump(exclude_none=True, by_alias=True) for op in patch_operations
+                ]
+
+                # Updates of the same work item are merged into one PATCH (and one revision)
+                accepted_updates += 1
                 work_item_id = update["work_item_id"]
-                operations = update["operations"]
+                if work_item_id in mutations:
+                    mutations[work_item_id].body.extend(patch_document)
+                    mutations[work_item_id].sources.extend([i] * len(patch_document))
+                    continue
+                mutations[work_item_id] = _Mutation(
+                    index=i,
+                    work_item_id=work_item_id,
+                    method="PATCH",
+                    params={
+                        "validateOnly": validate_only,
+                        "bypassRules": bypass_rules,
+                        "suppressNotifications": suppress_notifications,
+                        "api-version": "7.1",
+                    },
+                    body=patch_document,
+                    sources=[i] * len(patch_document),
+                )
 
-                # Convert operations to JsonPatchOperation objects
-                patch_operations = []
-                for op in operations:
-                    if isinstance(op, JsonPatchOperation):
-                        patch_operations.append(op)
-                    else:
-                        # Convert dict to JsonPatchOperation
-                        patch_operations.append(JsonPatchOperation(**op))
+            for work_item_id, mutation in list(mutations.items()):
+                conflict = _conflicting_operations(mutation)
+                if conflict is None:
+                    continue
+                if error_policy == "fail":
+                    raise ValueError(conflict)
+                logger.warning(f"Skipping updates of work item {work_item_id}: {conflict}")
+                failed_updates.append(conflict)
+                del mutations[work_item_id]
+
+            if len(mutations) < accepted_updates:
+                logger.info(
+                    f"Merged {accepted_updates} updates into {len(mutations)} work item patches"
+                )
 
-                try:
-                    # Use the CRUD client's update method through the main client
-                    updated_work_item = self._update_work_item_single(
-                        project_id=project_id,
-                        work_item_id=work_item_id,
-                        operations=patch_operations,
-                        validate_only=validate_only,
-                        bypass_rules=bypass_rules,
-                        suppress_notifications=suppress_notifications,
+            if error_policy == "fail" and not validate_only:
+                failure = self._dry_run_failure(project_id, list(mutations.values()))
+                if failure is not None:
+                    raise AdoError(
+                        f"Batch update failed on item {failure.mutation.index}: {failure.error}",
+                        "batch_update_failed",
                     )
 
-                    updated_work_items.append(updated_work_item)
-                    processed_work_items.append((work_item_id, updated_work_item))
+            first_failure = None
+            for result in self._execute_mutations(project_id, list(mutations.values())):
+                mutation = result.mutation
+                if result.error is None:
+                    try:
+                        updated_work_items.append(WorkItem(**result.data))
+                        processed_work_items.append(mutation.work_item_id)
+                        continue
+                    except Exception as e:
+                        result.error = f"unexpected response: {e}"
 
-                except Exception as e:
-                    error_msg = f"Failed to update work item {work_item_id}: {e}"
-                    failed_updates.append(error_msg)
+                failed_updates.append(
+                    f"Failed to update work item {mutation.work_item_id}: {result.error}"
+                )
+                if error_policy == "fail":
+                    logger.error(
+                        f"Batch update failed on item {mutation.index} "
+                        f"(ID: {mutation.work_item_id}): {result.error}"
+                    )
+                    first_failure = first_failure or result
+                else:
+                    logger.warning(
+                        f"Skipping failed update for work item {mutation.work_item_id}: {result.error}"
+                    )
 
-                    if error_policy == "fail":
-                        logger.error(f"Batch update failed on item {i} (ID: {work_item_id}): {e}")
-                        raise AdoError(
-                            f"Batch update failed on item {i}: {e}", "batch_update_failed"
-                        ) from e
-                    else:
-                        logger.warning(f"Skipping failed update for work item {work_item_id}: {e}")
-                        continue
+            if first_failure is not None:
+                raise AdoError(
+                    f"Batch update failed on item {first_failure.mutation.index}: {first_failure.error}",
+                    "batch_update_failed",
+                    context={
+                        "updated_work_items": updated_work_items,
+                        "failed_updates": failed_updates,
+                    },
+                )
 
             if failed_updates and error_policy == "omit":
                 logger.warning(f"Some updates failed but were omitted: {failed_updates}")
@@ -230,19 +589,19 @@ class BatchClient:
             return updated_work_items
 
         except Exception as e:
-            # If error_policy is "fail" and we've already updated some items,
-            # we could implement rollback here, but Azure DevOps doesn't support transactions
-            # so we'll just log the partial state
+            # Azure DevOps doesn't support transactions, so log the partial state
             if processed_work_items and error_policy == "fail":
                 logger.warning(
                     f"Batch update failed after successfully updating {len(processed_work_items)} items. "
-                    f"Updated work item IDs: {[item[0] for item in processed_work_items]}. "
+                    f"Updated work item IDs: {processed_work_items}. "
                     f"Consider manual rollback if needed."
                 )
 
             logger.error(f"Failed to update work items batch: {e}")
             raise AdoError(
-                f"Failed to update work items batch: {e}", "work_items_batch_update_failed"
+                f"Failed to update work items batch: {e}",
+                "work_items_batch_update_failed",
+                context=getattr(e, "context", None),
             ) from e
 
     def delete_work_items_batch(
@@ -253,10 +612,13 @@ class BatchClient:
         error_policy: str = "fail",
     ) -> list[bool]:
         """
-        Delete multiple work items in a batch operation using individual API calls.
+        Delete multiple work items with one request to the work item $batch endpoint.
 
-        Note: Azure DevOps doesn't have a true batch delete API for work items,
-        so this performs individual deletes with transaction-like behavior based on error_policy.
+        As with update_work_items_batch, each deletion is applied independently,
+        and the deletions are sent individually, a few at a time, if the server
+        rejects the $batch request. With error_policy "fail" nothing is deleted if
+        any of the work items does not exist; a deletion that still fails while
+        the batch is applied raises an AdoError carrying the per-item results.
 
         Args:
             project_id: The ID or name of the project.
@@ -270,7 +632,9 @@ class BatchClient:
             List of boolean values indicating success/failure for each work item
 
         Raises:
-            AdoError: If the API call fails or error_policy is "fail" and any item fails
+            AdoError: If the API call fails or error_policy is "fail" and any item fails.
+                Its context holds "deletion_results" when some work items had
+                already been deleted.
             ValueError: If more than 200 work item IDs are provided
         """
         if len(work_item_ids) > 200:
@@ -290,31 +654,54 @@ class BatchClient:
         )
 
         try:
-            for i, work_item_id in enumerate(work_item_ids):
-                try:
-                    # Use the CRUD client's delete method through the main client
-                    success = self._delete_work_item_single(
-                        project_id=project_id, work_item_id=work_item_id, destroy=destroy
+            mutations = [
+                _Mutation(
+                    index=i,
+                    work_item_id=work_item_id,
+                    method="DELETE",
+                    params={"destroy": destroy, "api-version": "7.1"},
+                )
+                for i, work_item_id in enumerate(work_item_ids)
+            ]
+
+            if error_policy == "fail":
+                missing = self._first_missing_work_item(project_id, mutations)
+                if missing is not None:
+                    raise AdoError(
+                        f"Batch deletion failed on item {missing.index}: "
+                        f"work item {missing.work_item_id} does not exist",
+                        "batch_delete_failed",
                     )
 
-                    deletion_results.append(success)
-                    processed_work_items.append(work_item_id)
+            first_failure = None
+            for result in self._execute_mutations(project_id, mutations):
+                mutation = result.mutation
+                if result.error is None:
+                    deletion_results.append(True)
+                    processed_work_items.append(mutation.work_item_id)
+                    continue
 
-                except Exception as e:
-                    error_msg = f"Failed to delete work item {work_item_id}: {e}"
-                    failed_deletions.append(error_msg)
+                failed_deletions.append(
+                    f"Failed to delete work item {mutation.work_item_id}: {result.error}"
+                )
+                deletion_results.append(False)
+                if error_policy == "fail":
+                    logger.error(
+                        f"Batch deletion failed on item {mutation.index} "
+                        f"(ID: {mutation.work_item_id}): {result.error}"
+                    )
+                    first_failure = first_failure or result
+                else:
+                    logger.warning(
+                        f"Skipping failed deletion for work item {mutation.work_item_id}: {result.error}"
+                    )
 
-                    if error_policy == "fail":
-                        logger.error(f"Batch deletion failed on item {i} (ID: {work_item_id}): {e}")
-                        raise AdoError(
-                            f"Batch deletion failed on item {i}: {e}", "batch_delete_failed"
-                        ) from e
-                    else:
-                        logger.warning(
-                            f"Skipping failed deletion for work item {work_item_id}: {e}"
-                        )
-                        deletion_results.append(False)
-                        continue
+            if first_failure is not None:
+                raise AdoError(
+                    f"Batch deletion failed on item {first_failure.mutation.index}: {first_failure.error}",
+                    "batch_delete_failed",
+                    context={"deletion_results": deletion_results},
+                )
 
             if failed_deletions and error_policy == "omit":
                 logger.warning(f"Some deletions failed but were omitted: {failed_deletions}")
@@ -336,80 +723,112 @@ class BatchClient:
 
             logger.error(f"Failed to delete work items batch: {e}")
             raise AdoError(
-                f"Failed to delete work items batch: {e}", "work_items_batch_delete_failed"
+                f"Failed to delete work items batch: {e}",
+                "work_items_batch_delete_failed",
+                context=getattr(e, "context", None),
             ) from e
 
-    def _update_work_item_single(
-        self,
-        project_id: str,
-        work_item_id: int,
-        operations: list[JsonPatchOperation],
-        validate_only: bool = False,
-        bypass_rules: bool = False,
-        suppress_notifications: bool = False,
-    ) -> WorkItem:
-        """
-        Helper method to update a single work item.
-
-        This method delegates to the CRUD client for consistent behavior
-        with the main WorkItemsClient.
-
-        Args:
-            project_id: The ID or name of the project.
-            work_item_id: The ID of the work item to update.
-            operations: List of JSON Patch operations to apply.
-            validate_only: If true, only validate the request.
-            bypass_rules: If true, bypass rules validation.
-            suppress_notifications: If true, suppress notifications.
-
-        Returns:
-            The updated WorkItem object.
-
-        Raises:
-            AdoError: If the API request fails.
-        """
-        # Import here to avoid circular imports
-        from ado.work_items.crud_client import CrudClient
-
-        crud_client = CrudClient(self.client)
-        return crud_client.update_work_item(
-            project_id=project_id,
-            work_item_id=work_item_id,
-            operations=operations,
-            validate_only=validate_only,
-            bypass_rules=bypass_rules,
-            suppress_notifications=suppress_notifications,
+    def _dry_run_failure(
+        self, project_id: str, mutations: list[_Mutation]
+    ) -> _MutationResult | None:
+        """Send updates with validateOnly and return the first that would fail, if any."""
+        dry_run = [
+            replace(mutation, params={**mutation.params, "validateOnly": True})
+            for mutation in mutations
+        ]
+        results = self._execute_mutations(project_id, dry_run)
+        return next((result for result in results if result.error is not None), None)
+
+    def _first_missing_work_item(
+        self, project_id: str, mutations: list[_Mutation]
+    ) -> _Mutation | None:
+        """Return the first deletion whose work item does not exist, if any."""
+        existing = {
+            work_item.id
+            for work_item in self.get_work_items_batch(
+                project_id, [mutation.work_item_id for mutation in mutations], fields=["System.Id"]
+            )
+        }
+        return next(
+            (mutation for mutation in mutations if mutation.work_item_id not in existing), None
         )
 
-    def _delete_work_item_single(
-        self,
-        project_id: str,
-        work_item_id: int,
-        destroy: bool = False,
-    ) -> bool:
+    def _execute_mutations(
+        self, project_id: str, mutations: list[_Mutation]
+    ) -> list[_MutationResult]:
         """
-        Helper method to delete a single work item.
-
-        This method delegates to the CRUD client for consistent behavior
-        with the main WorkItemsClient.
-
-        Args:
-            project_id: The ID or name of the project.
-            work_item_id: The ID of the work item to delete.
-            destroy: If true, permanently destroy the work item.
+        Send work item mutations, preferably as a single $batch request.
 
-        Returns:
-            True if deletion was successful.
-
-        Raises:
-            AdoError: If the API request fails.
+        Returns one result per mutation, in the same order. Falls back to
+        individual requests when the $batch request itself is rejected (e.g. by
+        an Azure DevOps Server version without the endpoint).
         """
-        # Import here to avoid circular imports
-        from ado.work_items.crud_client import CrudClient
-
-        crud_client = CrudClient(self.client)
-        return crud_client.delete_work_item(
-            project_id=project_id,
-            work_item_id=work_item_id,
-            destroy=destroy,
+        if not mutations:
+            return []
+
+        try:
+            return self._send_batch(project_id, mutations)
+        except requests.exceptions.HTTPError as e:
+            status_code = e.response.status_code if e.response is not None else None
+            # Server errors and authorization failures would fail the individual requests too
+            if status_code is None or not 400 <= status_code < 500 or status_code in (401, 403):
+                raise
+            logger.warning(
+                f"Work item $batch request rejected, sending {len(mutations)} requests individually: {e}"
+            )
+            return self._send_individually(project_id, mutations)
+
+    def _send_batch(self, project_id: str, mutations: list[_Mutation]) -> list[_MutationResult]:
+        url = f"{self.organization_url}/_apis/wit/$batch"
+        batch = [
+            {
+                "method": mutation.method,
+                "uri": f"/{quote(project_id)}/_apis/wit/workitems/{mutation.work_item_id}"
+                f"?{urlencode(_query_params(mutation.params))}",
+                "headers": {"Content-Type": "application/json-patch+json"},
+                **({"body": mutation.body} if mutation.body is not None else {}),
+            }
+            for mutation in mutations
+        ]
+
+        logger.info(f"Sending {len(batch)} work item requests to {url}")
+        data = self.client._send_request(
+            method="POST", url=url, params={"api-version": "7.1"}, json=batch
         )
+
+        responses = (data or {}).get("value", [])
+        if len(responses) != len(mutations):
+            raise AdoError(
+                f"Work item $batch returned {len(responses)} responses for {len(mutations)} requests",
+                "work_items_batch_response_mismatch",
+            )
+        return [
+            _batch_response_result(mutation, response)
+            for mutation, response in zip(mutations, responses, strict=True)
+        ]
+
+    def _send_individually(
+        self, project_id: str, mutations: list[_Mutation]
+    ) -> list[_MutationResult]:
+        max_workers = min(len(mutations), self.client.config.work_item_bulk.max_concurrency)
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="ado-work-item-mutation"
+        ) as executor:
+            # Each request runs in a copy of this context so it keeps the caller's deadline
+            futures = [
+                executor.submit(copy_context().run, self._send_single, project_id, mutation)
+                for mutation in mutations
+            ]
+            return [future.result() for future in futures]
+
+    def _send_single(self, project_id: str, mutation: _Mutation) -> _MutationResult:
+        url = f"{self.organization_url}/{project_id}/_apis/wit/workitems/{mutation.work_item_id}"
+        kwargs: dict[str, Any] = {"params": mutation.params}
+        if mutation.body is not None:
+            kwargs["json"] = mutation.body
+            kwargs["headers"] = {"Content-Type": "application/json-patch+json"}
+        try:
+            data = self.client._send_request(method=mutation.method, url=url, **kwargs)
+        except Exception as e:
+            return _MutationResult(mutation, error=str(e))
+        return _MutationResult(mutation, data=data)
@@ -19,7 +19,7 @@ def register_batch_tools(mcp_instance, client_container):
     """
 
     @mcp_instance.tool
-    def get_work_items_batch(
+    async def get_work_items_batch(
         project_id: str,
         work_item_ids: list[int],
         fields: list[str] | None = None,
@@ -119,7 +119,7 @@ def register_batch_tools(mcp_instance, client_container):
 
             # Execute batch retrieval with timing
             api_start_time = time.time()
-            work_items = work_items_client.get_work_items_batch(
+            work_items = await work_items_client.get_work_items_batch_async(
                 project_id=project_id,
                 work_item_ids=work_item_ids,
                 fields=fields,
@@ -183,6 +183,67 @@ def register_batch_tools(mcp_instance, client_container):
             logger.error(f"Failed to get work items batch: {e}")
             raise
 
+    @mcp_instance.tool
+    async def get_work_items_bulk(
+        project_id: str,
+        work_item_ids: list[int],
+        fields: list[str] | None = None,
+        expand_relations: bool = False,
+        as_of: str | None = None,
+        error_policy: str = "omit",
+    ) -> list[WorkItem] | None:
+        """
+        Get any number of work items by their IDs.
+
+        Unlike get_work_items_batch there is no 200-item limit: the IDs are
+        de-duplicated, split into batches of 200 and fetched concurrently.
+        Use this for reports over large query results.
+
+        Args:
+            project_id: The ID or name of the project.
+            work_item_ids: List of work item IDs to retrieve.
+            fields: List of specific fields to return (e.g., ["System.Title", "System.State"]).
+                   Requesting only the fields you need keeps large fetches fast.
+            expand_relations: If true, include related work items information.
+            as_of: Retrieve work items as they were at a specific date/time (ISO 8601 format).
+            error_policy: How to handle errors for individual items:
+                        - "omit" (default): Skip items that can't be retrieved
+                        - "fail": Fail the entire request if any item can't be retrieved
+
+        Returns:
+            List of WorkItem objects in the order their IDs were first requested
+
+        Examples:
+            get_work_items_bulk(
+                project_id="MyProject",
+                work_item_ids=ids_from_query,
+                fields=["System.Title", "System.State"]
+            )
+        """
+        ado_client_instance = client_container.get("client")
+        if not ado_client_instance:
+            logger.error("ADO client is not available.")
+            return None
+
+        try:
+            work_items_client = WorkItemsClient(ado_client_instance)
+            work_items = await work_items_client.get_work_items_bulk_async(
+                project_id=project_id,
+                work_item_ids=work_item_ids,
+                fields=fields,
+                expand_relations=expand_relations,
+                as_of=as_of,
+                error_policy=error_policy,
+            )
+            logger.info(
+                f"Successfully retrieved {len(work_items)} out of {len(work_item_ids)} requested work items"
+            )
+            return work_items
+
+        except Exception as e:
+            logger.error(f"Failed to get work items in bulk: {e}")
+            raise
+
     @mcp_instance.tool
     def update_work_items_batch(
         project_id: str,
@@ -197,6 +258,8 @@ def register_batch_tools(mcp_instance, client_container):
 
         This tool provides efficient bulk updating of work items with comprehensive error handling
         and performance monitoring. It uses the Azure DevOps batch API for optimal performance.
+        Several updates of the same work item are merged into one change (one revision);
+        updates that set the same field to different values are reported as a conflict.
 
         Args:
             project_id: The ID or name of the project.
@@ -217,11 +280,17 @@ def register_batch_tools(mcp_instance, client_container):
             bypass_rules: If true, bypass rules validation.
             suppress_notifications: If true, suppress notifications.
             error_policy: How to handle errors for individual items. Options:
-                        - "fail" (default): Fail the entire request if any item fails
+                        - "fail" (default): Fail the entire request if any item fails.
+                          The updates are validated first, so nothing is changed when
+                          one of them is invalid.
                         - "omit": Skip items that can't be updated and continue with others
 
         Returns:
-            List of updated work item dictionaries, or None if client unavailable.
+            List of updated work items, or None if client unavailable. There is one
+            entry per distinct work_item_id, in the order each ID first appears, not
+            one per update: when several updates target the same work item the list
+            is shorter than work_item_updates and its positions do not match the
+            input. Match results to updates by their id.
 
         Examples:
             # Update multiple work items' states
@@ -271,6 +340,8 @@ def register_batch_tools(mcp_instance, client_container):
             start_time = time.time()
             api_start_time = datetime.utcnow()
             update_count = len(work_item_updates)
+            # Updates of the same work item are merged, so the result has one entry per item
+            work_item_count = len({update.get("work_item_id") for update in work_item_updates})
 
             # Log batch operation details with structured data
             batch_operation_context = {
@@ -329,7 +400,7 @@ def register_batch_tools(mcp_instance, client_container):
             api_duration = (api_end_time - api_start_time).total_seconds()
 
             result_count = len(updated_work_items)
-            success_rate = (result_count / update_count) * 100 if update_count > 0 else 0
+            success_rate = (result_count / work_item_count) * 100 if work_item_count > 0 else 0
             updates_per_second = result_count / total_duration if total_duration > 0 else 0
 
             # Log comprehensive performance metrics
@@ -369,7 +440,7 @@ def register_batch_tools(mcp_instance, client_container):
         Delete multiple work items in a single batch operation with transaction-like behavior.
 
         This tool provides efficient bulk deletion of work items with comprehensive error handling
-        and performance monitoring. It uses individual Azure DevOps API calls for optimal reliability.
+        and performance monitoring. It uses the Azure DevOps batch API for optimal performance.
 
         Args:
             project_id: The ID or name of the project.
@@ -377,7 +448,8 @@ def register_batch_tools(mcp_instance, client_container):
             destroy: If true, permanently destroy the work items instead of moving to recycle bin.
                    WARNING: Destroyed work items cannot be recovered!
             error_policy: How to handle errors for individual items:
-                        - "fail" (default): Fail the entire request if any item fails
+                        - "fail" (default): Fail the entire request if any item fails.
+                          Nothing is deleted if any of the work items does not exist.
                         - "omit": Skip items that can't be deleted, continue with others
 
         Returns:
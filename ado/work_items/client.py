@@ -1,6 +1,7 @@
 """Client methods for Azure DevOps Work Items API operations."""
 
 import logging
+from collections.abc import AsyncIterator, Iterator
 from typing import Any
 
 from opentelemetry import trace
@@ -113,6 +114,23 @@ class WorkItemsClient:
             expand=expand,
         )
 
+    async def get_work_item_async(
+        self,
+        project_id: str,
+        work_item_id: int,
+        fields: list[str] | None = None,
+        as_of: str | None = None,
+        expand: str | None = None,
+    ) -> WorkItem:
+        """Async variant of get_work_item."""
+        return await self.crud_client.get_work_item_async(
+            project_id=project_id,
+            work_item_id=work_item_id,
+            fields=fields,
+            as_of=as_of,
+            expand=expand,
+        )
+
     def update_work_item(
         self,
         project_id: str,
@@ -148,6 +166,25 @@ class WorkItemsClient:
             suppress_notifications=suppress_notifications,
         )
 
+    async def update_work_item_async(
+        self,
+        project_id: str,
+        work_item_id: int,
+        operations: list[JsonPatchOperation],
+        validate_only: bool = False,
+        bypass_rules: bool = False,
+        suppress_notifications: bool = False,
+    ) -> WorkItem:
+        """Async variant of update_work_item."""
+        return await self.crud_client.update_work_item_async(
+            project_id=project_id,
+            work_item_id=work_item_id,
+            operations=operations,
+            validate_only=validate_only,
+            bypass_rules=bypass_rules,
+            suppress_notifications=suppress_notifications,
+        )
+
     def delete_work_item(
         self,
         project_id: str,
@@ -337,6 +374,67 @@ class WorkItemsClient:
             skip=skip,
         )
 
+    async def query_work_items_async(
+        self,
+        project_id: str,
+        wiql_query: str | None = None,
+        top: int | None = None,
+        skip: int | None = None,
+    ) -> WorkItemQueryResult:
+        """Async variant of query_work_items."""
+        return await self.query_client.query_work_items_async(
+            project_id=project_id,
+            wiql_query=wiql_query,
+            top=top,
+            skip=skip,
+        )
+
+    def query_work_items_hydrated(
+        self,
+        project_id: str,
+        wiql_query: str | None = None,
+        fields: list[str] | None = None,
+        top: int | None = None,
+        error_policy: str = "omit",
+    ) -> Iterator[list[WorkItem]]:
+        """
+        Run a WIQL query and fetch the work items it matches, window by window.
+
+        Args:
+            project_id: The ID or name of the project.
+            wiql_query: The WIQL query string. If None, queries all work items.
+            fields: Fields to fetch. Defaults to the query's SELECT columns.
+            top: Maximum number of work items to return.
+            error_policy: "omit" (default) or "fail", as for get_work_items_batch.
+
+        Yields:
+            Lists of up to 200 WorkItem objects, in query order.
+        """
+        return self.query_client.query_work_items_hydrated(
+            project_id=project_id,
+            wiql_query=wiql_query,
+            fields=fields,
+            top=top,
+            error_policy=error_policy,
+        )
+
+    def query_work_items_hydrated_async(
+        self,
+        project_id: str,
+        wiql_query: str | None = None,
+        fields: list[str] | None = None,
+        top: int | None = None,
+        error_policy: str = "omit",
+    ) -> AsyncIterator[list[WorkItem]]:
+        """Async variant of query_work_items_hydrated."""
+        return self.query_client.query_work_items_hydrated_async(
+            project_id=project_id,
+            wiql_query=wiql_query,
+            fields=fields,
+            top=top,
+            error_policy=error_policy,
+        )
+
     def get_work_items_batch(
         self,
         project_id: str,
@@ -375,6 +473,121 @@ class WorkItemsClient:
             error_policy=error_policy,
         )
 
+    async def get_work_items_batch_async(
+        self,
+        project_id: str,
+        work_item_ids: list[int],
+        fields: list[str] | None = None,
+        expand_relations: bool = False,
+        as_of: str | None = None,
+        error_policy: str = "omit",
+    ) -> list[WorkItem]:
+        """Async variant of get_work_items_batch."""
+        return await self.batch_client.get_work_items_batch_async(
+            project_id=project_id,
+            work_item_ids=work_item_ids,
+            fields=fields,
+            expand_relations=expand_relations,
+            as_of=as_of,
+            error_policy=error_policy,
+        )
+
+    def get_work_items_bulk(
+        self,
+        project_id: str,
+        work_item_ids: list[int],
+        fields: list[str] | None = None,
+        expand_relations: bool = False,
+        as_of: str | None = None,
+        error_policy: str = "omit",
+    ) -> list[WorkItem]:
+        """
+        Get any number of work items, fetched as concurrent 200-ID batches.
+
+        Args:
+            project_id: The ID or name of the project.
+            work_item_ids: Work item IDs to retrieve; duplicates are fetched once.
+            fields: List of specific fields to return. If not specified, all fields are returned.
+            expand_relations: If true, include related work items information.
+            as_of: Retrieve work items as they were at a specific date/time (ISO 8601 format).
+            error_policy: "omit" (default) or "fail", as for get_work_items_batch.
+
+        Returns:
+            List of WorkItem objects in the order their IDs were first requested.
+
+        Raises:
+            AdoError: If a chunk fails, or error_policy is "fail" and any item fails
+        """
+        return self.batch_client.get_work_items_bulk(
+            project_id=project_id,
+            work_item_ids=work_item_ids,
+            fields=fields,
+            expand_relations=expand_relations,
+            as_of=as_of,
+            error_policy=error_policy,
+        )
+
+    async def get_work_items_bulk_async(
+        self,
+        project_id: str,
+        work_item_ids: list[int],
+        fields: list[str] | None = None,
+        expand_relations: bool = False,
+        as_of: str | None = None,
+        error_policy: str = "omit",
+    ) -> list[WorkItem]:
+        """Async variant of get_work_items_bulk."""
+        return await self.batch_client.get_work_items_bulk_async(
+            project_id=project_id,
+            work_item_ids=work_item_ids,
+            fields=fields,
+            expand_relations=expand_relations,
+            as_of=as_of,
+            error_policy=error_policy,
+        )
+
+    def iter_work_items_bulk(
+        self,
+        project_id: str,
+        work_item_ids: list[int],
+        fields: list[str] | None = None,
+        expand_relations: bool = False,
+        as_of: str | None = None,
+        error_policy: str = "omit",
+        ordered: bool = False,
+    ) -> Iterator[list[WorkItem]]:
+        """Like get_work_items_bulk, but yields each chunk's work items as soon as it arrives."""
+        return self.batch_client.iter_work_items_bulk(
+            project_id=project_id,
+            work_item_ids=work_item_ids,
+            fields=fields,
+            expand_relations=expand_relations,
+            as_of=as_of,
+            error_policy=error_policy,
+            ordered=ordered,
+        )
+
+    def iter_work_items_bulk_async(
+        self,
+        project_id: str,
+        work_item_ids: list[int],
+        fields: list[str] | None = None,
+        expand_relations: bool = False,
+        as_of: str | None = None,
+        error_policy: str = "omit",
+        ordered: bool = False,
+    ) -> AsyncIterator[list[WorkItem]]:
+        """Async variant of iter_work_items_bulk."""
+        return self.batch_client.iter_work_items_bulk_async(
+            project_id=project_id,
+            work_item_ids=work_item_ids,
+            fields=fields,
+            expand_relations=expand_relations,
+            as_of=as_of,
+            error_policy=error_policy,
+            ordered=ordered,
+        )
+
     def update_work_items_batch(
         self,
         project_id: str,
@@ -385,10 +598,9 @@ class WorkItemsClient:
         error_policy: str = "fail",
     ) -> list[WorkItem]:
         """
-        Update multiple work items in a batch operation using individual API calls.
+        Update multiple work items with one request to the work item $batch endpoint.
 
-        Note: Azure DevOps doesn't have a true batch update API for work items,
-        so this performs individual updates with transaction-like behavior based on error_policy.
+        Note: Azure DevOps applies each update independently; the batch is not a transaction.
 
         Args:
             project_id: The ID or name of the project.
@@ -426,10 +638,9 @@ class WorkItemsClient:
         error_policy: str = "fail",
     ) -> list[bool]:
         """
-        Delete multiple work items in a batch operation using individual API calls.
+        Delete multiple work items with one request to the work item $batch endpoint.
 
-        Note: Azure DevOps doesn't have a true batch delete API for work items,
-        so this performs individual deletes with transaction-like behavior based on error_policy.
+        Note: Azure DevOps applies each deletion independently; the batch is not a transaction.
 
         Args:
             project_id: The ID or name of the project.
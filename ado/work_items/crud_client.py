@@ -6,6 +6,7 @@ from typing import Any
 from opentelemetry import trace
 
 from ado.client import AdoClient
+from ado.deadline import request_timeout
 from ado.errors import (
     AdoAuthenticationError,
     AdoError,
@@ -101,6 +102,7 @@ class CrudClient:
                 import requests
 
                 @self.client.retry_manager.retry_on_failure
+                @self.client.circuit_breakers.for_request("POST", url).protect
                 def make_create_request():
                     # Use session for connection pooling if available
                     request_func = (
@@ -108,14 +110,19 @@ class CrudClient:
                         if hasattr(self.client, "session") and self.client.session != requests
                         else requests.request
                     )
-                    response = request_func(
-                        method="POST",
-                        url=url,
-                        headers=request_headers,
-                        json=patch_document,
-                        params=params,
-                        timeout=self.client.config.request_timeout_seconds,
+                    timeout = request_timeout(
+                        self.client.config.request_timeout_seconds, f"POST {url}"
                     )
+                    with self.client.rate_limiter.acquire(f"POST {url}"):
+                        response = request_func(
+                            method="POST",
+                            url=url,
+                            headers=request_headers,
+                            json=patch_document,
+                            params=params,
+                            timeout=timeout,
+                        )
+                    self.client.rate_limiter.observe(response.status_code, response.headers)
 
                     # Handle specific status codes with proper error types
                     if response.status_code == 401:
@@ -185,15 +192,7 @@ class CrudClient:
         Raises:
             AdoError: If the API request fails.
         """
-        params = {"api-version": "7.1"}
-
-        if fields:
-            params["fields"] = ",".join(fields)
-        if as_of:
-            params["asOf"] = as_of
-        if expand:
-            params["$expand"] = expand
-
+        params = self._get_work_item_params(fields, as_of, expand)
         url = f"{self.organization_url}/{project_id}/_apis/wit/workitems/{work_item_id}"
 
         logger.info(f"Getting work item {work_item_id} from project '{project_id}'")
@@ -212,13 +211,61 @@ class CrudClient:
             # Re-raise our structured exceptions
             raise
         except Exception as e:
-            logger.error(f"Failed to get work item {work_item_id}: {e}")
-            raise AdoError(
-                f"Failed to get work item {work_item_id}: {e}",
-                "work_item_get_failed",
-                context={"project_id": project_id, "work_item_id": work_item_id},
-                original_exception=e,
-            ) from e
+            raise self._get_failed_error(project_id, work_item_id, e) from e
+
+    async def get_work_item_async(
+        self,
+        project_id: str,
+        work_item_id: int,
+        fields: list[str] | None = None,
+        as_of: str | None = None,
+        expand: str | None = None,
+    ) -> WorkItem:
+        """Async variant of get_work_item."""
+        params = self._get_work_item_params(fields, as_of, expand)
+        url = f"{self.organization_url}/{project_id}/_apis/wit/workitems/{work_item_id}"
+
+        logger.info(f"Getting work item {work_item_id} from project '{project_id}'")
+
+        try:
+            with tracer.start_as_current_span("get_work_item") as span:
+                span.set_attribute("work_item.id", work_item_id)
+                span.set_attribute("work_item.project_id", project_id)
+
+                data = await self.client._send_request_async(method="GET", url=url, params=params)
+
+            logger.info(f"Successfully retrieved work item {work_item_id}")
+            return WorkItem(**data)
+
+        except (AdoAuthenticationError, AdoRateLimitError, AdoNetworkError, AdoTimeoutError):
+            raise
+        except Exception as e:
+            raise self._get_failed_error(project_id, work_item_id, e) from e
+
+    def _get_work_item_params(
+        self, fields: list[str] | None, as_of: str | None, expand: str | None
+    ) -> dict[str, Any]:
+        """Build query parameters for a single work item GET."""
+        params = {"api-version": "7.1"}
+
+        if fields:
+            params["fields"] = ",".join(fields)
+        if as_of:
+            params["asOf"] = as_of
+        if expand:
+            params["$expand"] = expand
+
+        return params
+
+    def _get_failed_error(self, project_id: str, work_item_id: int, e: Exception) -> AdoError:
+        """Wrap an unexpected failure while getting a work item."""
+        logger.error(f"Failed to get work item {work_item_id}: {e}")
+        return AdoError(
+            f"Failed to get work item {work_item_id}: {e}",
+            "work_item_get_failed",
+            context={"project_id": project_id, "work_item_id": work_item_id},
+            original_exception=e,
+        )
 
     def update_work_item(
         self,
@@ -276,6 +323,7 @@ class CrudClient:
                 import requests
 
                 @self.client.retry_manager.retry_on_failure
+                @self.client.circuit_breakers.for_request("PATCH", url).protect
                 def make_update_request():
                     # Use session for connection pooling if available
                     request_func = (
@@ -283,14 +331,19 @@ class CrudClient:
                         if hasattr(self.client, "session") and self.client.session != requests
                         else requests.request
                     )
-                    response = request_func(
-                        method="PATCH",
-                        url=url,
-                        headers=request_headers,
-                        json=patch_document,
-                        params=params,
-                        timeout=self.client.config.request_timeout_seconds,
+                    timeout = request_timeout(
+                        self.client.config.request_timeout_seconds, f"PATCH {url}"
                     )
+                    with self.client.rate_limiter.acquire(f"PATCH {url}"):
+                        response = request_func(
+                            method="PATCH",
+                            url=url,
+                            headers=request_headers,
+                            json=patch_document,
+                            params=params,
+                            timeout=timeout,
+                        )
+                    self.client.rate_limiter.observe(response.status_code, response.headers)
 
                     # Handle specific status codes
                     if response.status_code == 401:
@@ -339,6 +392,69 @@ class CrudClient:
                 original_exception=e,
             ) from e
 
+    async def update_work_item_async(
+        self,
+        project_id: str,
+        work_item_id: int,
+        operations: list[JsonPatchOperation],
+        validate_only: bool = False,
+        bypass_rules: bool = False,
+        suppress_notifications: bool = False,
+    ) -> WorkItem:
+        """
+        Async variant of update_work_item.
+
+        Goes through the client's async transport, which applies the same retry,
+        authentication and rate limit handling as the synchronous request path.
+        """
+        patch_document = [op.model_dump(exclude_none=True, by_alias=True) for op in operations]
+
+        params = {
+            "validateOnly": validate_only,
+            "bypassRules": bypass_rules,
+            "suppressNotifications": suppress_notifications,
+            "api-version": "7.1",
+        }
+
+        url = f"{self.organization_url}/{project_id}/_apis/wit/workitems/{work_item_id}"
+
+        logger.info(
+            f"Updating work item {work_item_id} in project '{project_id}' "
+            f"with {len(operations)} operations"
+        )
+
+        try:
+            with tracer.start_as_current_span("update_work_item") as span:
+                span.set_attribute("work_item.id", work_item_id)
+                span.set_attribute("work_item.project_id", project_id)
+                span.set_attribute("work_item.operations_count", len(operations))
+
+                data = await self.client._send_request_async(
+                    method="PATCH",
+                    url=url,
+                    headers={"Content-Type": "application/json-patch+json"},
+                    json=patch_document,
+                    params=params,
+                )
+
+            logger.info(f"Successfully updated work item {work_item_id}")
+            return WorkItem(**data)
+
+        except (AdoAuthenticationError, AdoRateLimitError, AdoNetworkError, AdoTimeoutError):
+            raise
+        except Exception as e:
+            logger.error(f"Failed to update work item {work_item_id}: {e}")
+            raise AdoError(
+                f"Failed to update work item {work_item_id}: {e}",
+                "work_item_update_failed",
+                context={
+                    "project_id": project_id,
+                    "work_item_id": work_item_id,
+                    "operations_count": len(operations),
+                },
+                original_exception=e,
+            ) from e
+
     def delete_work_item(
         self,
         project_id: str,
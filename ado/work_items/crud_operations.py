@@ -192,7 +192,7 @@ def register_crud_tools(mcp_instance, client_container):
             raise
 
     @mcp_instance.tool
-    def get_work_item(
+    async def get_work_item(
         project_id: str,
         work_item_id: int,
         fields: list[str] | None = None,
@@ -241,7 +241,7 @@ def register_crud_tools(mcp_instance, client_container):
 
             expand = "relations" if expand_relations else None
 
-            work_item = work_items_client.get_work_item(
+            work_item = await work_items_client.get_work_item_async(
                 project_id=project_id,
                 work_item_id=work_item_id,
                 fields=fields,
@@ -257,7 +257,7 @@ def register_crud_tools(mcp_instance, client_container):
             raise
 
     @mcp_instance.tool
-    def update_work_item(
+    async def update_work_item(
         project_id: str,
         work_item_id: int,
         title: str | None = None,
@@ -399,7 +399,7 @@ def register_crud_tools(mcp_instance, client_container):
 
             work_items_client = WorkItemsClient(ado_client_instance)
 
-            work_item = work_items_client.update_work_item(
+            work_item = await work_items_client.update_work_item_async(
                 project_id=project_id,
                 work_item_id=work_item_id,
                 operations=operations,
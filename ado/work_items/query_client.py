@@ -1,12 +1,14 @@
 """Query client methods for Azure DevOps Work Items API operations."""
 
 import logging
+from collections.abc import AsyncIterator, Iterator
 
 from opentelemetry import trace
 
 from ado.client import AdoClient
 from ado.errors import AdoError
-from ado.work_items.models import WorkItemQueryResult
+from ado.work_items.batch_client import BatchClient
+from ado.work_items.models import WorkItem, WorkItemQueryResult
 
 logger = logging.getLogger(__name__)
 tracer = trace.get_tracer(__name__)
@@ -48,6 +50,107 @@ class QueryClient:
         Raises:
             AdoError: If the API request fails.
         """
+        url, params, request_body = self._build_query_request(project_id, wiql_query, top, skip)
+
+        try:
+            data = self.client._send_request(
+                # WIQL queries are reads; allow hedging despite the POST
+                method="POST", url=url, params=params, json=request_body, idempotent=True
+            )
+            return self._parse_query_result(project_id, data)
+
+        except Exception as e:
+            logger.error(f"Failed to query work items: {e}")
+            raise AdoError(f"Failed to query work items: {e}", "work_items_query_failed") from e
+
+    async def query_work_items_async(
+        self,
+        project_id: str,
+        wiql_query: str | None = None,
+        top: int | None = None,
+        skip: int | None = None,
+    ) -> WorkItemQueryResult:
+        """Async variant of query_work_items."""
+        url, params, request_body = self._build_query_request(project_id, wiql_query, top, skip)
+
+        try:
+            data = await self.client._send_request_async(
+                method="POST", url=url, params=params, json=request_body, idempotent=True
+            )
+            return self._parse_query_result(project_id, data)
+
+        except Exception as e:
+            logger.error(f"Failed to query work items: {e}")
+            raise AdoError(f"Failed to query work items: {e}", "work_items_query_failed") from e
+
+    def query_work_items_hydrated(
+        self,
+        project_id: str,
+        wiql_query: str | None = None,
+        fields: list[str] | None = None,
+        top: int | None = None,
+        error_policy: str = "omit",
+    ) -> Iterator[list[WorkItem]]:
+        """
+        Run a WIQL query and fetch the work items it matches, window by window.
+
+        The result IDs are fetched in 200-ID windows through concurrent batch
+        GETs that request only the given fields. Windows are yielded in query
+        order, each as soon as it and all windows before it have arrived.
+
+        Args:
+            project_id: The ID or name of the project.
+            wiql_query: The WIQL query string. If None, queries all work items.
+            fields: Fields to fetch. Defaults to the query's SELECT columns.
+            top: Maximum number of work items to return.
+            error_policy: "omit" (default) or "fail", as for get_work_items_batch.
+
+        Yields:
+            Lists of WorkItem objects, one per window.
+
+        Raises:
+            AdoError: If the query or a batch GET fails.
+        """
+        query_result = self.query_work_items(project_id, wiql_query, top)
+        yield from BatchClient(self.client).iter_work_items_bulk(
+            project_id,
+            [reference.id for reference in query_result.workItems],
+            fields or self._selected_fields(query_result),
+            error_policy=error_policy,
+            ordered=True,
+        )
+
+    async def query_work_items_hydrated_async(
+        self,
+        project_id: str,
+        wiql_query: str | None = None,
+        fields: list[str] | None = None,
+        top: int | None = None,
+        error_policy: str = "omit",
+    ) -> AsyncIterator[list[WorkItem]]:
+        """Async variant of query_work_items_hydrated."""
+        query_result = await self.query_work_items_async(project_id, wiql_query, top)
+        async for window in BatchClient(self.client).iter_work_items_bulk_async(
+            project_id,
+            [reference.id for reference in query_result.workItems],
+            fields or self._selected_fields(query_result),
+            error_policy=error_policy,
+            ordered=True,
+        ):
+            yield window
+
+    def _selected_fields(self, query_result: WorkItemQueryResult) -> list[str] | None:
+        """Reference names of the query's SELECT columns, if the response lists them."""
+        return [
+            column["referenceName"]
+            for column in query_result.columns or []
+            if column.get("referenceName")
+        ] or None
+
+    def _build_query_request(
+        self, project_id: str, wiql_query: str | None, top: int | None, skip: int | None
+    ) -> tuple[str, dict, dict]:
+        """Build the URL, query parameters and body for a WIQL query."""
         # Default query to list all work items if none provided
         if wiql_query is None:
             wiql_query = (
@@ -71,23 +174,18 @@ class QueryClient:
             f"Querying work items in project '{project_id}' with query: {wiql_query[:100]}..."
         )
 
-        try:
-            data = self.client._send_request(
-                method="POST", url=url, params=params, json=request_body
-            )
+        return url, params, request_body
 
-            logger.info(f"Successfully queried work items for project '{project_id}'")
+    def _parse_query_result(self, project_id: str, data: dict | None) -> WorkItemQueryResult:
+        """Parse a WIQL response, falling back to an empty flat result."""
+        logger.info(f"Successfully queried work items for project '{project_id}'")
 
-            # Parse as WorkItemQueryResult
-            if data:
-                try:
-                    return WorkItemQueryResult(**data)
-                except Exception as e:
-                    logger.warning(f"Failed to parse query result data: {data}. Error: {e}")
-                    return WorkItemQueryResult(queryType="flat", asOf="", columns=[], workItems=[])
-            else:
+        # Parse as WorkItemQueryResult
+        if data:
+            try:
+                return WorkItemQueryResult(**data)
+            except Exception as e:
+                logger.warning(f"Failed to parse query result data: {data}. Error: {e}")
                 return WorkItemQueryResult(queryType="flat", asOf="", columns=[], workItems=[])
-
-        except Exception as e:
-            logger.error(f"Failed to query work items: {e}")
-            raise AdoError(f"Failed to query work items: {e}", "work_items_query_failed") from e
+        else:
+            return WorkItemQueryResult(queryType="flat", asOf="", columns=[], workItems=[])
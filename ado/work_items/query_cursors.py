@@ -0,0 +1,133 @@
+"""
+Snapshots behind cursor-paginated work item queries.
+
+Paging a WIQL query with $top/$skip re-runs the query for every page, so deep
+pages cost more than the first and drift as work items change. Instead the
+first page stores the query's complete ordered ID list (which the WIQL
+endpoint returns cheaply) as a snapshot and hands out an opaque cursor. Later
+pages are slices of that snapshot: no query, and at most one batch GET for the
+page's fields.
+
+Snapshots live in memory and expire when unused for the configured TTL; an
+expired cursor means starting over from the first page. The store also bounds
+the number of work item IDs it holds across snapshots, so a burst of large
+queries cannot grow the process without limit.
+"""
+
+import base64
+import binascii
+import logging
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class QuerySnapshot:
+    """Ordered result of a WIQL query, fixed when its first page was read."""
+
+    organization_url: str
+    project_id: str
+    work_item_ids: list[int]
+    query_type: str
+    columns: list[dict[str, Any]] | None
+    ttl_seconds: float
+    # The query reached the MAX_QUERY_RESULTS limit (results may be cut off)
+    result_limit_reached: bool = False
+    expires_at: float = 0.0
+
+
+class QueryCursorStore:
+    """
+    Thread-safe store of query snapshots, evicting the least recently used.
+
+    Args:
+        max_snapshots: Number of snapshots kept at most.
+        max_work_item_ids: Number of work item IDs kept at most across all
+            snapshots. The newest snapshot is always kept, even if it alone
+            holds more.
+    """
+
+    def __init__(self, max_snapshots: int = 256, max_work_item_ids: int = 1_000_000):
+        self.max_snapshots = max_snapshots
+        self.max_work_item_ids = max_work_item_ids
+        self._snapshots: OrderedDict[str, QuerySnapshot] = OrderedDict()
+        self._work_item_id_count = 0
+        self._lock = threading.Lock()
+
+    def add(self, snapshot: QuerySnapshot) -> str:
+        """Store a snapshot and return its ID."""
+        snapshot_id = secrets.token_urlsafe(12)
+        with self._lock:
+            self._evict_expired()
+            snapshot.expires_at = time.monotonic() + snapshot.ttl_seconds
+            self._snapshots[snapshot_id] = snapshot
+            self._work_item_id_count += len(snapshot.work_item_ids)
+            while len(self._snapshots) > 1 and (
+                len(self._snapshots) > self.max_snapshots
+                or self._work_item_id_count > self.max_work_item_ids
+            ):
+                _, evicted = self._snapshots.popitem(last=False)
+                self._work_item_id_count -= len(evicted.work_item_ids)
+        return snapshot_id
+
+    def get(self, snapshot_id: str) -> QuerySnapshot | None:
+        """Return a live snapshot and extend its lifetime, or None if it expired."""
+        with self._lock:
+            snapshot = self._snapshots.get(snapshot_id)
+            if snapshot is None:
+                return None
+            now = time.monotonic()
+            if snapshot.expires_at <= now:
+                self._remove(snapshot_id)
+                return None
+            snapshot.expires_at = now + snapshot.ttl_seconds
+            self._snapshots.move_to_end(snapshot_id)
+            return snapshot
+
+    def clear(self) -> None:
+        with self._lock:
+            self._snapshots.clear()
+            self._work_item_id_count = 0
+
+    def _remove(self, snapshot_id: str) -> None:
+        snapshot = self._snapshots.pop(snapshot_id)
+        self._work_item_id_count -= len(snapshot.work_item_ids)
+
+    def _evict_expired(self) -> None:
+        now = time.monotonic()
+        for snapshot_id in [
+            key for key, value in self._snapshots.items() if value.expires_at <= now
+        ]:
+            self._remove(snapshot_id)
+
+
+def encode_cursor(snapshot_id: str, offset: int) -> str:
+    """Opaque cursor for the page of a snapshot starting at offset."""
+    return base64.urlsafe_b64encode(f"{snapshot_id}:{offset}".encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[str, int]:
+    """
+    Split a cursor into its snapshot ID and offset.
+
+    Raises:
+        ValueError: If the cursor was not produced by encode_cursor.
+    """
+    try:
+        snapshot_id, offset = base64.urlsafe_b64decode(cursor.encode()).decode().rsplit(":", 1)
+        offset = int(offset)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError(f"Invalid pagination cursor: {cursor!r}") from e
+    if offset < 0:
+        raise ValueError(f"Invalid pagination cursor: {cursor!r}")
+    return snapshot_id, offset
+
+
+# Shared by all tool calls of this server process
+query_cursor_store = QueryCursorStore()
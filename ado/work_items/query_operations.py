@@ -6,17 +6,30 @@ from datetime import datetime, timedelta
 from typing import Any
 
 from ado.work_items.client import WorkItemsClient
-from ado.work_items.models import WorkItemQueryResult, WorkItemReference
+from ado.work_items.models import WorkItem, WorkItemQueryResult, WorkItemReference
+from ado.work_items.query_cursors import (
+    QuerySnapshot,
+    decode_cursor,
+    encode_cursor,
+    query_cursor_store,
+)
 from ado.work_items.query_utils import analyze_query_complexity, build_wiql_from_filter
 
 logger = logging.getLogger(__name__)
 
+# Azure DevOps refuses WIQL queries returning more work items than this
+MAX_QUERY_RESULTS = 20000
+
+# Work items get_work_items_by_query returns by default and at most in one response
+DEFAULT_HYDRATED_RESULTS = 200
+MAX_HYDRATED_RESULTS = 1000
+
 
 def register_query_tools(mcp_instance, client_container):
     """Register query-related work item tools with the FastMCP instance."""
 
     @mcp_instance.tool
-    def list_work_items(
+    async def list_work_items(
         project_id: str,
         wiql_query: str | None = None,
         top: int | None = None,
@@ -35,7 +48,7 @@ def register_query_tools(mcp_instance, client_container):
             work_items_client = WorkItemsClient(ado_client_instance)
             logger.info(f"Listing work items for project: {project_id}")
 
-            query_result = work_items_client.query_work_items(
+            query_result = await work_items_client.query_work_items_async(
                 project_id=project_id, wiql_query=wiql_query, top=top
             )
 
@@ -48,7 +61,7 @@ def register_query_tools(mcp_instance, client_container):
             raise
 
     @mcp_instance.tool
-    def query_work_items(
+    async def query_work_items(
         project_id: str,
         wiql_query: str | None = None,
         top: int | None = None,
@@ -98,7 +111,7 @@ def register_query_tools(mcp_instance, client_container):
 
             # Execute query with timing
             api_start_time = time.time()
-            query_result = work_items_client.query_work_items(
+            query_result = await work_items_client.query_work_items_async(
                 project_id=project_id, wiql_query=wiql_query, top=top, skip=skip
             )
             api_duration = time.time() - api_start_time
@@ -138,7 +151,76 @@ def register_query_tools(mcp_instance, client_container):
             raise
 
     @mcp_instance.tool
-    def get_work_items_page(
+    async def get_work_items_by_query(
+        project_id: str,
+        wiql_query: str | None = None,
+        simple_filter: dict[str, Any] | None = None,
+        fields: list[str] | None = None,
+        top: int = DEFAULT_HYDRATED_RESULTS,
+        error_policy: str = "omit",
+    ) -> list[WorkItem] | None:
+        """
+        Run a query and return the matching work items with their fields in one call.
+
+        Unlike query_work_items, which returns only IDs, this fetches the work items
+        too, 200 at a time and concurrently. Only the given fields are fetched; they
+        default to the query's SELECT columns.
+
+        At most top work items are returned (200 by default, 1000 at most). To read
+        larger results, use get_work_items_page with fields and follow its cursor.
+
+        Examples:
+            get_work_items_by_query(
+                project_id="MyProject",
+                simple_filter={"state": "Active", "work_item_type": "Bug"},
+                fields=["System.Title", "System.AssignedTo"],
+                top=500
+            )
+        """
+        ado_client_instance = client_container.get("client")
+        if not ado_client_instance:
+            logger.error("ADO client is not available.")
+            return None
+
+        try:
+            if top < 1:
+                top = DEFAULT_HYDRATED_RESULTS
+            if top > MAX_HYDRATED_RESULTS:
+                logger.warning(
+                    f"get_work_items_by_query returns at most {MAX_HYDRATED_RESULTS} work items; "
+                    f"use get_work_items_page to read more (requested {top})"
+                )
+                top = MAX_HYDRATED_RESULTS
+
+            work_items_client = WorkItemsClient(ado_client_instance)
+            if wiql_query is None and simple_filter:
+                wiql_query = build_wiql_from_filter(simple_filter)
+
+            start_time = time.time()
+            work_items = [
+                work_item
+                async for window in work_items_client.query_work_items_hydrated_async(
+                    project_id=project_id,
+                    wiql_query=wiql_query,
+                    fields=fields,
+                    top=top,
+                    error_policy=error_policy,
+                )
+                for work_item in window
+            ]
+
+            logger.info(
+                f"Query returned {len(work_items)} work items with fields in "
+                f"{time.time() - start_time:.2f}s"
+            )
+            return work_items
+
+        except Exception as e:
+            logger.error(f"Failed to get work items by query: {e}")
+            raise
+
+    @mcp_instance.tool
+    async def get_work_items_page(
         project_id: str,
         page_number: int = 1,
         page_size: int = 50,
@@ -147,12 +229,23 @@ def register_query_tools(mcp_instance, client_container):
         assigned_to: str | None = None,
         area_path: str | None = None,
         order_by: str = "System.Id",
+        fields: list[str] | None = None,
+        cursor: str | None = None,
     ) -> dict[str, Any] | None:
         """
         Get a paginated list of work items with metadata about pagination.
 
         Simplified interface for paginated work items with common filtering options.
-        Returns both work items and pagination metadata.
+        Returns both work items and pagination metadata. Pass fields (e.g.
+        ["System.Title", "System.State"]) to get those fields of each work item
+        instead of bare references.
+
+        The first call runs the query once and remembers its ordered result for a
+        while; to read further pages pass the returned pagination.next_cursor as
+        cursor (the filters are then taken from the cursor). Pages read through a
+        cursor are stable and as cheap as the first one. When a query reaches the
+        20000-result limit (results may be cut off), pagination.result_limit_reached
+        is true on every page; narrower filters are needed to see any further matches.
         """
         ado_client_instance = client_container.get("client")
         if not ado_client_instance:
@@ -180,61 +273,109 @@ def register_query_tools(mcp_instance, client_container):
                 simple_filter["area_path"] = area_path
 
             work_items_client = WorkItemsClient(ado_client_instance)
+            start_time = time.time()
 
-            # Build WIQL query from filter
-            if simple_filter:
-                wiql_query = build_wiql_from_filter(simple_filter)
+            if cursor:
+                snapshot_id, offset = decode_cursor(cursor)
+                snapshot = query_cursor_store.get(snapshot_id)
+                if (
+                    snapshot is None
+                    or snapshot.organization_url != ado_client_instance.organization_url
+                    or snapshot.project_id != project_id
+                ):
+                    raise ValueError(
+                        "Pagination cursor has expired or belongs to another project; "
+                        "request the first page again without a cursor"
+                    )
             else:
-                wiql_query = (
-                    "SELECT [System.Id], [System.Title], [System.WorkItemType], "
-                    "[System.State], [System.AssignedTo], [System.CreatedDate] "
-                    "FROM WorkItems"
-                )
+                # Build WIQL query from filter
+                if simple_filter:
+                    wiql_query = build_wiql_from_filter(simple_filter)
+                else:
+                    wiql_query = (
+                        "SELECT [System.Id], [System.Title], [System.WorkItemType], "
+                        "[System.State], [System.AssignedTo], [System.CreatedDate] "
+                        "FROM WorkItems"
+                    )
 
-            # Add ordering
-            wiql_query += f" ORDER BY [{order_by}]"
+                # Add ordering
+                wiql_query += f" ORDER BY [{order_by}]"
 
-            # Calculate skip value
-            skip = (page_number - 1) * page_size
+                # One query returns the whole ordered ID list; pages are slices of it
+                query_result = await work_items_client.query_work_items_async(
+                    project_id=project_id, wiql_query=wiql_query, top=MAX_QUERY_RESULTS
+                )
+                snapshot = QuerySnapshot(
+                    organization_url=ado_client_instance.organization_url,
+                    project_id=project_id,
+                    work_item_ids=[reference.id for reference in query_result.workItems],
+                    query_type=query_result.queryType,
+                    columns=query_result.columns,
+                    ttl_seconds=ado_client_instance.config.query_cursor.ttl_seconds,
+                    # Azure DevOps rejects a larger $top, so a full result cannot
+                    # tell exactly MAX_QUERY_RESULTS matches from more
+                    result_limit_reached=len(query_result.workItems) >= MAX_QUERY_RESULTS,
+                )
+                if snapshot.result_limit_reached:
+                    logger.warning(
+                        f"Query reached the {MAX_QUERY_RESULTS}-result limit "
+                        "(results may be cut off)"
+                    )
+                snapshot_id = None
+                offset = (page_number - 1) * page_size
 
-            # Get one extra item to check if there are more pages
-            top = page_size + 1
+            page_number = offset // page_size + 1
+            total_count = len(snapshot.work_item_ids)
+            page_ids = snapshot.work_item_ids[offset : offset + page_size]
+            has_more = offset + page_size < total_count
 
-            start_time = time.time()
+            # Only snapshots with other pages to read need to be kept
+            if snapshot_id is None and (has_more or offset > 0):
+                snapshot_id = query_cursor_store.add(snapshot)
 
             # Log pagination-specific metrics
             pagination_metrics = {
                 "page_number": page_number,
                 "page_size": page_size,
-                "skip_items": skip,
+                "skip_items": offset,
                 "filter_count": len(simple_filter),
                 "has_ordering": order_by != "System.Id",
+                "from_cursor": cursor is not None,
             }
 
             logger.info(
                 f"Getting page {page_number} of work items (size: {page_size}) - {pagination_metrics}"
             )
 
-            query_result = work_items_client.query_work_items(
-                project_id=project_id, wiql_query=wiql_query, top=top, skip=skip
-            )
-
-            work_items = query_result.workItems
-            has_more = len(work_items) > page_size
-
-            # Remove the extra item if present
-            if has_more:
-                work_items = work_items[:page_size]
+            if fields:
+                work_items = await work_items_client.get_work_items_bulk_async(
+                    project_id, page_ids, fields
+                )
+            else:
+                work_items = [
+                    WorkItemReference(
+                        id=work_item_id,
+                        url=f"{ado_client_instance.organization_url}/_apis/wit/workItems/{work_item_id}",
+                    )
+                    for work_item_id in page_ids
+                ]
 
             # Build pagination metadata
             pagination_info = {
                 "page_number": page_number,
                 "page_size": page_size,
                 "items_count": len(work_items),
+                "total_count": total_count,
                 "has_more": has_more,
-                "has_previous": page_number > 1,
+                # total_count stops at MAX_QUERY_RESULTS; narrow the filters to see the rest
+                "result_limit_reached": snapshot.result_limit_reached,
+                "has_previous": offset > 0,
                 "next_page": page_number + 1 if has_more else None,
-                "previous_page": page_number - 1 if page_number > 1 else None,
+                "previous_page": page_number - 1 if offset > 0 else None,
+                "next_cursor": encode_cursor(snapshot_id, offset + page_size) if has_more else None,
+                "previous_cursor": encode_cursor(snapshot_id, max(offset - page_size, 0))
+                if offset > 0
+                else None,
             }
 
             # Calculate final performance metrics
@@ -253,8 +394,8 @@ def register_query_tools(mcp_instance, client_container):
                 "work_items": work_items,
                 "pagination": pagination_info,
                 "query_metadata": {
-                    "query_type": query_result.queryType,
-                    "columns": query_result.columns,
+                    "query_type": snapshot.query_type,
+                    "columns": snapshot.columns,
                 },
                 "performance_metrics": final_pagination_metrics,
             }
@@ -270,18 +411,20 @@ def register_query_tools(mcp_instance, client_container):
             raise
 
     @mcp_instance.tool
-    def get_my_work_items(
+    async def get_my_work_items(
         project_id: str,
         assigned_to: str,
         state: str | None = None,
         work_item_type: str | None = None,
         page_size: int = 50,
         page_number: int = 1,
+        fields: list[str] | None = None,
     ) -> dict[str, Any] | None:
         """
         Get work items assigned to a specific user.
 
         Convenience tool for getting work items assigned to a specific user with filtering.
+        Pass fields to get those fields of each work item instead of bare references.
         """
         ado_client_instance = client_container.get("client")
         if not ado_client_instance:
@@ -308,7 +451,7 @@ def register_query_tools(mcp_instance, client_container):
             top = page_size
 
             # Execute query
-            query_result = work_items_client.query_work_items(
+            query_result = await work_items_client.query_work_items_async(
                 project_id=project_id, wiql_query=wiql_query, top=top, skip=skip
             )
 
@@ -319,6 +462,11 @@ def register_query_tools(mcp_instance, client_container):
             work_items = query_result.workItems
             has_more = len(work_items) >= page_size  # Simplified check
 
+            if fields:
+                work_items = await work_items_client.get_work_items_bulk_async(
+                    project_id, [item.id for item in work_items], fields
+                )
+
             pagination_info = {
                 "page_number": page_number,
                 "page_size": page_size,
@@ -354,18 +502,20 @@ def register_query_tools(mcp_instance, client_container):
             raise
 
     @mcp_instance.tool
-    def get_recent_work_items(
+    async def get_recent_work_items(
         project_id: str,
         days: int = 7,
         work_item_type: str | None = None,
         state: str | None = None,
         page_size: int = 50,
         page_number: int = 1,
+        fields: list[str] | None = None,
     ) -> dict[str, Any] | None:
         """
         Get work items created or modified recently.
 
         Convenience tool for getting recently created or modified work items with filtering.
+        Pass fields to get those fields of each work item instead of bare references.
         """
         ado_client_instance = client_container.get("client")
         if not ado_client_instance:
@@ -399,7 +549,7 @@ def register_query_tools(mcp_instance, client_container):
             skip = (page_number - 1) * page_size
             top = page_size + 1  # Get one extra to check if there are more
 
-            query_result = work_items_client.query_work_items(
+            query_result = await work_items_client.query_work_items_async(
                 project_id=project_id, wiql_query=wiql_query, top=top, skip=skip
             )
 
@@ -410,6 +560,11 @@ def register_query_tools(mcp_instance, client_container):
             if has_more:
                 work_items = work_items[:page_size]
 
+            if fields:
+                work_items = await work_items_client.get_work_items_bulk_async(
+                    project_id, [item.id for item in work_items], fields
+                )
+
             # Build pagination metadata
             pagination_info = {
                 "page_number": page_number,
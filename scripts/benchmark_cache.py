@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Micro-benchmark AdoCache get/set throughput at large cache sizes and fuzzy name lookups."""
+
+import argparse
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from ado.cache import AdoCache  # noqa: E402
+from ado.utils.name_index import NameIndex  # noqa: E402
+
+DEFAULT_SIZES = [10_000, 50_000, 100_000]
+
+
+def bench_set(cache: AdoCache, keys: list[str]) -> float:
+    start = time.perf_counter()
+    for key in keys:
+        cache._set(key, key, 600)
+    return len(keys) / (time.perf_counter() - start)
+
+
+def bench_get(cache: AdoCache, keys: list[str], operations: int) -> float:
+    lookups = random.choices(keys, k=operations)
+    start = time.perf_counter()
+    for key in lookups:
+        cache._get(key)
+    return operations / (time.perf_counter() - start)
+
+
+def bench_concurrent_get(cache: AdoCache, keys: list[str], operations: int, threads: int) -> float:
+    per_thread = operations // threads
+    lookups = [random.choices(keys, k=per_thread) for _ in range(threads)]
+
+    def worker(worker_keys):
+        for key in worker_keys:
+            cache._get(key)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(worker, lookups))
+    return per_thread * threads / (time.perf_counter() - start)
+
+
+def bench_fuzzy_lookup(names: int, lookups: int, repeats: int = 5) -> float:
+    """Best-of-repeats milliseconds per misspelled-name lookup over `names` pipelines."""
+    index = NameIndex([f"service-{i}-deploy-pipeline" for i in range(names)], name_of=str)
+    queries = [f"service-{random.randrange(names)}-deplyo-pipeline" for _ in range(lookups)]
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for query in queries:
+            index.find(query)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000 / lookups
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--operations", type=int, default=100_000)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--names", type=int, default=5000)
+    args = parser.parse_args()
+
+    print(f"{'entries':>10} {'set ops/s':>14} {'get ops/s':>14} {'get ops/s (MT)':>16}")
+    print("-" * 58)
+    for size in args.sizes:
+        keys = [f"pipelines:project-{i}" for i in range(size)]
+        cache = AdoCache(max_size=size)
+
+        set_rate = bench_set(cache, keys)
+        get_rate = bench_get(cache, keys, args.operations)
+        concurrent_rate = bench_concurrent_get(cache, keys, args.operations, args.threads)
+
+        print(f"{size:>10,} {set_rate:>14,.0f} {get_rate:>14,.0f} {concurrent_rate:>16,.0f}")
+
+    fuzzy_ms = bench_fuzzy_lookup(args.names, lookups=100)
+    print(f"\nfuzzy name lookup over {args.names:,} pipelines: {fuzzy_ms:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
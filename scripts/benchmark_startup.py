@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Measure server cold start: import time, MCP handshake and first tool call."""
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+IMPORT_SNIPPET = (
+    "import time; t = time.perf_counter(); import server; print(time.perf_counter() - t)"
+)
+
+
+def server_env(lazy: bool) -> dict[str, str]:
+    env = dict(os.environ)
+    env["ADO_MCP_LAZY_START"] = "true" if lazy else "false"
+    return env
+
+
+def bench_import(lazy: bool) -> float:
+    """Seconds to import server.py in a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_SNIPPET],
+        cwd=ROOT,
+        env=server_env(lazy),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+async def bench_session(lazy: bool, tool: str | None) -> tuple[float, float, float | None]:
+    """Seconds from spawning a stdio server to the handshake, tool list and first tool result."""
+    from fastmcp import Client
+    from fastmcp.client.transports import PythonStdioTransport
+
+    with open(os.devnull, "w") as server_log:
+        transport = PythonStdioTransport(
+            ROOT / "server.py",
+            env=server_env(lazy),
+            cwd=str(ROOT),
+            python_cmd=sys.executable,
+            log_file=server_log,
+        )
+        start = time.perf_counter()
+        async with Client(transport) as client:
+            handshake = time.perf_counter() - start
+            await client.list_tools()
+            listed = time.perf_counter() - start
+            first_call = None
+            if tool:
+                await client.call_tool(tool, raise_on_error=False)
+                first_call = time.perf_counter() - start
+    return handshake, listed, first_call
+
+
+def top_imports(count: int) -> None:
+    """Print the modules with the largest cumulative import time."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import server"],
+        cwd=ROOT,
+        env=server_env(lazy=True),
+        capture_output=True,
+        text=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line.removeprefix("import time:").split("|")
+        rows.append((int(cumulative), module.strip()))
+    print(f"\n{'cumulative ms':>14}  module")
+    for cumulative, module in sorted(rows, reverse=True)[:count]:
+        print(f"{cumulative / 1000:>14.1f}  {module}")
+
+
+def summarize(label: str, samples: list[float]) -> None:
+    print(f"{label:<28} median {statistics.median(samples):7.3f}s  max {max(samples):7.3f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument(
+        "--tool",
+        help="Tool to call once connected (e.g. list_projects) to time the first useful answer",
+    )
+    parser.add_argument("--top-imports", type=int, default=0, metavar="N")
+    args = parser.parse_args()
+
+    for lazy in (False, True):
+        mode = "lazy" if lazy else "eager"
+        print(f"\n[{mode} start, ADO_MCP_LAZY_START={'true' if lazy else 'false'}]")
+        summarize("import server", [bench_import(lazy) for _ in range(args.runs)])
+
+        sessions = [asyncio.run(bench_session(lazy, args.tool)) for _ in range(args.runs)]
+        summarize("handshake", [handshake for handshake, _, _ in sessions])
+        summarize("tools listed", [listed for _, listed, _ in sessions])
+        if args.tool:
+            summarize(f"first {args.tool} result", [first for _, _, first in sessions])
+
+    if args.top_imports:
+        top_imports(args.top_imports)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,8 +4,13 @@ import os
 from fastmcp import FastMCP
 
 from ado import helpers, resources, tools
+from ado.cache import ado_cache
+from ado.cache_warmer import CacheWarmer
 from ado.client import AdoClient
+from ado.client_pool import AdoClientPool, normalize_organization_url
+from ado.deadline import ToolDeadlineMiddleware
 from ado.errors import AdoAuthenticationError
+from ado.startup import BackgroundClientInit, ClientReadyMiddleware
 
 # Configure basic logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -13,16 +18,51 @@ logger = logging.getLogger(__name__)
 
 mcp: FastMCP = FastMCP(name="ado-mcp", version="0.1.0")
 
+# Total time budget per tool call for requests and retries (0 disables it)
+mcp.add_middleware(
+    ToolDeadlineMiddleware(float(os.environ.get("ADO_TOOL_DEADLINE_SECONDS", "120")))
+)
+
 # Global container for the ADO client
 client_container = {
     "client": None,
 }
 
 
+def create_authenticated_client(org_url: str) -> AdoClient:
+    """
+    Creates an Azure DevOps client for an organization and checks its authentication.
+
+    With cache warm-up enabled, the organization's lookup data is then
+    prefetched in the background.
+    """
+    client = AdoClient(organization_url=org_url)
+    try:
+        client.check_authentication()
+    except Exception:
+        client.close()
+        raise
+    logger.info(f"✅ Azure DevOps client initialized and authenticated successfully for {org_url}.")
+    if client.config.cache_warmup.enabled:
+        CacheWarmer(client, normalize_organization_url(org_url), client.config.cache_warmup).start()
+    return client
+
+
+# Authenticated clients of recently used organizations, so switching back is instant
+client_pool = AdoClientPool(
+    create_authenticated_client,
+    max_clients=int(os.environ.get("ADO_CLIENT_POOL_MAX_CLIENTS", "4")),
+)
+
+
 def initialize_ado_client(org_url=None):
     """
     Initializes the Azure DevOps client. If org_url is not provided, it uses
     the ADO_ORGANIZATION_URL environment variable.
+
+    Clients are taken from the client pool, so an organization used before is
+    not authenticated again, and the cache is switched to the organization's
+    partition.
     """
     if not org_url:
         org_url = os.environ.get("ADO_ORGANIZATION_URL")
@@ -31,11 +71,8 @@ def initialize_ado_client(org_url=None):
         return None, "ADO_ORGANIZATION_URL is not set."
 
     try:
-        client = AdoClient(organization_url=org_url)
-        client.check_authentication()
-        logger.info(
-            f"✅ Azure DevOps client initialized and authenticated successfully for {org_url}."
-        )
+        client = client_pool.get(org_url)
+        ado_cache.use_organization(normalize_organization_url(org_url))
         return client, None
     except (ValueError, AdoAuthenticationError) as e:
         error_message = f"Authentication check failed: {e}"
@@ -67,10 +104,17 @@ def set_ado_organization(organization_url: str) -> dict:
         raise AdoAuthenticationError(f"Authentication check failed: {error_message}")
 
 
-# Initial client setup
-client_container["client"], _ = initialize_ado_client(
-    org_url=os.environ.get("ADO_ORGANIZATION_URL")
-)
+# Initial client setup. In lazy-start mode it runs in the background so the MCP
+# handshake doesn't wait for authentication; tool calls wait for it instead.
+client_init = BackgroundClientInit(client_container)
+mcp.add_middleware(ClientReadyMiddleware(client_init))
+
+if os.environ.get("ADO_MCP_LAZY_START", "false").lower() == "true":
+    client_init.start(lambda: initialize_ado_client(os.environ.get("ADO_ORGANIZATION_URL"))[0])
+else:
+    client_container["client"], _ = initialize_ado_client(
+        org_url=os.environ.get("ADO_ORGANIZATION_URL")
+    )
 
 tools.register_ado_tools(mcp, client_container)
 helpers.register_helper_tools(mcp, client_container)
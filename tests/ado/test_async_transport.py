@@ -0,0 +1,214 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from ado import client as client_module
+from ado.config import RetryConfig
+from ado.errors import AdoNetworkError, AdoRateLimitError
+from ado.retry import RetryManager
+
+ORG_URL = "https://dev.azure.com/test-org"
+
+
+@pytest.fixture
+def make_client(make_ado_client):
+    def make(handler, max_retries=2):
+        client = make_ado_client(
+            retry=RetryConfig(max_retries=max_retries, initial_delay=0.01, jitter=False)
+        )
+        transport = httpx.MockTransport(handler)
+        client._create_async_session = lambda: httpx.AsyncClient(transport=transport)
+        return client
+
+    return make
+
+
+class TestAsyncTransport:
+    async def test_returns_parsed_json(self, make_client):
+        def handler(request):
+            return httpx.Response(200, json={"value": [{"id": 1}]})
+
+        client = make_client(handler)
+        try:
+            result = await client._send_request_async("GET", f"{ORG_URL}/_apis/projects")
+        finally:
+            await client.aclose()
+
+        assert result == {"value": [{"id": 1}]}, f"Expected parsed JSON but got {result}"
+
+    async def test_returns_none_for_empty_body(self, make_client):
+        client = make_client(lambda request: httpx.Response(204))
+        try:
+            result = await client._send_request_async("DELETE", f"{ORG_URL}/_apis/thing")
+        finally:
+            await client.aclose()
+
+        assert result is None, f"Expected None for empty response but got {result}"
+
+    async def test_sends_auth_and_merged_headers(self, make_client):
+        seen = {}
+
+        def handler(request):
+            seen.update(request.headers)
+            return httpx.Response(200, json={})
+
+        client = make_client(handler)
+        try:
+            await client._send_request_async(
+                "PATCH",
+                f"{ORG_URL}/_apis/wit/workitems/1",
+                headers={"Content-Type": "application/json-patch+json"},
+                content=json.dumps([]),
+            )
+        finally:
+            await client.aclose()
+
+        assert seen.get("authorization", "").startswith("Basic "), (
+            f"Expected Basic auth header but got {seen.get('authorization')}"
+        )
+        assert seen.get("content-type") == "application/json-patch+json", (
+            f"Expected per-request Content-Type to override default but got {seen.get('content-type')}"
+        )
+        assert client.headers["Content-Type"] == "application/json", (
+            "Per-request headers must not mutate the client's default headers"
+        )
+
+    async def test_retries_rate_limit_then_raises(self, make_client):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(429)
+
+        client = make_client(handler, max_retries=2)
+        try:
+            with pytest.raises(AdoRateLimitError):
+                await client._send_request_async("GET", f"{ORG_URL}/_apis/projects")
+        finally:
+            await client.aclose()
+
+        assert len(calls) == 3, f"Expected 1 attempt + 2 retries but got {len(calls)} calls"
+
+    async def test_retries_server_error_until_success(self, make_client):
+        responses = iter([httpx.Response(503), httpx.Response(200, json={"ok": True})])
+
+        client = make_client(lambda request: next(responses))
+        try:
+            result = await client._send_request_async("GET", f"{ORG_URL}/_apis/projects")
+        finally:
+            await client.aclose()
+
+        assert result == {"ok": True}, f"Expected success after retry but got {result}"
+
+    async def test_server_error_raises_network_error_after_retries(self, make_client):
+        client = make_client(lambda request: httpx.Response(500), max_retries=1)
+        try:
+            with pytest.raises(AdoNetworkError):
+                await client._send_request_async("GET", f"{ORG_URL}/_apis/projects")
+        finally:
+            await client.aclose()
+
+    async def test_client_error_is_not_retried(self, make_client):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(404, json={"message": "not found"})
+
+        client = make_client(handler)
+        try:
+            with pytest.raises(httpx.HTTPStatusError):
+                await client._send_request_async("GET", f"{ORG_URL}/_apis/missing")
+        finally:
+            await client.aclose()
+
+        assert len(calls) == 1, f"Expected 4xx errors not to be retried but got {len(calls)} calls"
+
+    async def test_list_projects_async(self, make_client):
+        def handler(request):
+            project = {
+                "id": "p1",
+                "name": "Project One",
+                "url": f"{ORG_URL}/_apis/projects/p1",
+                "state": "wellFormed",
+                "revision": 1,
+                "visibility": "private",
+                "lastUpdateTime": "2024-01-01T00:00:00Z",
+            }
+            return httpx.Response(200, json={"value": [project], "count": 1})
+
+        client = make_client(handler)
+        try:
+            projects = await client.list_projects_async()
+        finally:
+            await client.aclose()
+
+        assert [p.name for p in projects] == ["Project One"], (
+            f"Expected one parsed project but got {projects}"
+        )
+
+    def test_sessions_of_every_event_loop_are_closed(self, make_client):
+        client = make_client(lambda request: httpx.Response(204))
+
+        async def open_session():
+            return client._get_async_session()
+
+        loop = asyncio.new_event_loop()
+        try:
+            first = loop.run_until_complete(open_session())
+            second = asyncio.run(open_session())
+            client.close()
+            closed = first.is_closed
+        finally:
+            loop.close()
+
+        assert first is not second, "Expected each event loop to get its own session"
+        assert closed, "Expected close() to close the session of a still open loop"
+        assert client._async_sessions == {}, "Expected no sessions to be kept after close()"
+
+    async def test_close_from_the_owning_loop_keeps_the_close_task(self, make_client):
+        client = make_client(lambda request: httpx.Response(204))
+        session = client._get_async_session()
+
+        client.close()
+        pending = set(client_module._closing_tasks)
+        assert pending, "Expected the close task to be referenced until it finishes"
+        await asyncio.wait(pending)
+        await asyncio.sleep(0)
+
+        assert session.is_closed, "Expected the session to be closed"
+        assert not client_module._closing_tasks, "Expected finished close tasks to be dropped"
+
+
+class TestAsyncRetryManager:
+    async def test_async_retry_succeeds_after_failures(self):
+        manager = RetryManager(RetryConfig(max_retries=3, initial_delay=0.01, jitter=False))
+        attempts = []
+
+        @manager.async_retry_on_failure
+        async def flaky():
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise AdoNetworkError("temporary failure")
+            return "done"
+
+        result = await flaky()
+
+        assert result == "done", f"Expected 'done' but got {result}"
+        assert len(attempts) == 3, f"Expected 3 attempts but got {len(attempts)}"
+
+    async def test_async_retry_does_not_retry_value_errors(self):
+        manager = RetryManager(RetryConfig(max_retries=3, initial_delay=0.01))
+        attempts = []
+
+        @manager.async_retry_on_failure
+        async def broken():
+            attempts.append(1)
+            raise ValueError("bad input")
+
+        with pytest.raises(ValueError):
+            await broken()
+
+        assert len(attempts) == 1, f"Expected no retries but got {len(attempts)} attempts"
@@ -4,6 +4,14 @@ import json
 
 import pytest
 
+from ado.client import AdoClient
+from ado.config import AdoMcpConfig, TelemetryConfig
+from ado.models import Project
+from ado.rate_limiter import rate_limiters
+from ado.retry import retry_budget
+
+TEST_ORG_URL = "https://dev.azure.com/test-org"
+
 
 def pytest_addoption(parser):
     """Add command line options for test ordering."""
@@ -97,6 +105,14 @@ def pytest_terminal_summary(terminalreporter, exitstatus, config):
             pass
 
 
+@pytest.fixture(autouse=True)
+def reset_process_wide_state():
+    """Start every test without request pacing state left behind by earlier tests."""
+    rate_limiters.clear()
+    retry_budget.reset()
+    yield
+
+
 @pytest.fixture
 def show_test_info(request):
     """Fixture to display test execution order and timing info."""
@@ -116,3 +132,41 @@ def show_test_info(request):
             pass
 
     yield
+
+
+@pytest.fixture
+def make_ado_client():
+    """
+    Factory for AdoClients of a test organization with telemetry disabled.
+
+    Keyword arguments are AdoMcpConfig sections, e.g. retry=RetryConfig(max_retries=0).
+    """
+
+    def make(organization_url: str = TEST_ORG_URL, **config_sections) -> AdoClient:
+        config = AdoMcpConfig(
+            organization_url=organization_url,
+            telemetry=TelemetryConfig(enabled=False),
+            **config_sections,
+        )
+        return AdoClient(organization_url=organization_url, pat="test-pat", config=config)
+
+    return make
+
+
+@pytest.fixture
+def make_project():
+    """Factory for Project models, with the ID derived from the name unless given."""
+
+    def make(name: str, project_id: str | None = None) -> Project:
+        project_id = project_id or f"{name}-id"
+        return Project(
+            id=project_id,
+            name=name,
+            url=f"{TEST_ORG_URL}/_apis/projects/{project_id}",
+            state="wellFormed",
+            revision=1,
+            visibility="private",
+            lastUpdateTime="2024-01-01T00:00:00Z",
+        )
+
+    return make
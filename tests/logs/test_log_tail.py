@@ -0,0 +1,166 @@
+import re
+from unittest.mock import patch
+
+import httpx
+import requests
+
+from ado.pipelines import log_tail
+from ado.pipelines.log_tail import read_log_tail, read_log_tail_async
+
+ORG_URL = "https://dev.azure.com/test-org"
+SIGNED_URL = "https://logs.example.com/signed/log/7"
+
+
+def make_log(line_count: int) -> bytes:
+    return "".join(f"line {i}\n" for i in range(1, line_count + 1)).encode("utf-8")
+
+
+def serve_range(data: bytes, range_header: str | None, honor_range: bool = True):
+    """Return (status, headers, body) for a Range request against data."""
+    if not honor_range or not range_header:
+        return 200, {}, data
+    if not data:
+        return 416, {}, b""
+
+    suffix = re.fullmatch(r"bytes=-(\d+)", range_header)
+    if suffix:
+        start = max(0, len(data) - int(suffix.group(1)))
+        end = len(data) - 1
+    else:
+        start, end = (int(x) for x in re.fullmatch(r"bytes=(\d+)-(\d+)", range_header).groups())
+        end = min(end, len(data) - 1)
+    headers = {"Content-Range": f"bytes {start}-{end}/{len(data)}"}
+    return 206, headers, data[start : end + 1]
+
+
+class FakeSession:
+    """Minimal requests-like session serving a log with optional Range support."""
+
+    def __init__(self, data: bytes, honor_range: bool = True):
+        self.data = data
+        self.honor_range = honor_range
+        self.requests = []
+
+    def get(self, url, headers=None, timeout=None, stream=False):
+        range_header = (headers or {}).get("Range")
+        self.requests.append(range_header)
+        status, response_headers, body = serve_range(self.data, range_header, self.honor_range)
+
+        response = requests.Response()
+        response.status_code = status
+        response.headers.update(response_headers)
+        response._content = body
+        response._content_consumed = True
+        response.url = url
+        return response
+
+
+class TestReadLogTail:
+    def test_returns_last_lines_using_single_range_request(self):
+        session = FakeSession(make_log(20000))
+
+        tail = read_log_tail(session, SIGNED_URL, max_lines=5, timeout=5)
+
+        assert tail.content.splitlines() == [f"line {i}" for i in range(19996, 20001)], (
+            f"Unexpected tail content: {tail.content!r}"
+        )
+        assert len(session.requests) == 1, f"Expected one Range request but got {session.requests}"
+        assert tail.truncated is True, "Expected the tail of a long log to be marked truncated"
+        assert tail.total_bytes == len(session.data), (
+            f"Expected total_bytes {len(session.data)} but got {tail.total_bytes}"
+        )
+        assert tail.bytes_read < len(session.data), "Expected only part of the log to be read"
+
+    def test_grows_window_until_enough_lines(self):
+        session = FakeSession(make_log(200))
+
+        with patch.object(log_tail, "TAIL_CHUNK_BYTES", 64):
+            tail = read_log_tail(session, SIGNED_URL, max_lines=50, timeout=5)
+
+        assert tail.content.splitlines() == [f"line {i}" for i in range(151, 201)], (
+            f"Unexpected tail content: {tail.content.splitlines()[:3]}..."
+        )
+        assert len(session.requests) > 1, "Expected several backwards Range requests"
+
+    def test_short_log_is_returned_whole(self):
+        session = FakeSession(make_log(3))
+
+        tail = read_log_tail(session, SIGNED_URL, max_lines=100, timeout=5)
+
+        assert tail.content == "line 1\nline 2\nline 3", f"Unexpected content: {tail.content!r}"
+        assert tail.truncated is False, "Expected a short log not to be marked truncated"
+        assert tail.lines_returned == 3, f"Expected 3 lines but got {tail.lines_returned}"
+
+    def test_empty_log(self):
+        tail = read_log_tail(FakeSession(b""), SIGNED_URL, max_lines=10, timeout=5)
+
+        assert tail.content == "", f"Expected empty content but got {tail.content!r}"
+        assert tail.total_bytes == 0, f"Expected 0 total bytes but got {tail.total_bytes}"
+
+    def test_falls_back_to_streaming_when_range_ignored(self):
+        session = FakeSession(make_log(500), honor_range=False)
+
+        tail = read_log_tail(session, SIGNED_URL, max_lines=2, timeout=5)
+
+        assert tail.content == "line 499\nline 500", f"Unexpected content: {tail.content!r}"
+        assert tail.truncated is True, "Expected streamed tail to be marked truncated"
+
+    def test_non_positive_max_lines_returns_everything(self):
+        session = FakeSession(make_log(10))
+
+        tail = read_log_tail(session, SIGNED_URL, max_lines=0, timeout=5)
+
+        assert tail.lines_returned == 10, f"Expected all 10 lines but got {tail.lines_returned}"
+        assert session.requests == [None], "Expected a plain GET without Range"
+
+
+class TestReadLogTailAsync:
+    async def test_reads_tail_with_range_requests(self):
+        data = make_log(1000)
+        ranges = []
+
+        def handler(request):
+            ranges.append(request.headers.get("Range"))
+            status, headers, body = serve_range(data, request.headers.get("Range"))
+            return httpx.Response(status, headers=headers, content=body)
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as session:
+            with patch.object(log_tail, "TAIL_CHUNK_BYTES", 128):
+                tail = await read_log_tail_async(session, SIGNED_URL, max_lines=40, timeout=5)
+
+        assert tail.content.splitlines() == [f"line {i}" for i in range(961, 1001)], (
+            "Unexpected async tail content"
+        )
+        assert all(r and r.startswith("bytes=") for r in ranges), f"Unexpected ranges: {ranges}"
+
+    async def test_streams_when_range_ignored(self):
+        data = make_log(300)
+
+        def handler(request):
+            return httpx.Response(200, content=data)
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as session:
+            tail = await read_log_tail_async(session, SIGNED_URL, max_lines=3, timeout=5)
+
+        assert tail.content == "line 298\nline 299\nline 300", f"Unexpected: {tail.content!r}"
+        assert tail.bytes_read == len(data), f"Expected {len(data)} bytes but got {tail.bytes_read}"
+
+
+class TestLogOperationsTail:
+    def test_get_log_tail_by_id_exposes_counts(self, make_ado_client):
+        client = make_ado_client()
+        client.session = FakeSession(make_log(1000))
+        metadata = {"id": 7, "lineCount": 1000, "signedContent": {"url": SIGNED_URL}}
+
+        with patch.object(client, "_send_request", return_value=metadata):
+            log_content = client.get_log_tail_by_id("project", 1, 2, 7, max_lines=10)
+            content = client.get_log_content_by_id("project", 1, 2, 7, max_lines=10)
+
+        assert log_content.lines_returned == 10, (
+            f"Expected 10 lines but got {log_content.lines_returned}"
+        )
+        assert log_content.total_lines == 1000, (
+            f"Expected total_lines from metadata but got {log_content.total_lines}"
+        )
+        assert log_content.truncated is True, "Expected the log tail to be marked truncated"
+        assert content == log_content.content, "Expected get_log_content_by_id to return the tail"
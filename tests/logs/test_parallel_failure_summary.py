@@ -0,0 +1,205 @@
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ado.config import LogFetchConfig
+from ado.errors import AdoConfigurationError
+from ado.models import LogContent, TimelineRecord, TimelineResponse
+from ado.pipelines.builds import BuildOperations
+
+ORG_URL = "https://dev.azure.com/test-org"
+
+
+@pytest.fixture
+def make_client(make_ado_client):
+    def make(max_concurrency=8, timeout=5.0):
+        return make_ado_client(
+            log_fetch=LogFetchConfig(
+                max_concurrency=max_concurrency, per_log_timeout_seconds=timeout
+            )
+        )
+
+    return make
+
+
+def make_timeline(task_count: int) -> TimelineResponse:
+    records = [TimelineRecord(id="job", name="Job", type="Job", result="failed")]
+    records += [
+        TimelineRecord(
+            id=f"task-{i}", name=f"Task {i}", type="Task", result="failed", log={"id": i}
+        )
+        for i in range(1, task_count + 1)
+    ]
+    return TimelineResponse(records=records)
+
+
+def make_log(log_id: int) -> LogContent:
+    return LogContent(
+        log_id=log_id,
+        content=f"error in log {log_id}",
+        lines_returned=1,
+        total_lines=1,
+        bytes_read=16,
+        total_bytes=16,
+        truncated=False,
+    )
+
+
+def make_run():
+    run = MagicMock()
+    run._links = {"web": {"href": f"{ORG_URL}/_build/results?buildId=5"}}
+    return run
+
+
+class TestParallelFailureSummary:
+    def test_logs_are_fetched_concurrently(self, make_client):
+        client = make_client(max_concurrency=10)
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def slow_log(project_id, pipeline_id, run_id, log_id, max_lines):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.1)
+            with lock:
+                active -= 1
+            return make_log(log_id)
+
+        with (
+            patch.object(client._logs, "get_pipeline_timeline", return_value=make_timeline(10)),
+            patch.object(client._logs, "get_log_tail_by_id", side_effect=slow_log),
+            patch.object(BuildOperations, "get_pipeline_run", return_value=make_run()),
+        ):
+            started = time.monotonic()
+            summary = client.get_pipeline_failure_summary("project", 1, 5)
+            elapsed = time.monotonic() - started
+
+        assert peak > 1, f"Expected log fetches to overlap but peak concurrency was {peak}"
+        assert elapsed < 0.8, f"Expected parallel fetches to finish quickly but took {elapsed:.2f}s"
+        assert [step.log_content for step in summary.root_cause_tasks] == [
+            f"error in log {i}" for i in range(1, 11)
+        ], "Expected logs to be attached to their steps in timeline order"
+        assert summary.pipeline_url.endswith("buildId=5"), f"Unexpected URL: {summary.pipeline_url}"
+
+    def test_concurrency_is_bounded(self, make_client):
+        client = make_client(max_concurrency=2)
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def slow_log(project_id, pipeline_id, run_id, log_id, max_lines):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+            return make_log(log_id)
+
+        with (
+            patch.object(client._logs, "get_pipeline_timeline", return_value=make_timeline(6)),
+            patch.object(client._logs, "get_log_tail_by_id", side_effect=slow_log),
+            patch.object(BuildOperations, "get_pipeline_run", return_value=make_run()),
+        ):
+            client.get_pipeline_failure_summary("project", 1, 5)
+
+        assert peak <= 2, f"Expected at most 2 concurrent log fetches but saw {peak}"
+
+    def test_failed_and_slow_logs_are_reported_per_step(self, make_client):
+        client = make_client(timeout=0.2)
+
+        def flaky_log(project_id, pipeline_id, run_id, log_id, max_lines):
+            if log_id == 2:
+                raise RuntimeError("signed URL expired")
+            if log_id == 3:
+                time.sleep(1)
+            return make_log(log_id)
+
+        with (
+            patch.object(client._logs, "get_pipeline_timeline", return_value=make_timeline(3)),
+            patch.object(client._logs, "get_log_tail_by_id", side_effect=flaky_log),
+            patch.object(BuildOperations, "get_pipeline_run", return_value=make_run()),
+        ):
+            started = time.monotonic()
+            summary = client.get_pipeline_failure_summary("project", 1, 5)
+            elapsed = time.monotonic() - started
+
+        first, second, third = summary.root_cause_tasks
+        assert first.log_content == "error in log 1", "Expected the healthy log to be attached"
+        assert second.log_error == "signed URL expired", f"Unexpected error: {second.log_error}"
+        assert "timed out" in third.log_error, f"Expected a timeout but got {third.log_error}"
+        assert summary.failed_log_fetches == 2, (
+            f"Expected 2 failed log fetches but got {summary.failed_log_fetches}"
+        )
+        assert elapsed < 0.9, f"Expected the slow log to be abandoned but took {elapsed:.2f}s"
+
+    def test_run_lookup_overlaps_timeline_fetch(self, make_client):
+        client = make_client()
+        run_started = threading.Event()
+
+        def slow_timeline(project_id, pipeline_id, run_id):
+            assert run_started.wait(1), "Expected the run lookup to start before the timeline ends"
+            return make_timeline(1)
+
+        def get_run(self, project_id, pipeline_id, run_id):
+            run_started.set()
+            return make_run()
+
+        with (
+            patch.object(client._logs, "get_pipeline_timeline", side_effect=slow_timeline),
+            patch.object(client._logs, "get_log_tail_by_id", return_value=make_log(1)),
+            patch.object(BuildOperations, "get_pipeline_run", get_run),
+        ):
+            summary = client.get_pipeline_failure_summary("project", 1, 5)
+
+        assert summary.total_failed_steps == 2, f"Unexpected summary: {summary}"
+
+    def test_config_rejects_non_positive_concurrency(self):
+        with pytest.raises(AdoConfigurationError):
+            LogFetchConfig(max_concurrency=0)
+
+
+class TestParallelFailureSummaryAsync:
+    async def test_logs_are_gathered_with_timeouts(self, make_client):
+        client = make_client(max_concurrency=4, timeout=0.2)
+        active = 0
+        peak = 0
+
+        async def log_tail(project_id, pipeline_id, run_id, log_id, max_lines):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            try:
+                await asyncio.sleep(1 if log_id == 4 else 0.05)
+            finally:
+                active -= 1
+            return make_log(log_id)
+
+        async def timeline(project_id, pipeline_id, run_id):
+            return make_timeline(8)
+
+        async def get_run(self, project_id, pipeline_id, run_id):
+            return make_run()
+
+        with (
+            patch.object(client._logs, "get_pipeline_timeline_async", side_effect=timeline),
+            patch.object(client._logs, "get_log_tail_by_id_async", side_effect=log_tail),
+            patch.object(BuildOperations, "get_pipeline_run_async", get_run),
+        ):
+            summary = await client.get_pipeline_failure_summary_async("project", 1, 5)
+
+        timed_out = [step for step in summary.root_cause_tasks if step.log_error]
+        assert [step.log_id for step in timed_out] == [4], (
+            f"Expected only log 4 to time out but got {[s.log_id for s in timed_out]}"
+        )
+        assert 1 < peak <= 4, f"Expected bounded concurrent fetches but peak was {peak}"
+        assert summary.failed_log_fetches == 1, (
+            f"Expected one failed log fetch but got {summary.failed_log_fetches}"
+        )
@@ -0,0 +1,164 @@
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from ado.config import TimelineTrackerConfig
+from ado.errors import AdoConfigurationError
+from ado.pipelines.timeline_tracker import TimelineTracker
+
+ORG_URL = "https://dev.azure.com/test-org"
+
+
+def record(record_id, state="pending", result=None, record_type="Task"):
+    return {
+        "id": record_id,
+        "name": record_id,
+        "type": record_type,
+        "state": state,
+        "result": result,
+    }
+
+
+class TestTimelineTracker:
+    def test_full_fetch_is_stored(self):
+        tracker = TimelineTracker()
+
+        timeline = tracker.merge(
+            "project", 1, {"records": [record("a"), record("b")], "changeId": 5}, None
+        )
+
+        assert [r.id for r in timeline.records] == ["a", "b"], "Expected both records returned"
+        assert tracker.change_id("project", 1) == 5, "Expected the changeId to be remembered"
+
+    def test_delta_replaces_changed_records_and_appends_new_ones(self):
+        tracker = TimelineTracker()
+        first = tracker.merge(
+            "project", 1, {"records": [record("a"), record("b")], "changeId": 5}, None
+        )
+
+        delta = {"records": [record("b", "completed", "failed"), record("c")], "changeId": 9}
+        merged = tracker.merge("project", 1, delta, 5)
+
+        states = {r.id: (r.state, r.result) for r in merged.records}
+        assert states == {
+            "a": ("pending", None),
+            "b": ("completed", "failed"),
+            "c": ("pending", None),
+        }, f"Unexpected merged records: {states}"
+        assert merged.changeId == 9, f"Expected changeId 9 but got {merged.changeId}"
+        assert first.records[1].state == "pending", "Expected earlier snapshots to be unchanged"
+
+    def test_empty_delta_returns_stored_timeline(self):
+        tracker = TimelineTracker()
+        tracker.merge("project", 1, {"records": [record("a")], "changeId": 3}, None)
+
+        timeline = tracker.merge("project", 1, None, 3)
+
+        assert [r.id for r in timeline.records] == ["a"], "Expected the stored records"
+        assert tracker.change_id("project", 1) == 3, "Expected the changeId to be unchanged"
+
+    def test_delta_without_stored_base_is_not_kept(self):
+        tracker = TimelineTracker()
+        tracker.merge("project", 1, {"records": [record("a")], "changeId": 3}, None)
+        tracker.forget("project", 1)
+
+        timeline = tracker.merge("project", 1, {"records": [record("b")], "changeId": 5}, 3)
+
+        assert timeline is None, "Expected a delta without its base to be rejected"
+        assert tracker.change_id("project", 1) is None, "Expected the partial timeline dropped"
+
+    def test_evicts_least_recently_used_runs(self):
+        tracker = TimelineTracker(max_runs=2)
+        for run_id in (1, 2, 3):
+            tracker.merge("project", run_id, {"records": [], "changeId": run_id}, None)
+
+        assert tracker.change_id("project", 1) is None, "Expected the oldest run to be evicted"
+        assert len(tracker) == 2, f"Expected 2 tracked runs but got {len(tracker)}"
+
+    def test_config_rejects_non_positive_size(self, make_client):
+        with pytest.raises(AdoConfigurationError):
+            TimelineTrackerConfig(max_runs=0)
+
+
+@pytest.fixture
+def make_client(make_ado_client):
+    def make(enabled=True):
+        return make_ado_client(timeline_tracker=TimelineTrackerConfig(enabled=enabled))
+
+    return make
+
+
+class TestIncrementalTimelineFetch:
+    def test_second_fetch_requests_delta_by_change_id(self, make_client):
+        client = make_client()
+        responses = [
+            {"records": [record("a"), record("b")], "changeId": 4},
+            {"records": [record("a", "completed", "succeeded")], "changeId": 6},
+        ]
+
+        with patch.object(client, "_send_request", side_effect=responses) as mock_send:
+            client.get_pipeline_timeline("project", 1, 42)
+            timeline = client.get_pipeline_timeline("project", 1, 42)
+
+        urls = [call.args[1] for call in mock_send.call_args_list]
+        assert "changeId" not in urls[0], f"Expected a full first fetch but got {urls[0]}"
+        assert urls[1].endswith("&changeId=4"), f"Expected a delta request but got {urls[1]}"
+        assert {r.id: r.state for r in timeline.records} == {"a": "completed", "b": "pending"}, (
+            "Expected the delta merged into the stored timeline"
+        )
+
+    def test_delta_is_refetched_in_full_when_run_was_dropped(self, make_client):
+        client = make_client()
+        responses = [
+            {"records": [record("a"), record("b")], "changeId": 4},
+            {"records": [record("a", "completed", "succeeded")], "changeId": 6},
+            {"records": [record("a", "completed", "succeeded"), record("b")], "changeId": 6},
+        ]
+
+        def forget_then_send(method, url):
+            if "changeId" in url:
+                client.timeline_tracker.forget("project", 42)
+            return responses.pop(0)
+
+        with patch.object(client, "_send_request", side_effect=forget_then_send) as mock_send:
+            client.get_pipeline_timeline("project", 1, 42)
+            timeline = client.get_pipeline_timeline("project", 1, 42)
+
+        urls = [call.args[1] for call in mock_send.call_args_list]
+        assert "changeId" not in urls[2], f"Expected a full refetch but got {urls[2]}"
+        assert [r.id for r in timeline.records] == ["a", "b"], "Expected the full record set"
+        assert client.timeline_tracker.change_id("project", 42) == 6
+
+    def test_disabled_tracker_always_fetches_full_timeline(self, make_client):
+        client = make_client(enabled=False)
+        response = {"records": [record("a")], "changeId": 4}
+
+        with patch.object(client, "_send_request", return_value=response) as mock_send:
+            client.get_pipeline_timeline("project", 1, 42)
+            client.get_pipeline_timeline("project", 1, 42)
+
+        urls = [call.args[1] for call in mock_send.call_args_list]
+        assert all("changeId" not in url for url in urls), f"Unexpected delta requests: {urls}"
+        assert len(client.timeline_tracker) == 0, "Expected nothing tracked when disabled"
+
+    async def test_async_fetch_requests_delta(self, make_client):
+        client = make_client()
+        seen = []
+
+        def handler(request):
+            seen.append(str(request.url))
+            if "changeId" in request.url.params:
+                return httpx.Response(200, json={"records": [record("b")], "changeId": 2})
+            return httpx.Response(200, json={"records": [record("a")], "changeId": 1})
+
+        transport = httpx.MockTransport(handler)
+        client._create_async_session = lambda: httpx.AsyncClient(transport=transport)
+        try:
+            await client.get_pipeline_timeline_async("project", 1, 42)
+            timeline = await client.get_pipeline_timeline_async("project", 1, 42)
+        finally:
+            await client.aclose()
+
+        assert "changeId=1" in seen[1], f"Expected a delta request but got {seen[1]}"
+        assert [r.id for r in timeline.records] == ["a", "b"], "Expected merged async timeline"
@@ -0,0 +1,182 @@
+import asyncio
+import threading
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from ado.config import RunPollerConfig
+from ado.errors import AdoConfigurationError
+from ado.models import PipelineRun, TimelineRecord, TimelineResponse
+from ado.pipelines.run_poller import _WatchedRun, estimate_remaining_seconds
+
+ORG_URL = "https://dev.azure.com/test-org"
+
+
+class FakeAdo:
+    """Serves batched build status and pipeline run lookups from in-memory state."""
+
+    def __init__(self):
+        self.status = {}
+        self.batch_urls = []
+        self.run_lookups = []
+        self.lock = threading.Lock()
+
+    def send_request(self, method, url, **kwargs):
+        assert "buildIds=" in url, f"Unexpected request to {url}"
+        with self.lock:
+            self.batch_urls.append(url)
+            ids = [int(i) for i in url.split("buildIds=")[1].split("&")[0].split(",")]
+            return {
+                "value": [
+                    {"id": i, "status": self.status[i], "startTime": "2024-01-01T00:00:00Z"}
+                    for i in ids
+                    if i in self.status
+                ]
+            }
+
+    def get_pipeline_run(self, project_id, pipeline_id, run_id):
+        with self.lock:
+            self.run_lookups.append(run_id)
+            state = "completed" if self.status.get(run_id) == "completed" else "inProgress"
+        return PipelineRun(id=run_id, url=f"{ORG_URL}/runs/{run_id}", state=state, result=None)
+
+
+@pytest.fixture
+def make_client(make_ado_client):
+    def make(**poller_kwargs):
+        return make_ado_client(
+            run_poller=RunPollerConfig(
+                min_interval_seconds=0.05, max_interval_seconds=0.05, **poller_kwargs
+            )
+        )
+
+    return make
+
+
+@pytest.fixture
+def fake_ado(make_client):
+    fake = FakeAdo()
+    client = make_client(timeline_refresh_seconds=0)
+    with (
+        patch.object(client, "_send_request", side_effect=fake.send_request),
+        patch.object(client._builds, "get_pipeline_run", side_effect=fake.get_pipeline_run),
+    ):
+        yield client, fake
+    client.close()
+
+
+class TestRunStatusPoller:
+    def test_runs_in_a_project_share_one_status_request(self, fake_ado):
+        client, fake = fake_ado
+        fake.status = dict.fromkeys(range(1, 11), "inProgress")
+
+        with client.run_poller._condition:
+            futures = [client.run_poller.watch("project", 1, run_id) for run_id in range(1, 11)]
+        threading.Timer(
+            0.2, lambda: fake.status.update(dict.fromkeys(fake.status, "completed"))
+        ).start()
+        results = [future.result(timeout=2) for future in futures]
+
+        first_batch = fake.batch_urls[0].split("buildIds=")[1].split("&")[0]
+        assert [run.id for run in results] == list(range(1, 11)), "Expected every waiter resolved"
+        assert first_batch == ",".join(str(i) for i in range(1, 11)), (
+            f"Expected the first status check to batch all runs but got {first_batch}"
+        )
+        assert len(fake.batch_urls) < 10, (
+            f"Expected a handful of batched requests but got {len(fake.batch_urls)}"
+        )
+        assert client.run_poller.watched_count() == 0, "Expected no runs left being watched"
+
+    def test_projects_are_batched_separately(self, fake_ado):
+        client, fake = fake_ado
+        fake.status = {1: "completed", 2: "completed"}
+
+        first = client.run_poller.watch("project-a", 1, 1)
+        second = client.run_poller.watch("project-b", 1, 2)
+        first.result(timeout=2)
+        second.result(timeout=2)
+
+        projects = sorted(url.split("/")[4] for url in fake.batch_urls)
+        assert projects == ["project-a", "project-b"], f"Unexpected batched requests: {projects}"
+
+    def test_wait_times_out_and_stops_watching(self, fake_ado):
+        client, fake = fake_ado
+        fake.status = {5: "inProgress"}
+
+        with pytest.raises(TimeoutError):
+            client.wait_for_pipeline_completion("project", 1, 5, timeout_seconds=0.2)
+
+        assert client.run_poller.watched_count() == 0, "Expected the timed out run to be dropped"
+
+    def test_repeated_errors_are_delivered_to_waiters(self, make_client):
+        client = make_client(timeline_refresh_seconds=0)
+        client.run_poller.config.max_interval_seconds = 0.01
+        with patch.object(client, "_send_request", side_effect=RuntimeError("boom")):
+            future = client.run_poller.watch("project", 1, 9)
+            with pytest.raises(RuntimeError, match="boom"):
+                future.result(timeout=2)
+        client.close()
+
+    async def test_async_waiters_are_resolved(self, fake_ado):
+        client, fake = fake_ado
+        fake.status = {3: "inProgress", 4: "inProgress"}
+
+        async def complete_later():
+            await asyncio.sleep(0.15)
+            fake.status.update({3: "completed", 4: "completed"})
+
+        results = await asyncio.gather(
+            client._builds.wait_for_pipeline_completion_async("project", 1, 3, timeout_seconds=2),
+            client._builds.wait_for_pipeline_completion_async("project", 1, 4, timeout_seconds=2),
+            complete_later(),
+        )
+
+        assert [run.id for run in results[:2]] == [3, 4], f"Unexpected results: {results}"
+
+
+class TestAdaptiveInterval:
+    def make_run(self, age_seconds, estimated_remaining=None):
+        return _WatchedRun(
+            "project",
+            1,
+            1,
+            started_at=datetime.now(UTC) - timedelta(seconds=age_seconds),
+            estimated_remaining=estimated_remaining,
+        )
+
+    def test_young_runs_are_polled_fast(self, make_client):
+        client = make_client()
+        client.run_poller.config = RunPollerConfig(min_interval_seconds=2, max_interval_seconds=30)
+
+        interval = client.run_poller.next_interval(self.make_run(age_seconds=5))
+
+        assert interval == 2, f"Expected the minimum interval for a new run but got {interval}"
+
+    def test_interval_follows_estimated_remaining_time(self, make_client):
+        client = make_client()
+        client.run_poller.config = RunPollerConfig(min_interval_seconds=2, max_interval_seconds=30)
+
+        near_done = client.run_poller.next_interval(self.make_run(600, estimated_remaining=10))
+        far_off = client.run_poller.next_interval(self.make_run(600, estimated_remaining=3600))
+
+        assert near_done == 2.5, f"Expected a short interval near completion but got {near_done}"
+        assert far_off == 30, f"Expected the interval capped at the maximum but got {far_off}"
+
+    def test_estimate_from_timeline(self):
+        now = datetime(2024, 1, 1, 0, 10, tzinfo=UTC)
+        timeline = TimelineResponse(
+            records=[
+                TimelineRecord(type="Task", state="completed", startTime="2024-01-01T00:00:00Z"),
+                TimelineRecord(type="Task", state="inProgress", startTime="2024-01-01T00:05:00Z"),
+                TimelineRecord(type="Job", state="inProgress"),
+            ]
+        )
+
+        remaining = estimate_remaining_seconds(timeline, now)
+
+        assert remaining == 600, f"Expected 600s remaining but got {remaining}"
+
+    def test_config_rejects_max_below_min(self):
+        with pytest.raises(AdoConfigurationError):
+            RunPollerConfig(min_interval_seconds=10, max_interval_seconds=5)
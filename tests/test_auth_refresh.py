@@ -0,0 +1,181 @@
+import json
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+from ado.auth import (
+    AuthCredential,
+    AuthManager,
+    AuthProvider,
+    AzureCliEntraAuthProvider,
+    PatAuthProvider,
+    SharedTokenCache,
+)
+from ado.config import AuthConfig
+
+
+class SequenceProvider(AuthProvider):
+    """Hands out bearer tokens token-1, token-2, ... expiring after lifetime seconds."""
+
+    def __init__(self, lifetime: float = 3600, delay: float = 0.0):
+        self.lifetime = lifetime
+        self.delay = delay
+        self.calls = 0
+
+    def get_credential(self) -> AuthCredential | None:
+        time.sleep(self.delay)
+        self.calls += 1
+        return AuthCredential(
+            token=f"token-{self.calls}",
+            auth_type="bearer",
+            method="azure_cli_entra",
+            expires_at=time.time() + self.lifetime,
+        )
+
+    def get_name(self) -> str:
+        return "Sequence"
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestBackgroundRefresh:
+    def test_stale_credential_is_served_while_refreshing(self):
+        manager = AuthManager(AuthConfig(cache_ttl_seconds=0))
+        provider = SequenceProvider(delay=0.2)
+        manager.add_provider(provider)
+        manager.get_credential()
+        time.sleep(0.01)
+
+        start = time.monotonic()
+        credential = manager.get_credential()
+
+        assert time.monotonic() - start < 0.1, "Expected the stale credential without waiting"
+        assert credential.token == "token-1"
+        assert wait_for(lambda: manager.cached_credential.token == "token-2"), (
+            "Expected a new credential fetched in the background"
+        )
+        manager.close()
+
+    def test_headers_follow_refreshed_credential(self):
+        manager = AuthManager(AuthConfig(cache_ttl_seconds=0))
+        manager.add_provider(SequenceProvider())
+        assert manager.get_auth_headers()["Authorization"] == "Bearer token-1"
+
+        assert wait_for(lambda: manager.get_auth_headers()["Authorization"] == "Bearer token-2"), (
+            "Expected the headers swapped to the refreshed credential"
+        )
+        manager.close()
+
+    def test_refresh_is_scheduled_before_expiry(self):
+        manager = AuthManager(AuthConfig(refresh_margin_seconds=300))
+        manager.add_provider(SequenceProvider(lifetime=600))
+
+        with patch("ado.auth.threading.Timer") as timer:
+            manager.get_credential()
+
+        delay = timer.call_args.args[0]
+        assert 290 <= delay <= 300, f"Expected a refresh 300s before expiry but got {delay}"
+        timer.return_value.start.assert_called_once()
+
+    def test_failed_refresh_keeps_current_credential(self):
+        manager = AuthManager(AuthConfig(cache_ttl_seconds=0))
+        provider = SequenceProvider()
+        manager.add_provider(provider)
+        manager.get_credential()
+        provider.get_credential = MagicMock(side_effect=RuntimeError("az failed"))
+
+        with patch.object(manager, "_schedule_refresh") as schedule:
+            manager._refresh()
+
+        assert manager.get_credential().token == "token-1", "Expected the old credential kept"
+        schedule.assert_called_once()
+
+    def test_without_background_refresh_stale_credential_is_fetched_again(self):
+        manager = AuthManager(AuthConfig(cache_ttl_seconds=0, background_refresh=False))
+        manager.add_provider(SequenceProvider())
+        manager.get_credential()
+        time.sleep(0.01)
+
+        assert manager.get_credential().token == "token-2", "Expected a blocking re-fetch"
+
+    def test_non_expiring_credentials_do_not_schedule_timers(self):
+        manager = AuthManager(AuthConfig())
+        manager.add_provider(PatAuthProvider("test-pat"))
+
+        with patch("ado.auth.threading.Timer") as timer:
+            manager.get_credential()
+
+        timer.assert_not_called()
+
+
+class TestSharedTokenCache:
+    def test_round_trip_respects_min_validity(self, tmp_path):
+        cache = SharedTokenCache(str(tmp_path / "tokens.json"))
+        credential = AuthCredential("tok", "bearer", "azure_cli_entra", time.time() + 100)
+
+        cache.store("key", credential)
+
+        assert cache.load("key").token == "tok", "Expected the stored token"
+        assert cache.load("key", min_valid_seconds=200) is None, (
+            "Expected tokens expiring too soon to be ignored"
+        )
+
+    def test_non_expiring_credentials_are_not_stored(self, tmp_path):
+        cache = SharedTokenCache(str(tmp_path / "tokens.json"))
+
+        cache.store("key", AuthCredential("pat", "basic", "pat"))
+
+        assert not (tmp_path / "tokens.json").exists(), "Expected PATs never written to disk"
+
+    def test_unreadable_file_is_ignored(self, tmp_path):
+        path = tmp_path / "tokens.json"
+        path.write_text("not json")
+
+        assert SharedTokenCache(str(path)).load("key") is None
+
+    def test_concurrent_callers_run_az_once(self, tmp_path):
+        cache_path = str(tmp_path / "tokens.json")
+        token_json = json.dumps({"accessToken": "shared", "expires_on": int(time.time()) + 3600})
+        calls = []
+
+        def fake_az(*args, **kwargs):
+            calls.append(1)
+            time.sleep(0.1)
+            return MagicMock(returncode=0, stdout=token_json)
+
+        # Separate providers and caches, as in separate server processes
+        providers = [
+            AzureCliEntraAuthProvider(token_cache=SharedTokenCache(cache_path)) for _ in range(4)
+        ]
+        results = []
+        with patch("ado.auth.subprocess.run", side_effect=fake_az):
+            threads = [
+                threading.Thread(target=lambda p=p: results.append(p.get_credential()))
+                for p in providers
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert len(calls) == 1, f"Expected one az call but saw {len(calls)}"
+        assert {credential.token for credential in results} == {"shared"}
+
+
+class TestEntraExpiration:
+    def test_parses_timestamp_and_local_datetime(self):
+        parse = AzureCliEntraAuthProvider._parse_expiration
+
+        assert parse({"expires_on": 1700000000}) == 1700000000.0
+        local = parse({"expiresOn": "2030-01-01 12:00:00.000000"})
+        assert local is not None and local > time.time(), (
+            f"Expected the local datetime form parsed but got {local}"
+        )
+        assert parse({}) is None
@@ -0,0 +1,76 @@
+from unittest.mock import MagicMock, patch
+
+from ado.cache import ado_cache
+from ado.cache_warmer import CacheWarmer
+from ado.config import CacheWarmupConfig
+from ado.rate_limiter import _background
+from ado.work_items.models import ClassificationNode, WorkItemType
+
+ORG = "https://dev.azure.com/warmup-org"
+
+
+def make_client(projects):
+    client = MagicMock()
+    client._lookups.ensure_projects_cached.return_value = projects
+    return client
+
+
+def make_type_client():
+    type_client = MagicMock()
+    type_client.list_work_item_types.return_value = [
+        WorkItemType(name="Bug", referenceName="Microsoft.VSTS.WorkItemTypes.Bug")
+    ]
+    type_client.list_area_paths.return_value = [ClassificationNode(name="Area")]
+    type_client.list_iteration_paths.return_value = [ClassificationNode(name="Sprint 1")]
+    return type_client
+
+
+class TestCacheWarmer:
+    def test_warms_hot_projects_in_background_priority(self, make_project):
+        projects = [make_project("Hot", project_id="p-1"), make_project("Cold", project_id="p-2")]
+        client = make_client(projects)
+        priorities = []
+        client._lookups.ensure_pipelines_cached.side_effect = lambda project_id: priorities.append(
+            _background.get()
+        )
+        config = CacheWarmupConfig(enabled=True, projects=["hot"])
+
+        with patch("ado.cache_warmer.TypeClient", return_value=make_type_client()):
+            summary = CacheWarmer(client, ORG, config).warm()
+
+        client._lookups.ensure_pipelines_cached.assert_called_once_with("p-1")
+        assert summary["succeeded"] == 5 and summary["failed"] == 0, f"Unexpected: {summary}"
+        assert priorities == [True], "Expected warm-up requests to run at background priority"
+        with ado_cache.organization_scope(ORG):
+            assert ado_cache.get_work_item_types("Hot")[0].name == "Bug", (
+                "Expected work item types cached under the project name too"
+            )
+            assert ado_cache.get_iteration_paths("Hot") is not None
+        ado_cache.drop_organization(ORG)
+
+    def test_unknown_projects_are_skipped(self, make_project):
+        client = make_client([make_project("Hot", project_id="p-1")])
+        config = CacheWarmupConfig(enabled=True, projects=["Missing"])
+
+        summary = CacheWarmer(client, ORG, config).warm()
+
+        client._lookups.ensure_pipelines_cached.assert_not_called()
+        assert summary["succeeded"] == 1, "Expected only the project list to be fetched"
+
+    def test_failures_are_counted_not_raised(self, make_project):
+        client = make_client([make_project("Hot", project_id="p-1")])
+        client._lookups.ensure_pipelines_cached.side_effect = RuntimeError("boom")
+        config = CacheWarmupConfig(enabled=True, projects=["p-1"], work_item_metadata=False)
+
+        summary = CacheWarmer(client, ORG, config).warm()
+
+        assert summary["failed"] == 1 and summary["succeeded"] == 1, f"Unexpected: {summary}"
+
+    def test_failed_project_list_stops_warm_up(self):
+        client = make_client(None)
+        client._lookups.ensure_projects_cached.side_effect = RuntimeError("unauthorized")
+
+        summary = CacheWarmer(client, ORG, CacheWarmupConfig(projects=["Hot"])).warm()
+
+        assert summary["failed"] == 1 and summary["succeeded"] == 0
+        client._lookups.ensure_pipelines_cached.assert_not_called()
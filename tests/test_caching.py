@@ -1,4 +1,5 @@
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 from ado.cache import AdoCache, ado_cache
 from ado.models import Pipeline, Project
@@ -159,6 +160,31 @@ class TestAdoCache:
         final_count = self.cache.get_stats()["total_entries"]
         assert final_count == 1, f"Expected 1 entry after cleanup but got {final_count}"
 
+    def test_lru_eviction_keeps_recently_read_entries(self):
+        cache = AdoCache(max_size=3)
+        for key in ("a", "b", "c"):
+            cache._set(key, key, 60)
+
+        cache._get("a")
+        cache._set("d", "d", 60)
+
+        keys = cache.get_stats()["cache_keys"]
+        assert keys == ["c", "a", "d"], f"Expected 'b' evicted and LRU order kept but got {keys}"
+
+    def test_concurrent_access_respects_max_size(self):
+        cache = AdoCache(max_size=100)
+
+        def worker(offset):
+            for i in range(500):
+                cache._set(f"key:{offset}:{i}", i, 60)
+                cache._get(f"key:{offset}:{i // 2}")
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(worker, range(8)))
+
+        total = cache.get_stats()["total_entries"]
+        assert total == 100, f"Expected the cache to stay at max_size but got {total} entries"
+
 
 @requires_ado_creds
 class TestCachingIntegration:
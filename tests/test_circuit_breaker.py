@@ -0,0 +1,196 @@
+import asyncio
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from ado.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    endpoint_template,
+    is_endpoint_failure,
+)
+from ado.config import CircuitBreakerConfig, RetryConfig
+from ado.errors import AdoCircuitOpenError, AdoConfigurationError, AdoNetworkError
+
+ORG_URL = "https://dev.azure.com/breaker-org"
+
+
+def make_breaker(**overrides):
+    settings = {"failure_threshold": 2, "open_seconds": 0.1}
+    settings.update(overrides)
+    return CircuitBreaker("GET dev.azure.com/_apis/x", CircuitBreakerConfig(**settings))
+
+
+def http_error(status_code):
+    response = MagicMock()
+    response.status_code = status_code
+    error = requests.exceptions.HTTPError(f"{status_code}")
+    error.response = response
+    return error
+
+
+class TestEndpointTemplate:
+    def test_ids_and_scope_are_templated(self):
+        template = endpoint_template(
+            "get", f"{ORG_URL}/MyProject/_apis/build/builds/42/timeline?changeId=3"
+        )
+
+        assert template == "GET dev.azure.com/_apis/build/builds/{id}/timeline", (
+            f"Unexpected template: {template}"
+        )
+
+    def test_guids_are_templated(self):
+        template = endpoint_template(
+            "GET", f"{ORG_URL}/_apis/projects/6ce954b1-ce1f-45d1-b94d-e6bf2464ba2c"
+        )
+
+        assert template == "GET dev.azure.com/_apis/projects/{id}", f"Unexpected: {template}"
+
+    def test_hosts_are_kept_apart(self):
+        log_url = "https://logs.example.net/signed/abc/123/log.txt"
+
+        assert endpoint_template("GET", log_url).startswith("GET logs.example.net/"), (
+            "Expected signed content hosts to get their own breakers"
+        )
+
+
+class TestEndpointFailures:
+    def test_server_errors_and_network_errors_count(self):
+        assert is_endpoint_failure(http_error(503)), "Expected 5xx to count as a failure"
+        assert is_endpoint_failure(AdoNetworkError("down")), "Expected network errors to count"
+        assert is_endpoint_failure(requests.exceptions.ConnectTimeout()), "Expected timeouts"
+
+    def test_client_errors_do_not_count(self):
+        assert not is_endpoint_failure(http_error(404)), "Expected 4xx not to count"
+        assert not is_endpoint_failure(ValueError("bad")), "Expected other errors not to count"
+
+
+class TestCircuitBreaker:
+    def test_opens_after_consecutive_failures_and_fails_fast(self):
+        breaker = make_breaker()
+        breaker.record_failure()
+        assert breaker.state == CLOSED, "Expected one failure to keep the breaker closed"
+
+        breaker.record_failure()
+
+        assert breaker.state == OPEN, "Expected the breaker to open at the threshold"
+        with pytest.raises(AdoCircuitOpenError):
+            breaker.before_request()
+
+    def test_success_resets_failure_count(self):
+        breaker = make_breaker()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state == CLOSED, "Expected failures to have to be consecutive"
+
+    def test_half_open_allows_one_probe(self):
+        breaker = make_breaker()
+        breaker.record_failure()
+        breaker.record_failure()
+        time.sleep(0.12)
+
+        assert breaker.before_request() is True, "Expected a probe once the open period ends"
+        assert breaker.state == HALF_OPEN
+        with pytest.raises(AdoCircuitOpenError):
+            breaker.before_request()
+
+    def test_successful_probe_closes(self):
+        breaker = make_breaker()
+        breaker.record_failure()
+        breaker.record_failure()
+        time.sleep(0.12)
+
+        calls = breaker.protect(lambda: "ok")()
+
+        assert calls == "ok" and breaker.state == CLOSED, "Expected the probe to close it"
+
+    def test_failed_probe_reopens(self):
+        breaker = make_breaker()
+        breaker.record_failure()
+        breaker.record_failure()
+        time.sleep(0.12)
+
+        @breaker.protect
+        async def probe():
+            raise AdoNetworkError("still down")
+
+        with pytest.raises(AdoNetworkError):
+            asyncio.run(probe())
+
+        assert breaker.state == OPEN, "Expected a failed probe to open the breaker again"
+
+    def test_client_errors_do_not_trip(self):
+        breaker = make_breaker()
+
+        @breaker.protect
+        def not_found():
+            raise http_error(404)
+
+        for _ in range(3):
+            with pytest.raises(requests.exceptions.HTTPError):
+                not_found()
+
+        assert breaker.state == CLOSED, "Expected 4xx responses not to open the breaker"
+
+    def test_config_validation(self):
+        with pytest.raises(AdoConfigurationError):
+            CircuitBreakerConfig(failure_threshold=0)
+
+
+class TestCircuitBreakerRegistry:
+    def test_endpoints_have_independent_breakers(self):
+        registry = CircuitBreakerRegistry(CircuitBreakerConfig(failure_threshold=1))
+        timeline = registry.for_request("GET", f"{ORG_URL}/p/_apis/build/builds/1/timeline")
+        timeline.record_failure()
+
+        other = registry.for_request("GET", f"{ORG_URL}/p/_apis/build/builds/2/timeline")
+        projects = registry.for_request("GET", f"{ORG_URL}/_apis/projects")
+
+        assert other is timeline, "Expected builds to share their endpoint's breaker"
+        assert projects.state == CLOSED, "Expected other endpoints unaffected"
+        assert registry.states()[timeline.endpoint] == OPEN
+
+    def test_disabled_registry_does_not_wrap(self):
+        registry = CircuitBreakerRegistry(CircuitBreakerConfig(enabled=False))
+
+        def func():
+            return 1
+
+        assert registry.for_request("GET", ORG_URL).protect(func) is func
+
+
+class TestClientCircuitBreaking:
+    def test_open_endpoint_fails_fast_without_blocking_others(self, make_ado_client):
+        client = make_ado_client(
+            ORG_URL,
+            retry=RetryConfig(max_retries=0),
+            circuit_breaker=CircuitBreakerConfig(failure_threshold=2),
+        )
+        flaky_url = f"{ORG_URL}/_apis/preview/pipelines/1"
+        healthy_url = f"{ORG_URL}/_apis/projects"
+
+        ok = MagicMock(status_code=200, headers={}, content=b"{}", text="", url=healthy_url)
+        ok.json.return_value = {"ok": True}
+
+        def respond(method, url, **kwargs):
+            if url == flaky_url:
+                raise requests.exceptions.ConnectionError("reset")
+            return ok
+
+        with patch.object(client.session, "request", side_effect=respond) as mock_request:
+            for _ in range(2):
+                with pytest.raises(AdoNetworkError):
+                    client._send_request("POST", flaky_url)
+            with pytest.raises(AdoCircuitOpenError):
+                client._send_request("POST", flaky_url)
+            result = client._send_request("POST", healthy_url)
+
+        assert mock_request.call_count == 3, "Expected the open breaker to skip the request"
+        assert result == {"ok": True}, "Expected the healthy endpoint to keep working"
@@ -0,0 +1,169 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from ado.cache import AdoCache
+from ado.client_pool import AdoClientPool
+from ado.errors import AdoAuthenticationError, AdoConfigurationError
+
+ORG_A = "https://dev.azure.com/org-a"
+ORG_B = "https://dev.azure.com/org-b"
+ORG_C = "https://dev.azure.com/org-c"
+
+
+def make_factory():
+    created = []
+
+    def factory(organization_url):
+        client = MagicMock(name=organization_url)
+        client.organization_url = organization_url
+        created.append(client)
+        return client
+
+    return factory, created
+
+
+class TestAdoClientPool:
+    def test_clients_are_reused_per_organization(self):
+        factory, created = make_factory()
+        pool = AdoClientPool(factory)
+
+        first = pool.get(ORG_A)
+        pool.get(ORG_B)
+        again = pool.get(ORG_A + "/")
+
+        assert again is first, "Expected the pooled client to be reused"
+        assert len(created) == 2, f"Expected one client per organization but got {len(created)}"
+
+    def test_least_recently_used_client_is_closed(self):
+        factory, created = make_factory()
+        pool = AdoClientPool(factory, max_clients=2)
+
+        pool.get(ORG_A)
+        pool.get(ORG_B)
+        pool.get(ORG_A)
+        pool.get(ORG_C)
+
+        assert pool.organizations() == [ORG_A, ORG_C], f"Unexpected pool: {pool.organizations()}"
+        assert created[1].close.called, "Expected the evicted client to be closed"
+        assert not created[0].close.called, "Expected the recently used client to be kept"
+
+    def test_failed_creation_leaves_pool_unchanged(self):
+        pool = AdoClientPool(MagicMock(side_effect=AdoAuthenticationError("bad token")))
+
+        with pytest.raises(AdoAuthenticationError):
+            pool.get(ORG_A)
+
+        assert len(pool) == 0, "Expected nothing pooled after a failed creation"
+
+    def test_concurrent_first_use_creates_one_client(self):
+        created = []
+
+        def slow_factory(organization_url):
+            time.sleep(0.05)
+            created.append(organization_url)
+            return MagicMock()
+
+        pool = AdoClientPool(slow_factory)
+        threads = [threading.Thread(target=pool.get, args=(ORG_A,)) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert created == [ORG_A], f"Expected a single client to be created but got {created}"
+
+    def test_rejects_non_positive_size(self):
+        with pytest.raises(AdoConfigurationError):
+            AdoClientPool(MagicMock(), max_clients=0)
+
+
+class TestOrganizationPartitions:
+    def test_organizations_do_not_share_entries(self, make_project):
+        cache = AdoCache()
+        cache.use_organization(ORG_A)
+        cache.set_projects([make_project("Alpha")])
+
+        cache.use_organization(ORG_B)
+
+        assert cache.get_projects() is None, "Expected no projects cached for another org"
+
+    def test_switching_back_keeps_cache_warm(self, make_project):
+        cache = AdoCache()
+        cache.use_organization(ORG_A)
+        cache.set_projects([make_project("Alpha")])
+        cache.use_organization(ORG_B)
+        cache.set_projects([make_project("Beta")])
+
+        cache.use_organization(ORG_A)
+
+        assert cache.find_project_by_name("alpha") == make_project("Alpha"), (
+            "Expected org A's projects to still be cached"
+        )
+        assert cache.get_stats()["cached_organizations"] == [ORG_B, ORG_A], (
+            "Expected both organizations partitioned"
+        )
+
+    def test_scope_overrides_active_organization(self, make_project):
+        cache = AdoCache()
+        cache.use_organization(ORG_A)
+
+        with cache.organization_scope(ORG_B):
+            cache.set_projects([make_project("Beta")])
+
+        assert cache.get_projects() is None, "Expected the scoped write to go to org B"
+        with cache.organization_scope(ORG_B):
+            assert cache.get_projects() == [make_project("Beta")], "Expected org B's projects"
+
+    def test_least_recently_used_partition_is_evicted(self, make_project):
+        cache = AdoCache(max_partitions=2)
+        for org in (ORG_A, ORG_B, ORG_C):
+            cache.use_organization(org)
+            cache.set_projects([make_project("Alpha")])
+
+        assert cache.get_stats()["cached_organizations"] == [ORG_B, ORG_C], (
+            "Expected the oldest organization's partition to be evicted"
+        )
+
+    def test_background_refresh_writes_to_the_requesting_organization(self, make_project):
+        cache = AdoCache()
+        cache.use_organization(ORG_A)
+        release = threading.Event()
+
+        def refresh():
+            release.wait(5)
+            cache.set_projects([make_project("Alpha")])
+
+        cache.refresh_in_background("projects", refresh)
+        cache.use_organization(ORG_B)
+        release.set()
+        deadline = time.time() + 5
+        while cache._refreshing and time.time() < deadline:
+            time.sleep(0.01)
+
+        assert cache.get_projects() is None, "Expected nothing written to the newly active org"
+        cache.use_organization(ORG_A)
+        assert cache.get_projects() == [make_project("Alpha")], "Expected org A refreshed"
+
+
+class TestServerOrganizationSwitch:
+    def test_switching_back_reuses_the_authenticated_client(self, monkeypatch):
+        import server
+
+        factory, created = make_factory()
+        monkeypatch.setattr(server, "client_pool", AdoClientPool(factory))
+        monkeypatch.setitem(server.client_container, "client", None)
+
+        try:
+            first, _ = server.initialize_ado_client(ORG_A)
+            server.initialize_ado_client(ORG_B)
+            again, error = server.initialize_ado_client(ORG_A)
+            active_organization = server.ado_cache.organization
+        finally:
+            server.ado_cache.use_organization("")
+
+        assert error is None and again is first, "Expected the pooled org A client"
+        assert len(created) == 2, f"Expected two clients to be created but got {len(created)}"
+        assert active_organization == ORG_A, "Expected org A's cache partition active"
@@ -78,11 +78,13 @@ class TestComprehensiveToolRegistration:
             "delete_work_item",
             # Work Item Batch Operations
             "get_work_items_batch",
+            "get_work_items_bulk",
             "update_work_items_batch",
             "delete_work_items_batch",
             # Work Item Queries
             "list_work_items",
             "query_work_items",
+            "get_work_items_by_query",
             "get_work_items_page",
             "get_my_work_items",
             "get_recent_work_items",
@@ -210,6 +212,7 @@ class TestComprehensiveToolRegistration:
             },
             "Work Item Batch Operations": {
                 "get_work_items_batch",
+                "get_work_items_bulk",
                 "update_work_items_batch",
                 "delete_work_items_batch",
             },
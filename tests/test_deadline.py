@@ -0,0 +1,158 @@
+import asyncio
+import time
+
+import pytest
+from fastmcp import FastMCP
+from fastmcp.client import Client
+
+from ado.config import RetryConfig
+from ado.deadline import (
+    ToolDeadlineMiddleware,
+    deadline_scope,
+    extend_deadline,
+    remaining_time,
+    request_timeout,
+)
+from ado.errors import AdoNetworkError, AdoTimeoutError
+from ado.retry import RetryBudget, RetryManager
+
+
+class TestDeadlineScope:
+    def test_no_deadline_by_default(self):
+        assert remaining_time() is None, "Expected no deadline outside a scope"
+        assert request_timeout(30, "GET u") == 30, "Expected the configured timeout unchanged"
+
+    def test_nested_scope_only_shortens(self):
+        with deadline_scope(10):
+            with deadline_scope(60):
+                assert remaining_time() <= 10, "Expected the shorter outer deadline to win"
+            with deadline_scope(1):
+                assert remaining_time() <= 1, "Expected the shorter inner deadline to win"
+
+        assert remaining_time() is None, "Expected the deadline to end with the scope"
+
+    def test_request_timeout_is_capped(self):
+        with deadline_scope(2):
+            assert request_timeout(30, "GET u") <= 2, "Expected a scalar timeout capped"
+            connect, read = request_timeout((5, 30), "GET u")
+            assert connect <= 2 and read <= 2, "Expected both tuple timeouts capped"
+
+    def test_expired_deadline_raises(self):
+        with deadline_scope(0.01):
+            time.sleep(0.02)
+            with pytest.raises(AdoTimeoutError) as exc_info:
+                request_timeout(30, "GET u")
+
+        assert exc_info.value.context["deadline_exceeded"], "Expected a deadline error"
+
+    def test_extend_pushes_deadline_back(self):
+        with deadline_scope(1):
+            extend_deadline(60)
+            assert remaining_time() > 30, "Expected the deadline extended"
+
+
+class TestRetryDeadline:
+    def test_retries_stop_when_backoff_exceeds_deadline(self):
+        retry_manager = RetryManager(
+            RetryConfig(max_retries=5, initial_delay=1.0, jitter=False), RetryBudget()
+        )
+        calls = []
+
+        @retry_manager.retry_on_failure
+        def failing():
+            calls.append(1)
+            raise AdoNetworkError("Network error")
+
+        start = time.monotonic()
+        with deadline_scope(0.5), pytest.raises(AdoNetworkError):
+            failing()
+
+        assert len(calls) == 1, f"Expected no retry past the deadline but got {len(calls)} calls"
+        assert time.monotonic() - start < 0.5, "Expected to give up without sleeping"
+
+    def test_retries_within_deadline_still_happen(self):
+        retry_manager = RetryManager(
+            RetryConfig(max_retries=3, initial_delay=0.05, jitter=False), RetryBudget()
+        )
+        calls = []
+
+        @retry_manager.retry_on_failure
+        def flaky():
+            calls.append(1)
+            if len(calls) < 3:
+                raise AdoNetworkError("Network error")
+            return "ok"
+
+        with deadline_scope(5):
+            assert flaky() == "ok", "Expected success after retries"
+
+
+class TestRetryBudget:
+    def test_exhausted_budget_stops_retries(self):
+        budget = RetryBudget(ratio=0.0, min_retries_per_second=0.0, max_tokens=1)
+        retry_manager = RetryManager(
+            RetryConfig(max_retries=3, initial_delay=0.01, jitter=False), budget
+        )
+        calls = []
+
+        @retry_manager.retry_on_failure
+        def failing():
+            calls.append(1)
+            raise AdoNetworkError("Network error")
+
+        with pytest.raises(AdoNetworkError):
+            failing()
+
+        assert len(calls) == 2, f"Expected one budgeted retry but got {len(calls) - 1}"
+
+    def test_requests_earn_retries(self):
+        budget = RetryBudget(ratio=0.5, min_retries_per_second=0.0, max_tokens=10)
+        while budget.try_acquire():
+            pass
+
+        budget.record_request()
+        assert not budget.try_acquire(), "Expected half a token not to allow a retry"
+        budget.record_request()
+        assert budget.try_acquire(), "Expected two requests to earn one retry"
+
+    def test_reset_refills_the_budget(self):
+        budget = RetryBudget(ratio=0.0, min_retries_per_second=0.0, max_tokens=3)
+        while budget.try_acquire():
+            pass
+
+        budget.reset()
+
+        assert budget.available == 3, f"Expected a full budget but got {budget.available}"
+
+    def test_async_retries_use_budget(self):
+        budget = RetryBudget(ratio=0.0, min_retries_per_second=0.0, max_tokens=0)
+        retry_manager = RetryManager(RetryConfig(max_retries=3, initial_delay=0.01), budget)
+        calls = []
+
+        @retry_manager.async_retry_on_failure
+        async def failing():
+            calls.append(1)
+            raise AdoNetworkError("Network error")
+
+        with pytest.raises(AdoNetworkError):
+            asyncio.run(failing())
+
+        assert len(calls) == 1, f"Expected no retries without budget but got {len(calls) - 1}"
+
+
+class TestToolDeadlineMiddleware:
+    def test_tool_calls_run_under_deadline(self):
+        mcp = FastMCP(name="deadline-test")
+        mcp.add_middleware(ToolDeadlineMiddleware(30))
+
+        @mcp.tool
+        async def remaining() -> float:
+            return remaining_time() or -1.0
+
+        async def call():
+            async with Client(mcp) as client:
+                return await client.call_tool("remaining", {})
+
+        result = asyncio.run(call())
+
+        assert 0 < result.data <= 30, f"Expected the tool to see its deadline, got {result.data}"
@@ -0,0 +1,198 @@
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ado.config import HedgingConfig, RetryConfig
+from ado.errors import AdoConfigurationError
+from ado.hedging import Hedger, LatencyTracker
+
+ORG_URL = "https://dev.azure.com/hedging-org"
+ENDPOINT = "GET dev.azure.com/_apis/x"
+
+
+def make_hedger(**overrides):
+    settings = {
+        "enabled": True,
+        "min_samples": 5,
+        "budget_ratio": 1.0,
+        "max_burst": 5.0,
+        "min_delay_seconds": 0.01,
+    }
+    settings.update(overrides)
+    return Hedger(HedgingConfig(**settings))
+
+
+def warm_up(hedger, endpoint=ENDPOINT, seconds=0.02, count=10):
+    for _ in range(count):
+        hedger.latencies.record(endpoint, seconds)
+
+
+class TestLatencyTracker:
+    def test_percentile_needs_min_samples(self):
+        tracker = LatencyTracker(window_size=10)
+        tracker.record(ENDPOINT, 0.1)
+
+        assert tracker.percentile(ENDPOINT, 95, min_samples=2) is None, (
+            "Expected no percentile before min_samples latencies"
+        )
+
+    def test_percentile_over_rolling_window(self):
+        tracker = LatencyTracker(window_size=100)
+        for _ in range(100):
+            tracker.record(ENDPOINT, 5.0)
+        for i in range(100):
+            tracker.record(ENDPOINT, i / 100)
+
+        assert tracker.percentile(ENDPOINT, 95) == pytest.approx(0.95), (
+            "Expected old latencies to have left the window"
+        )
+
+
+class TestHedger:
+    def test_threshold_has_a_floor(self):
+        hedger = make_hedger(min_delay_seconds=0.5)
+        warm_up(hedger, seconds=0.01)
+
+        assert hedger.threshold(ENDPOINT) == 0.5, "Expected min_delay_seconds as the floor"
+
+    def test_slow_primary_is_hedged_and_hedge_wins(self):
+        hedger = make_hedger()
+        warm_up(hedger)
+        calls = []
+        lock = threading.Lock()
+
+        def attempt():
+            with lock:
+                calls.append(1)
+                first = len(calls) == 1
+            time.sleep(0.5 if first else 0.0)
+            return "primary" if first else "hedge"
+
+        start = time.monotonic()
+        result = hedger.run(ENDPOINT, attempt)
+
+        assert result == "hedge", f"Expected the hedge to answer first but got {result}"
+        assert time.monotonic() - start < 0.4, "Expected not to wait for the slow primary"
+        hedger.close()
+
+    def test_fast_primary_is_not_hedged(self):
+        hedger = make_hedger()
+        warm_up(hedger, seconds=0.2)
+        attempt = MagicMock(return_value="ok")
+
+        assert hedger.run(ENDPOINT, attempt) == "ok"
+        assert attempt.call_count == 1, "Expected no hedge for a request under the threshold"
+        hedger.close()
+
+    def test_more_callers_than_workers_do_not_set_off_hedges(self):
+        hedger = make_hedger(max_workers=2, min_delay_seconds=0.05)
+        warm_up(hedger, seconds=0.2, count=50)
+        # Well under the threshold unless the call waits for a worker first
+        attempt = MagicMock(side_effect=lambda: time.sleep(0.1) or "ok")
+        callers = [threading.Thread(target=hedger.run, args=(ENDPOINT, attempt)) for _ in range(16)]
+
+        start = time.monotonic()
+        for caller in callers:
+            caller.start()
+        for caller in callers:
+            caller.join()
+
+        assert attempt.call_count == 16, "Expected queueing not to set off hedges"
+        assert time.monotonic() - start < 0.5, "Expected the callers not to queue"
+        hedger.close()
+
+    def test_failed_hedge_falls_back_to_primary(self):
+        hedger = make_hedger()
+        warm_up(hedger)
+        calls = []
+        lock = threading.Lock()
+
+        def attempt():
+            with lock:
+                calls.append(1)
+                first = len(calls) == 1
+            if not first:
+                raise ValueError("hedge failed")
+            time.sleep(0.1)
+            return "primary"
+
+        assert hedger.run(ENDPOINT, attempt) == "primary", "Expected the primary's result"
+        hedger.close()
+
+    def test_exhausted_budget_prevents_hedging(self):
+        hedger = make_hedger(budget_ratio=0.0, max_burst=0.0)
+        warm_up(hedger)
+        attempt = MagicMock(side_effect=lambda: time.sleep(0.05) or "ok")
+
+        assert hedger.run(ENDPOINT, attempt) == "ok"
+        assert attempt.call_count == 1, "Expected no hedge without budget"
+        hedger.close()
+
+    def test_async_slow_primary_is_hedged_and_cancelled(self):
+        hedger = make_hedger()
+        warm_up(hedger)
+        calls = []
+
+        async def attempt():
+            calls.append(1)
+            if len(calls) == 1:
+                try:
+                    await asyncio.sleep(1.0)
+                except asyncio.CancelledError:
+                    calls.append("cancelled")
+                    raise
+                return "primary"
+            return "hedge"
+
+        async def run():
+            result = await hedger.run_async(ENDPOINT, attempt)
+            await asyncio.sleep(0)
+            return result
+
+        assert asyncio.run(run()) == "hedge", "Expected the hedge to answer first"
+        assert "cancelled" in calls, "Expected the losing primary to be cancelled"
+
+    def test_only_eligible_requests_are_wrapped(self):
+        hedger = make_hedger()
+
+        def func():
+            return 1
+
+        assert hedger.hedge("POST", f"{ORG_URL}/_apis/wit/workitems")(func) is func
+        assert hedger.hedge("POST", f"{ORG_URL}/_apis/wit/wiql", idempotent=True)(func) is not func
+        assert make_hedger(enabled=False).hedge("GET", ORG_URL)(func) is func
+
+    def test_config_validation(self):
+        with pytest.raises(AdoConfigurationError):
+            HedgingConfig(percentile=100)
+
+
+class TestClientHedging:
+    def test_wiql_query_is_hedged(self, make_ado_client):
+        client = make_ado_client(
+            ORG_URL,
+            retry=RetryConfig(max_retries=0),
+            hedging=HedgingConfig(enabled=True, min_samples=5, budget_ratio=1.0),
+        )
+        url = f"{ORG_URL}/proj/_apis/wit/wiql"
+        warm_up(client.hedger, endpoint="POST dev.azure.com/_apis/wit/wiql")
+        calls = []
+        lock = threading.Lock()
+
+        def respond(method, url, **kwargs):
+            with lock:
+                calls.append(1)
+                first = len(calls) == 1
+            time.sleep(0.5 if first else 0.0)
+            response = MagicMock(status_code=200, headers={}, content=b"{}", text="", url=url)
+            response.json.return_value = {"copy": "primary" if first else "hedge"}
+            return response
+
+        with patch.object(client.session, "request", side_effect=respond):
+            result = client._send_request("POST", url, json={"query": "x"}, idempotent=True)
+
+        assert result == {"copy": "hedge"}, f"Expected the hedged copy to win but got {result}"
+        client.close()
@@ -0,0 +1,163 @@
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from ado.config import ValidatorCacheConfig
+from ado.errors import AdoConfigurationError
+from ado.http_cache import ValidatorCache
+
+ORG_URL = "https://dev.azure.com/test-org"
+
+
+class TestValidatorCache:
+    def test_stores_entries_with_validators(self):
+        cache = ValidatorCache()
+        key = ValidatorCache.make_key(f"{ORG_URL}/_apis/projects")
+
+        stored = cache.store(key, {"ETag": '"abc"'}, {"value": []})
+
+        entry = cache.get(key)
+        assert stored is True, "Expected a response with an ETag to be stored"
+        assert entry.conditional_headers() == {"If-None-Match": '"abc"'}, (
+            f"Unexpected conditional headers: {entry.conditional_headers()}"
+        )
+
+    def test_skips_responses_without_validators(self):
+        cache = ValidatorCache()
+        key = ValidatorCache.make_key(f"{ORG_URL}/_apis/projects")
+        cache.store(key, {"ETag": '"old"'}, {"value": []})
+
+        stored = cache.store(key, {}, {"value": [1]})
+
+        assert stored is False, "Expected a response without validators not to be stored"
+        assert cache.get(key) is None, "Expected the stale entry to be dropped"
+
+    def test_evicts_least_recently_used(self):
+        cache = ValidatorCache(max_entries=2)
+        keys = [ValidatorCache.make_key(f"{ORG_URL}/{i}") for i in range(3)]
+        cache.store(keys[0], {"ETag": "0"}, 0)
+        cache.store(keys[1], {"ETag": "1"}, 1)
+        cache.get(keys[0])
+        cache.store(keys[2], {"ETag": "2"}, 2)
+
+        assert cache.get(keys[1]) is None, "Expected the least recently used entry to be evicted"
+        assert cache.get(keys[0]) is not None, "Expected the recently read entry to be kept"
+        assert len(cache) == 2, f"Expected 2 entries but got {len(cache)}"
+
+    def test_params_are_part_of_key(self):
+        key_a = ValidatorCache.make_key("u", {"a": 1, "b": 2})
+        key_b = ValidatorCache.make_key("u", {"b": 2, "a": 1})
+        key_c = ValidatorCache.make_key("u", {"a": 2})
+
+        assert key_a == key_b, "Expected param order not to affect the key"
+        assert key_a != key_c, "Expected different params to produce different keys"
+
+    def test_config_rejects_non_positive_size(self, make_client):
+        with pytest.raises(AdoConfigurationError):
+            ValidatorCacheConfig(max_entries=0)
+
+
+@pytest.fixture
+def make_client(make_ado_client):
+    def make(enabled=True):
+        return make_ado_client(validator_cache=ValidatorCacheConfig(enabled=enabled))
+
+    return make
+
+
+def mock_response(status_code, body=None, headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.content = b"{}" if body is not None else b""
+    response.json.return_value = body
+    response.text = ""
+    response.url = f"{ORG_URL}/_apis/pipelines"
+    response.raise_for_status.return_value = None
+    return response
+
+
+class TestClientRevalidation:
+    def test_sync_get_revalidates_with_etag(self, make_client):
+        client = make_client()
+        url = f"{ORG_URL}/_apis/pipelines"
+        body = {"value": [{"id": 1}]}
+        responses = [mock_response(200, body, {"ETag": '"v1"'}), mock_response(304)]
+
+        with patch.object(client.session, "request", side_effect=responses) as mock_request:
+            first = client._send_request("GET", url)
+            second = client._send_request("GET", url)
+
+        second_headers = mock_request.call_args_list[1].kwargs["headers"]
+        assert second_headers.get("If-None-Match") == '"v1"', (
+            f"Expected If-None-Match on revalidation but got {second_headers}"
+        )
+        assert second == first == body, "Expected the stored body to be reused on 304"
+        assert "If-None-Match" not in client.headers, "Client default headers must not change"
+
+    def test_revalidated_body_is_a_copy(self, make_client):
+        client = make_client()
+        url = f"{ORG_URL}/_apis/pipelines"
+        responses = [
+            mock_response(200, {"value": [1]}, {"ETag": '"v1"'}),
+            mock_response(304),
+            mock_response(304),
+        ]
+
+        with patch.object(client.session, "request", side_effect=responses):
+            client._send_request("GET", url)["value"].append(2)
+            client._send_request("GET", url)["value"].append(3)
+            third = client._send_request("GET", url)
+
+        assert third == {"value": [1]}, f"Expected callers not to change the stored body: {third}"
+
+    def test_sync_get_without_validators_sends_no_conditional_headers(self, make_client):
+        client = make_client()
+        url = f"{ORG_URL}/_apis/pipelines"
+        responses = [mock_response(200, {"a": 1}), mock_response(200, {"a": 2})]
+
+        with patch.object(client.session, "request", side_effect=responses) as mock_request:
+            client._send_request("GET", url)
+            result = client._send_request("GET", url)
+
+        second_headers = mock_request.call_args_list[1].kwargs["headers"]
+        assert "If-None-Match" not in second_headers, (
+            f"Expected no conditional headers but got {second_headers}"
+        )
+        assert result == {"a": 2}, f"Expected the fresh body but got {result}"
+
+    def test_disabled_cache_sends_no_conditional_headers(self, make_client):
+        client = make_client(enabled=False)
+        url = f"{ORG_URL}/_apis/pipelines"
+        responses = [mock_response(200, {"a": 1}, {"ETag": '"v1"'}), mock_response(200, {"a": 1})]
+
+        with patch.object(client.session, "request", side_effect=responses) as mock_request:
+            client._send_request("GET", url)
+            client._send_request("GET", url)
+
+        second_headers = mock_request.call_args_list[1].kwargs["headers"]
+        assert "If-None-Match" not in second_headers, "Expected no revalidation when disabled"
+        assert len(client.validator_cache) == 0, "Expected nothing stored when disabled"
+
+    async def test_async_get_revalidates_with_etag(self, make_client):
+        client = make_client()
+        seen_headers = []
+
+        def handler(request):
+            seen_headers.append(dict(request.headers))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json={"value": [1]}, headers={"ETag": '"v1"'})
+
+        transport = httpx.MockTransport(handler)
+        client._create_async_session = lambda: httpx.AsyncClient(transport=transport)
+        url = f"{ORG_URL}/_apis/build/builds/1/timeline"
+        try:
+            first = await client._send_request_async("GET", url)
+            second = await client._send_request_async("GET", url)
+        finally:
+            await client.aclose()
+
+        assert "if-none-match" not in seen_headers[0], "First request must be unconditional"
+        assert second == first == {"value": [1]}, f"Expected stored body on 304 but got {second}"
@@ -0,0 +1,123 @@
+import json
+import time
+
+import pytest
+
+from ado.cache import AdoCache, ado_cache
+from ado.cache_store import SqliteCacheStore, decode_value, encode_value
+from ado.config import PersistentCacheConfig
+from ado.errors import AdoConfigurationError
+
+ORG_URL = "https://dev.azure.com/test-org"
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SqliteCacheStore(str(tmp_path / "cache.sqlite3"))
+    yield store
+    store.close()
+
+
+class TestCacheValueEncoding:
+    def test_models_round_trip(self, make_project):
+        value = {"projects": [make_project("Alpha")], "count": 1}
+
+        restored = decode_value(encode_value(value))
+
+        assert restored["projects"][0] == make_project("Alpha"), (
+            f"Expected the Project model to be restored but got {restored['projects'][0]!r}"
+        )
+
+    def test_refuses_classes_outside_the_package(self):
+        payload = json.dumps({"__ado_model__": "subprocess:Popen", "data": {}})
+
+        with pytest.raises(ValueError):
+            decode_value(payload)
+
+    def test_unsupported_values_are_rejected(self):
+        with pytest.raises(TypeError):
+            encode_value({"when": object()})
+
+
+class TestSqliteCacheStore:
+    def test_entries_expire(self, store):
+        store.set("org", "fresh", [1], time.time() + 60)
+        store.set("org", "stale", [2], time.time() - 1)
+
+        assert store.get("org", "fresh")[0] == [1], "Expected the unexpired entry"
+        assert store.get("org", "stale") is None, "Expected the expired entry to be ignored"
+        assert store.purge_expired() == 1, "Expected one expired entry purged"
+
+    def test_namespaces_are_isolated(self, store):
+        store.set("org-a", "projects", ["a"], time.time() + 60)
+
+        assert store.get("org-b", "projects") is None, "Expected no entry for another org"
+
+    def test_config_rejects_non_positive_timeout(self):
+        with pytest.raises(AdoConfigurationError):
+            PersistentCacheConfig(busy_timeout_seconds=0)
+
+
+class TestPersistentTier:
+    def test_warm_start_is_served_from_disk(self, store, make_project):
+        first_process = AdoCache()
+        first_process.attach_store(store, namespace=ORG_URL)
+        first_process.set_projects([make_project("Alpha"), make_project("Beta")])
+
+        # A new process starts with an empty memory tier but the same file
+        second_store = SqliteCacheStore(store.path)
+        second_process = AdoCache()
+        second_process.attach_store(second_store, namespace=ORG_URL)
+        project = second_process.find_project_by_name("beta")
+        second_store.close()
+
+        assert project == make_project("Beta"), f"Expected project from disk but got {project!r}"
+        assert "projects" in second_process.get_stats()["cache_keys"], (
+            "Expected the persisted entry to be promoted into memory"
+        )
+
+    def test_expiry_is_preserved(self, store):
+        cache = AdoCache()
+        cache.attach_store(store, namespace=ORG_URL)
+        cache._set("pipelines:p1", ["x"], 1)
+
+        fresh = AdoCache()
+        fresh.attach_store(store, namespace=ORG_URL)
+        time.sleep(1.1)
+
+        assert fresh._get("pipelines:p1") is None, "Expected the persisted entry to expire"
+
+    def test_clear_all_clears_persisted_entries(self, store):
+        cache = AdoCache()
+        cache.attach_store(store, namespace=ORG_URL)
+        cache._set("projects", ["x"], 60)
+
+        cache.clear_all()
+
+        assert store.get(ORG_URL, "projects") is None, "Expected clear_all to clear the disk tier"
+
+    def test_client_attaches_store_when_enabled(self, tmp_path, make_ado_client):
+        path = str(tmp_path / "client-cache.sqlite3")
+        try:
+            make_ado_client(persistent_cache=PersistentCacheConfig(enabled=True, path=path))
+
+            assert ado_cache._store is not None and ado_cache._store.path == path, (
+                "Expected the client to attach the persistent store to the shared cache"
+            )
+            assert ado_cache._store_namespace == ORG_URL, "Expected the store scoped to the org"
+        finally:
+            ado_cache.detach_store()
+
+    def test_store_namespace_uses_the_normalized_url(self, tmp_path, make_ado_client):
+        path = str(tmp_path / "client-cache.sqlite3")
+        try:
+            make_ado_client(
+                organization_url=f" {ORG_URL}/ ",
+                persistent_cache=PersistentCacheConfig(enabled=True, path=path),
+            )
+
+            assert ado_cache._store_namespace == ORG_URL, (
+                f"Expected the normalized URL but got {ado_cache._store_namespace!r}"
+            )
+        finally:
+            ado_cache.detach_store()
@@ -1,15 +1,22 @@
 import os
-import time
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from requests.exceptions import HTTPError, RequestException, Timeout
 
 from ado.auth import AuthManager, EnvironmentPatAuthProvider, PatAuthProvider
+from ado.circuit_breaker import CircuitBreaker
 from ado.client import AdoClient
-from ado.config import AdoMcpConfig, AuthConfig, RetryConfig, TelemetryConfig
+from ado.config import (
+    AdoMcpConfig,
+    AuthConfig,
+    CircuitBreakerConfig,
+    RetryConfig,
+    TelemetryConfig,
+)
 from ado.errors import (
     AdoAuthenticationError,
+    AdoCircuitOpenError,
     AdoConfigurationError,
     AdoError,
     AdoNetworkError,
@@ -342,21 +349,25 @@ class TestRetryMechanism:
     def test_retry_manager_circuit_breaker(self):
         config = RetryConfig(max_retries=2, initial_delay=0.1)
         retry_manager = RetryManager(config)
-
-        retry_manager._failure_count = 5
-        retry_manager._circuit_open = True
-        retry_manager._last_failure_time = time.time()
+        breaker = CircuitBreaker("GET dev.azure.com/_apis/projects", CircuitBreakerConfig())
+        for _ in range(breaker.config.failure_threshold):
+            breaker.record_failure()
+        call_count = 0
 
         @retry_manager.retry_on_failure
+        @breaker.protect
         def function_with_circuit_open():
+            nonlocal call_count
+            call_count += 1
             raise AdoNetworkError("Network error")
 
-        with pytest.raises(AdoNetworkError) as exc_info:
+        with pytest.raises(AdoCircuitOpenError) as exc_info:
             function_with_circuit_open()
 
-        assert "Network error" in str(exc_info.value), (
-            f"Expected 'Network error' in exception message but got '{str(exc_info.value)}'"
+        assert "Circuit breaker open" in str(exc_info.value), (
+            f"Expected 'Circuit breaker open' in exception message but got '{str(exc_info.value)}'"
         )
+        assert call_count == 0, f"Expected a fast failure without calls but got {call_count}"
 
 
 class TestTelemetryIntegration:
@@ -0,0 +1,187 @@
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ado.config import RateLimitConfig, RetryConfig
+from ado.deadline import deadline_scope
+from ado.errors import AdoConfigurationError, AdoRateLimitError, AdoTimeoutError
+from ado.rate_limiter import AdaptiveRateLimiter, RateLimiterRegistry, background_priority
+
+ORG_URL = "https://dev.azure.com/rate-limit-org"
+
+
+def make_limiter(**overrides):
+    settings = {"requests_per_second": 1000.0, "burst": 1000, "decrease_cooldown_seconds": 0.0}
+    settings.update(overrides)
+    return AdaptiveRateLimiter(RateLimitConfig(**settings), name=ORG_URL)
+
+
+class TestAdaptiveRateLimiter:
+    def test_concurrency_window_bounds_in_flight_requests(self):
+        limiter = make_limiter(initial_concurrency=2, max_concurrency=2)
+        in_flight = []
+        peak = []
+        lock = threading.Lock()
+
+        def request():
+            with limiter.acquire():
+                with lock:
+                    in_flight.append(1)
+                    peak.append(len(in_flight))
+                time.sleep(0.05)
+                with lock:
+                    in_flight.pop()
+
+        threads = [threading.Thread(target=request) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert max(peak) == 2, f"Expected at most 2 requests in flight but saw {max(peak)}"
+
+    def test_token_bucket_paces_requests(self):
+        limiter = make_limiter(requests_per_second=20.0, burst=1)
+
+        start = time.monotonic()
+        for _ in range(5):
+            with limiter.acquire():
+                pass
+
+        elapsed = time.monotonic() - start
+        assert elapsed >= 0.15, f"Expected requests paced at 20/s but took {elapsed:.3f}s"
+
+    def test_throttle_signals_shrink_and_successes_grow_window(self):
+        limiter = make_limiter(initial_concurrency=16)
+
+        limiter.observe(200, {"X-RateLimit-Delay": "0.5"})
+        assert limiter.stats()["concurrency_limit"] == 8, "Expected a delay to halve the window"
+
+        for _ in range(16):
+            limiter.observe(200, {})
+        assert limiter.stats()["concurrency_limit"] == 9, "Expected additive increase"
+
+    def test_429_pauses_all_requests(self):
+        limiter = make_limiter()
+
+        limiter.observe(429, {"Retry-After": "0.2"})
+        start = time.monotonic()
+        with limiter.acquire():
+            pass
+
+        assert time.monotonic() - start >= 0.15, "Expected requests held until Retry-After"
+
+    def test_low_remaining_budget_slows_rate_until_reset(self):
+        limiter = make_limiter(requests_per_second=100.0)
+
+        limiter.observe(
+            200,
+            {
+                "X-RateLimit-Limit": "1000",
+                "X-RateLimit-Remaining": "100",
+                "X-RateLimit-Reset": str(time.time() + 60),
+            },
+        )
+
+        assert limiter.stats()["requests_per_second"] == pytest.approx(10.0), (
+            "Expected the rate scaled to the remaining budget"
+        )
+
+    def test_wait_past_deadline_raises(self):
+        limiter = make_limiter()
+        limiter.observe(429, {"Retry-After": "5"})
+
+        with deadline_scope(0.1), pytest.raises(AdoTimeoutError):
+            with limiter.acquire():
+                pass
+
+    def test_async_acquire_waits_for_pause(self):
+        limiter = make_limiter()
+        limiter.observe(429, {"Retry-After": "0.1"})
+
+        async def acquire():
+            start = time.monotonic()
+            async with limiter.acquire_async():
+                return time.monotonic() - start
+
+        assert asyncio.run(acquire()) >= 0.05, "Expected the async caller to wait too"
+
+    def test_background_requests_leave_room_for_interactive_ones(self):
+        limiter = make_limiter(initial_concurrency=4, max_concurrency=4, background_share=0.5)
+        release = threading.Event()
+        admitted = []
+
+        def background_request():
+            with background_priority(), limiter.acquire():
+                admitted.append(1)
+                release.wait(2)
+
+        threads = [threading.Thread(target=background_request) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.1)
+
+        assert len(admitted) == 2, (
+            f"Expected half the window for background but saw {len(admitted)}"
+        )
+        start = time.monotonic()
+        with limiter.acquire():
+            pass
+        assert time.monotonic() - start < 0.05, "Expected interactive requests admitted at once"
+        release.set()
+        for thread in threads:
+            thread.join()
+
+    def test_disabled_limiter_admits_everything(self):
+        limiter = make_limiter(enabled=False)
+        limiter.observe(429, {"Retry-After": "60"})
+
+        with limiter.acquire():
+            pass
+
+    def test_registry_shares_limiter_per_organization(self):
+        registry = RateLimiterRegistry()
+        config = RateLimitConfig()
+
+        first = registry.get(ORG_URL, config)
+
+        assert registry.get(ORG_URL + "/", config) is first, "Expected one limiter per org"
+        assert registry.get("https://dev.azure.com/other", config) is not first
+
+    def test_cleared_registry_creates_fresh_limiters(self):
+        registry = RateLimiterRegistry()
+        config = RateLimitConfig()
+        blocked = registry.get(ORG_URL, config)
+        blocked.observe(429, {"Retry-After": "60"})
+
+        registry.clear()
+
+        assert registry.get(ORG_URL, config).stats()["blocked_for_seconds"] == 0, (
+            "Expected a cleared registry not to keep the organization paused"
+        )
+
+    def test_config_validates_concurrency_bounds(self):
+        with pytest.raises(AdoConfigurationError):
+            RateLimitConfig(initial_concurrency=8, max_concurrency=4)
+
+
+class TestClientRateLimiting:
+    def test_429_response_pauses_the_organization(self, make_ado_client):
+        client = make_ado_client(retry=RetryConfig(max_retries=0))
+        client.rate_limiter = make_limiter()
+        response = MagicMock()
+        response.status_code = 429
+        response.headers = {"Retry-After": "30"}
+        response.text = ""
+        response.url = f"{ORG_URL}/_apis/projects"
+
+        with patch.object(client.session, "request", return_value=response):
+            with pytest.raises(AdoRateLimitError):
+                client._send_request("POST", f"{ORG_URL}/_apis/projects")
+
+        assert client.rate_limiter.stats()["blocked_for_seconds"] > 25, (
+            "Expected the 429 to pause every request to the organization"
+        )
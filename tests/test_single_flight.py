@@ -0,0 +1,187 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from ado.single_flight import SingleFlight
+
+ORG_URL = "https://dev.azure.com/test-org"
+
+
+class TestSingleFlightKeys:
+    def test_params_order_does_not_change_key(self):
+        key_a = SingleFlight.make_key("GET", "u", {"a": 1, "b": 2}, ORG_URL)
+        key_b = SingleFlight.make_key("get", "u", {"b": 2, "a": 1}, ORG_URL)
+
+        assert key_a == key_b, "Expected keys with reordered params and method case to match"
+
+    def test_org_and_headers_are_part_of_key(self):
+        base = SingleFlight.make_key("GET", "u", None, ORG_URL)
+        other_org = SingleFlight.make_key("GET", "u", None, "https://dev.azure.com/other")
+        with_headers = SingleFlight.make_key("GET", "u", None, ORG_URL, {"If-None-Match": "x"})
+
+        assert base != other_org, "Expected different organizations to produce different keys"
+        assert base != with_headers, "Expected per-request headers to produce a different key"
+
+
+class TestSingleFlightSync:
+    def test_concurrent_calls_share_one_execution(self):
+        group = SingleFlight()
+        calls = []
+        started = threading.Event()
+
+        def slow_fetch():
+            calls.append(1)
+            started.set()
+            time.sleep(0.2)
+            return {"value": 42}
+
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            leader = pool.submit(group.do, "key", slow_fetch)
+            started.wait()
+            followers = [pool.submit(group.do, "key", slow_fetch) for _ in range(4)]
+            results = [leader.result()] + [f.result() for f in followers]
+
+        assert len(calls) == 1, f"Expected one upstream call but got {len(calls)}"
+        assert all(r == {"value": 42} for r in results), f"Unexpected results: {results}"
+        assert len({id(r) for r in results}) == len(results), (
+            "Expected every follower to get its own copy of the result"
+        )
+        assert group.in_flight_count() == 0, "Expected no calls left in flight"
+
+    def test_exception_is_shared_and_not_cached(self):
+        group = SingleFlight()
+        started = threading.Event()
+
+        def failing_fetch():
+            started.set()
+            time.sleep(0.1)
+            raise RuntimeError("upstream failed")
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            leader = pool.submit(group.do, "key", failing_fetch)
+            started.wait()
+            follower = pool.submit(group.do, "key", failing_fetch)
+
+            with pytest.raises(RuntimeError):
+                leader.result()
+            with pytest.raises(RuntimeError):
+                follower.result()
+
+        assert group.do("key", lambda: "fresh") == "fresh", (
+            "Expected a new call after the failed one completed"
+        )
+
+
+class TestSingleFlightAsync:
+    async def test_concurrent_awaits_share_one_execution(self):
+        group = SingleFlight()
+        calls = []
+
+        async def slow_fetch():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return {"value": 42}
+
+        results = await asyncio.gather(*(group.do_async("key", slow_fetch) for _ in range(10)))
+
+        assert len(calls) == 1, f"Expected one upstream call but got {len(calls)}"
+        assert all(r == {"value": 42} for r in results), f"Unexpected results: {results}"
+        assert group.in_flight_count() == 0, "Expected no tasks left in flight"
+
+    async def test_followers_can_modify_their_result(self):
+        group = SingleFlight()
+
+        async def slow_fetch():
+            await asyncio.sleep(0.05)
+            return {"value": [1]}
+
+        leader, follower = await asyncio.gather(
+            group.do_async("key", slow_fetch), group.do_async("key", slow_fetch)
+        )
+        follower["value"].append(2)
+
+        assert leader == {"value": [1]}, f"Expected the leader's result unchanged but got {leader}"
+
+    async def test_cancelled_waiter_does_not_cancel_shared_call(self, make_client):
+        group = SingleFlight()
+
+        async def slow_fetch():
+            await asyncio.sleep(0.05)
+            return "done"
+
+        first = asyncio.create_task(group.do_async("key", slow_fetch))
+        second = asyncio.create_task(group.do_async("key", slow_fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == "done", "Expected the remaining waiter to receive the result"
+
+
+@pytest.fixture
+def make_client(make_ado_client):
+    def make(handler, coalescing=True):
+        client = make_ado_client(request_coalescing_enabled=coalescing)
+        transport = httpx.MockTransport(handler)
+        client._create_async_session = lambda: httpx.AsyncClient(transport=transport)
+        return client
+
+    return make
+
+
+class TestClientCoalescing:
+    async def test_identical_gets_are_coalesced(self, make_client):
+        calls = []
+
+        async def handler(request):
+            calls.append(request.method)
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json={"value": []})
+
+        client = make_client(handler)
+        try:
+            url = f"{ORG_URL}/_apis/projects"
+            await asyncio.gather(*(client._send_request_async("GET", url) for _ in range(5)))
+        finally:
+            await client.aclose()
+
+        assert calls == ["GET"], f"Expected one upstream GET but got {calls}"
+
+    async def test_posts_are_not_coalesced(self, make_client):
+        calls = []
+
+        async def handler(request):
+            calls.append(request.method)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={})
+
+        client = make_client(handler)
+        try:
+            url = f"{ORG_URL}/_apis/wit/wiql"
+            await asyncio.gather(
+                *(client._send_request_async("POST", url, json={}) for _ in range(3))
+            )
+        finally:
+            await client.aclose()
+
+        assert len(calls) == 3, f"Expected every POST to go upstream but got {len(calls)}"
+
+    async def test_coalescing_can_be_disabled(self, make_client):
+        calls = []
+
+        async def handler(request):
+            calls.append(request.method)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={})
+
+        client = make_client(handler, coalescing=False)
+        try:
+            url = f"{ORG_URL}/_apis/projects"
+            await asyncio.gather(*(client._send_request_async("GET", url) for _ in range(3)))
+        finally:
+            await client.aclose()
+
+        assert len(calls) == 3, f"Expected no coalescing when disabled but got {len(calls)} calls"
@@ -0,0 +1,121 @@
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ado.cache import AdoCache
+from ado.lookups import AdoLookups
+from ado.models import Pipeline
+
+ORG_URL = "https://dev.azure.com/test-org"
+
+
+def expire(cache: AdoCache, key: str, seconds_ago: float) -> None:
+    cache._cache[key].expires_at = time.time() - seconds_ago
+
+
+def wait_for_refreshes(cache: AdoCache, timeout: float = 5.0) -> None:
+    deadline = time.time() + timeout
+    while cache._refreshing and time.time() < deadline:
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def cache():
+    cache = AdoCache()
+    with patch("ado.lookups.ado_cache", cache):
+        yield cache
+
+
+class TestStaleEntries:
+    def test_entry_within_grace_is_served_stale(self, make_project):
+        cache = AdoCache()
+        cache.set_projects([make_project("Alpha")])
+        expire(cache, "projects", 10)
+
+        projects, stale = cache.get_projects_allow_stale()
+
+        assert stale, "Expected the recently expired entry to be reported stale"
+        assert projects == [make_project("Alpha")], f"Expected stale projects but got {projects}"
+        assert cache.get_projects() == [make_project("Alpha")], (
+            "Expected other readers to see the stale data until it is refreshed"
+        )
+
+    def test_entry_past_grace_is_a_miss(self, make_project):
+        cache = AdoCache()
+        cache.set_projects([make_project("Alpha")])
+        expire(cache, "projects", cache.STALE_GRACE + 1)
+
+        projects, stale = cache.get_projects_allow_stale()
+
+        assert projects is None and not stale, "Expected an entry past the grace window to miss"
+
+    def test_refreshes_are_deduplicated(self):
+        cache = AdoCache()
+        release = threading.Event()
+        calls = []
+
+        def refresh():
+            calls.append(1)
+            release.wait(5)
+
+        started = [cache.refresh_in_background("projects", refresh) for _ in range(5)]
+        release.set()
+        wait_for_refreshes(cache)
+
+        assert started == [True, False, False, False, False], f"Unexpected starts: {started}"
+        assert len(calls) == 1, f"Expected a single refresh but got {len(calls)}"
+
+
+class TestStaleWhileRevalidateLookups:
+    def test_stale_projects_returned_and_refreshed(self, cache, make_project):
+        cache.set_projects([make_project("Alpha")])
+        expire(cache, "projects", 10)
+        client = MagicMock()
+        client.list_projects.return_value = [make_project("Alpha"), make_project("Beta")]
+        lookups = AdoLookups(client)
+
+        projects = lookups.ensure_projects_cached()
+        wait_for_refreshes(cache)
+
+        assert [p.name for p in projects] == ["Alpha"], "Expected the stale projects immediately"
+        assert client.list_projects.call_count == 1, "Expected one background refresh"
+        assert [p.name for p in cache.get_projects()] == ["Alpha", "Beta"], (
+            "Expected the refreshed projects to replace the stale entry"
+        )
+        assert not cache.get_projects_allow_stale()[1], "Expected the refreshed entry to be fresh"
+
+    async def test_async_stale_pipelines_trigger_one_refresh(self, cache):
+        pipeline = Pipeline(id=1, name="CI", folder="\\", revision=1, url=f"{ORG_URL}/p/1")
+        cache.set_pipelines("project-id", [pipeline])
+        expire(cache, "pipelines:project-id", 10)
+        release = threading.Event()
+        client = MagicMock()
+        client.list_pipelines.side_effect = lambda project_id: release.wait(5) and [pipeline]
+        lookups = AdoLookups(client)
+
+        for _ in range(3):
+            pipelines = await lookups.ensure_pipelines_cached_async("project-id")
+        release.set()
+        wait_for_refreshes(cache)
+
+        assert pipelines == [pipeline], f"Expected stale pipelines but got {pipelines}"
+        assert client.list_pipelines.call_count == 1, (
+            f"Expected one refresh but got {client.list_pipelines.call_count}"
+        )
+
+    def test_failed_refresh_keeps_serving_stale_data(self, cache, make_project):
+        cache.set_projects([make_project("Alpha")])
+        expire(cache, "projects", 10)
+        client = MagicMock()
+        client.list_projects.side_effect = RuntimeError("boom")
+        lookups = AdoLookups(client)
+
+        lookups.ensure_projects_cached()
+        wait_for_refreshes(cache)
+        projects = lookups.ensure_projects_cached()
+        wait_for_refreshes(cache)
+
+        assert [p.name for p in projects] == ["Alpha"], "Expected stale data after a failure"
+        assert client.list_projects.call_count == 2, "Expected the refresh to be retried"
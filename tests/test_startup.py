@@ -0,0 +1,104 @@
+import asyncio
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from ado.deadline import deadline_scope
+from ado.errors import AdoTimeoutError
+from ado.startup import BackgroundClientInit, ClientReadyMiddleware
+
+
+def blocked_initializer(release: threading.Event, client="client"):
+    def initializer():
+        release.wait(5)
+        return client
+
+    return initializer
+
+
+class TestBackgroundClientInit:
+    def test_client_is_set_once_initialized(self):
+        container = {"client": None}
+        release = threading.Event()
+        client_init = BackgroundClientInit(container)
+
+        client_init.start(blocked_initializer(release))
+
+        assert client_init.pending, "Expected initialization to run in the background"
+        assert container["client"] is None
+        release.set()
+        assert client_init.wait(2), "Expected initialization to finish"
+        assert container["client"] == "client"
+
+    def test_client_selected_meanwhile_is_kept(self):
+        container = {"client": None}
+        release = threading.Event()
+        client_init = BackgroundClientInit(container)
+        client_init.start(blocked_initializer(release, client="initial"))
+
+        container["client"] = "selected"
+        release.set()
+        client_init.wait(2)
+
+        assert container["client"] == "selected", "Expected the later selection to win"
+
+    def test_failure_leaves_no_client(self):
+        container = {"client": None}
+        client_init = BackgroundClientInit(container)
+
+        def failing():
+            raise RuntimeError("network down")
+
+        client_init.start(failing)
+
+        assert client_init.wait(2) and container["client"] is None
+
+    def test_wait_async_respects_deadline(self):
+        release = threading.Event()
+        client_init = BackgroundClientInit({"client": None})
+        client_init.start(blocked_initializer(release))
+
+        async def wait():
+            with deadline_scope(0.1):
+                await client_init.wait_async()
+
+        with pytest.raises(AdoTimeoutError):
+            asyncio.run(wait())
+        release.set()
+
+
+class TestClientReadyMiddleware:
+    def test_tool_call_waits_for_initialization(self):
+        container = {"client": None}
+        release = threading.Event()
+        client_init = BackgroundClientInit(container)
+        client_init.start(blocked_initializer(release))
+        middleware = ClientReadyMiddleware(client_init)
+
+        async def call_next(context):
+            return container["client"]
+
+        async def call():
+            asyncio.get_running_loop().call_later(0.05, release.set)
+            return await middleware.on_call_tool(None, call_next)
+
+        assert asyncio.run(call()) == "client", "Expected the tool to see the initialized client"
+
+
+def test_telemetry_sdk_is_not_imported_eagerly():
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, ado.client; print(any(m.startswith('opentelemetry.sdk') for m in sys.modules))",
+        ],
+        cwd=Path(__file__).resolve().parent.parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == "False", "Expected the OpenTelemetry SDK loaded on first use"
@@ -11,10 +11,12 @@ from dataclasses import dataclass
 import pytest
 
 from ado.utils.fuzzy_matching import (
+    FuzzyIndex,
     FuzzyMatcher,
     MatchResult,
     create_suggestion_error_message,
     extract_suggestions_for_response,
+    get_fuzzy_index,
 )
 
 
@@ -542,3 +544,84 @@ class TestIntegrationWithLLMErrors:
                 f"Project discovery failed for '{query}' -> '{expected_project}'. "
                 f"Found: {[m.name for m in matches]}"
             )
+
+
+class TestFuzzyIndex:
+    """Test cases for indexed matching of large candidate lists."""
+
+    def setup_method(self):
+        """Set up a large project's worth of pipelines."""
+        self.pipelines = [MockPipeline(i, f"team-{i % 40}-service-{i}-deploy") for i in range(5000)]
+
+    def test_index_is_reused_for_the_same_candidates(self):
+        """Test that repeated queries against the same list share one index."""
+
+        def name_of(p):
+            return p.name
+
+        first = get_fuzzy_index(self.pipelines, name_of)
+        second = get_fuzzy_index(self.pipelines, name_of)
+        other = get_fuzzy_index(list(self.pipelines), name_of)
+
+        assert first is second, "Expected the index to be reused for the same list"
+        assert other is not first, "Expected a new index for a different list"
+
+    def test_indexed_matches_equal_unindexed_scores(self):
+        """Test that pre-filtering doesn't change which candidates match or their scores."""
+        matcher = FuzzyMatcher(max_suggestions=100)
+        index = FuzzyIndex(self.pipelines[:300], lambda p: p.name)
+
+        for query in ("team-3-servce-123-deploy", "Service-42", "deploy team", "tema-7"):
+            matches = matcher.find_matches_in_index(query, index)
+            expected = sorted(
+                (
+                    (matcher._calculate_similarity(query, p.name), -p.id)
+                    for p in self.pipelines[:300]
+                ),
+                reverse=True,
+            )
+            expected = [(-neg_id, score) for score, neg_id in expected if score >= 0.5][:100]
+
+            assert [(m.item.id, m.similarity) for m in matches] == expected, (
+                f"Indexed matches differ from full scoring for '{query}'"
+            )
+
+    def test_suggestions_for_large_project_are_fast(self):
+        """Test that suggestions for 5,000 pipelines come back in single-digit milliseconds."""
+        matcher = FuzzyMatcher()
+
+        def name_of(p):
+            return p.name
+
+        # The first query builds the index, later ones reuse it
+        matcher.find_matches("warm-up", self.pipelines, name_extractor=name_of)
+
+        # Best of several runs, so a busy test machine doesn't make this flaky
+        elapsed_ms = float("inf")
+        for _ in range(5):
+            start_time = time.perf_counter()
+            matches = matcher.find_matches(
+                "team-3-servce-1234-deploy", self.pipelines, name_extractor=name_of
+            )
+            elapsed_ms = min(elapsed_ms, (time.perf_counter() - start_time) * 1000)
+
+        assert matches[0].name == "team-34-service-1234-deploy", (
+            f"Expected the closest pipeline first but got '{matches[0].name}'"
+        )
+        # Typically single-digit milliseconds; the bound leaves room for loaded CI machines
+        assert elapsed_ms < 100, f"Expected fast suggestions but took {elapsed_ms:.1f}ms"
+
+    def test_time_budget_returns_best_matches_so_far(self, caplog):
+        """Test that matching stops at the time budget instead of only logging."""
+        matcher = FuzzyMatcher(performance_threshold_ms=0)
+
+        with caplog.at_level("WARNING", logger="ado.utils.fuzzy_matching"):
+            matches = matcher.find_matches(
+                "team-3-service-12", self.pipelines, name_extractor=lambda p: p.name
+            )
+
+        assert matches, "Expected the matches found before the budget ran out"
+        assert matches[0].match_type == "exact_substring", (
+            f"Expected substring matches to be found first but got {matches[0].match_type}"
+        )
+        assert "exceeded performance threshold" in caplog.text, "Expected a budget warning"
@@ -0,0 +1,109 @@
+"""
+Unit tests for the name indexes used by AdoCache lookups.
+"""
+
+from dataclasses import dataclass
+from difflib import SequenceMatcher, get_close_matches
+from unittest.mock import patch
+
+from ado.cache import AdoCache
+from ado.models import Pipeline
+from ado.utils.name_index import MAX_FUZZY_CANDIDATES, NameIndex
+
+
+@dataclass
+class MockPipeline:
+    """Mock pipeline object for testing."""
+
+    id: int
+    name: str
+
+
+def make_pipelines(count: int) -> list[MockPipeline]:
+    return [MockPipeline(id=i, name=f"service-{i}-deploy-pipeline") for i in range(count)]
+
+
+class TestNameIndex:
+    def test_exact_match_ignores_case(self):
+        index = NameIndex([MockPipeline(1, "CI-Build"), MockPipeline(2, "Deploy")])
+
+        assert index.get("ci-build") == MockPipeline(1, "CI-Build"), "Expected case-folded match"
+        assert index.get("ci-buil") is None, "Expected no exact match for a partial name"
+
+    def test_first_duplicate_wins(self):
+        index = NameIndex([MockPipeline(1, "Deploy"), MockPipeline(2, "deploy")])
+
+        assert index.get("DEPLOY").id == 1, "Expected the first item with a duplicate name"
+
+    def test_fuzzy_match_agrees_with_difflib(self):
+        pipelines = make_pipelines(500)
+        names = [p.name for p in pipelines]
+        index = NameIndex(pipelines)
+
+        for query in ("service-42-deplyo-pipeline", "servce-317-deploy-pipeline", "sevice-9-dep"):
+            expected = get_close_matches(query, names, n=1, cutoff=0.6)
+            found = index.find(query)
+            assert ([found.name] if found else []) == expected, (
+                f"Expected {expected} for {query!r} but got {found}"
+            )
+
+    def test_unrelated_name_has_no_fuzzy_match(self):
+        index = NameIndex(make_pipelines(100))
+
+        assert index.find("xyzzy") is None, "Expected no match for an unrelated name"
+        assert index.find("service-1-deploy-pipelin", fuzzy=False) is None, (
+            "Expected no match when fuzzy matching is disabled"
+        )
+
+    def test_fuzzy_lookup_scores_few_names_in_large_projects(self):
+        index = NameIndex(make_pipelines(5000))
+        scored = []
+
+        class CountingMatcher(SequenceMatcher):
+            def set_seq1(self, a):
+                if a:  # SequenceMatcher() itself starts from empty sequences
+                    scored.append(a)
+                super().set_seq1(a)
+
+        with patch("ado.utils.name_index.SequenceMatcher", CountingMatcher):
+            match = index.find("service-4321-deplyo-pipeline")
+
+        assert match is not None and match.id == 4321, f"Expected pipeline 4321 but got {match}"
+        assert len(scored) <= MAX_FUZZY_CANDIDATES, (
+            f"Expected at most {MAX_FUZZY_CANDIDATES} names scored but scored {len(scored)}"
+        )
+
+
+class TestCacheNameIndexes:
+    def test_index_is_built_when_pipelines_are_cached(self):
+        cache = AdoCache()
+        pipelines = [Pipeline(id=i, name=f"pipeline-{i}", revision=1, url="u") for i in range(3)]
+
+        cache.set_pipelines("project", pipelines)
+
+        index = cache._cache["pipelines:project:name_map"].data
+        assert isinstance(index, NameIndex) and index.items is pipelines, (
+            "Expected a name index over the cached pipelines"
+        )
+        assert cache.find_pipeline_by_name("project", "PIPELINE-2").id == 2, (
+            "Expected an exact lookup through the index"
+        )
+
+    def test_missing_index_is_rebuilt(self):
+        cache = AdoCache()
+        pipelines = [Pipeline(id=1, name="deploy", revision=1, url="u")]
+        cache.set_pipelines("project", pipelines)
+        del cache._cache["pipelines:project:name_map"]
+
+        assert cache.find_pipeline_by_name("project", "deplyo").id == 1, (
+            "Expected the index to be rebuilt for a fuzzy lookup"
+        )
+        assert "pipelines:project:name_map" in cache._cache, "Expected the rebuilt index cached"
+
+    def test_invalidate_pipelines_drops_index(self):
+        cache = AdoCache()
+        cache.set_pipelines("project", [Pipeline(id=1, name="deploy", revision=1, url="u")])
+
+        cache.invalidate_pipelines("project")
+
+        assert cache.get_stats()["total_entries"] == 0, "Expected pipelines and index removed"
@@ -0,0 +1,281 @@
+"""Tests for batch updates and deletions through the work item $batch endpoint."""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from ado.config import AdoMcpConfig
+from ado.errors import AdoError
+from ado.work_items.batch_client import BatchClient
+
+ORG = "https://dev.azure.com/batch-org"
+
+
+def make_batch_client():
+    client = MagicMock()
+    client.organization_url = ORG
+    client.config = AdoMcpConfig()
+    return BatchClient(client)
+
+
+def title_update(work_item_id, title):
+    return {
+        "work_item_id": work_item_id,
+        "operations": [{"op": "replace", "path": "/fields/System.Title", "value": title}],
+    }
+
+
+def batch_response(*entries):
+    return {
+        "count": len(entries),
+        "value": [
+            {"code": code, "headers": {}, "body": json.dumps(body)} for code, body in entries
+        ],
+    }
+
+
+def work_item_body(work_item_id, title="Updated"):
+    return {"id": work_item_id, "rev": 2, "fields": {"System.Title": title}}
+
+
+def http_error(status_code):
+    response = requests.Response()
+    response.status_code = status_code
+    return requests.exceptions.HTTPError(f"{status_code} Client Error", response=response)
+
+
+class TestBatchUpdates:
+    def test_updates_are_validated_then_sent_as_one_batch_request(self):
+        batch_client = make_batch_client()
+        batch_client.client._send_request.return_value = batch_response(
+            (200, work_item_body(1, "One")), (200, work_item_body(2, "Two"))
+        )
+
+        work_items = batch_client.update_work_items_batch(
+            "My Project",
+            [title_update(1, "One"), title_update(2, "Two")],
+            bypass_rules=True,
+        )
+
+        dry_run, call = batch_client.client._send_request.call_args_list
+        assert all("validateOnly=true" in request["uri"] for request in dry_run.kwargs["json"])
+        assert call.kwargs["method"] == "POST"
+        assert call.kwargs["url"] == f"{ORG}/_apis/wit/$batch"
+        first = call.kwargs["json"][0]
+        assert first["method"] == "PATCH"
+        assert first["uri"].startswith("/My%20Project/_apis/wit/workitems/1?")
+        assert "bypassRules=true" in first["uri"] and "validateOnly=false" in first["uri"]
+        assert first["headers"]["Content-Type"] == "application/json-patch+json"
+        assert first["body"] == title_update(1, "One")["operations"]
+        assert [item.fields["System.Title"] for item in work_items] == ["One", "Two"]
+
+    def test_omit_policy_skips_failed_items(self):
+        batch_client = make_batch_client()
+        batch_client.client._send_request.return_value = batch_response(
+            (404, {"message": "Work item 999 does not exist"}), (200, work_item_body(2))
+        )
+
+        work_items = batch_client.update_work_items_batch(
+            "Project", [title_update(999, "x"), title_update(2, "y")], error_policy="omit"
+        )
+
+        assert [item.id for item in work_items] == [2]
+
+    def test_fail_policy_changes_nothing_when_an_update_is_invalid(self):
+        batch_client = make_batch_client()
+        batch_client.client._send_request.return_value = batch_response(
+            (200, work_item_body(1)), (404, {"message": "Work item 999 does not exist"})
+        )
+
+        with pytest.raises(AdoError) as exc_info:
+            batch_client.update_work_items_batch(
+                "Project", [title_update(1, "x"), title_update(999, "y")]
+            )
+
+        assert "item 1" in str(exc_info.value) and "404" in str(exc_info.value)
+        (call,) = batch_client.client._send_request.call_args_list
+        assert all("validateOnly=true" in request["uri"] for request in call.kwargs["json"]), (
+            "Expected only the validation batch to be sent"
+        )
+
+    def test_failure_while_applying_carries_the_updated_items(self):
+        batch_client = make_batch_client()
+        batch_client.client._send_request.side_effect = [
+            batch_response((200, work_item_body(1)), (200, work_item_body(2))),
+            batch_response((200, work_item_body(1)), (409, {"message": "Revision conflict"})),
+        ]
+
+        with pytest.raises(AdoError) as exc_info:
+            batch_client.update_work_items_batch(
+                "Project", [title_update(1, "x"), title_update(2, "y")]
+            )
+
+        updated = exc_info.value.context["updated_work_items"]
+        assert [item.id for item in updated] == [1], f"Unexpected updated items: {updated}"
+        assert "409" in str(exc_info.value)
+
+    def test_invalid_update_fails_before_anything_is_sent(self):
+        batch_client = make_batch_client()
+
+        with pytest.raises(AdoError, match="work_item_id"):
+            batch_client.update_work_items_batch(
+                "Project", [title_update(1, "x"), {"operations": []}]
+            )
+
+        batch_client.client._send_request.assert_not_called()
+
+    def test_rejected_batch_falls_back_to_individual_requests(self):
+        batch_client = make_batch_client()
+
+        def send_request(method, url, **kwargs):
+            if method == "POST":
+                raise http_error(404)
+            work_item_id = int(url.rsplit("/", 1)[-1])
+            return work_item_body(work_item_id)
+
+        batch_client.client._send_request.side_effect = send_request
+
+        work_items = batch_client.update_work_items_batch(
+            "Project", [title_update(1, "x"), title_update(2, "y")]
+        )
+
+        assert [item.id for item in work_items] == [1, 2]
+        patch_calls = [
+            call
+            for call in batch_client.client._send_request.call_args_list
+            if call.kwargs["method"] == "PATCH"
+        ]
+        assert [call.kwargs["params"]["validateOnly"] for call in patch_calls] == [
+            True,
+            True,
+            False,
+            False,
+        ], "Expected the validation pass to fall back to individual requests too"
+        assert patch_calls[0].kwargs["headers"]["Content-Type"] == "application/json-patch+json"
+
+    def test_server_errors_do_not_fall_back(self):
+        batch_client = make_batch_client()
+        batch_client.client._send_request.side_effect = http_error(503)
+
+        with pytest.raises(AdoError):
+            batch_client.update_work_items_batch("Project", [title_update(1, "x")])
+
+        assert batch_client.client._send_request.call_count == 1
+
+
+class TestUpdateMerging:
+    def test_updates_of_the_same_item_become_one_patch(self):
+        batch_client = make_batch_client()
+        batch_client.client._send_request.return_value = batch_response(
+            (200, work_item_body(1)), (200, work_item_body(2))
+        )
+        state = {"op": "replace", "path": "/fields/System.State", "value": "Active"}
+        assignee = {"op": "replace", "path": "/fields/System.AssignedTo", "value": "a@b.com"}
+
+        work_items = batch_client.update_work_items_batch(
+            "Project",
+            [
+                {"work_item_id": 1, "operations": [state]},
+                title_update(2, "Two"),
+                {"work_item_id": 1, "operations": [assignee]},
+            ],
+        )
+
+        call = batch_client.client._send_request.call_args_list[-1]
+        requests_sent = call.kwargs["json"]
+        assert len(requests_sent) == 2, "Expected one PATCH per work item"
+        assert requests_sent[0]["body"] == [state, assignee]
+        assert [item.id for item in work_items] == [1, 2]
+
+    def test_conflicting_updates_fail_before_anything_is_sent(self):
+        batch_client = make_batch_client()
+
+        with pytest.raises(AdoError, match="conflict on /fields/System.Title"):
+            batch_client.update_work_items_batch(
+                "Project", [title_update(1, "First"), title_update(1, "Second")]
+            )
+
+        batch_client.client._send_request.assert_not_called()
+
+    def test_conflicting_item_is_skipped_under_omit(self):
+        batch_client = make_batch_client()
+        batch_client.client._send_request.return_value = batch_response((200, work_item_body(2)))
+
+        work_items = batch_client.update_work_items_batch(
+            "Project",
+            [title_update(1, "First"), title_update(2, "Two"), title_update(1, "Second")],
+            error_policy="omit",
+        )
+
+        (call,) = batch_client.client._send_request.call_args_list
+        assert [request["uri"].split("?")[0] for request in call.kwargs["json"]] == [
+            "/Project/_apis/wit/workitems/2"
+        ]
+        assert [item.id for item in work_items] == [2]
+
+    def test_repeated_identical_and_append_operations_do_not_conflict(self):
+        batch_client = make_batch_client()
+        batch_client.client._send_request.return_value = batch_response((200, work_item_body(1)))
+        link = {
+            "op": "add",
+            "path": "/relations/-",
+            "value": {"rel": "System.LinkTypes.Related", "url": f"{ORG}/_apis/wit/workItems/2"},
+        }
+
+        batch_client.update_work_items_batch(
+            "Project",
+            [
+                title_update(1, "Same"),
+                {"work_item_id": 1, "operations": [link]},
+                title_update(1, "Same"),
+                {
+                    "work_item_id": 1,
+                    "operations": [{**link, "value": {**link["value"], "url": "x"}}],
+                },
+            ],
+        )
+
+        call = batch_client.client._send_request.call_args_list[-1]
+        assert len(call.kwargs["json"][0]["body"]) == 4
+
+
+class TestBatchDeletions:
+    def test_deletions_report_per_item_results(self):
+        batch_client = make_batch_client()
+        batch_client.client._send_request.return_value = batch_response(
+            (200, {"id": 1}), (404, {"message": "Work item 2 does not exist"})
+        )
+
+        results = batch_client.delete_work_items_batch(
+            "Project", [1, 2], destroy=True, error_policy="omit"
+        )
+
+        (call,) = batch_client.client._send_request.call_args_list
+        assert [request["method"] for request in call.kwargs["json"]] == ["DELETE", "DELETE"]
+        assert "destroy=true" in call.kwargs["json"][0]["uri"]
+        assert "body" not in call.kwargs["json"][0]
+        assert results == [True, False]
+
+    def test_fail_policy_deletes_nothing_when_an_item_is_missing(self):
+        batch_client = make_batch_client()
+        batch_client.client._send_request.return_value = {"value": [{"id": 1, "fields": {}}]}
+
+        with pytest.raises(AdoError, match="work item 2 does not exist"):
+            batch_client.delete_work_items_batch("Project", [1, 2])
+
+        (call,) = batch_client.client._send_request.call_args_list
+        assert call.kwargs["method"] == "GET", "Expected no deletion to be sent"
+
+    def test_failure_while_deleting_carries_the_results(self):
+        batch_client = make_batch_client()
+        batch_client.client._send_request.side_effect = [
+            {"value": [{"id": 1, "fields": {}}, {"id": 2, "fields": {}}]},
+            batch_response((200, {"id": 1}), (403, {"message": "Access denied"})),
+        ]
+
+        with pytest.raises(AdoError, match="403") as exc_info:
+            batch_client.delete_work_items_batch("Project", [1, 2])
+
+        assert exc_info.value.context["deletion_results"] == [True, False]
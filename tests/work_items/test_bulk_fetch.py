@@ -0,0 +1,158 @@
+"""Tests for chunked, concurrent bulk work item retrieval."""
+
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from ado.config import AdoMcpConfig
+from ado.errors import AdoError
+from ado.work_items.batch_client import BatchClient
+
+ORG = "https://dev.azure.com/bulk-org"
+
+
+def requested_ids(params):
+    return [int(work_item_id) for work_item_id in params["ids"].split(",")]
+
+
+def work_item_payload(params):
+    # Answer in reverse order to check that results are put back in request order
+    return {
+        "value": [
+            {"id": work_item_id, "fields": {"System.Title": f"Item {work_item_id}"}}
+            for work_item_id in reversed(requested_ids(params))
+        ]
+    }
+
+
+def make_batch_client(max_concurrency=4):
+    client = MagicMock()
+    client.organization_url = ORG
+    client.config = AdoMcpConfig()
+    client.config.work_item_bulk.max_concurrency = max_concurrency
+    return BatchClient(client)
+
+
+class TestBulkFetch:
+    def test_splits_into_chunks_of_200_and_restores_request_order(self):
+        batch_client = make_batch_client()
+        chunk_sizes = []
+
+        def send_request(method, url, params):
+            chunk_sizes.append(len(requested_ids(params)))
+            return work_item_payload(params)
+
+        batch_client.client._send_request.side_effect = send_request
+        work_item_ids = list(range(450, 0, -1))
+
+        work_items = batch_client.get_work_items_bulk("Project", work_item_ids)
+
+        assert sorted(chunk_sizes) == [50, 200, 200], f"Unexpected chunks: {chunk_sizes}"
+        assert [item.id for item in work_items] == work_item_ids
+
+    def test_duplicate_ids_are_fetched_once(self):
+        batch_client = make_batch_client()
+        batch_client.client._send_request.side_effect = lambda method, url, params: (
+            work_item_payload(params)
+        )
+
+        work_items = batch_client.get_work_items_bulk("Project", [3, 1, 3, 2, 1])
+
+        (call,) = batch_client.client._send_request.call_args_list
+        assert requested_ids(call.kwargs["params"]) == [3, 1, 2]
+        assert [item.id for item in work_items] == [3, 1, 2]
+
+    def test_chunks_run_concurrently_up_to_the_limit(self):
+        batch_client = make_batch_client(max_concurrency=2)
+        lock = threading.Lock()
+        running = {"now": 0, "peak": 0}
+        both_started = threading.Barrier(2, timeout=2)
+
+        def send_request(method, url, params):
+            with lock:
+                running["now"] += 1
+                running["peak"] = max(running["peak"], running["now"])
+            try:
+                both_started.wait()
+            except threading.BrokenBarrierError:
+                pass
+            with lock:
+                running["now"] -= 1
+            return work_item_payload(params)
+
+        batch_client.client._send_request.side_effect = send_request
+
+        work_items = batch_client.get_work_items_bulk("Project", list(range(1, 801)))
+
+        assert len(work_items) == 800
+        assert running["peak"] == 2, f"Expected two chunks in flight, saw {running['peak']}"
+
+    def test_iter_yields_each_chunk(self):
+        batch_client = make_batch_client()
+        batch_client.client._send_request.side_effect = lambda method, url, params: (
+            work_item_payload(params)
+        )
+
+        chunks = list(batch_client.iter_work_items_bulk("Project", list(range(1, 402))))
+
+        assert sorted(len(chunk) for chunk in chunks) == [1, 200, 200]
+
+    def test_failed_chunk_raises(self):
+        batch_client = make_batch_client()
+
+        def send_request(method, url, params):
+            if 300 in requested_ids(params):
+                raise RuntimeError("service unavailable")
+            return work_item_payload(params)
+
+        batch_client.client._send_request.side_effect = send_request
+
+        with pytest.raises(AdoError):
+            batch_client.get_work_items_bulk("Project", list(range(1, 401)))
+
+    def test_empty_id_list_makes_no_requests(self):
+        batch_client = make_batch_client()
+
+        assert batch_client.get_work_items_bulk("Project", []) == []
+        batch_client.client._send_request.assert_not_called()
+
+
+class TestBulkFetchAsync:
+    def test_async_bulk_fetch_restores_request_order(self):
+        batch_client = make_batch_client(max_concurrency=2)
+        running = {"now": 0, "peak": 0}
+
+        async def send_request(method, url, params):
+            running["now"] += 1
+            running["peak"] = max(running["peak"], running["now"])
+            await asyncio.sleep(0.01)
+            running["now"] -= 1
+            return work_item_payload(params)
+
+        batch_client.client._send_request_async = send_request
+        work_item_ids = list(range(1000, 0, -1)) + [5]
+
+        work_items = asyncio.run(batch_client.get_work_items_bulk_async("Project", work_item_ids))
+
+        assert [item.id for item in work_items] == work_item_ids[:-1]
+        assert running["peak"] == 2, f"Expected two chunks in flight, saw {running['peak']}"
+
+    def test_async_iter_streams_chunks(self):
+        batch_client = make_batch_client()
+
+        async def send_request(method, url, params):
+            return work_item_payload(params)
+
+        batch_client.client._send_request_async = send_request
+
+        async def collect():
+            return [
+                len(chunk)
+                async for chunk in batch_client.iter_work_items_bulk_async(
+                    "Project", list(range(1, 251))
+                )
+            ]
+
+        assert sorted(asyncio.run(collect())) == [50, 200]
@@ -0,0 +1,210 @@
+"""Tests for cursor pagination of get_work_items_page over query snapshots."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastmcp import FastMCP
+from fastmcp.client import Client
+
+from ado.config import AdoMcpConfig
+from ado.work_items.query_cursors import (
+    QueryCursorStore,
+    QuerySnapshot,
+    decode_cursor,
+    encode_cursor,
+)
+from ado.work_items.query_operations import register_query_tools
+
+ORG = "https://dev.azure.com/cursor-org"
+
+
+def make_snapshot(ttl_seconds=60.0, work_item_ids=()):
+    return QuerySnapshot(
+        organization_url=ORG,
+        project_id="Project",
+        work_item_ids=list(work_item_ids),
+        query_type="flat",
+        columns=None,
+        ttl_seconds=ttl_seconds,
+    )
+
+
+class TestQueryCursorStore:
+    def test_cursor_round_trip(self):
+        assert decode_cursor(encode_cursor("abc_-1", 400)) == ("abc_-1", 400)
+
+    def test_invalid_cursor_is_rejected(self):
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            decode_cursor("not a cursor")
+
+    def test_negative_offset_is_rejected(self):
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            decode_cursor(encode_cursor("abc", -50))
+
+    def test_snapshots_expire_when_unused(self):
+        store = QueryCursorStore()
+        with patch("ado.work_items.query_cursors.time.monotonic", return_value=100.0):
+            snapshot_id = store.add(make_snapshot(ttl_seconds=10))
+        with patch("ado.work_items.query_cursors.time.monotonic", return_value=105.0):
+            assert store.get(snapshot_id) is not None, "Expected the snapshot within its TTL"
+        with patch("ado.work_items.query_cursors.time.monotonic", return_value=114.0):
+            assert store.get(snapshot_id) is not None, "Expected reads to extend the TTL"
+        with patch("ado.work_items.query_cursors.time.monotonic", return_value=125.0):
+            assert store.get(snapshot_id) is None
+
+    def test_least_recently_used_snapshot_is_evicted(self):
+        store = QueryCursorStore(max_snapshots=2)
+        first = store.add(make_snapshot())
+        second = store.add(make_snapshot())
+        store.get(first)
+
+        store.add(make_snapshot())
+
+        assert store.get(first) is not None and store.get(second) is None
+
+    def test_snapshots_are_evicted_to_bound_the_ids_held(self):
+        store = QueryCursorStore(max_work_item_ids=10)
+        first = store.add(make_snapshot(work_item_ids=range(6)))
+        second = store.add(make_snapshot(work_item_ids=range(4)))
+
+        third = store.add(make_snapshot(work_item_ids=range(5)))
+
+        assert store.get(first) is None, "Expected the oldest snapshot to make room"
+        assert store.get(second) is not None and store.get(third) is not None
+
+    def test_snapshot_larger_than_the_bound_is_still_kept(self):
+        store = QueryCursorStore(max_work_item_ids=10)
+        store.add(make_snapshot(work_item_ids=range(3)))
+
+        snapshot_id = store.add(make_snapshot(work_item_ids=range(20)))
+
+        assert store.get(snapshot_id) is not None
+
+
+def make_client(work_item_ids):
+    client = MagicMock()
+    client.organization_url = ORG
+    client.config = AdoMcpConfig()
+    requests_sent = []
+
+    async def send_request_async(method, url, params, **kwargs):
+        requests_sent.append((method, params))
+        if method == "POST":
+            return {
+                "queryType": "flat",
+                "columns": [{"referenceName": "System.Id"}],
+                "workItems": [
+                    {"id": work_item_id, "url": f"{ORG}/_apis/wit/workItems/{work_item_id}"}
+                    for work_item_id in work_item_ids
+                ],
+            }
+        ids = [int(work_item_id) for work_item_id in params["ids"].split(",")]
+        return {"value": [{"id": work_item_id, "fields": {}} for work_item_id in ids]}
+
+    client._send_request_async = send_request_async
+    return client, requests_sent
+
+
+def call_page_tool(client, calls):
+    mcp = FastMCP(name="cursor-test")
+    register_query_tools(mcp, {"client": client})
+
+    async def run():
+        results = []
+        async with Client(mcp) as mcp_client:
+            for arguments in calls:
+                arguments = arguments(results[-1] if results else None)
+                result = await mcp_client.call_tool("get_work_items_page", arguments)
+                results.append(result.data)
+        return results
+
+    return asyncio.run(run())
+
+
+class TestCursorPagination:
+    def test_later_pages_are_read_from_the_snapshot(self):
+        client, requests_sent = make_client(list(range(1, 13)))
+
+        pages = call_page_tool(
+            client,
+            [
+                lambda _: {"project_id": "Project", "page_size": 5},
+                lambda previous: {
+                    "project_id": "Project",
+                    "page_size": 5,
+                    "cursor": previous["pagination"]["next_cursor"],
+                },
+                lambda previous: {
+                    "project_id": "Project",
+                    "page_size": 5,
+                    "cursor": previous["pagination"]["next_cursor"],
+                },
+            ],
+        )
+
+        assert [item["id"] for item in pages[1]["work_items"]] == [6, 7, 8, 9, 10]
+        assert pages[1]["pagination"]["page_number"] == 2
+        assert pages[1]["pagination"]["has_previous"] is True
+        assert [item["id"] for item in pages[2]["work_items"]] == [11, 12]
+        assert pages[2]["pagination"]["next_cursor"] is None
+        assert pages[2]["pagination"]["result_limit_reached"] is False
+        assert pages[0]["pagination"]["total_count"] == 12
+        assert [method for method, _ in requests_sent] == ["POST"], (
+            "Expected the query to run only for the first page"
+        )
+
+    def test_cursor_pages_fetch_only_their_fields(self):
+        client, requests_sent = make_client(list(range(1, 8)))
+
+        pages = call_page_tool(
+            client,
+            [
+                lambda _: {"project_id": "Project", "page_size": 3},
+                lambda previous: {
+                    "project_id": "Project",
+                    "page_size": 3,
+                    "fields": ["System.Title"],
+                    "cursor": previous["pagination"]["next_cursor"],
+                },
+            ],
+        )
+
+        assert [item["id"] for item in pages[1]["work_items"]] == [4, 5, 6]
+        assert requests_sent[1] == (
+            "GET",
+            {"ids": "4,5,6", "api-version": "7.1", "errorPolicy": "omit", "fields": "System.Title"},
+        )
+
+    def test_reaching_the_query_result_limit_is_reported(self):
+        client, _ = make_client(list(range(1, 8)))
+
+        with patch("ado.work_items.query_operations.MAX_QUERY_RESULTS", 7):
+            pages = call_page_tool(
+                client,
+                [
+                    lambda _: {"project_id": "Project", "page_size": 5},
+                    lambda previous: {
+                        "project_id": "Project",
+                        "cursor": previous["pagination"]["next_cursor"],
+                    },
+                ],
+            )
+
+        assert pages[1]["pagination"]["has_more"] is False
+        assert [page["pagination"]["result_limit_reached"] for page in pages] == [True, True]
+
+    def test_cursor_of_another_project_is_rejected(self):
+        client, _ = make_client(list(range(1, 8)))
+
+        with pytest.raises(Exception, match="expired or belongs to another project"):
+            call_page_tool(
+                client,
+                [
+                    lambda _: {"project_id": "Project", "page_size": 3},
+                    lambda previous: {
+                        "project_id": "Other",
+                        "cursor": previous["pagination"]["next_cursor"],
+                    },
+                ],
+            )
@@ -0,0 +1,133 @@
+"""Tests for running a WIQL query and fetching the matched work items in windows."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from fastmcp import FastMCP
+from fastmcp.client import Client
+
+from ado.config import AdoMcpConfig
+from ado.work_items.query_client import QueryClient
+from ado.work_items.query_operations import register_query_tools
+
+ORG = "https://dev.azure.com/hydrate-org"
+
+
+def wiql_response(work_item_ids):
+    return {
+        "queryType": "flat",
+        "asOf": "2024-01-01T00:00:00Z",
+        "columns": [
+            {"referenceName": "System.Id", "name": "ID"},
+            {"referenceName": "System.Title", "name": "Title"},
+        ],
+        "workItems": [
+            {"id": work_item_id, "url": f"{ORG}/_apis/wit/workItems/{work_item_id}"}
+            for work_item_id in work_item_ids
+        ],
+    }
+
+
+def batch_get_response(params):
+    # Answer in reverse order to check that windows keep the query order
+    ids = [int(work_item_id) for work_item_id in params["ids"].split(",")]
+    return {"value": [{"id": work_item_id, "fields": {}} for work_item_id in reversed(ids)]}
+
+
+def make_query_client(work_item_ids):
+    client = MagicMock()
+    client.organization_url = ORG
+    client.config = AdoMcpConfig()
+    gets = []
+
+    def send_request(method, url, params, **kwargs):
+        if method == "POST":
+            return wiql_response(work_item_ids)
+        gets.append(params)
+        return batch_get_response(params)
+
+    async def send_request_async(method, url, params, **kwargs):
+        return send_request(method, url, params, **kwargs)
+
+    client._send_request.side_effect = send_request
+    client._send_request_async = send_request_async
+    return QueryClient(client), gets
+
+
+class TestQueryHydration:
+    def test_windows_follow_query_order(self):
+        query_ids = list(range(500, 0, -1))
+        query_client, gets = make_query_client(query_ids)
+
+        windows = list(
+            query_client.query_work_items_hydrated("Project", "SELECT [System.Id] FROM WorkItems")
+        )
+
+        assert [len(window) for window in windows] == [200, 200, 100]
+        assert [item.id for window in windows for item in window] == query_ids
+        assert len(gets) == 3
+
+    def test_fields_default_to_query_columns(self):
+        query_client, gets = make_query_client([1, 2])
+
+        list(query_client.query_work_items_hydrated("Project"))
+
+        assert gets[0]["fields"] == "System.Id,System.Title"
+
+    def test_explicit_fields_are_requested(self):
+        query_client, gets = make_query_client([1, 2])
+
+        list(query_client.query_work_items_hydrated("Project", fields=["System.State"]))
+
+        assert gets[0]["fields"] == "System.State"
+
+    def test_empty_result_fetches_nothing(self):
+        query_client, gets = make_query_client([])
+
+        assert list(query_client.query_work_items_hydrated("Project")) == []
+        assert gets == []
+
+    def test_async_windows_follow_query_order(self):
+        query_ids = list(range(250, 0, -1))
+        query_client, _ = make_query_client(query_ids)
+
+        async def collect():
+            return [
+                [item.id for item in window]
+                async for window in query_client.query_work_items_hydrated_async("Project")
+            ]
+
+        windows = asyncio.run(collect())
+
+        assert [work_item_id for window in windows for work_item_id in window] == query_ids
+        assert [len(window) for window in windows] == [200, 50]
+
+
+class TestGetWorkItemsByQuery:
+    @pytest.mark.parametrize(("top", "expected_top"), [(None, 200), (50, 50), (5000, 1000)])
+    def test_result_size_is_bounded(self, top, expected_top):
+        query_client, _ = make_query_client(list(range(1, 4)))
+        client = query_client.client
+        send_request_async = client._send_request_async
+        queries = []
+
+        async def record_query(method, url, params, **kwargs):
+            if method == "POST":
+                queries.append(params)
+            return await send_request_async(method, url, params, **kwargs)
+
+        client._send_request_async = record_query
+        mcp = FastMCP(name="hydration-test")
+        register_query_tools(mcp, {"client": client})
+        arguments = {"project_id": "Project"}
+        if top is not None:
+            arguments["top"] = top
+
+        async def run():
+            async with Client(mcp) as mcp_client:
+                return await mcp_client.call_tool("get_work_items_by_query", arguments)
+
+        asyncio.run(run())
+
+        assert queries[0]["$top"] == expected_top, f"Unexpected WIQL $top: {queries[0]}"